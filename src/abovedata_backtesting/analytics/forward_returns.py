@@ -0,0 +1,147 @@
+"""Batched forward returns over many tickers, signal dates and horizons.
+
+Every ticker's closes are indexed once. The start row of each signal date is
+then found with ``searchsorted`` — the first trading day on or after the
+date, so only prices known after the signal are used — and every
+(signal date, ticker, horizon) return is computed in one NumPy pass per
+ticker instead of filtering a DataFrame per pair.
+
+Usage
+-----
+>>> engine = ForwardReturnEngine.from_market_data(market_data)
+>>> fwd = engine.matrix(signal_dates, horizons=[10, 30, 60])  # (dates, tickers, h)
+>>> own = engine.series("DE", signal_dates, horizon=30)        # (dates,)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+
+DateArray = NDArray[np.datetime64]
+
+
+def as_date_array(dates: Sequence[date] | pl.Series | DateArray) -> DateArray:
+    """Signal dates as a datetime64[D] array."""
+    if isinstance(dates, pl.Series):
+        dates = dates.cast(pl.Date).to_numpy()
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+@dataclass(frozen=True, slots=True)
+class TickerCloses:
+    """One ticker's trading days and closes, sorted by date (NaN = null)."""
+
+    dates: DateArray
+    closes: NDArray[np.float64]
+
+    @classmethod
+    def from_frame(
+        cls, market_df: pl.DataFrame, price_col: str = "close"
+    ) -> TickerCloses:
+        df = market_df.select(pl.col("date").cast(pl.Date), price_col).sort("date")
+        return cls(
+            dates=df["date"].to_numpy().astype("datetime64[D]"),
+            closes=df[price_col].cast(pl.Float64).fill_null(np.nan).to_numpy(),
+        )
+
+    def forward_returns(
+        self, signal_dates: DateArray, horizons: NDArray[np.int64]
+    ) -> NDArray[np.float64]:
+        """(n_dates, n_horizons) returns; NaN where no return is defined.
+
+        A return is defined when at least two trading days exist on or after
+        the signal date and both closes are non-null with a non-zero start.
+        Horizons past the last trading day are capped at it.
+        """
+        n = len(self.dates)
+        start = np.searchsorted(self.dates, signal_dates, side="left")
+        n_future = n - start
+        valid = n_future >= 2
+
+        out = np.full((len(signal_dates), len(horizons)), np.nan)
+        if not valid.any():
+            return out
+
+        start_v = start[valid]
+        end = start_v[:, None] + np.minimum(
+            horizons[None, :], n_future[valid, None] - 1
+        )
+        close_0 = self.closes[start_v][:, None]
+        close_t = self.closes[end]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = (close_t - close_0) / close_0
+        out[valid] = np.where(close_0 != 0, returns, np.nan)
+        return out
+
+
+@dataclass(frozen=True, slots=True)
+class ForwardReturnEngine:
+    """Forward returns for any signal dates × tickers × horizons.
+
+    Parameters
+    ----------
+    tickers : tuple[str, ...]
+        Column order of ``matrix``.
+    closes : tuple[TickerCloses, ...]
+        Indexed closes, aligned with ``tickers``.
+    """
+
+    tickers: tuple[str, ...]
+    closes: tuple[TickerCloses, ...]
+
+    @classmethod
+    def from_market_data(
+        cls, market_data: Mapping[str, pl.DataFrame], price_col: str = "close"
+    ) -> ForwardReturnEngine:
+        tickers = tuple(sorted(market_data))
+        return cls(
+            tickers=tickers,
+            closes=tuple(
+                TickerCloses.from_frame(market_data[t], price_col) for t in tickers
+            ),
+        )
+
+    def __contains__(self, ticker: object) -> bool:
+        return ticker in self.tickers
+
+    def matrix(
+        self,
+        signal_dates: Sequence[date] | pl.Series | DateArray,
+        horizons: Sequence[int],
+        tickers: Sequence[str] | None = None,
+    ) -> NDArray[np.float64]:
+        """(n_dates, n_tickers, n_horizons) forward returns; NaN = undefined.
+
+        ``tickers`` selects and orders the ticker axis (default: all).
+        """
+        dates = as_date_array(signal_dates)
+        h = np.asarray(horizons, dtype=np.int64)
+        selected = self.tickers if tickers is None else tickers
+        out = np.empty((len(dates), len(selected), len(h)))
+        for j, ticker in enumerate(selected):
+            out[:, j, :] = self._closes(ticker).forward_returns(dates, h)
+        return out
+
+    def series(
+        self,
+        ticker: str,
+        signal_dates: Sequence[date] | pl.Series | DateArray,
+        horizon: int,
+    ) -> NDArray[np.float64]:
+        """One ticker's forward returns at one horizon, aligned with the dates."""
+        h = np.array([horizon], dtype=np.int64)
+        return self._closes(ticker).forward_returns(as_date_array(signal_dates), h)[
+            :, 0
+        ]
+
+    def _closes(self, ticker: str) -> TickerCloses:
+        try:
+            return self.closes[self.tickers.index(ticker)]
+        except ValueError:
+            raise KeyError(f"No market data for ticker '{ticker}'") from None
@@ -0,0 +1,177 @@
+"""Batched Spearman rank IC with pairwise-complete NaN handling.
+
+``scipy.stats.spearmanr`` handles one pair of series per call. These kernels
+correlate one series against every column of a panel at once:
+
+  - Each column keeps only the rows where both inputs are finite
+    (pairwise-complete), and values are ranked within those rows with
+    average ranks for ties, as spearmanr does on the dropped-NaN pair.
+  - The ranks come from comparison counts, computed as one matrix product
+    for the shared series and as chunked broadcasts for the panel columns.
+  - Columns with fewer than ``min_obs`` complete pairs are NaN. P-values use
+    spearmanr's two-sided t-distribution with n - 2 degrees of freedom.
+  - ``spearman_windows`` / ``rolling_spearman`` treat each window of two
+    aligned series as a column, so a whole rolling IC series is one call.
+
+Usage
+-----
+>>> res = spearman_ic(signal, fwd_returns, min_obs=8)  # fwd_returns: (n, m)
+>>> res.ic, res.pval, res.n_obs                        # each (m,)
+>>> rolling_spearman(peer_signal, fwd_returns_1d, window=6).ic  # (n,)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import stats
+
+FloatArray = NDArray[np.float64]
+
+# Bound on n × n × columns booleans per chunk when ranking panel columns.
+_RANK_CHUNK_ELEMENTS = 1 << 24
+
+
+@dataclass(frozen=True, slots=True)
+class RankICResult:
+    """Spearman IC, two-sided p-value and complete-pair count per cell."""
+
+    ic: FloatArray
+    pval: FloatArray
+    n_obs: NDArray[np.int64]
+
+
+def masked_average_ranks(values: FloatArray, mask: NDArray[np.bool_]) -> FloatArray:
+    """Average ranks (1-based) of each column among its masked rows.
+
+    ``values`` is (n,) — one series ranked under every mask column — or
+    (n, m), ranked column by column. Returns (n, m); NaN outside the mask.
+    """
+    n, m = mask.shape
+    maskf = mask.astype(np.float64)
+    if values.ndim == 1:
+        less = (values[None, :] < values[:, None]).astype(np.float64) @ maskf
+        ties = (values[None, :] == values[:, None]).astype(np.float64) @ maskf
+    else:
+        less = np.empty((n, m))
+        ties = np.empty((n, m))
+        step = max(1, _RANK_CHUNK_ELEMENTS // max(n * n, 1))
+        for lo in range(0, m, step):
+            v = values[:, lo : lo + step]
+            k = mask[None, :, lo : lo + step]
+            less[:, lo : lo + step] = ((v[None, :, :] < v[:, None, :]) & k).sum(1)
+            ties[:, lo : lo + step] = ((v[None, :, :] == v[:, None, :]) & k).sum(1)
+    # Ties include the value itself: average of ranks less+1 .. less+ties.
+    return np.where(mask, less + (ties + 1.0) / 2.0, np.nan)
+
+
+def spearman_ic(x: FloatArray, y: FloatArray, min_obs: int = 5) -> RankICResult:
+    """Spearman IC of series ``x`` (n,) against each column of ``y`` (n, m).
+
+    Rows where either value is non-finite are dropped per column. Cells with
+    fewer than ``min_obs`` complete pairs, or a constant input, are NaN.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if y.ndim == 1:
+        y = y[:, None]
+    mask = np.isfinite(x)[:, None] & np.isfinite(y)
+
+    # Non-finite values are masked out; zero them so comparisons stay quiet.
+    rx = masked_average_ranks(np.where(np.isfinite(x), x, 0.0), mask)
+    ry = masked_average_ranks(np.where(mask, y, 0.0), mask)
+    return _rank_correlation(rx, ry, mask, min_obs)
+
+
+def spearman_ic_matrix(x: FloatArray, y: FloatArray, min_obs: int = 5) -> RankICResult:
+    """Spearman IC of every column of ``x`` (n, a) against every column of ``y``.
+
+    Both panels share the row axis (e.g. dates). Returns (a, b) results with
+    the same pairwise-complete rules as ``spearman_ic``.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    rows = [spearman_ic(x[:, i], y, min_obs) for i in range(x.shape[1])]
+    return RankICResult(
+        ic=np.vstack([r.ic for r in rows]),
+        pval=np.vstack([r.pval for r in rows]),
+        n_obs=np.vstack([r.n_obs for r in rows]),
+    )
+
+
+def spearman_windows(
+    x: FloatArray,
+    y: FloatArray,
+    starts: NDArray[np.int64],
+    ends: NDArray[np.int64],
+    min_obs: int = 3,
+) -> RankICResult:
+    """Spearman IC of ``x`` vs ``y`` over each window ``[starts[k], ends[k])``.
+
+    All windows are ranked and correlated together: windows are gathered
+    into a (width, n_windows) panel, padding past each window's end is
+    masked out, and the result has one cell per window.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    if len(starts) == 0:
+        empty = np.empty(0)
+        return RankICResult(ic=empty, pval=empty, n_obs=np.empty(0, dtype=np.int64))
+
+    width = max(int((ends - starts).max()), 1)
+    idx = starts[None, :] + np.arange(width)[:, None]  # (width, n_windows)
+    inside = idx < ends[None, :]
+    idx = np.minimum(idx, len(x) - 1)
+    xw, yw = x[idx], y[idx]
+    mask = inside & np.isfinite(xw) & np.isfinite(yw)
+
+    rx = masked_average_ranks(np.where(mask, xw, 0.0), mask)
+    ry = masked_average_ranks(np.where(mask, yw, 0.0), mask)
+    return _rank_correlation(rx, ry, mask, min_obs)
+
+
+def rolling_spearman(
+    x: FloatArray, y: FloatArray, window: int, min_obs: int = 3
+) -> RankICResult:
+    """Trailing-window Spearman IC at every position of aligned ``x``/``y``.
+
+    Cell t covers pairs ``max(0, t - window + 1) .. t``; windows shorter than
+    ``window`` at the start are kept and masked only by ``min_obs``.
+    """
+    ends = np.arange(1, len(x) + 1, dtype=np.int64)
+    starts = np.maximum(ends - window, 0)
+    return spearman_windows(x, y, starts, ends, min_obs)
+
+
+def _rank_correlation(
+    rx: FloatArray, ry: FloatArray, mask: NDArray[np.bool_], min_obs: int
+) -> RankICResult:
+    """Per-column Pearson correlation of masked ranks, with t-test p-values."""
+    n_obs = mask.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Pearson correlation of the ranks. Average ranks of n values always
+        # have mean (n + 1) / 2, so the centred ranks are exact multiples of
+        # 0.5 and their sums of products are exact: equal rank patterns give
+        # bit-identical ICs regardless of column or window.
+        mean_rank = (n_obs + 1) / 2.0
+        cx = np.where(mask, rx - mean_rank, 0.0)
+        cy = np.where(mask, ry - mean_rank, 0.0)
+        sxy = (cx * cy).sum(axis=0)
+        sxx = (cx * cx).sum(axis=0)
+        syy = (cy * cy).sum(axis=0)
+        ic = np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0)
+
+        # Two-sided t-test, as in scipy.stats.spearmanr
+        t_dof = n_obs - 2
+        t = ic * np.sqrt((t_dof / ((ic + 1.0) * (1.0 - ic))).clip(0))
+        pval = 2.0 * stats.t.sf(np.abs(t), t_dof)
+
+    valid = (n_obs >= max(min_obs, 2)) & np.isfinite(ic)
+    return RankICResult(
+        ic=np.where(valid, ic, np.nan),
+        pval=np.where(valid, pval, np.nan),
+        n_obs=n_obs.astype(np.int64),
+    )
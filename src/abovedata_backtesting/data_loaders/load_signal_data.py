@@ -56,3 +56,21 @@ def list_visible_cols(
         and d.name.startswith("visible_col=")
         and (d / "processed_data.parquet").exists()
     )
+
+
+def list_signal_tickers(method: str = "stl_p4_s7_robustTrue") -> list[str]:
+    """Return tickers with signal data for ``method``.
+
+    Scans ``data/signal-data/ticker=*/`` for a ``method={method}/``
+    subdirectory.
+    """
+    signal_dir = data_root / "signal-data"
+    if not signal_dir.exists():
+        return []
+    return sorted(
+        d.name.removeprefix("ticker=")
+        for d in signal_dir.iterdir()
+        if d.is_dir()
+        and d.name.startswith("ticker=")
+        and (d / f"method={method}").is_dir()
+    )
@@ -8,20 +8,23 @@ Optionally filters by signal magnitude, confidence, and regime shifts.
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import Sequence
 from dataclasses import dataclass, field, fields
 from itertools import product
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
+import numpy as np
 import polars as pl
-
-from abovedata_backtesting.entries.entry_signals import _short_signal_col
+from numpy.typing import NDArray
 
 from abovedata_backtesting.entries.entry_context import EntryContext
+from abovedata_backtesting.entries.entry_events import EntryEvents
 from abovedata_backtesting.entries.entry_signals import (
     EntryRule,
-    _apply_entry_positions,
     _resolve_entry_dates,
+    _short_signal_col,
 )
+from abovedata_backtesting.entries.trading_calendar import TradingCalendar
 
 # ── Column name mappings ────────────────────────────────────────────────────
 
@@ -62,6 +65,24 @@ def _safe_float(val: Any) -> float | None:
         return None
 
 
+def _timing_dates(
+    signal_rows: list[dict[str, Any]], target_next_quarter: bool
+) -> tuple[list[dt.date], dict[dt.date, dict[str, Any]]]:
+    """Timing dates and the signal row each one trades on."""
+    if target_next_quarter:
+        # Leading signal: data from row T, trade timed to row T+1's earnings
+        timing_dates: list[dt.date] = []
+        data_source: dict[dt.date, dict[str, Any]] = {}
+        for i, row in enumerate(signal_rows[:-1]):  # skip last (no T+1)
+            next_earnings = signal_rows[i + 1]["_parsed_date"]
+            timing_dates.append(next_earnings)
+            data_source[next_earnings] = row
+        return timing_dates, data_source
+    # Contemporaneous: data and timing from same row
+    timing_dates = [r["_parsed_date"] for r in signal_rows]
+    return timing_dates, {r["_parsed_date"]: r for r in signal_rows}
+
+
 def _classify_regime(corr: float | None) -> str:
     if corr is None:
         return "unknown"
@@ -182,6 +203,51 @@ class RunningContext:
         self.confidences[timing_date] = 0.0
 
 
+@dataclass(frozen=True, slots=True)
+class CorrelationAwareBatch:
+    """
+    Entry decisions of many CorrelationAwareEntry variants on shared events.
+
+    Variants in a batch share signal_col, corr_col, confidence_col, timing
+    (target_next_quarter, entry_days_before) and the prior-quarter context
+    switch, so they have the same entry events and per-event inputs; they
+    differ only in their filters and confidence scaling.
+
+    Parameters
+    ----------
+    n_days : int
+        Number of rows in the market data the events index into.
+    entry_idx : (E,) int64
+        Sorted market-data row index of each entry event.
+    positions, strengths, confidences : (V, E) float64
+        Per-variant event values, as EntryEvents direction/strength/confidence.
+    context_ids : (V, E) int32
+        Index into ``contexts`` for each variant and event.
+    contexts : tuple[EntryContext, ...]
+        Shared context table; entry 0 is the empty context.
+    """
+
+    n_days: int
+    entry_idx: NDArray[np.int64]
+    positions: NDArray[np.float64]
+    strengths: NDArray[np.float64]
+    confidences: NDArray[np.float64]
+    context_ids: NDArray[np.int32]
+    contexts: tuple[EntryContext, ...]
+
+    def events(self, variant: int) -> EntryEvents:
+        """EntryEvents of one variant, identical to its own events() output."""
+        return EntryEvents.from_shared_contexts(
+            self.n_days,
+            self.entry_idx,
+            self.positions[variant],
+            self.strengths[variant],
+            self.confidences[variant],
+            self.context_ids[variant],
+            self.contexts,
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class CorrelationAwareEntry(EntryRule):
     """
@@ -204,6 +270,8 @@ class CorrelationAwareEntry(EntryRule):
     target_next_quarter: bool = False
     date_col: str = "earnings_date"
 
+    batchable: ClassVar[bool] = True
+
     # ── Auto-generated from dataclass fields ────────────────────────────
 
     @property
@@ -299,12 +367,18 @@ class CorrelationAwareEntry(EntryRule):
         signals: pl.DataFrame,
         daily_cumulative: pl.DataFrame | None = None,
     ) -> pl.DataFrame:
+        return self.events(market_data, signals, daily_cumulative).to_daily(market_data)
+
+    def events(
+        self,
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        daily_cumulative: pl.DataFrame | None = None,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> EntryEvents:
         if self.signal_col not in signals.columns:
-            return market_data.with_columns(
-                pl.lit(0.0).alias("position"),
-                pl.lit(0.0).alias("signal_strength"),
-                pl.lit(0.0).alias("confidence"),
-            )
+            return EntryEvents.empty(market_data.height)
 
         running_context = RunningContext(
             corr_col=self.corr_col,
@@ -315,25 +389,15 @@ class CorrelationAwareEntry(EntryRule):
         signal_rows = self._parse_signal_rows(signals)
 
         # Build entry timing and data source mappings
-        if self.target_next_quarter:
-            # Leading signal: data from row T, trade timed to row T+1's earnings
-            # entry_map: {entry_date → T+1_earnings_date}
-            # data_source: {T+1_earnings_date → row_T}
-            timing_dates: list[dt.date] = []
-            data_source: dict[dt.date, dict[str, Any]] = {}
-            for i, row in enumerate(signal_rows[:-1]):  # skip last (no T+1)
-                next_earnings = signal_rows[i + 1]["_parsed_date"]
-                timing_dates.append(next_earnings)
-                data_source[next_earnings] = row
-        else:
-            # Contemporaneous: data and timing from same row
-            timing_dates = [r["_parsed_date"] for r in signal_rows]
-            data_source = {r["_parsed_date"]: r for r in signal_rows}
+        # (target_next_quarter: entry_map {entry_date → T+1_earnings_date},
+        # data_source {T+1_earnings_date → row_T})
+        timing_dates, data_source = _timing_dates(signal_rows, self.target_next_quarter)
 
         entry_map = _resolve_entry_dates(
             market_data,
             timing_dates,
             self.entry_days_before,
+            calendar,
         )
 
         for entry_date, timing_date in entry_map.items():
@@ -392,7 +456,7 @@ class CorrelationAwareEntry(EntryRule):
                 final_direction=int(final_dir),
             )
 
-        return _apply_entry_positions(
+        return EntryEvents.from_entry_map(
             market_data,
             entry_map,
             running_context.directions,
@@ -401,6 +465,212 @@ class CorrelationAwareEntry(EntryRule):
             running_context.contexts,
         )
 
+    # ── Batched grid evaluation ─────────────────────────────────────────
+
+    @classmethod
+    def batch_events(
+        cls,
+        rules: Sequence[Self],
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> list[EntryEvents]:
+        """Events for many variants, sharing all work that filters don't change.
+
+        Signal rows are parsed once per date_col, entry dates are resolved for
+        every entry_days_before in one calendar call per timing, and signal
+        estimates and correlation context are computed once per batch (see
+        CorrelationAwareBatch). Each variant then costs a few vectorized
+        comparisons. Results equal ``rule.events(market_data, signals)``.
+        """
+        if calendar is None:
+            calendar = TradingCalendar.from_market_data(market_data)
+
+        out: list[EntryEvents | None] = [None] * len(rules)
+        batches: dict[tuple[Any, ...], list[int]] = {}
+        for i, rule in enumerate(rules):
+            if rule.signal_col not in signals.columns:
+                out[i] = EntryEvents.empty(market_data.height)
+            else:
+                batches.setdefault(rule._batch_key(), []).append(i)
+
+        # Shared per date_col / timing: parsed rows, timing dates, and the
+        # entry index of every timing date for every offset in the grid.
+        parsed: dict[str, list[dict[str, Any]]] = {}
+        offsets: dict[tuple[str, bool], list[int]] = {}
+        for idx in batches.values():
+            lead = rules[idx[0]]
+            if lead.date_col not in parsed:
+                parsed[lead.date_col] = lead._parse_signal_rows(signals)
+            timing = offsets.setdefault((lead.date_col, lead.target_next_quarter), [])
+            if lead.entry_days_before not in timing:
+                timing.append(lead.entry_days_before)
+
+        timings: dict[
+            tuple[str, bool],
+            tuple[list[dt.date], dict[dt.date, dict[str, Any]], NDArray[np.int64]],
+        ] = {}
+        for (date_col, target_next), timing_offsets in offsets.items():
+            timing_dates, data_source = _timing_dates(parsed[date_col], target_next)
+            timings[(date_col, target_next)] = (
+                timing_dates,
+                data_source,
+                calendar.entry_indices(timing_dates, timing_offsets),
+            )
+
+        for idx in batches.values():
+            lead = rules[idx[0]]
+            key = (lead.date_col, lead.target_next_quarter)
+            timing_dates, data_source, entry_idx = timings[key]
+            column = offsets[key].index(lead.entry_days_before)
+            batch = cls._evaluate_batch(
+                [rules[i] for i in idx],
+                calendar,
+                parsed[lead.date_col],
+                timing_dates,
+                data_source,
+                entry_idx[:, column],
+            )
+            for variant, i in enumerate(idx):
+                out[i] = batch.events(variant)
+
+        return [e for e in out if e is not None]
+
+    def input_columns(self) -> tuple[str, ...]:
+        ctx = RunningContext(corr_col=self.corr_col, confidence_col=self.confidence_col)
+        return (
+            self.date_col,
+            self.signal_col,
+            ctx.corr_col_name,
+            ctx.conf_col_name,
+            ctx.regime_col_name,
+            "quarter_start",
+            "quarter_end",
+            "pct_count_complete",
+        )
+
+    def _batch_key(self) -> tuple[Any, ...]:
+        """Fields that must match for two variants to share a batch."""
+        return (
+            self.signal_col,
+            self.corr_col,
+            self.confidence_col,
+            self.target_next_quarter,
+            self.date_col,
+            self.entry_days_before,
+            self.use_prior_quarter_corr and self.entry_days_before > 0,
+        )
+
+    @classmethod
+    def _evaluate_batch(
+        cls,
+        rules: Sequence[Self],
+        calendar: TradingCalendar,
+        signal_rows: list[dict[str, Any]],
+        timing_dates: list[dt.date],
+        data_source: dict[dt.date, dict[str, Any]],
+        timing_entry_idx: NDArray[np.int64],
+    ) -> CorrelationAwareBatch:
+        """Decide every event for every variant of one batch."""
+        lead = rules[0]
+        running_context = RunningContext(
+            corr_col=lead.corr_col,
+            confidence_col=lead.confidence_col,
+        )
+
+        # Entry events: one per distinct entry index, last timing date wins
+        # (the dict semantics of _resolve_entry_dates).
+        entry_idx, owners = calendar.unique_entries(timing_entry_idx)
+        event_timing = [timing_dates[k] for k in owners.tolist()]
+        trading_dates: list[dt.date] = calendar.dates[entry_idx].tolist()
+
+        # Per-event inputs shared by every variant.
+        n_events = len(entry_idx)
+        signal = np.full(n_events, np.nan)
+        conf = np.full(n_events, np.nan)
+        regime = np.zeros(n_events, dtype=bool)
+        final_dir = np.zeros(n_events)
+        # Context table: 0 = empty; per event, one entered context then one
+        # per skip reason, in _check_skip order.
+        contexts: list[EntryContext] = [EntryContext.make_empty()]
+        ctx_base = np.zeros(n_events, dtype=np.int32)
+
+        for k, (timing_date, entry_date) in enumerate(zip(event_timing, trading_dates)):
+            row = data_source.get(timing_date)
+            if row is None:
+                continue
+            est = lead._estimate_signal(row, entry_date, None)
+            if est is None:
+                continue
+            c, f, shift = lead._get_corr_context(
+                row,
+                signal_rows,
+                running_context.corr_col_name,
+                running_context.conf_col_name,
+                running_context.regime_col_name,
+            )
+            raw_dir = _sign(est)
+            direction = raw_dir * _sign(c) if c and abs(c) > 0.01 else raw_dir
+            signal[k] = est
+            conf[k] = np.nan if f is None else f
+            regime[k] = shift is not None and shift != ""
+            final_dir[k] = direction
+
+            ctx_base[k] = len(contexts)
+            contexts.extend(
+                lead._build_context(
+                    row["_parsed_date"],
+                    est,
+                    c,
+                    f,
+                    shift,
+                    final_direction=final_direction,
+                    skip_reason=skip_reason,
+                )
+                for final_direction, skip_reason in (
+                    (int(direction), None),
+                    (0, "below_min_signal"),
+                    (0, "below_min_confidence"),
+                    (0, "regime_shift"),
+                )
+            )
+
+        # Variant × event decision surface.
+        min_signal = np.array([r.min_signal_abs for r in rules])[:, None]
+        min_conf = np.array([r.min_confidence for r in rules])[:, None]
+        skip_shifts = np.array([r.skip_regime_shifts for r in rules])[:, None]
+        scale = np.array([r.scale_by_confidence for r in rules])[:, None]
+
+        has_signal = ~np.isnan(signal)
+        has_conf = ~np.isnan(conf)
+        below_signal = np.abs(signal) < min_signal
+        below_conf = (min_conf > 0) & (~has_conf | (conf < min_conf))
+        regime_skip = skip_shifts & regime & ~below_signal & ~below_conf
+        skipped = has_signal & (below_signal | below_conf | regime_skip)
+        entered = has_signal & ~skipped
+
+        scaled = np.where(scale & has_conf, final_dir * conf, final_dir)
+        conf_or_zero = np.where(has_conf, conf, 0.0)
+        skip_offset = np.select([below_signal, below_conf, regime_skip], [1, 2, 3], 0)
+        context_ids = np.where(
+            entered,
+            ctx_base,
+            np.where(skipped, ctx_base + skip_offset, 0),
+        ).astype(np.int32)
+
+        return CorrelationAwareBatch(
+            n_days=len(calendar),
+            entry_idx=entry_idx,
+            positions=np.where(entered, scaled, 0.0),
+            strengths=np.repeat(
+                np.where(has_signal, signal, 0.0)[None, :], len(rules), axis=0
+            ),
+            confidences=np.where(entered, conf_or_zero, 0.0),
+            context_ids=context_ids,
+            contexts=tuple(contexts),
+        )
+
     # ── Private helpers ─────────────────────────────────────────────────
 
     def _build_daily_cumulative(
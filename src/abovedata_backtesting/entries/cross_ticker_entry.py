@@ -13,27 +13,29 @@ Lookahead protection:
 from __future__ import annotations
 
 import datetime as dt
-import warnings
+from bisect import bisect_left
 from dataclasses import dataclass, fields
 from itertools import product
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 import numpy as np
 import polars as pl
-from scipy import stats
 
-from abovedata_backtesting.data_loaders.load_signal_data import (
-    list_visible_cols,
-    load_signal_data,
-)
+from abovedata_backtesting.analytics.rank_ic import rolling_spearman
 from abovedata_backtesting.entries.entry_context import EntryContext
+from abovedata_backtesting.entries.entry_events import EntryEvents
 from abovedata_backtesting.entries.entry_signals import (
     EntryRule,
-    _apply_entry_positions,
     _resolve_entry_dates,
     _short_signal_col,
 )
+from abovedata_backtesting.entries.peer_signal_store import (
+    PeerSignalSeries,
+    PeerSignalStore,
+    default_peer_store,
+)
+from abovedata_backtesting.entries.trading_calendar import TradingCalendar
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
@@ -52,88 +54,6 @@ def _safe_float(val: Any) -> float | None:
         return None
 
 
-# ── Peer data loading (cached) ──────────────────────────────────────────────
-
-# Module-level cache for peer signal data.
-# Key: (ticker, method, visible_col) → list of (earnings_date, {signal_col: value})
-_peer_cache: dict[tuple[str, str, str], list[tuple[dt.date, dict[str, float]]]] = {}
-
-
-def _load_peer_signals(
-    ticker: str,
-    signal_cols: list[str],
-    method: str = "stl_p4_s7_robustTrue",
-) -> list[tuple[dt.date, dict[str, float]]]:
-    """Load peer's signal data.  Returns sorted list of (date, {col: value}).
-
-    Picks the best visible_col for the ticker (most non-null resid obs).
-    Caches the result at module level to avoid reloading across grid combos.
-    """
-    # Try the cache first.
-    vcs = list_visible_cols(ticker, method=method)
-    if not vcs:
-        return []
-
-    # Pick best visible_col (most non-null resid).
-    best_vc, best_count = vcs[0], 0
-    for vc in vcs:
-        resid_col = f"{vc}_resid"
-        try:
-            df = load_signal_data(
-                ticker, method=method, name="processed_data", visible_col=vc
-            )
-        except Exception:
-            continue
-        if resid_col in df.columns:
-            count = df[resid_col].drop_nulls().len()
-            if count > best_count:
-                best_count = count
-                best_vc = vc
-
-    cache_key = (ticker, method, best_vc)
-    if cache_key in _peer_cache:
-        return _peer_cache[cache_key]
-
-    try:
-        df = load_signal_data(
-            ticker, method=method, name="processed_data", visible_col=best_vc
-        )
-    except Exception:
-        _peer_cache[cache_key] = []
-        return []
-
-    if "earnings_date" not in df.columns:
-        _peer_cache[cache_key] = []
-        return []
-
-    resid_col = f"{best_vc}_resid"
-    # Build the list of (date, signal_values).
-    result: list[tuple[dt.date, dict[str, float]]] = []
-    for row in df.sort("earnings_date").iter_rows(named=True):
-        ed = row.get("earnings_date")
-        if ed is None:
-            continue
-        if isinstance(ed, dt.datetime):
-            ed = ed.date()
-
-        vals: dict[str, float] = {}
-        # Always include the resid column under "resid" key.
-        resid_val = _safe_float(row.get(resid_col))
-        if resid_val is not None:
-            vals["resid"] = resid_val
-
-        for col in signal_cols:
-            v = _safe_float(row.get(col))
-            if v is not None:
-                vals[col] = v
-
-        if vals:
-            result.append((ed, vals))
-
-    _peer_cache[cache_key] = result
-    return result
-
-
 # ── Peer selection helper ───────────────────────────────────────────────────
 
 
@@ -265,6 +185,11 @@ class CrossTickerEntry(EntryRule):
     and the peer signal contribution flips accordingly.
     """
 
+    # Reads peer signal files from disk, which the entry cache key can't see.
+    cacheable: ClassVar[bool] = False
+    # Peer signal data shared by every instance (and grid combo).
+    peer_store: ClassVar[PeerSignalStore] = default_peer_store
+
     target_ticker: str = ""
     peer_tickers: tuple[str, ...] = ()
     peer_signal_col: str = "resid"
@@ -305,6 +230,9 @@ class CrossTickerEntry(EntryRule):
             f.name: getattr(self, f.name) for f in fields(self)
         }
 
+    def input_columns(self) -> tuple[str, ...]:
+        return (self.date_col, self.own_signal_col)
+
     @classmethod
     def grid(cls, **param_lists: list[Any]) -> list[Self]:
         """Generate grid of instances from parameter lists.
@@ -359,43 +287,36 @@ class CrossTickerEntry(EntryRule):
         market_data: pl.DataFrame,
         signals: pl.DataFrame,
     ) -> pl.DataFrame:
-        if not self.peer_tickers:
-            return market_data.with_columns(
-                pl.lit(0.0).alias("position"),
-                pl.lit(0.0).alias("signal_strength"),
-                pl.lit(0.0).alias("confidence"),
-            )
+        return self.events(market_data, signals).to_daily(market_data)
 
-        # 1. Load peer signal data.
-        all_signal_cols = [self.peer_signal_col]
-        if self.peer_signal_col != "resid":
-            all_signal_cols.append("resid")
+    def events(
+        self,
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> EntryEvents:
+        if not self.peer_tickers:
+            return EntryEvents.empty(market_data.height)
 
-        peer_data: dict[str, list[tuple[dt.date, dict[str, float]]]] = {}
+        # 1. Peer signal series (loaded once per peer, shared across the grid).
+        peer_data: dict[str, PeerSignalSeries] = {}
         for pt in self.peer_tickers:
-            pd_list = _load_peer_signals(pt, signal_cols=all_signal_cols)
-            if pd_list:
-                peer_data[pt] = pd_list
+            series = self.peer_store.series(pt, self.peer_signal_col)
+            if len(series):
+                peer_data[pt] = series
 
         if not peer_data:
-            return market_data.with_columns(
-                pl.lit(0.0).alias("position"),
-                pl.lit(0.0).alias("signal_strength"),
-                pl.lit(0.0).alias("confidence"),
-            )
+            return EntryEvents.empty(market_data.height)
 
         # 2. Parse own signal rows.
         own_rows = self._parse_own_rows(signals)
         if not own_rows:
-            return market_data.with_columns(
-                pl.lit(0.0).alias("position"),
-                pl.lit(0.0).alias("signal_strength"),
-                pl.lit(0.0).alias("confidence"),
-            )
+            return EntryEvents.empty(market_data.height)
 
         timing_dates = [r["_date"] for r in own_rows]
         entry_map = _resolve_entry_dates(
-            market_data, timing_dates, self.entry_days_before
+            market_data, timing_dates, self.entry_days_before, calendar
         )
 
         # 3. Pre-compute forward returns for our ticker at past earnings dates.
@@ -411,6 +332,14 @@ class CrossTickerEntry(EntryRule):
             if fwd is not None:
                 own_fwd_rets[d] = fwd
 
+        # Rolling cross-IC series per peer, computed once for all entry dates.
+        rolling_ics = {
+            pt: self._rolling_cross_ic_series(
+                pt_data, own_fwd_rets, self.rolling_ic_window
+            )
+            for pt, pt_data in peer_data.items()
+        }
+
         # 4. Iterate over our earnings dates and compute entries.
         directions: dict[dt.date, float] = {}
         strengths: dict[dt.date, float] = {}
@@ -434,22 +363,16 @@ class CrossTickerEntry(EntryRule):
 
             for pt, pt_data in peer_data.items():
                 # a. Find peer's most recent prior signal.
-                peer_sig = self._find_prior_peer_signal(
-                    timing_date, pt_data, self.peer_signal_col
+                peer_sig = pt_data.latest_before(
+                    timing_date, self.max_peer_signal_age_days
                 )
                 if peer_sig is None:
                     continue
 
-                peer_date, peer_val = peer_sig
+                _peer_date, peer_val = peer_sig
 
-                # b. Compute rolling cross-IC: peer's past signals vs our past fwd returns.
-                rolling_ic = self._rolling_cross_ic(
-                    timing_date,
-                    pt_data,
-                    self.peer_signal_col,
-                    own_fwd_rets,
-                    self.rolling_ic_window,
-                )
+                # b. Rolling cross-IC: peer's past signals vs our past fwd returns.
+                rolling_ic = self._rolling_cross_ic_at(timing_date, *rolling_ics[pt])
 
                 # c. Adjust peer signal by relationship direction.
                 if rolling_ic is not None and abs(rolling_ic) > 0.01:
@@ -495,7 +418,7 @@ class CrossTickerEntry(EntryRule):
                 preprocessor_name=f"peers={','.join(self.peer_tickers[:3])}",
             )
 
-        return _apply_entry_positions(
+        return EntryEvents.from_entry_map(
             market_data, entry_map, directions, strengths, confidences, contexts
         )
 
@@ -521,78 +444,46 @@ class CrossTickerEntry(EntryRule):
 
         return rows
 
-    def _find_prior_peer_signal(
+    def _rolling_cross_ic_series(
         self,
-        our_date: dt.date,
-        peer_data: list[tuple[dt.date, dict[str, float]]],
-        signal_col: str,
-    ) -> tuple[dt.date, float] | None:
-        """Find the peer's most recent signal BEFORE our_date.
-
-        Only matches within max_peer_signal_age_days.
-        """
-        best: tuple[dt.date, float] | None = None
-        cutoff = our_date - dt.timedelta(days=self.max_peer_signal_age_days)
-
-        for peer_date, peer_vals in peer_data:
-            if peer_date >= our_date:
-                continue  # No lookahead.
-            if peer_date < cutoff:
-                continue  # Too old.
-
-            val = peer_vals.get(signal_col)
-            if val is None:
-                continue
-
-            if best is None or peer_date > best[0]:
-                best = (peer_date, val)
-
-        return best
-
-    def _rolling_cross_ic(
-        self,
-        current_date: dt.date,
-        peer_data: list[tuple[dt.date, dict[str, float]]],
-        signal_col: str,
+        peer_data: PeerSignalSeries,
         own_fwd_rets: dict[dt.date, float],
         window: int,
-    ) -> float | None:
-        """Compute rolling cross-IC: peer's signals vs our forward returns.
+    ) -> tuple[list[dt.date], np.ndarray]:
+        """Rolling cross-IC series: peer's signals vs our forward returns.
 
-        Only uses data strictly before current_date (no lookahead).
-        Returns the Spearman IC over the most recent `window` overlapping quarters.
+        Pairs (peer's most recent prior signal, our forward return) at each
+        of our earnings dates where the peer had a recent signal, in date
+        order. Element k of the returned IC series is the Spearman IC over
+        the most recent ``window`` pairs up to and including pair k.
         """
-        # Collect (peer_signal, our_fwd_return) pairs at our earnings dates
-        # where the peer had a recent signal.
-        pairs: list[tuple[float, float]] = []
-
-        # Get our earnings dates with forward returns (sorted, before current_date).
-        our_dates_sorted = sorted(d for d in own_fwd_rets.keys() if d < current_date)
-
-        for our_d in our_dates_sorted:
-            # Find peer's most recent signal before our_d.
-            peer_sig = self._find_prior_peer_signal(our_d, peer_data, signal_col)
-            if peer_sig is None:
-                continue
-
-            fwd = own_fwd_rets[our_d]
-            pairs.append((peer_sig[1], fwd))
-
-        # Use only the most recent `window` pairs.
-        if len(pairs) < 3:
-            return None
+        our_dates = sorted(own_fwd_rets)
+        # Peer's most recent signal before each of our dates (-1 = none).
+        peer_idx = peer_data.latest_before_many(
+            np.array(our_dates, dtype="datetime64[D]"),
+            self.max_peer_signal_age_days,
+        )
+        paired = np.flatnonzero(peer_idx >= 0)
 
-        pairs = pairs[-window:]
-        peer_arr = np.array([p[0] for p in pairs])
-        fwd_arr = np.array([p[1] for p in pairs])
+        pair_dates = [our_dates[k] for k in paired]
+        peer_vals = peer_data.values[peer_idx[paired]]
+        fwd_vals = np.array([own_fwd_rets[d] for d in pair_dates])
+        ics = rolling_spearman(peer_vals, fwd_vals, window, min_obs=1).ic
+        return pair_dates, ics
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            ic, _ = stats.spearmanr(peer_arr, fwd_arr)
+    @staticmethod
+    def _rolling_cross_ic_at(
+        current_date: dt.date, pair_dates: list[dt.date], rolling_ics: np.ndarray
+    ) -> float | None:
+        """Rolling cross-IC using only pairs strictly before current_date.
 
-        if not np.isfinite(ic):
+        None until at least 3 pairs exist (no lookahead past current_date).
+        """
+        n_prior = bisect_left(pair_dates, current_date)
+        if n_prior < 3:
             return None
-        return float(ic)
+        ic = rolling_ics[n_prior - 1]
+        return float(ic) if np.isfinite(ic) else None
 
     def _aggregate(
         self,
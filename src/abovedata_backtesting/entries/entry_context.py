@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import datetime as dt
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,6 +70,29 @@ class EntryContext:
     def make_empty(cls) -> EntryContext:
         return cls(entry_type="none")
 
+    def to_row(self) -> dict[str, Any]:
+        """Convert to a dict keyed by ENTRY_CONTEXT_COLUMNS (inverse of from_row)."""
+        return {
+            "entry_type": self.entry_type,
+            "entry_signal_col": self.signal_col,
+            "entry_signal_value": self.signal_value,
+            "entry_signal_date": self.signal_date,
+            "entry_raw_direction": self.raw_direction,
+            "entry_final_direction": self.final_direction,
+            "entry_flipped": self.flipped,
+            "entry_corr_col_used": self.corr_col_used,
+            "entry_corr_value_used": self.corr_value_used,
+            "entry_prior_quarter_corr": self.prior_quarter_corr,
+            "entry_confidence_col_used": self.confidence_col_used,
+            "entry_confidence_value_used": self.confidence_value_used,
+            "entry_correlation_regime": self.correlation_regime,
+            "entry_regime_shift_detected": self.regime_shift_detected,
+            "entry_regime_shift_skipped": self.regime_shift_skipped,
+            "entry_momentum_zscore": self.momentum_zscore,
+            "entry_lookback_days": self.lookback_days,
+            "entry_preprocessor_name": self.preprocessor_name,
+        }
+
     @classmethod
     def from_row(cls, row: dict) -> EntryContext | None:
         """Build EntryContext from a daily DataFrame row with entry_* columns."""
@@ -0,0 +1,335 @@
+"""Sparse, event-based entry output.
+
+Entry rules only act on a handful of signal dates per year, yet a daily
+frame repeats every forward-filled value (position, strength, confidence,
+signal_id and 18 context columns) on every trading day. ``EntryEvents``
+keeps one row per entry date instead, with contexts stored once in a shared
+table and referenced by id. The daily view is rebuilt on demand: as numpy
+arrays for exit evaluation, or as the full DataFrame for reports.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+
+from abovedata_backtesting.entries.entry_context import (
+    ENTRY_CONTEXT_COLUMNS,
+    EntryContext,
+)
+
+
+def _fill_missing(values: list[float | None]) -> NDArray[np.float64]:
+    """Forward-fill None like Polars forward_fill().fill_null(0) would."""
+    out = np.zeros(len(values), dtype=np.float64)
+    last = 0.0
+    for i, v in enumerate(values):
+        if v is not None:
+            last = v
+        out[i] = last
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class EntryEvents:
+    """
+    Entry rule output as one row per entry date.
+
+    Parameters
+    ----------
+    n_days : int
+        Number of rows in the market data the events index into.
+    entry_idx : (E,) int64
+        Sorted, unique market-data row index of each entry.
+    direction : (E,) float64
+        Position value from the entry date onward (0.0 = flat).
+    strength, confidence : (E,) float64
+        Signal strength / confidence forward-filled alongside the position.
+    signal_id : (E,) int32
+        Signal period id (1-based, in entry-date order).
+    context_id : (E,) int32
+        Index into ``contexts`` for each event.
+    contexts : tuple[EntryContext, ...]
+        Shared table of distinct entry contexts.
+    """
+
+    n_days: int
+    entry_idx: NDArray[np.int64]
+    direction: NDArray[np.float64]
+    strength: NDArray[np.float64]
+    confidence: NDArray[np.float64]
+    signal_id: NDArray[np.int32]
+    context_id: NDArray[np.int32]
+    contexts: tuple[EntryContext, ...] = ()
+
+    @property
+    def n_events(self) -> int:
+        return int(self.entry_idx.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the event arrays."""
+        return sum(
+            a.nbytes
+            for a in (
+                self.entry_idx,
+                self.direction,
+                self.strength,
+                self.confidence,
+                self.signal_id,
+                self.context_id,
+            )
+        )
+
+    @classmethod
+    def empty(cls, n_days: int) -> EntryEvents:
+        """No entries: flat for the whole period."""
+        return cls(
+            n_days=n_days,
+            entry_idx=np.empty(0, dtype=np.int64),
+            direction=np.empty(0, dtype=np.float64),
+            strength=np.empty(0, dtype=np.float64),
+            confidence=np.empty(0, dtype=np.float64),
+            signal_id=np.empty(0, dtype=np.int32),
+            context_id=np.empty(0, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_entry_map(
+        cls,
+        market_data: pl.DataFrame,
+        entry_map: dict[dt.date, dt.date],
+        directions: dict[dt.date, float],
+        strengths: dict[dt.date, float],
+        confidences: dict[dt.date, float],
+        contexts: dict[dt.date, EntryContext],
+    ) -> EntryEvents:
+        """Build events from the per-signal-date dicts entry rules produce.
+
+        ``entry_map`` maps entry_date → signal_date; the other dicts are keyed
+        by signal_date. Signal dates without a decision get a flat position
+        and an empty context, matching the daily-frame semantics.
+        """
+        if not entry_map:
+            return cls.empty(market_data.height)
+
+        # signal_id follows entry-date order over the whole map; dates absent
+        # from market_data keep their id slot but produce no event (as a join
+        # would drop them).
+        date_to_idx = {d: i for i, d in enumerate(market_data["date"].to_list())}
+        numbered = [
+            (date_to_idx[d], sid, entry_map[d])
+            for sid, d in enumerate(sorted(entry_map), start=1)
+            if d in date_to_idx
+        ]
+        numbered.sort()
+        sig_dates = [sig for _, _, sig in numbered]
+
+        table: dict[EntryContext, int] = {}
+        context_ids: list[int] = []
+        for sig_date in sig_dates:
+            ctx = contexts.get(sig_date, EntryContext.make_empty())
+            context_ids.append(table.setdefault(ctx, len(table)))
+
+        return cls(
+            n_days=market_data.height,
+            entry_idx=np.array([idx for idx, _, _ in numbered], dtype=np.int64),
+            direction=_fill_missing([directions.get(s, 0.0) for s in sig_dates]),
+            strength=_fill_missing([strengths.get(s, 0.0) for s in sig_dates]),
+            confidence=_fill_missing([confidences.get(s, 0.0) for s in sig_dates]),
+            signal_id=np.array([sid for _, sid, _ in numbered], dtype=np.int32),
+            context_id=np.array(context_ids, dtype=np.int32),
+            contexts=tuple(table),
+        )
+
+    @classmethod
+    def from_shared_contexts(
+        cls,
+        n_days: int,
+        entry_idx: NDArray[np.int64],
+        direction: NDArray[np.float64],
+        strength: NDArray[np.float64],
+        confidence: NDArray[np.float64],
+        context_ids: NDArray[np.int32],
+        contexts: tuple[EntryContext, ...],
+    ) -> EntryEvents:
+        """Build events whose contexts index a table shared by many variants.
+
+        ``entry_idx`` must be sorted and unique; signal ids are 1..E. Only
+        the contexts the events use are kept, renumbered in first-use order
+        as from_entry_map would produce them.
+        """
+        n_events = int(entry_idx.shape[0])
+        if n_events == 0:
+            return cls.empty(n_days)
+
+        used, first = np.unique(context_ids, return_index=True)
+        order = used[np.argsort(first)]
+        remap = np.empty(len(contexts), dtype=np.int32)
+        remap[order] = np.arange(len(order), dtype=np.int32)
+
+        return cls(
+            n_days=n_days,
+            entry_idx=entry_idx,
+            direction=direction,
+            strength=strength,
+            confidence=confidence,
+            signal_id=np.arange(1, n_events + 1, dtype=np.int32),
+            context_id=remap[context_ids],
+            contexts=tuple(contexts[i] for i in order.tolist()),
+        )
+
+    @classmethod
+    def from_daily(cls, daily: pl.DataFrame) -> EntryEvents:
+        """Recover events from a daily entry frame (for custom entry rules).
+
+        Events start wherever ``signal_id`` changes to a non-zero id, or —
+        without a signal_id column — wherever the position value changes.
+        """
+        n = daily.height
+        positions = daily["position"].fill_null(0.0).to_numpy().astype(np.float64)
+        if "signal_id" in daily.columns:
+            sids = daily["signal_id"].fill_null(0).to_numpy().astype(np.int32)
+            prev = np.concatenate([[0], sids[:-1]]) if n else sids
+            starts = np.flatnonzero((sids != prev) & (sids != 0))
+        else:
+            prev_pos = np.concatenate([[0.0], positions[:-1]]) if n else positions
+            starts = np.flatnonzero(positions != prev_pos)
+            sids = np.zeros(n, dtype=np.int32)
+            sids[starts] = np.arange(1, len(starts) + 1, dtype=np.int32)
+
+        def _col(name: str) -> NDArray[np.float64]:
+            if name not in daily.columns:
+                return np.zeros(len(starts), dtype=np.float64)
+            values = daily[name].fill_null(0.0).to_numpy().astype(np.float64)
+            return values[starts]
+
+        table: dict[EntryContext, int] = {}
+        context_ids: list[int] = []
+        has_context = all(c in daily.columns for c in ENTRY_CONTEXT_COLUMNS)
+        context_rows = (
+            daily[starts.tolist()].select(ENTRY_CONTEXT_COLUMNS).to_dicts()
+            if has_context
+            else [{} for _ in starts]
+        )
+        for row in context_rows:
+            ctx = EntryContext.from_row(row) if row else None
+            ctx = ctx if ctx is not None else EntryContext.make_empty()
+            context_ids.append(table.setdefault(ctx, len(table)))
+
+        return cls(
+            n_days=n,
+            entry_idx=starts.astype(np.int64),
+            direction=positions[starts],
+            strength=_col("signal_strength"),
+            confidence=_col("confidence"),
+            signal_id=sids[starts].astype(np.int32),
+            context_id=np.array(context_ids, dtype=np.int32),
+            contexts=tuple(table),
+        )
+
+    def with_position_filter(
+        self, pos_filter: Literal["long_short", "long_only", "short_only"]
+    ) -> EntryEvents:
+        """Zero out event directions excluded by the position filter."""
+        if pos_filter == "long_only":
+            direction = np.where(self.direction > 0, self.direction, 0.0)
+        elif pos_filter == "short_only":
+            direction = np.where(self.direction < 0, self.direction, 0.0)
+        else:
+            return self
+        return EntryEvents(
+            n_days=self.n_days,
+            entry_idx=self.entry_idx,
+            direction=direction,
+            strength=self.strength,
+            confidence=self.confidence,
+            signal_id=self.signal_id,
+            context_id=self.context_id,
+            contexts=self.contexts,
+        )
+
+    def _segments(self) -> NDArray[np.int64]:
+        """Per-day event number (0 before the first event, else 1..E)."""
+        marker = np.zeros(self.n_days, dtype=np.int64)
+        marker[self.entry_idx] = np.arange(1, self.n_events + 1, dtype=np.int64)
+        return np.maximum.accumulate(marker) if self.n_days else marker
+
+    def daily_arrays(
+        self,
+    ) -> tuple[
+        NDArray[np.float64], NDArray[np.int32], NDArray[np.float64], NDArray[np.float64]
+    ]:
+        """Forward-filled (positions, signal_ids, strengths, confs) per day."""
+        seg = self._segments()
+        zero_f = np.zeros(1, dtype=np.float64)
+        return (
+            np.concatenate([zero_f, self.direction])[seg],
+            np.concatenate([np.zeros(1, dtype=np.int32), self.signal_id])[seg],
+            np.concatenate([zero_f, self.strength])[seg],
+            np.concatenate([zero_f, self.confidence])[seg],
+        )
+
+    def to_daily(self, market_data: pl.DataFrame) -> pl.DataFrame:
+        """Rebuild the daily entry frame (market data + forward-filled columns).
+
+        Writes:
+            position, signal_strength, confidence, signal_id
+            + entry context columns
+        """
+        if self.n_events == 0:
+            return market_data.with_columns(
+                pl.lit(0.0).alias("position"),
+                pl.lit(0.0).alias("signal_strength"),
+                pl.lit(0.0).alias("confidence"),
+            )
+
+        dates = market_data["date"].to_list()
+        rows: list[dict[str, Any]] = []
+        for e in range(self.n_events):
+            row: dict[str, Any] = {
+                "_entry_date": dates[int(self.entry_idx[e])],
+                "_position": float(self.direction[e]),
+                "_signal_strength": float(self.strength[e]),
+                "_confidence": float(self.confidence[e]),
+                "_signal_id": int(self.signal_id[e]),
+            }
+            ctx_row = self.contexts[int(self.context_id[e])].to_row()
+            for col in ENTRY_CONTEXT_COLUMNS:
+                row[f"_{col}"] = ctx_row.get(col, None)
+            rows.append(row)
+
+        # Join onto market_data by date
+        result = market_data.join(
+            pl.DataFrame(rows),
+            left_on="date",
+            right_on="_entry_date",
+            how="left",
+        )
+
+        # Forward-fill columns
+        for src, dst, dtype in [
+            ("_position", "position", pl.Float64),
+            ("_signal_strength", "signal_strength", pl.Float64),
+            ("_confidence", "confidence", pl.Float64),
+            ("_signal_id", "signal_id", pl.Int32),
+        ]:
+            result = result.with_columns(
+                pl.col(src).forward_fill().fill_null(0).cast(dtype).alias(dst),
+            )
+
+        # Forward-fill context columns
+        for col in ENTRY_CONTEXT_COLUMNS:
+            if f"_{col}" in result.columns:
+                result = result.with_columns(
+                    pl.col(f"_{col}").forward_fill().alias(col),
+                )
+
+        # Drop temporary columns
+        drop_cols = [c for c in result.columns if c.startswith("_")]
+        return result.drop(drop_cols)
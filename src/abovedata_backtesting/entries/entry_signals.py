@@ -2,17 +2,18 @@ from __future__ import annotations
 
 import datetime as dt
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from itertools import product
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 import numpy as np
 import polars as pl
+from numpy.typing import NDArray
 
-from abovedata_backtesting.entries.entry_context import (
-    ENTRY_CONTEXT_COLUMNS,
-    EntryContext,
-)
+from abovedata_backtesting.entries.entry_context import EntryContext
+from abovedata_backtesting.entries.entry_events import EntryEvents
+from abovedata_backtesting.entries.trading_calendar import TradingCalendar
 
 
 def _short_signal_col(col: str) -> str:
@@ -30,6 +31,16 @@ def _short_signal_col(col: str) -> str:
 class EntryRule(ABC):
     """Abstract base class for entry signal logic."""
 
+    # False for rules that read inputs other than (market_data, signals),
+    # e.g. peer files on disk — their outputs must not be persisted by a
+    # content-addressed cache keyed on those two frames.
+    cacheable: ClassVar[bool] = True
+
+    # True for rules whose batch_events() evaluates many variants in one
+    # pass; grid runners then hand all of a preprocessor's variants of the
+    # rule type to a single batch_events() call.
+    batchable: ClassVar[bool] = False
+
     @abstractmethod
     def apply(
         self,
@@ -37,6 +48,47 @@ class EntryRule(ABC):
         signals: pl.DataFrame,
     ) -> pl.DataFrame: ...
 
+    def events(
+        self,
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> EntryEvents:
+        """Entry output as sparse events (one row per entry date).
+
+        The default derives events from apply(); built-in rules override this
+        and build their daily frame from it instead. ``calendar`` is the
+        run's shared TradingCalendar for ``market_data``, if one was built.
+        """
+        return EntryEvents.from_daily(self.apply(market_data, signals))
+
+    @classmethod
+    def batch_events(
+        cls,
+        rules: Sequence[Self],
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> list[EntryEvents]:
+        """Events for many variants of this rule on the same inputs.
+
+        Returns one EntryEvents per rule, in order. The default evaluates each
+        rule on its own; rules that set ``batchable`` share work across the
+        grid instead.
+        """
+        return [rule.events(market_data, signals, calendar=calendar) for rule in rules]
+
+    def input_columns(self) -> tuple[str, ...] | None:
+        """Signal columns events() reads, or None if it may read any column.
+
+        Grid runners fingerprint only these columns of each preprocessed
+        signal frame, so preprocessors that differ only in other columns
+        share one evaluation. Listed columns may be absent from a frame.
+        """
+        return None
+
     @property
     @abstractmethod
     def name(self) -> str: ...
@@ -53,26 +105,16 @@ def _resolve_entry_dates(
     market_data: pl.DataFrame,
     signal_dates: list[dt.date],
     entry_days_before: int,
+    calendar: TradingCalendar | None = None,
 ) -> dict[dt.date, dt.date]:
-    """Map each signal_date to an entry_date N trading days before it."""
-    trading_dates = market_data["date"].to_list()
-    date_to_idx = {d: i for i, d in enumerate(trading_dates)}
-
-    entry_map: dict[dt.date, dt.date] = {}
-    for sig_date in signal_dates:
-        if sig_date not in date_to_idx:
-            candidates = [d for d in trading_dates if d <= sig_date]
-            if not candidates:
-                continue
-            sig_idx = date_to_idx[candidates[-1]]
-        else:
-            sig_idx = date_to_idx[sig_date]
-
-        entry_idx = sig_idx - entry_days_before
-        if entry_idx >= 0:
-            entry_map[trading_dates[entry_idx]] = sig_date
+    """Map each signal_date to an entry_date N trading days before it.
 
-    return entry_map
+    ``calendar`` is the run's shared index of ``market_data``; one is built
+    on the fly when it is not supplied.
+    """
+    if calendar is None:
+        calendar = TradingCalendar.from_market_data(market_data)
+    return calendar.entry_map(signal_dates, entry_days_before)
 
 
 def _apply_entry_positions(
@@ -86,66 +128,13 @@ def _apply_entry_positions(
     """
     Apply sparse entry positions to market data, then forward-fill.
 
-    Vectorized implementation: builds a sparse entries DataFrame,
-    joins onto market_data by entry_date, then forward-fills.
-
     Writes:
         position, signal_strength, confidence, signal_id
         + entry context columns (if contexts provided)
     """
-    # Build sparse entries DataFrame: one row per entry date
-    rows: list[dict[str, Any]] = []
-    for signal_id, entry_date in enumerate(sorted(entry_map.keys()), start=1):
-        sig_date = entry_map[entry_date]
-        row: dict[str, Any] = {
-            "_entry_date": entry_date,
-            "_position": directions.get(sig_date, 0.0),
-            "_signal_strength": strengths.get(sig_date, 0.0),
-            "_confidence": confidences.get(sig_date, 0.0),
-            "_signal_id": signal_id,
-        }
-        # Add context columns
-        ctx_row = _context_to_row(contexts.get(sig_date, EntryContext.make_empty()))
-        for col in ENTRY_CONTEXT_COLUMNS:
-            row[f"_{col}"] = ctx_row.get(col, None)
-
-        rows.append(row)
-
-    # Join onto market_data by date
-    result = market_data.join(
-        pl.DataFrame(rows),
-        left_on="date",
-        right_on="_entry_date",
-        how="left",
-    )
-
-    # Forward-fill columns
-    for src, dst, dtype in [
-        ("_position", "position", pl.Float64),
-        ("_signal_strength", "signal_strength", pl.Float64),
-        ("_confidence", "confidence", pl.Float64),
-        ("_signal_id", "signal_id", pl.Int32),
-    ]:
-        result = result.with_columns(
-            pl.col(src)
-            .forward_fill()
-            .fill_null(0 if dtype != pl.Int32 else 0)
-            .cast(dtype)
-            .alias(dst),
-        )
-
-    # Forward-fill context columns
-    for col in ENTRY_CONTEXT_COLUMNS:
-        if f"_{col}" in result.columns:
-            result = result.with_columns(
-                pl.col(f"_{col}").forward_fill().alias(col),
-            )
-
-    # Drop temporary columns
-    drop_cols = [c for c in result.columns if c.startswith("_")]
-    result = result.drop(drop_cols)
-
-    return result
+    return EntryEvents.from_entry_map(
+        market_data, entry_map, directions, strengths, confidences, contexts
+    ).to_daily(market_data)
 
 
 def enforce_max_entries(
@@ -241,30 +230,6 @@ def enforce_max_entries_fast(
     )
 
 
-def _context_to_row(ctx: EntryContext) -> dict[str, Any]:
-    """Convert an EntryContext to a dict matching ENTRY_CONTEXT_COLUMNS."""
-    return {
-        "entry_type": ctx.entry_type,
-        "entry_signal_col": ctx.signal_col,
-        "entry_signal_value": ctx.signal_value,
-        "entry_signal_date": ctx.signal_date,
-        "entry_raw_direction": ctx.raw_direction,
-        "entry_final_direction": ctx.final_direction,
-        "entry_flipped": ctx.flipped,
-        "entry_corr_col_used": ctx.corr_col_used,
-        "entry_corr_value_used": ctx.corr_value_used,
-        "entry_prior_quarter_corr": ctx.prior_quarter_corr,
-        "entry_confidence_col_used": ctx.confidence_col_used,
-        "entry_confidence_value_used": ctx.confidence_value_used,
-        "entry_correlation_regime": ctx.correlation_regime,
-        "entry_regime_shift_detected": ctx.regime_shift_detected,
-        "entry_regime_shift_skipped": ctx.regime_shift_skipped,
-        "entry_momentum_zscore": ctx.momentum_zscore,
-        "entry_lookback_days": ctx.lookback_days,
-        "entry_preprocessor_name": ctx.preprocessor_name,
-    }
-
-
 # =============================================================================
 # Momentum (price-based entry, timed to signal dates)
 # =============================================================================
@@ -280,6 +245,8 @@ class MomentumEntry(EntryRule):
     entry_days_before: int = 0
     date_col: str = "earnings_date"
 
+    batchable: ClassVar[bool] = True
+
     @property
     def name(self) -> str:
         return f"momentum_lb{self.lookback_days}_z{self.zscore_threshold}_e{self.entry_days_before}d"
@@ -293,6 +260,9 @@ class MomentumEntry(EntryRule):
             "entry_days_before": self.entry_days_before,
         }
 
+    def input_columns(self) -> tuple[str, ...]:
+        return (self.date_col,)
+
     @classmethod
     def grid(
         cls,
@@ -318,11 +288,20 @@ class MomentumEntry(EntryRule):
         market_data: pl.DataFrame,
         signals: pl.DataFrame,
     ) -> pl.DataFrame:
+        return self.events(market_data, signals).to_daily(market_data)
+
+    def events(
+        self,
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> EntryEvents:
         signal_dates = (
             signals[self.date_col].cast(pl.Date).drop_nulls().unique().sort().to_list()
         )
         entry_map = _resolve_entry_dates(
-            market_data, signal_dates, self.entry_days_before
+            market_data, signal_dates, self.entry_days_before, calendar
         )
 
         momentum = pl.col("close") / pl.col("close").shift(self.lookback_days) - 1
@@ -377,10 +356,149 @@ class MomentumEntry(EntryRule):
                 lookback_days=self.lookback_days,
             )
 
-        return _apply_entry_positions(
+        return EntryEvents.from_entry_map(
             market_data, entry_map, directions, strengths, confidences, contexts
         )
 
+    @classmethod
+    def batch_events(
+        cls,
+        rules: Sequence[Self],
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> list[EntryEvents]:
+        """Events for many variants from one momentum z-score surface.
+
+        The z-scores of every (lookback_days, zscore_window) pair are computed
+        in a single Polars pass (the same expressions as events(), so values
+        match bit for bit). Entry dates for every entry_days_before come from
+        one calendar call per date_col; thresholds are then array masks over
+        the z-scores gathered at each variant's entry events.
+        """
+        if calendar is None:
+            calendar = TradingCalendar.from_market_data(market_data)
+
+        pairs = list(dict.fromkeys((r.lookback_days, r.zscore_window) for r in rules))
+        surface = _momentum_zscores(market_data, pairs)
+
+        out: list[EntryEvents] = []
+        timings: dict[str, tuple[list[int], NDArray[np.int64], list[dt.date]]] = {}
+        tables: dict[
+            tuple[str, int, int, int],
+            tuple[NDArray[np.int64], NDArray[np.float64], tuple[EntryContext, ...]],
+        ] = {}
+        for rule in rules:
+            if rule.date_col not in timings:
+                signal_dates = (
+                    signals[rule.date_col]
+                    .cast(pl.Date)
+                    .drop_nulls()
+                    .unique()
+                    .sort()
+                    .to_list()
+                )
+                offsets = sorted({r.entry_days_before for r in rules})
+                timings[rule.date_col] = (
+                    offsets,
+                    calendar.entry_indices(signal_dates, offsets),
+                    signal_dates,
+                )
+
+            # Events and candidate contexts shared by all thresholds.
+            key = (
+                rule.date_col,
+                rule.entry_days_before,
+                rule.lookback_days,
+                rule.zscore_window,
+            )
+            if key not in tables:
+                offsets, entry_idx, signal_dates = timings[rule.date_col]
+                events, owners = calendar.unique_entries(
+                    entry_idx[:, offsets.index(rule.entry_days_before)]
+                )
+                z = surface[
+                    events, pairs.index((rule.lookback_days, rule.zscore_window))
+                ]
+                tables[key] = (
+                    events,
+                    z,
+                    _momentum_contexts(
+                        [signal_dates[k] for k in owners.tolist()],
+                        z,
+                        rule.lookback_days,
+                    ),
+                )
+            events, z, contexts = tables[key]
+
+            valid = ~np.isnan(z)
+            direction = np.where(
+                valid & (z > rule.zscore_threshold),
+                1.0,
+                np.where(valid & (z < -rule.zscore_threshold), -1.0, 0.0),
+            )
+            # Context table: 0 = empty, then (-1, 0, +1) per event.
+            context_ids = np.where(
+                valid, 2 + 3 * np.arange(len(z)) + direction.astype(np.int32), 0
+            ).astype(np.int32)
+            out.append(
+                EntryEvents.from_shared_contexts(
+                    market_data.height,
+                    events,
+                    direction,
+                    np.where(valid, z, 0.0),
+                    np.where(valid, np.minimum(1.0, np.abs(z) / 3.0), 0.0),
+                    context_ids,
+                    contexts,
+                )
+            )
+        return out
+
+
+def _momentum_zscores(
+    market_data: pl.DataFrame, pairs: list[tuple[int, int]]
+) -> NDArray[np.float64]:
+    """Momentum z-score per day for each (lookback_days, zscore_window) pair.
+
+    Returns an (n_days, len(pairs)) array, NaN where the z-score is null or
+    NaN. Uses MomentumEntry.events()'s expressions, all in one select.
+    """
+    if not pairs:
+        return np.empty((market_data.height, 0), dtype=np.float64)
+    exprs: list[pl.Expr] = []
+    for i, (lookback, window) in enumerate(pairs):
+        momentum = pl.col("close") / pl.col("close").shift(lookback) - 1
+        lagged_momentum = momentum.shift(1)
+        exprs.append(
+            (
+                (momentum - lagged_momentum.rolling_mean(window))
+                / lagged_momentum.rolling_std(window)
+            ).alias(f"_z{i}")
+        )
+    return market_data.select(exprs).to_numpy().astype(np.float64)
+
+
+def _momentum_contexts(
+    sig_dates: list[dt.date], z: NDArray[np.float64], lookback_days: int
+) -> tuple[EntryContext, ...]:
+    """Empty context, then the short / flat / long context of each event."""
+    contexts = [EntryContext.make_empty()]
+    for sig_date, zscore in zip(sig_dates, z.tolist()):
+        contexts.extend(
+            EntryContext(
+                entry_type="momentum",
+                signal_date=sig_date,
+                raw_direction=direction,
+                final_direction=direction,
+                flipped=False,
+                momentum_zscore=zscore if zscore == zscore else None,
+                lookback_days=lookback_days,
+            )
+            for direction in (-1, 0, 1)
+        )
+    return tuple(contexts)
+
 
 # =============================================================================
 # Signal threshold (fundamental only)
@@ -414,6 +532,10 @@ class SignalThresholdEntry(EntryRule):
             "entry_days_before": self.entry_days_before,
         }
 
+    def input_columns(self) -> tuple[str, ...]:
+        optional = (self.confidence_col,) if self.confidence_col else ()
+        return (self.date_col, self.signal_col, *optional)
+
     @classmethod
     def grid(
         cls,
@@ -441,12 +563,17 @@ class SignalThresholdEntry(EntryRule):
         market_data: pl.DataFrame,
         signals: pl.DataFrame,
     ) -> pl.DataFrame:
+        return self.events(market_data, signals).to_daily(market_data)
+
+    def events(
+        self,
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> EntryEvents:
         if self.signal_col not in signals.columns:
-            return market_data.with_columns(
-                pl.lit(0.0).alias("position"),
-                pl.lit(0.0).alias("signal_strength"),
-                pl.lit(0.0).alias("confidence"),
-            )
+            return EntryEvents.empty(market_data.height)
 
         sig_rows = signals.select(
             pl.col(self.date_col).cast(pl.Date).alias("sig_date"),
@@ -467,7 +594,7 @@ class SignalThresholdEntry(EntryRule):
         )
 
         entry_map = _resolve_entry_dates(
-            market_data, signal_dates, self.entry_days_before
+            market_data, signal_dates, self.entry_days_before, calendar
         )
 
         directions: dict[dt.date, float] = {}
@@ -507,7 +634,7 @@ class SignalThresholdEntry(EntryRule):
                 confidence_value_used=conf_val,
             )
 
-        return _apply_entry_positions(
+        return EntryEvents.from_entry_map(
             market_data, entry_map, directions, strengths, confidences, contexts
         )
 
@@ -550,6 +677,9 @@ class DivergenceEntry(EntryRule):
             "entry_days_before": self.entry_days_before,
         }
 
+    def input_columns(self) -> tuple[str, ...]:
+        return (self.date_col, self.signal_col)
+
     @classmethod
     def grid(
         cls,
@@ -579,12 +709,17 @@ class DivergenceEntry(EntryRule):
         market_data: pl.DataFrame,
         signals: pl.DataFrame,
     ) -> pl.DataFrame:
+        return self.events(market_data, signals).to_daily(market_data)
+
+    def events(
+        self,
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> EntryEvents:
         if self.signal_col not in signals.columns:
-            return market_data.with_columns(
-                pl.lit(0.0).alias("position"),
-                pl.lit(0.0).alias("signal_strength"),
-                pl.lit(0.0).alias("confidence"),
-            )
+            return EntryEvents.empty(market_data.height)
 
         momentum = pl.col("close") / pl.col("close").shift(self.lookback_days) - 1
         lagged_momentum = momentum.shift(1)
@@ -616,7 +751,7 @@ class DivergenceEntry(EntryRule):
         signal_vals = dict(zip(signal_dates, sig_rows["sig_val"].to_list()))
 
         entry_map = _resolve_entry_dates(
-            market_data, signal_dates, self.entry_days_before
+            market_data, signal_dates, self.entry_days_before, calendar
         )
 
         directions: dict[dt.date, float] = {}
@@ -667,7 +802,7 @@ class DivergenceEntry(EntryRule):
                 confidence_value_used=conf_val,
             )
 
-        return _apply_entry_positions(
+        return EntryEvents.from_entry_map(
             market_data, entry_map, directions, strengths, confidences, contexts
         )
 
@@ -707,6 +842,9 @@ class SignalMomentumEntry(EntryRule):
             "entry_days_before": self.entry_days_before,
         }
 
+    def input_columns(self) -> tuple[str, ...]:
+        return (self.date_col, self.signal_col)
+
     @classmethod
     def grid(
         cls,
@@ -734,12 +872,17 @@ class SignalMomentumEntry(EntryRule):
         market_data: pl.DataFrame,
         signals: pl.DataFrame,
     ) -> pl.DataFrame:
+        return self.events(market_data, signals).to_daily(market_data)
+
+    def events(
+        self,
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> EntryEvents:
         if self.signal_col not in signals.columns:
-            return market_data.with_columns(
-                pl.lit(0.0).alias("position"),
-                pl.lit(0.0).alias("signal_strength"),
-                pl.lit(0.0).alias("confidence"),
-            )
+            return EntryEvents.empty(market_data.height)
 
         momentum = pl.col("close") / pl.col("close").shift(self.lookback_days) - 1
         lagged_momentum = momentum.shift(1)
@@ -771,7 +914,7 @@ class SignalMomentumEntry(EntryRule):
         signal_vals = dict(zip(signal_dates, sig_rows["sig_val"].to_list()))
 
         entry_map = _resolve_entry_dates(
-            market_data, signal_dates, self.entry_days_before
+            market_data, signal_dates, self.entry_days_before, calendar
         )
 
         directions: dict[dt.date, float] = {}
@@ -817,7 +960,7 @@ class SignalMomentumEntry(EntryRule):
                 confidence_value_used=conf_val,
             )
 
-        return _apply_entry_positions(
+        return EntryEvents.from_entry_map(
             market_data, entry_map, directions, strengths, confidences, contexts
         )
 
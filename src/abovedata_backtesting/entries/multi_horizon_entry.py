@@ -15,12 +15,13 @@ from typing import Any, Literal, Self
 import polars as pl
 
 from abovedata_backtesting.entries.entry_context import EntryContext
+from abovedata_backtesting.entries.entry_events import EntryEvents
 from abovedata_backtesting.entries.entry_signals import (
     EntryRule,
-    _apply_entry_positions,
     _resolve_entry_dates,
     _short_signal_col,
 )
+from abovedata_backtesting.entries.trading_calendar import TradingCalendar
 
 MultiHorizonStrategy = Literal["consensus", "momentum", "reversal", "weighted"]
 
@@ -89,6 +90,20 @@ class MultiHorizonEntry(EntryRule):
             "entry_days_before": self.entry_days_before,
         }
 
+    def input_columns(self) -> tuple[str, ...]:
+        from abovedata_backtesting.entries.correlation_aware_entry import (
+            _CORR_COL_MAP,
+        )
+
+        horizon_cols = tuple(
+            self.signal_col if h == 0 else f"{self.signal_col}_lag{h}q"
+            for h in self.horizons
+        )
+        corr = (
+            (_CORR_COL_MAP.get(self.corr_col, self.corr_col),) if self.corr_col else ()
+        )
+        return (self.date_col, self.signal_col, *horizon_cols, *corr)
+
     @classmethod
     def grid(
         cls,
@@ -123,6 +138,15 @@ class MultiHorizonEntry(EntryRule):
         market_data: pl.DataFrame,
         signals: pl.DataFrame,
     ) -> pl.DataFrame:
+        return self.events(market_data, signals).to_daily(market_data)
+
+    def events(
+        self,
+        market_data: pl.DataFrame,
+        signals: pl.DataFrame,
+        *,
+        calendar: TradingCalendar | None = None,
+    ) -> EntryEvents:
         # Resolve column names for each horizon
         col_map: dict[int, str] = {}
         for h in self.horizons:
@@ -138,11 +162,7 @@ class MultiHorizonEntry(EntryRule):
             if self.signal_col in signals.columns and 0 in col_map:
                 col_map = {0: self.signal_col}
             else:
-                return market_data.with_columns(
-                    pl.lit(0.0).alias("position"),
-                    pl.lit(0.0).alias("signal_strength"),
-                    pl.lit(0.0).alias("confidence"),
-                )
+                return EntryEvents.empty(market_data.height)
 
         # Optional correlation column
         corr_col_name = None
@@ -166,7 +186,7 @@ class MultiHorizonEntry(EntryRule):
             signal_dates.append(ed)
 
         entry_map = _resolve_entry_dates(
-            market_data, signal_dates, self.entry_days_before
+            market_data, signal_dates, self.entry_days_before, calendar
         )
 
         # Build lookup: date -> row
@@ -233,7 +253,7 @@ class MultiHorizonEntry(EntryRule):
                 confidence_value_used=conf,
             )
 
-        return _apply_entry_positions(
+        return EntryEvents.from_entry_map(
             market_data, entry_map, directions, strengths, confidences, contexts
         )
 
@@ -0,0 +1,195 @@
+"""Shared, as-of indexed peer signal data for CrossTickerEntry.
+
+Every CrossTickerEntry in a grid asks the same questions of the same peer
+files: "what was peer P's latest <signal> before date D, if no older than
+N days?". The store answers them from sorted NumPy arrays:
+
+  - Each peer's best visible_col (most non-null residuals) is chosen once,
+    and its processed_data file is read once, per (ticker, method).
+  - Each requested signal column becomes a ``PeerSignalSeries`` of sorted
+    dates and non-null values, built on first use and then reused.
+  - As-of lookups use ``searchsorted``, one date or many at a time.
+
+The store is thread safe (loads happen under a lock) and picklable, so a
+warmed store can be handed to worker processes.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+
+from abovedata_backtesting.data_loaders.load_signal_data import (
+    list_visible_cols,
+    load_signal_data,
+)
+
+DEFAULT_METHOD = "stl_p4_s7_robustTrue"
+
+
+@dataclass(frozen=True, slots=True)
+class PeerSignalSeries:
+    """One peer signal column: sorted dates with non-null values."""
+
+    dates: NDArray[np.datetime64]
+    values: NDArray[np.float64]
+
+    @classmethod
+    def empty(cls) -> PeerSignalSeries:
+        return cls(np.empty(0, dtype="datetime64[D]"), np.empty(0))
+
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame, date_col: str, col: str) -> PeerSignalSeries:
+        """Non-null, non-NaN values of ``col`` by date (stable date order)."""
+        if col not in df.columns:
+            return cls.empty()
+        rows = (
+            df.select(
+                pl.col(date_col).cast(pl.Date).alias("date"),
+                pl.col(col).cast(pl.Float64, strict=False).alias("value"),
+            )
+            .filter(pl.col("date").is_not_null() & pl.col("value").is_not_nan())
+            .sort("date", maintain_order=True)
+        )
+        return cls(
+            dates=rows["date"].to_numpy().astype("datetime64[D]"),
+            values=rows["value"].to_numpy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def latest_before_many(
+        self, dates: NDArray[np.datetime64], max_age_days: int
+    ) -> NDArray[np.int64]:
+        """Index of the latest signal strictly before each date, or -1.
+
+        Signals older than ``max_age_days`` before the date don't count. If
+        several signals share the latest date, the first one is used.
+        """
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        last = np.searchsorted(self.dates, dates, side="left") - 1
+        found = last >= 0
+        idx = np.full(len(dates), -1, dtype=np.int64)
+        if not found.any():
+            return idx
+        prior = self.dates[last[found]]
+        first = np.searchsorted(self.dates, prior, side="left")
+        fresh = prior >= dates[found] - np.timedelta64(max_age_days, "D")
+        idx[np.flatnonzero(found)[fresh]] = first[fresh]
+        return idx
+
+    def latest_before(
+        self, date: dt.date, max_age_days: int
+    ) -> tuple[dt.date, float] | None:
+        """(date, value) of the latest signal strictly before ``date``."""
+        i = int(self.latest_before_many(np.array([date]), max_age_days)[0])
+        if i < 0:
+            return None
+        return self.dates[i].item(), float(self.values[i])
+
+
+@dataclass
+class PeerSignalStore:
+    """Peer signal files, loaded once and indexed for as-of lookups.
+
+    Parameters
+    ----------
+    method : str
+        Default signal method (sub-directory under signal-data).
+    """
+
+    method: str = DEFAULT_METHOD
+    _frames: dict[tuple[str, str], tuple[str, pl.DataFrame] | None] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _series: dict[tuple[str, str, str], PeerSignalSeries] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False
+    )
+
+    def series(
+        self, ticker: str, signal_col: str, method: str | None = None
+    ) -> PeerSignalSeries:
+        """Peer's ``signal_col`` series ("resid" = its best visible_col residual).
+
+        Empty when the peer has no usable signal data.
+        """
+        method = method or self.method
+        key = (ticker, method, signal_col)
+        if (cached := self._series.get(key)) is not None:
+            return cached
+        with self._lock:
+            if (cached := self._series.get(key)) is not None:
+                return cached
+            loaded = self._load(ticker, method)
+            if loaded is None:
+                series = PeerSignalSeries.empty()
+            else:
+                best_vc, df = loaded
+                col = f"{best_vc}_resid" if signal_col == "resid" else signal_col
+                series = PeerSignalSeries.from_frame(df, "earnings_date", col)
+            self._series[key] = series
+            return series
+
+    def best_visible_col(self, ticker: str, method: str | None = None) -> str | None:
+        """The peer's visible_col with the most non-null residuals."""
+        loaded = self._load(ticker, method or self.method)
+        return None if loaded is None else loaded[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._series.clear()
+
+    def _load(self, ticker: str, method: str) -> tuple[str, pl.DataFrame] | None:
+        with self._lock:
+            if (ticker, method) not in self._frames:
+                self._frames[(ticker, method)] = _load_best_frame(ticker, method)
+            return self._frames[(ticker, method)]
+
+    def __getstate__(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "method": self.method,
+                "_frames": dict(self._frames),
+                "_series": dict(self._series),
+            }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.method = state["method"]
+        self._frames = state["_frames"]
+        self._series = state["_series"]
+        self._lock = threading.RLock()
+
+
+def _load_best_frame(ticker: str, method: str) -> tuple[str, pl.DataFrame] | None:
+    """Read each visible_col file once; keep the one with most residuals."""
+    best: tuple[str, pl.DataFrame] | None = None
+    best_count = 0
+    for vc in list_visible_cols(ticker, method=method):
+        try:
+            df = load_signal_data(
+                ticker, method=method, name="processed_data", visible_col=vc
+            )
+        except Exception:  # noqa: BLE001, S112 — unreadable variant: skip it
+            continue
+        if "earnings_date" not in df.columns:
+            continue
+        resid_col = f"{vc}_resid"
+        count = df[resid_col].drop_nulls().len() if resid_col in df.columns else 0
+        if best is None or count > best_count:
+            best, best_count = (vc, df), count
+    return best
+
+
+# Shared by every CrossTickerEntry unless replaced.
+default_peer_store = PeerSignalStore()
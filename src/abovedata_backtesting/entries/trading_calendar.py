@@ -0,0 +1,96 @@
+"""
+Trading calendar: signal date → entry date resolution for entry rules.
+
+Built once per market frame and shared by every entry rule of a grid run.
+Signal dates that are not trading days snap to the last trading date on or
+before them; the entry date is then ``entry_days_before`` trading days
+earlier. All lookups are a single ``searchsorted`` over the sorted dates.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+
+
+@dataclass(frozen=True, slots=True)
+class TradingCalendar:
+    """Sorted trading dates of one market frame (``datetime64[D]``)."""
+
+    dates: NDArray[np.datetime64]
+
+    @classmethod
+    def from_market_data(cls, market_data: pl.DataFrame) -> TradingCalendar:
+        """Index the ``date`` column; it must be strictly increasing."""
+        dates = np.array(market_data["date"].to_numpy(), dtype="datetime64[D]")
+        if dates.size > 1 and not (dates[1:] > dates[:-1]).all():
+            raise ValueError("market_data must be sorted by unique 'date'")
+        dates.setflags(write=False)
+        return cls(dates=dates)
+
+    def __len__(self) -> int:
+        return int(self.dates.shape[0])
+
+    def signal_indices(self, signal_dates: Sequence[dt.date]) -> NDArray[np.int64]:
+        """Index of the last trading date <= each signal date (-1 if none)."""
+        wanted = np.array(signal_dates, dtype="datetime64[D]")
+        return np.searchsorted(self.dates, wanted, side="right").astype(np.int64) - 1
+
+    def entry_indices(
+        self, signal_dates: Sequence[dt.date], offsets: Sequence[int]
+    ) -> NDArray[np.int64]:
+        """Entry index per (signal date, offset), shape ``(n_signals, n_offsets)``.
+
+        Entries that would fall before the first trading date, or signals with
+        no trading date on or before them, are -1.
+        """
+        sig_idx = self.signal_indices(signal_dates)[:, None]
+        entry_idx = sig_idx - np.asarray(offsets, dtype=np.int64)[None, :]
+        return np.where((sig_idx >= 0) & (entry_idx >= 0), entry_idx, -1)
+
+    @staticmethod
+    def unique_entries(
+        entry_idx: NDArray[np.int64],
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Collapse one offset's entry indices to one event per entry date.
+
+        ``entry_idx`` is a column of entry_indices(). Returns the sorted
+        unique entry indices and, for each, the position of the signal that
+        owns it: the last signal resolving there, as with dict assignment.
+        """
+        valid = np.flatnonzero(entry_idx >= 0)
+        rev = valid[::-1]
+        events, first = np.unique(entry_idx[rev], return_index=True)
+        return events.astype(np.int64), rev[first].astype(np.int64)
+
+    def entry_maps(
+        self, signal_dates: Sequence[dt.date], offsets: Sequence[int]
+    ) -> dict[int, dict[dt.date, dt.date]]:
+        """``{offset: {entry_date: signal_date}}`` for every offset at once.
+
+        When several signals resolve to the same entry date the later signal
+        in ``signal_dates`` wins, as with sequential dict assignment.
+        """
+        signal_dates = list(signal_dates)
+        offsets = list(offsets)
+        idx = self.entry_indices(signal_dates, offsets)
+        entry_dates: list[dt.date] = self.dates.tolist()
+        maps: dict[int, dict[dt.date, dt.date]] = {}
+        for j, offset in enumerate(offsets):
+            maps[offset] = {
+                entry_dates[i]: sig_date
+                for i, sig_date in zip(idx[:, j].tolist(), signal_dates)
+                if i >= 0
+            }
+        return maps
+
+    def entry_map(
+        self, signal_dates: Sequence[dt.date], entry_days_before: int
+    ) -> dict[dt.date, dt.date]:
+        """Map each signal date to the entry date N trading days before it."""
+        return self.entry_maps(signal_dates, [entry_days_before])[entry_days_before]
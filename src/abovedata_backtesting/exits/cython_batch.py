@@ -0,0 +1,227 @@
+"""Batched exit evaluation kernel (pure-Python mode).
+
+Scores every (exit rule, max_entries) variant of one cached entry result in a
+single call and returns only the ranking metrics as a 2-D matrix — no Trade,
+TradeLog, BacktestMetrics or GridSearchResult objects are built. The grid
+search uses it to rank all combos cheaply, then materializes full results for
+the winners only.
+
+Works as regular Python when not compiled. When compiled with Cython,
+the typed loops run as native C code.
+
+Build: cythonize -i src/abovedata_backtesting/exits/cython_batch.py
+"""
+
+from __future__ import annotations
+
+import cython
+import numpy as np
+from numpy.typing import NDArray
+
+from abovedata_backtesting.exits.cython_exits import (
+    enforce_max_entries_cy,
+    fixed_holding_exit_cy,
+    stop_loss_take_profit_exit_multi_cy,
+    trailing_stop_exit_multi_cy,
+)
+
+# Exit kinds understood by evaluate_exit_grid_cy (see exit_params layout below).
+EXIT_SIGNAL_CHANGE = 0  # no params
+EXIT_FIXED_HOLDING = 1  # p1 = holding_days
+EXIT_TRAILING_STOP = 2  # p1 = trailing_stop_pct
+EXIT_STOP_LOSS_TAKE_PROFIT = 3  # p1 = stop_loss_pct, p2 = take_profit_pct
+
+# Column order of the metrics matrix. Names match the summary DataFrame columns
+# built by StrategyProcessor so rankings resolve against the same metric names.
+BATCH_METRICS: tuple[str, ...] = (
+    "sharpe_ratio",
+    "trade_total_return",
+    "trade_n_trades",
+    "max_drawdown",
+    "trade_win_rate",
+)
+SHARPE_COL = 0
+TOTAL_RETURN_COL = 1
+N_TRADES_COL = 2
+MAX_DRAWDOWN_COL = 3
+WIN_RATE_COL = 4
+
+
+@cython.cfunc
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def _score_positions(
+    positions: cython.const[cython.double][:],
+    trade_closes: cython.const[cython.double][:],
+    asset_returns: cython.const[cython.double][:],
+    periods_per_year: cython.double,
+    out: cython.double[:, :],
+    row: cython.Py_ssize_t,
+) -> None:
+    n: cython.Py_ssize_t = positions.shape[0]
+    i: cython.Py_ssize_t
+    r: cython.double
+    # Daily strategy returns: compounding, Welford variance, drawdown
+    growth: cython.double = 1.0
+    peak: cython.double = 0.0
+    max_dd: cython.double = 0.0
+    mean: cython.double = 0.0
+    m2: cython.double = 0.0
+    delta: cython.double
+    # Trade boundaries (mirrors TradeLog.from_arrays)
+    pos: cython.double
+    prev: cython.double = 0.0
+    active: cython.bint
+    prev_active: cython.bint
+    sign: cython.double
+    prev_sign: cython.double = 0.0
+    in_trade: cython.bint = False
+    entry_idx: cython.Py_ssize_t = 0
+    entry_dir: cython.double = 0.0
+    trade_ret: cython.double
+    n_trades: cython.Py_ssize_t = 0
+    n_wins: cython.Py_ssize_t = 0
+    trade_growth: cython.double = 1.0
+    total: cython.double
+    n_years: cython.double
+    ann: cython.double
+    vol: cython.double
+
+    for i in range(n):
+        pos = positions[i]
+
+        r = asset_returns[i] * pos
+        growth *= 1.0 + r
+        if i == 0 or growth > peak:
+            peak = growth
+        max_dd = min(max_dd, (growth - peak) / peak)
+        delta = r - mean
+        mean += delta / (i + 1)
+        m2 += delta * (r - mean)
+
+        active = pos > 0.01 or pos < -0.01
+        prev_active = prev > 0.01 or prev < -0.01
+        sign = 1.0 if pos > 0 else (-1.0 if pos < 0 else 0.0)
+
+        if prev_active and (not active or sign != prev_sign) and in_trade:
+            trade_ret = (trade_closes[i] / trade_closes[entry_idx] - 1.0) * entry_dir
+            trade_growth *= 1.0 + trade_ret
+            n_trades += 1
+            if trade_ret > 0:
+                n_wins += 1
+            in_trade = False
+
+        if active and (not prev_active or sign != prev_sign):
+            in_trade = True
+            entry_idx = i
+            entry_dir = sign
+
+        prev = pos
+        prev_sign = sign
+
+    if in_trade:
+        trade_ret = (trade_closes[n - 1] / trade_closes[entry_idx] - 1.0) * entry_dir
+        trade_growth *= 1.0 + trade_ret
+        n_trades += 1
+        if trade_ret > 0:
+            n_wins += 1
+
+    out[row, SHARPE_COL] = 0.0
+    out[row, MAX_DRAWDOWN_COL] = 0.0
+    if n >= 2:
+        total = growth - 1.0
+        n_years = max(n / periods_per_year, 0.01)
+        ann = (1.0 + total) ** (1.0 / n_years) - 1.0
+        vol = (m2 / (n - 1)) ** 0.5 * periods_per_year**0.5
+        if vol > 0:
+            out[row, SHARPE_COL] = ann / vol
+        out[row, MAX_DRAWDOWN_COL] = max_dd
+
+    out[row, N_TRADES_COL] = n_trades
+    if n_trades > 0:
+        out[row, TOTAL_RETURN_COL] = trade_growth - 1.0
+        out[row, WIN_RATE_COL] = cython.cast(cython.double, n_wins) / n_trades
+    else:
+        out[row, TOTAL_RETURN_COL] = 0.0
+        out[row, WIN_RATE_COL] = 0.0
+
+
+def evaluate_exit_grid_cy(
+    positions: NDArray[np.float64],
+    closes: NDArray[np.float64],
+    highs: NDArray[np.float64],
+    lows: NDArray[np.float64],
+    asset_returns: NDArray[np.float64],
+    signal_date_mask: NDArray[np.uint8],
+    signal_ids: NDArray[np.int32],
+    exit_kinds: NDArray[np.int32],
+    exit_params: NDArray[np.float64],
+    max_entries: NDArray[np.int32],
+    periods_per_year: float = 252,
+) -> NDArray[np.float64]:
+    """Score every exit × max_entries variant of one entry result.
+
+    Parameters
+    ----------
+    positions : (N,) float64 raw positions from the entry rule
+    closes, highs, lows : (N,) float64 price arrays
+    asset_returns : (N,) float64 daily asset returns
+    signal_date_mask : (N,) uint8, 1 where the date is a signal date
+    signal_ids : (N,) int32 signal period ids
+    exit_kinds : (E,) int32, one of the EXIT_* constants
+    exit_params : (E, 2) float64 exit parameters (p1, p2) per exit
+    max_entries : (M,) int32 max_entries_per_signal values
+
+    Returns
+    -------
+    (E * M, len(BATCH_METRICS)) float64 matrix. Row ``e * M + m`` scores
+    exit ``e`` with ``max_entries[m]``; columns follow BATCH_METRICS.
+    """
+    n_exits = exit_kinds.shape[0]
+    n_max = max_entries.shape[0]
+    out = np.zeros((n_exits * n_max, len(BATCH_METRICS)), dtype=np.float64)
+    if positions.shape[0] == 0:
+        return out
+
+    pos = np.ascontiguousarray(positions, dtype=np.float64)
+    cl = np.ascontiguousarray(closes, dtype=np.float64)
+    rets = np.ascontiguousarray(asset_returns, dtype=np.float64)
+
+    # Stop-based exits: one multi-parameter pass per exit family
+    exited: dict[int, tuple[NDArray[np.float64], NDArray[np.float64]]] = {}
+    trailing = np.flatnonzero(exit_kinds == EXIT_TRAILING_STOP)
+    if trailing.shape[0]:
+        tr_pos, tr_exit = trailing_stop_exit_multi_cy(
+            pos, cl, highs, lows, exit_params[trailing, 0]
+        )
+        for k, e in enumerate(trailing):
+            exited[int(e)] = (tr_pos[k], tr_exit[k])
+    sltp = np.flatnonzero(exit_kinds == EXIT_STOP_LOSS_TAKE_PROFIT)
+    if sltp.shape[0]:
+        st_pos, st_exit = stop_loss_take_profit_exit_multi_cy(
+            pos, cl, highs, lows, exit_params[sltp, 0], exit_params[sltp, 1]
+        )
+        for k, e in enumerate(sltp):
+            exited[int(e)] = (st_pos[k], st_exit[k])
+
+    for e in range(n_exits):
+        kind = int(exit_kinds[e])
+        if e in exited:
+            new_pos, trade_closes = exited[e]
+        elif kind == EXIT_SIGNAL_CHANGE:
+            new_pos, trade_closes = pos, cl
+        elif kind == EXIT_FIXED_HOLDING:
+            new_pos = fixed_holding_exit_cy(
+                pos, signal_date_mask, int(exit_params[e, 0])
+            )
+            trade_closes = cl
+        else:
+            raise ValueError(f"Unknown exit kind {kind}")
+
+        for m in range(n_max):
+            capped = enforce_max_entries_cy(new_pos, signal_ids, int(max_entries[m]))
+            _score_positions(
+                capped, trade_closes, rets, periods_per_year, out, e * n_max + m
+            )
+    return out
@@ -5,7 +5,7 @@
     "distutils": {
         "name": "abovedata_backtesting.exits.cython_exits",
         "sources": [
-            "/Users/eddyt/Algo/projects/abovedata-all/abovedata-backtesting/src/abovedata_backtesting/exits/cython_exits.py"
+            "/root/package/src/abovedata_backtesting/exits/cython_exits.py"
         ]
     },
     "module_name": "abovedata_backtesting.exits.cython_exits"
@@ -2420,9 +2420,6 @@ static void __Pyx_RaiseUnboundLocalError(const char *varname);
 /* DivInt[long].proto */
 static CYTHON_INLINE long __Pyx_div_long(long, long, int b_is_constant);
 
-/* pyint_simplify.proto */
-static CYTHON_INLINE int __Pyx_PyInt_FromNumber(PyObject **number_var, const char *argname, int accept_none);
-
 /* PyObjectVectorCallKwBuilder.proto */
 CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
 #if CYTHON_VECTORCALL
@@ -2441,6 +2438,9 @@ static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, P
 #define __Pyx_VectorcallBuilder_AddArgStr(key, value, builder, args, n) PyDict_SetItemString(builder, key, value)
 #endif
 
+/* pyint_simplify.proto */
+static CYTHON_INLINE int __Pyx_PyInt_FromNumber(PyObject **number_var, const char *argname, int accept_none);
+
 /* AllocateExtensionType.proto */
 static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final);
 
@@ -2723,6 +2723,12 @@ static int __Pyx_ValidateAndInit_memviewslice(
                 __Pyx_memviewslice *memviewslice,
                 PyObject *original_obj);
 
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(PyObject *, int writable_flag);
+
 /* ObjectToMemviewSlice.proto */
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double(PyObject *, int writable_flag);
 
@@ -2730,7 +2736,10 @@ static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_dou
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char(PyObject *, int writable_flag);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_int(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_double(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_int__const__(PyObject *, int writable_flag);
 
 /* MemviewSliceCopy.proto */
 static __Pyx_memviewslice
@@ -2875,7 +2884,9 @@ static int __pyx_memoryview_thread_locks_used;
 static PyThread_type_lock __pyx_memoryview_thread_locks[8];
 static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_holding_exit(__Pyx_memviewslice, __Pyx_memviewslice, int, __Pyx_memviewslice); /*proto*/
 static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing_stop_exit(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, double, __Pyx_memviewslice, __Pyx_memviewslice); /*proto*/
+static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing_stop_exit_multi(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice); /*proto*/
 static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__stop_loss_take_profit_exit(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, double, double, __Pyx_memviewslice, __Pyx_memviewslice); /*proto*/
+static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__stop_loss_take_profit_exit_multi(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice); /*proto*/
 static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_max_entries(__Pyx_memviewslice, __Pyx_memviewslice, int, __Pyx_memviewslice); /*proto*/
 static int __pyx_array_allocate_buffer(struct __pyx_array_obj *); /*proto*/
 static struct __pyx_array_obj *__pyx_array_new(PyObject *, Py_ssize_t, char *, char const *, char *); /*proto*/
@@ -2912,9 +2923,11 @@ static void __pyx_memoryview_slice_assign_scalar(__Pyx_memviewslice *, int, size
 static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize_t *, int, size_t, void *); /*proto*/
 static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *, PyObject *); /*proto*/
 /* #### Code section: typeinfo ### */
+static const __Pyx_TypeInfo __Pyx_TypeInfo_double__const__ = { "const double", NULL, sizeof(double const ), { 0 }, 0, 'R', 0, 0 };
+static const __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_char__const__ = { "const unsigned char", NULL, sizeof(unsigned char const ), { 0 }, 0, __PYX_IS_UNSIGNED(unsigned char const ) ? 'U' : 'I', __PYX_IS_UNSIGNED(unsigned char const ), 0 };
 static const __Pyx_TypeInfo __Pyx_TypeInfo_double = { "double", NULL, sizeof(double), { 0 }, 0, 'R', 0, 0 };
 static const __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_char = { "unsigned char", NULL, sizeof(unsigned char), { 0 }, 0, __PYX_IS_UNSIGNED(unsigned char) ? 'U' : 'I', __PYX_IS_UNSIGNED(unsigned char), 0 };
-static const __Pyx_TypeInfo __Pyx_TypeInfo_int = { "int", NULL, sizeof(int), { 0 }, 0, __PYX_IS_UNSIGNED(int) ? 'U' : 'I', __PYX_IS_UNSIGNED(int), 0 };
+static const __Pyx_TypeInfo __Pyx_TypeInfo_int__const__ = { "const int", NULL, sizeof(int const ), { 0 }, 0, __PYX_IS_UNSIGNED(int const ) ? 'U' : 'I', __PYX_IS_UNSIGNED(int const ), 0 };
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "abovedata_backtesting.exits.cython_exits"
 extern int __pyx_module_is_main_abovedata_backtesting__exits__cython_exits;
@@ -2930,7 +2943,7 @@ static PyObject *__pyx_builtin_id;
 static const char __pyx_k_c[] = "c";
 static const char __pyx_k_name[] = "name";
 static const char __pyx_k_fortran[] = "fortran";
-static const char __pyx_k_Cython_accelerated_exit_strategy[] = "Cython-accelerated exit strategy kernels (pure-Python mode).\n\nWorks as regular Python when not compiled. When compiled with Cython,\nthe typed loops run as native C code (~50-100x faster).\n\nBuild: cythonize -i src/abovedata_backtesting/exits/cython_exits.py\n";
+static const char __pyx_k_Cython_accelerated_exit_strategy[] = "Cython-accelerated exit strategy kernels (pure-Python mode).\n\nWorks as regular Python when not compiled. When compiled with Cython,\nthe typed loops run as native C code (~50-100x faster).\n\nThe kernels never write to their inputs: input memoryviews are const, so\nread-only buffers (e.g. Polars' zero-copy to_numpy views) are accepted and\nwrappers only convert inputs that are not already C-contiguous with the\nright dtype (no defensive copies).\nThe ``*_multi_cy`` variants sweep K parameter values in one pass over the\nprice series and write (K, N) outputs.\n\nBuild: cythonize -i src/abovedata_backtesting/exits/cython_exits.py\n";
 /* #### Code section: decls ### */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __pyx_array_obj *__pyx_v_self, PyObject *__pyx_v_shape, Py_ssize_t __pyx_v_itemsize, PyObject *__pyx_v_format, PyObject *__pyx_v_mode, int __pyx_v_allocate_buffer); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array_2__getbuffer__(struct __pyx_array_obj *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
@@ -2973,10 +2986,13 @@ static void __pyx_memoryviewslice___pyx_pf_15View_dot_MemoryView_16_memoryviewsl
 static PyObject *__pyx_pf___pyx_memoryviewslice___reduce_cython__(CYTHON_UNUSED struct __pyx_memoryviewslice_obj *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf___pyx_memoryviewslice_2__setstate_cython__(CYTHON_UNUSED struct __pyx_memoryviewslice_obj *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_15View_dot_MemoryView___pyx_unpickle_Enum(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_fixed_holding_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_signal_date_mask, PyObject *__pyx_v_holding_days); /* proto */
-static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailing_stop_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, double __pyx_v_trailing_stop_pct); /* proto */
-static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4stop_loss_take_profit_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, double __pyx_v_stop_loss_pct, double __pyx_v_take_profit_pct); /* proto */
-static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6enforce_max_entries_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_signal_ids, PyObject *__pyx_v_max_entries_per_signal); /* proto */
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits__as_f64(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_arr); /* proto */
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2fixed_holding_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_signal_date_mask, PyObject *__pyx_v_holding_days); /* proto */
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4trailing_stop_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, double __pyx_v_trailing_stop_pct); /* proto */
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6trailing_stop_exit_multi_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, PyObject *__pyx_v_trailing_stop_pcts); /* proto */
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_8stop_loss_take_profit_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, double __pyx_v_stop_loss_pct, double __pyx_v_take_profit_pct); /* proto */
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_10stop_loss_take_profit_exit_multi_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, PyObject *__pyx_v_stop_loss_pcts, PyObject *__pyx_v_take_profit_pcts); /* proto */
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_12enforce_max_entries_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_signal_ids, PyObject *__pyx_v_max_entries_per_signal); /* proto */
 static PyObject *__pyx_tp_new_array(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_Enum(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
@@ -3014,8 +3030,8 @@ typedef struct {
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
   PyObject *__pyx_slice[1];
   PyObject *__pyx_tuple[1];
-  PyObject *__pyx_codeobj_tab[4];
-  PyObject *__pyx_string_tab[160];
+  PyObject *__pyx_codeobj_tab[7];
+  PyObject *__pyx_string_tab[177];
   PyObject *__pyx_number_tab[4];
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
@@ -3073,150 +3089,167 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_kp_u_Invalid_shape_in_axis __pyx_string_tab[13]
 #define __pyx_kp_u_MemoryView_of __pyx_string_tab[14]
 #define __pyx_kp_u_NDArray_np_float64 __pyx_string_tab[15]
-#define __pyx_kp_u_NDArray_np_int32 __pyx_string_tab[16]
-#define __pyx_kp_u_NDArray_np_uint8 __pyx_string_tab[17]
-#define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[18]
-#define __pyx_kp_u_Out_of_bounds_on_buffer_access_a __pyx_string_tab[19]
-#define __pyx_kp_u_Step_may_not_be_zero_axis_d __pyx_string_tab[20]
-#define __pyx_kp_u_Unable_to_convert_item_to_object __pyx_string_tab[21]
-#define __pyx_kp_u__2 __pyx_string_tab[22]
-#define __pyx_kp_u__3 __pyx_string_tab[23]
-#define __pyx_kp_u__4 __pyx_string_tab[24]
-#define __pyx_kp_u__5 __pyx_string_tab[25]
-#define __pyx_kp_u__6 __pyx_string_tab[26]
-#define __pyx_kp_u_add_note __pyx_string_tab[27]
-#define __pyx_kp_u_and __pyx_string_tab[28]
-#define __pyx_kp_u_at_0x __pyx_string_tab[29]
-#define __pyx_kp_u_collections_abc __pyx_string_tab[30]
-#define __pyx_kp_u_contiguous_and_direct __pyx_string_tab[31]
-#define __pyx_kp_u_contiguous_and_indirect __pyx_string_tab[32]
-#define __pyx_kp_u_disable __pyx_string_tab[33]
-#define __pyx_kp_u_enable __pyx_string_tab[34]
-#define __pyx_kp_u_gc __pyx_string_tab[35]
-#define __pyx_kp_u_got __pyx_string_tab[36]
-#define __pyx_kp_u_got_differing_extents_in_dimensi __pyx_string_tab[37]
-#define __pyx_kp_u_isenabled __pyx_string_tab[38]
-#define __pyx_kp_u_itemsize_0_for_cython_array __pyx_string_tab[39]
-#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[40]
-#define __pyx_kp_u_object __pyx_string_tab[41]
-#define __pyx_kp_u_src_abovedata_backtesting_exits __pyx_string_tab[42]
-#define __pyx_kp_u_strided_and_direct __pyx_string_tab[43]
-#define __pyx_kp_u_strided_and_direct_or_indirect __pyx_string_tab[44]
-#define __pyx_kp_u_strided_and_indirect __pyx_string_tab[45]
-#define __pyx_kp_u_tuple_NDArray_np_float64_NDArray __pyx_string_tab[46]
-#define __pyx_kp_u_unable_to_allocate_array_data __pyx_string_tab[47]
-#define __pyx_kp_u_unable_to_allocate_shape_and_str __pyx_string_tab[48]
-#define __pyx_n_u_ASCII __pyx_string_tab[49]
-#define __pyx_n_u_Ellipsis __pyx_string_tab[50]
-#define __pyx_n_u_NDArray __pyx_string_tab[51]
-#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[52]
-#define __pyx_n_u_Sequence __pyx_string_tab[53]
-#define __pyx_n_u_View_MemoryView __pyx_string_tab[54]
-#define __pyx_n_u_abc __pyx_string_tab[55]
-#define __pyx_n_u_abovedata_backtesting_exits_cyth __pyx_string_tab[56]
-#define __pyx_n_u_allocate_buffer __pyx_string_tab[57]
-#define __pyx_n_u_array __pyx_string_tab[58]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[59]
-#define __pyx_n_u_base __pyx_string_tab[60]
-#define __pyx_n_u_c __pyx_string_tab[61]
-#define __pyx_n_u_cl __pyx_string_tab[62]
-#define __pyx_n_u_class __pyx_string_tab[63]
-#define __pyx_n_u_class_getitem __pyx_string_tab[64]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[65]
-#define __pyx_n_u_closes __pyx_string_tab[66]
-#define __pyx_n_u_copy __pyx_string_tab[67]
-#define __pyx_n_u_count __pyx_string_tab[68]
-#define __pyx_n_u_dict __pyx_string_tab[69]
-#define __pyx_n_u_dtype __pyx_string_tab[70]
-#define __pyx_n_u_dtype_is_object __pyx_string_tab[71]
-#define __pyx_n_u_empty __pyx_string_tab[72]
-#define __pyx_n_u_encode __pyx_string_tab[73]
-#define __pyx_n_u_enforce_max_entries_cy __pyx_string_tab[74]
-#define __pyx_n_u_enumerate __pyx_string_tab[75]
-#define __pyx_n_u_error __pyx_string_tab[76]
-#define __pyx_n_u_fixed_holding_exit_cy __pyx_string_tab[77]
-#define __pyx_n_u_flags __pyx_string_tab[78]
-#define __pyx_n_u_float __pyx_string_tab[79]
-#define __pyx_n_u_float64 __pyx_string_tab[80]
-#define __pyx_n_u_format __pyx_string_tab[81]
-#define __pyx_n_u_fortran __pyx_string_tab[82]
-#define __pyx_n_u_func __pyx_string_tab[83]
-#define __pyx_n_u_getstate __pyx_string_tab[84]
-#define __pyx_n_u_hi __pyx_string_tab[85]
-#define __pyx_n_u_highs __pyx_string_tab[86]
-#define __pyx_n_u_holding_days __pyx_string_tab[87]
-#define __pyx_n_u_id __pyx_string_tab[88]
-#define __pyx_n_u_import __pyx_string_tab[89]
-#define __pyx_n_u_index __pyx_string_tab[90]
-#define __pyx_n_u_int __pyx_string_tab[91]
-#define __pyx_n_u_int32 __pyx_string_tab[92]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[93]
-#define __pyx_n_u_items __pyx_string_tab[94]
-#define __pyx_n_u_itemsize __pyx_string_tab[95]
-#define __pyx_n_u_lo __pyx_string_tab[96]
-#define __pyx_n_u_lows __pyx_string_tab[97]
-#define __pyx_n_u_main __pyx_string_tab[98]
-#define __pyx_n_u_mask __pyx_string_tab[99]
-#define __pyx_n_u_max_entries_per_signal __pyx_string_tab[100]
-#define __pyx_n_u_memview __pyx_string_tab[101]
-#define __pyx_n_u_mode __pyx_string_tab[102]
-#define __pyx_n_u_module __pyx_string_tab[103]
-#define __pyx_n_u_n __pyx_string_tab[104]
-#define __pyx_n_u_name __pyx_string_tab[105]
-#define __pyx_n_u_name_2 __pyx_string_tab[106]
-#define __pyx_n_u_ndim __pyx_string_tab[107]
-#define __pyx_n_u_new __pyx_string_tab[108]
-#define __pyx_n_u_np __pyx_string_tab[109]
-#define __pyx_n_u_numpy __pyx_string_tab[110]
-#define __pyx_n_u_numpy_typing __pyx_string_tab[111]
-#define __pyx_n_u_obj __pyx_string_tab[112]
-#define __pyx_n_u_out __pyx_string_tab[113]
-#define __pyx_n_u_out_exit __pyx_string_tab[114]
-#define __pyx_n_u_out_pos __pyx_string_tab[115]
-#define __pyx_n_u_pack __pyx_string_tab[116]
-#define __pyx_n_u_pop __pyx_string_tab[117]
-#define __pyx_n_u_pos __pyx_string_tab[118]
-#define __pyx_n_u_positions __pyx_string_tab[119]
-#define __pyx_n_u_pyx_checksum __pyx_string_tab[120]
-#define __pyx_n_u_pyx_state __pyx_string_tab[121]
-#define __pyx_n_u_pyx_type __pyx_string_tab[122]
-#define __pyx_n_u_pyx_unpickle_Enum __pyx_string_tab[123]
-#define __pyx_n_u_pyx_vtable __pyx_string_tab[124]
-#define __pyx_n_u_qualname __pyx_string_tab[125]
-#define __pyx_n_u_reduce __pyx_string_tab[126]
-#define __pyx_n_u_reduce_cython __pyx_string_tab[127]
-#define __pyx_n_u_reduce_ex __pyx_string_tab[128]
-#define __pyx_n_u_register __pyx_string_tab[129]
-#define __pyx_n_u_return __pyx_string_tab[130]
-#define __pyx_n_u_set_name __pyx_string_tab[131]
-#define __pyx_n_u_setdefault __pyx_string_tab[132]
-#define __pyx_n_u_setstate __pyx_string_tab[133]
-#define __pyx_n_u_setstate_cython __pyx_string_tab[134]
-#define __pyx_n_u_shape __pyx_string_tab[135]
-#define __pyx_n_u_sids __pyx_string_tab[136]
-#define __pyx_n_u_signal_date_mask __pyx_string_tab[137]
-#define __pyx_n_u_signal_ids __pyx_string_tab[138]
-#define __pyx_n_u_size __pyx_string_tab[139]
-#define __pyx_n_u_start __pyx_string_tab[140]
-#define __pyx_n_u_step __pyx_string_tab[141]
-#define __pyx_n_u_stop __pyx_string_tab[142]
-#define __pyx_n_u_stop_loss_pct __pyx_string_tab[143]
-#define __pyx_n_u_stop_loss_take_profit_exit_cy __pyx_string_tab[144]
-#define __pyx_n_u_struct __pyx_string_tab[145]
-#define __pyx_n_u_take_profit_pct __pyx_string_tab[146]
-#define __pyx_n_u_test __pyx_string_tab[147]
-#define __pyx_n_u_trailing_stop_exit_cy __pyx_string_tab[148]
-#define __pyx_n_u_trailing_stop_pct __pyx_string_tab[149]
-#define __pyx_n_u_uint8 __pyx_string_tab[150]
-#define __pyx_n_u_unpack __pyx_string_tab[151]
-#define __pyx_n_u_update __pyx_string_tab[152]
-#define __pyx_n_u_values __pyx_string_tab[153]
-#define __pyx_n_u_x __pyx_string_tab[154]
-#define __pyx_kp_b_iso88591_F_fBj_Q_2V1L_b_Q_F_3fAT_r_f_A_1 __pyx_string_tab[155]
-#define __pyx_kp_b_iso88591_F_fBj_Q_2V1_fBhe1_F_3fAT_r_q_V __pyx_string_tab[156]
-#define __pyx_kp_b_iso88591_q_F_fBj_Q_6_E_6_r_5_6_b_q_b_as __pyx_string_tab[157]
-#define __pyx_kp_b_iso88591_q_F_fBj_Q_6_E_6_r_5_6_b_q_b_as_2 __pyx_string_tab[158]
-#define __pyx_n_b_O __pyx_string_tab[159]
+#define __pyx_kp_u_NDArray_np_floating __pyx_string_tab[16]
+#define __pyx_kp_u_NDArray_np_int32 __pyx_string_tab[17]
+#define __pyx_kp_u_NDArray_np_uint8 __pyx_string_tab[18]
+#define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[19]
+#define __pyx_kp_u_Out_of_bounds_on_buffer_access_a __pyx_string_tab[20]
+#define __pyx_kp_u_Step_may_not_be_zero_axis_d __pyx_string_tab[21]
+#define __pyx_kp_u_Unable_to_convert_item_to_object __pyx_string_tab[22]
+#define __pyx_kp_u__2 __pyx_string_tab[23]
+#define __pyx_kp_u__3 __pyx_string_tab[24]
+#define __pyx_kp_u__4 __pyx_string_tab[25]
+#define __pyx_kp_u__5 __pyx_string_tab[26]
+#define __pyx_kp_u__6 __pyx_string_tab[27]
+#define __pyx_kp_u_add_note __pyx_string_tab[28]
+#define __pyx_kp_u_and __pyx_string_tab[29]
+#define __pyx_kp_u_and_take_profit_pcts __pyx_string_tab[30]
+#define __pyx_kp_u_at_0x __pyx_string_tab[31]
+#define __pyx_kp_u_collections_abc __pyx_string_tab[32]
+#define __pyx_kp_u_contiguous_and_direct __pyx_string_tab[33]
+#define __pyx_kp_u_contiguous_and_indirect __pyx_string_tab[34]
+#define __pyx_kp_u_differ __pyx_string_tab[35]
+#define __pyx_kp_u_disable __pyx_string_tab[36]
+#define __pyx_kp_u_enable __pyx_string_tab[37]
+#define __pyx_kp_u_gc __pyx_string_tab[38]
+#define __pyx_kp_u_got __pyx_string_tab[39]
+#define __pyx_kp_u_got_differing_extents_in_dimensi __pyx_string_tab[40]
+#define __pyx_kp_u_isenabled __pyx_string_tab[41]
+#define __pyx_kp_u_itemsize_0_for_cython_array __pyx_string_tab[42]
+#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[43]
+#define __pyx_kp_u_object __pyx_string_tab[44]
+#define __pyx_kp_u_src_abovedata_backtesting_exits __pyx_string_tab[45]
+#define __pyx_kp_u_stop_loss_pcts_2 __pyx_string_tab[46]
+#define __pyx_kp_u_strided_and_direct __pyx_string_tab[47]
+#define __pyx_kp_u_strided_and_direct_or_indirect __pyx_string_tab[48]
+#define __pyx_kp_u_strided_and_indirect __pyx_string_tab[49]
+#define __pyx_kp_u_tuple_NDArray_np_float64_NDArray __pyx_string_tab[50]
+#define __pyx_kp_u_unable_to_allocate_array_data __pyx_string_tab[51]
+#define __pyx_kp_u_unable_to_allocate_shape_and_str __pyx_string_tab[52]
+#define __pyx_n_u_ASCII __pyx_string_tab[53]
+#define __pyx_n_u_Ellipsis __pyx_string_tab[54]
+#define __pyx_n_u_NDArray __pyx_string_tab[55]
+#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[56]
+#define __pyx_n_u_Sequence __pyx_string_tab[57]
+#define __pyx_n_u_View_MemoryView __pyx_string_tab[58]
+#define __pyx_n_u_abc __pyx_string_tab[59]
+#define __pyx_n_u_abovedata_backtesting_exits_cyth __pyx_string_tab[60]
+#define __pyx_n_u_allocate_buffer __pyx_string_tab[61]
+#define __pyx_n_u_arr __pyx_string_tab[62]
+#define __pyx_n_u_as_f64 __pyx_string_tab[63]
+#define __pyx_n_u_ascontiguousarray __pyx_string_tab[64]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[65]
+#define __pyx_n_u_base __pyx_string_tab[66]
+#define __pyx_n_u_c __pyx_string_tab[67]
+#define __pyx_n_u_cl __pyx_string_tab[68]
+#define __pyx_n_u_class __pyx_string_tab[69]
+#define __pyx_n_u_class_getitem __pyx_string_tab[70]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[71]
+#define __pyx_n_u_closes __pyx_string_tab[72]
+#define __pyx_n_u_count __pyx_string_tab[73]
+#define __pyx_n_u_dict __pyx_string_tab[74]
+#define __pyx_n_u_dtype __pyx_string_tab[75]
+#define __pyx_n_u_dtype_is_object __pyx_string_tab[76]
+#define __pyx_n_u_empty __pyx_string_tab[77]
+#define __pyx_n_u_encode __pyx_string_tab[78]
+#define __pyx_n_u_enforce_max_entries_cy __pyx_string_tab[79]
+#define __pyx_n_u_enumerate __pyx_string_tab[80]
+#define __pyx_n_u_error __pyx_string_tab[81]
+#define __pyx_n_u_fixed_holding_exit_cy __pyx_string_tab[82]
+#define __pyx_n_u_flags __pyx_string_tab[83]
+#define __pyx_n_u_float __pyx_string_tab[84]
+#define __pyx_n_u_float64 __pyx_string_tab[85]
+#define __pyx_n_u_format __pyx_string_tab[86]
+#define __pyx_n_u_fortran __pyx_string_tab[87]
+#define __pyx_n_u_func __pyx_string_tab[88]
+#define __pyx_n_u_getstate __pyx_string_tab[89]
+#define __pyx_n_u_hi __pyx_string_tab[90]
+#define __pyx_n_u_highs __pyx_string_tab[91]
+#define __pyx_n_u_holding_days __pyx_string_tab[92]
+#define __pyx_n_u_id __pyx_string_tab[93]
+#define __pyx_n_u_import __pyx_string_tab[94]
+#define __pyx_n_u_index __pyx_string_tab[95]
+#define __pyx_n_u_int __pyx_string_tab[96]
+#define __pyx_n_u_int32 __pyx_string_tab[97]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[98]
+#define __pyx_n_u_items __pyx_string_tab[99]
+#define __pyx_n_u_itemsize __pyx_string_tab[100]
+#define __pyx_n_u_lo __pyx_string_tab[101]
+#define __pyx_n_u_lows __pyx_string_tab[102]
+#define __pyx_n_u_main __pyx_string_tab[103]
+#define __pyx_n_u_mask __pyx_string_tab[104]
+#define __pyx_n_u_max_entries_per_signal __pyx_string_tab[105]
+#define __pyx_n_u_memview __pyx_string_tab[106]
+#define __pyx_n_u_mode __pyx_string_tab[107]
+#define __pyx_n_u_module __pyx_string_tab[108]
+#define __pyx_n_u_n __pyx_string_tab[109]
+#define __pyx_n_u_name __pyx_string_tab[110]
+#define __pyx_n_u_name_2 __pyx_string_tab[111]
+#define __pyx_n_u_ndim __pyx_string_tab[112]
+#define __pyx_n_u_new __pyx_string_tab[113]
+#define __pyx_n_u_np __pyx_string_tab[114]
+#define __pyx_n_u_numpy __pyx_string_tab[115]
+#define __pyx_n_u_numpy_typing __pyx_string_tab[116]
+#define __pyx_n_u_obj __pyx_string_tab[117]
+#define __pyx_n_u_out __pyx_string_tab[118]
+#define __pyx_n_u_out_exit __pyx_string_tab[119]
+#define __pyx_n_u_out_pos __pyx_string_tab[120]
+#define __pyx_n_u_pack __pyx_string_tab[121]
+#define __pyx_n_u_pcts __pyx_string_tab[122]
+#define __pyx_n_u_pop __pyx_string_tab[123]
+#define __pyx_n_u_pos __pyx_string_tab[124]
+#define __pyx_n_u_positions __pyx_string_tab[125]
+#define __pyx_n_u_pyx_checksum __pyx_string_tab[126]
+#define __pyx_n_u_pyx_state __pyx_string_tab[127]
+#define __pyx_n_u_pyx_type __pyx_string_tab[128]
+#define __pyx_n_u_pyx_unpickle_Enum __pyx_string_tab[129]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[130]
+#define __pyx_n_u_qualname __pyx_string_tab[131]
+#define __pyx_n_u_reduce __pyx_string_tab[132]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[133]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[134]
+#define __pyx_n_u_register __pyx_string_tab[135]
+#define __pyx_n_u_return __pyx_string_tab[136]
+#define __pyx_n_u_set_name __pyx_string_tab[137]
+#define __pyx_n_u_setdefault __pyx_string_tab[138]
+#define __pyx_n_u_setstate __pyx_string_tab[139]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[140]
+#define __pyx_n_u_shape __pyx_string_tab[141]
+#define __pyx_n_u_sids __pyx_string_tab[142]
+#define __pyx_n_u_signal_date_mask __pyx_string_tab[143]
+#define __pyx_n_u_signal_ids __pyx_string_tab[144]
+#define __pyx_n_u_size __pyx_string_tab[145]
+#define __pyx_n_u_sl __pyx_string_tab[146]
+#define __pyx_n_u_start __pyx_string_tab[147]
+#define __pyx_n_u_step __pyx_string_tab[148]
+#define __pyx_n_u_stop __pyx_string_tab[149]
+#define __pyx_n_u_stop_loss_pct __pyx_string_tab[150]
+#define __pyx_n_u_stop_loss_pcts __pyx_string_tab[151]
+#define __pyx_n_u_stop_loss_take_profit_exit_cy __pyx_string_tab[152]
+#define __pyx_n_u_stop_loss_take_profit_exit_multi __pyx_string_tab[153]
+#define __pyx_n_u_struct __pyx_string_tab[154]
+#define __pyx_n_u_take_profit_pct __pyx_string_tab[155]
+#define __pyx_n_u_take_profit_pcts __pyx_string_tab[156]
+#define __pyx_n_u_test __pyx_string_tab[157]
+#define __pyx_n_u_tp __pyx_string_tab[158]
+#define __pyx_n_u_trailing_stop_exit_cy __pyx_string_tab[159]
+#define __pyx_n_u_trailing_stop_exit_multi_cy __pyx_string_tab[160]
+#define __pyx_n_u_trailing_stop_pct __pyx_string_tab[161]
+#define __pyx_n_u_trailing_stop_pcts __pyx_string_tab[162]
+#define __pyx_n_u_uint8 __pyx_string_tab[163]
+#define __pyx_n_u_unpack __pyx_string_tab[164]
+#define __pyx_n_u_update __pyx_string_tab[165]
+#define __pyx_n_u_values __pyx_string_tab[166]
+#define __pyx_n_u_x __pyx_string_tab[167]
+#define __pyx_n_u_zeros __pyx_string_tab[168]
+#define __pyx_kp_b_iso88591_2_q_2_F_3fAT_r_q_V_1 __pyx_string_tab[169]
+#define __pyx_kp_b_iso88591_2_q_F_A_F_3fAT_r_f_A_1 __pyx_string_tab[170]
+#define __pyx_kp_b_iso88591_2_q_V2Q __pyx_string_tab[171]
+#define __pyx_kp_b_iso88591_7_1_T_q_IV1A_b_awfBa_r_q_vRq_Q __pyx_string_tab[172]
+#define __pyx_kp_b_iso88591_q_b_as_r_q_6_1_q_9A __pyx_string_tab[173]
+#define __pyx_kp_b_iso88591_q_b_as_r_q_6_1_q_T_T_IQ_9A __pyx_string_tab[174]
+#define __pyx_kp_b_iso88591_r_2Q_j_Qb_Qb_RvQd_6_b_awfBa_r_q __pyx_string_tab[175]
+#define __pyx_n_b_O __pyx_string_tab[176]
 #define __pyx_int_0 __pyx_number_tab[0]
 #define __pyx_int_neg_1 __pyx_number_tab[1]
 #define __pyx_int_1 __pyx_number_tab[2]
@@ -3245,8 +3278,8 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_type___pyx_memoryviewslice);
   for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_slice[i]); }
   for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<4; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<160; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<7; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<177; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<4; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_clear_contents ### */
 /* CommonTypesMetaclass.module_state_clear */
@@ -3280,8 +3313,8 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   Py_VISIT(traverse_module_state->__pyx_type___pyx_memoryviewslice);
   for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_slice[i]); }
   for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<4; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<160; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<7; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<177; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<4; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_traverse_contents ### */
 /* CommonTypesMetaclass.module_state_traverse */
@@ -16563,7 +16596,186 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
   return __pyx_r;
 }
 
-/* "abovedata_backtesting/exits/cython_exits.py":16
+/* "abovedata_backtesting/exits/cython_exits.py":23
+ * 
+ * 
+ * def _as_f64(arr: NDArray[np.floating]) -> NDArray[np.float64]:             # <<<<<<<<<<<<<<
+ *     """Contiguous float64 view of ``arr``; copies only when required."""
+ *     return np.ascontiguousarray(arr, dtype=np.float64)
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_1_as_f64(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits__as_f64, "Contiguous float64 view of ``arr``; copies only when required.");
+static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_1_as_f64 = {"_as_f64", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_1_as_f64, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits__as_f64};
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_1_as_f64(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_arr = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_as_f64 (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_arr,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 23, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 23, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "_as_f64", 0) < (0)) __PYX_ERR(0, 23, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("_as_f64", 1, 1, 1, i); __PYX_ERR(0, 23, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 23, __pyx_L3_error)
+    }
+    __pyx_v_arr = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_as_f64", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 23, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits._as_f64", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits__as_f64(__pyx_self, __pyx_v_arr);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits__as_f64(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_arr) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  size_t __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_as_f64", 0);
+
+  /* "abovedata_backtesting/exits/cython_exits.py":25
+ * def _as_f64(arr: NDArray[np.floating]) -> NDArray[np.float64]:
+ *     """Contiguous float64 view of ``arr``; copies only when required."""
+ *     return np.ascontiguousarray(arr, dtype=np.float64)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_ascontiguousarray); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_v_arr};
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 25, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 25, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":23
+ * 
+ * 
+ * def _as_f64(arr: NDArray[np.floating]) -> NDArray[np.float64]:             # <<<<<<<<<<<<<<
+ *     """Contiguous float64 view of ``arr``; copies only when required."""
+ *     return np.ascontiguousarray(arr, dtype=np.float64)
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits._as_f64", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "abovedata_backtesting/exits/cython_exits.py":28
  * 
  * 
  * @cython.cfunc             # <<<<<<<<<<<<<<
@@ -16587,7 +16799,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
   int __pyx_t_6;
   __Pyx_RefNannySetupContext("_fixed_holding_exit", 0);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":25
+  /* "abovedata_backtesting/exits/cython_exits.py":37
  *     out: cython.double[:],
  * ) -> None:
  *     n: cython.Py_ssize_t = positions.shape[0]             # <<<<<<<<<<<<<<
@@ -16596,7 +16808,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
   __pyx_v_n = (__pyx_v_positions.shape[0]);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":27
+  /* "abovedata_backtesting/exits/cython_exits.py":39
  *     n: cython.Py_ssize_t = positions.shape[0]
  *     i: cython.Py_ssize_t
  *     days_held: cython.int = 0             # <<<<<<<<<<<<<<
@@ -16605,7 +16817,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
   __pyx_v_days_held = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":28
+  /* "abovedata_backtesting/exits/cython_exits.py":40
  *     i: cython.Py_ssize_t
  *     days_held: cython.int = 0
  *     in_position: cython.bint = False             # <<<<<<<<<<<<<<
@@ -16614,7 +16826,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
   __pyx_v_in_position = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":31
+  /* "abovedata_backtesting/exits/cython_exits.py":43
  *     pos: cython.double
  * 
  *     for i in range(n):             # <<<<<<<<<<<<<<
@@ -16626,7 +16838,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "abovedata_backtesting/exits/cython_exits.py":32
+    /* "abovedata_backtesting/exits/cython_exits.py":44
  * 
  *     for i in range(n):
  *         pos = positions[i]             # <<<<<<<<<<<<<<
@@ -16634,9 +16846,9 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
  *             if not in_position:
 */
     __pyx_t_4 = __pyx_v_i;
-    __pyx_v_pos = (*((double *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_4 * __pyx_v_positions.strides[0]) )));
+    __pyx_v_pos = (*((double const  *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_4 * __pyx_v_positions.strides[0]) )));
 
-    /* "abovedata_backtesting/exits/cython_exits.py":33
+    /* "abovedata_backtesting/exits/cython_exits.py":45
  *     for i in range(n):
  *         pos = positions[i]
  *         if pos > 0.01 or pos < -0.01:             # <<<<<<<<<<<<<<
@@ -16654,7 +16866,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
     __pyx_L6_bool_binop_done:;
     if (__pyx_t_5) {
 
-      /* "abovedata_backtesting/exits/cython_exits.py":34
+      /* "abovedata_backtesting/exits/cython_exits.py":46
  *         pos = positions[i]
  *         if pos > 0.01 or pos < -0.01:
  *             if not in_position:             # <<<<<<<<<<<<<<
@@ -16664,7 +16876,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
       __pyx_t_5 = (!__pyx_v_in_position);
       if (__pyx_t_5) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":35
+        /* "abovedata_backtesting/exits/cython_exits.py":47
  *         if pos > 0.01 or pos < -0.01:
  *             if not in_position:
  *                 in_position = True             # <<<<<<<<<<<<<<
@@ -16673,7 +16885,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
         __pyx_v_in_position = 1;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":36
+        /* "abovedata_backtesting/exits/cython_exits.py":48
  *             if not in_position:
  *                 in_position = True
  *                 days_held = 1             # <<<<<<<<<<<<<<
@@ -16682,7 +16894,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
         __pyx_v_days_held = 1;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":37
+        /* "abovedata_backtesting/exits/cython_exits.py":49
  *                 in_position = True
  *                 days_held = 1
  *                 out[i] = pos             # <<<<<<<<<<<<<<
@@ -16692,7 +16904,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
         __pyx_t_4 = __pyx_v_i;
         *((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_4 * __pyx_v_out.strides[0]) )) = __pyx_v_pos;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":34
+        /* "abovedata_backtesting/exits/cython_exits.py":46
  *         pos = positions[i]
  *         if pos > 0.01 or pos < -0.01:
  *             if not in_position:             # <<<<<<<<<<<<<<
@@ -16702,7 +16914,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
         goto __pyx_L8;
       }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":38
+      /* "abovedata_backtesting/exits/cython_exits.py":50
  *                 days_held = 1
  *                 out[i] = pos
  *             elif signal_date_mask[i]:             # <<<<<<<<<<<<<<
@@ -16710,10 +16922,10 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
  *                 out[i] = pos
 */
       __pyx_t_4 = __pyx_v_i;
-      __pyx_t_5 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_signal_date_mask.data + __pyx_t_4 * __pyx_v_signal_date_mask.strides[0]) ))) != 0);
+      __pyx_t_5 = ((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_signal_date_mask.data + __pyx_t_4 * __pyx_v_signal_date_mask.strides[0]) ))) != 0);
       if (__pyx_t_5) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":39
+        /* "abovedata_backtesting/exits/cython_exits.py":51
  *                 out[i] = pos
  *             elif signal_date_mask[i]:
  *                 days_held = 1             # <<<<<<<<<<<<<<
@@ -16722,7 +16934,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
         __pyx_v_days_held = 1;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":40
+        /* "abovedata_backtesting/exits/cython_exits.py":52
  *             elif signal_date_mask[i]:
  *                 days_held = 1
  *                 out[i] = pos             # <<<<<<<<<<<<<<
@@ -16732,7 +16944,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
         __pyx_t_4 = __pyx_v_i;
         *((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_4 * __pyx_v_out.strides[0]) )) = __pyx_v_pos;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":38
+        /* "abovedata_backtesting/exits/cython_exits.py":50
  *                 days_held = 1
  *                 out[i] = pos
  *             elif signal_date_mask[i]:             # <<<<<<<<<<<<<<
@@ -16742,7 +16954,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
         goto __pyx_L8;
       }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":41
+      /* "abovedata_backtesting/exits/cython_exits.py":53
  *                 days_held = 1
  *                 out[i] = pos
  *             elif days_held >= holding_days:             # <<<<<<<<<<<<<<
@@ -16752,7 +16964,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
       __pyx_t_5 = (__pyx_v_days_held >= __pyx_v_holding_days);
       if (__pyx_t_5) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":42
+        /* "abovedata_backtesting/exits/cython_exits.py":54
  *                 out[i] = pos
  *             elif days_held >= holding_days:
  *                 out[i] = 0.0             # <<<<<<<<<<<<<<
@@ -16762,7 +16974,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
         __pyx_t_4 = __pyx_v_i;
         *((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_4 * __pyx_v_out.strides[0]) )) = 0.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":43
+        /* "abovedata_backtesting/exits/cython_exits.py":55
  *             elif days_held >= holding_days:
  *                 out[i] = 0.0
  *                 in_position = False             # <<<<<<<<<<<<<<
@@ -16771,7 +16983,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
         __pyx_v_in_position = 0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":44
+        /* "abovedata_backtesting/exits/cython_exits.py":56
  *                 out[i] = 0.0
  *                 in_position = False
  *                 days_held = 0             # <<<<<<<<<<<<<<
@@ -16780,7 +16992,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
         __pyx_v_days_held = 0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":41
+        /* "abovedata_backtesting/exits/cython_exits.py":53
  *                 days_held = 1
  *                 out[i] = pos
  *             elif days_held >= holding_days:             # <<<<<<<<<<<<<<
@@ -16790,7 +17002,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
         goto __pyx_L8;
       }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":46
+      /* "abovedata_backtesting/exits/cython_exits.py":58
  *                 days_held = 0
  *             else:
  *                 days_held += 1             # <<<<<<<<<<<<<<
@@ -16800,7 +17012,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
       /*else*/ {
         __pyx_v_days_held = (__pyx_v_days_held + 1);
 
-        /* "abovedata_backtesting/exits/cython_exits.py":47
+        /* "abovedata_backtesting/exits/cython_exits.py":59
  *             else:
  *                 days_held += 1
  *                 out[i] = pos             # <<<<<<<<<<<<<<
@@ -16812,7 +17024,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
       }
       __pyx_L8:;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":33
+      /* "abovedata_backtesting/exits/cython_exits.py":45
  *     for i in range(n):
  *         pos = positions[i]
  *         if pos > 0.01 or pos < -0.01:             # <<<<<<<<<<<<<<
@@ -16822,7 +17034,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
       goto __pyx_L5;
     }
 
-    /* "abovedata_backtesting/exits/cython_exits.py":49
+    /* "abovedata_backtesting/exits/cython_exits.py":61
  *                 out[i] = pos
  *         else:
  *             out[i] = 0.0             # <<<<<<<<<<<<<<
@@ -16833,7 +17045,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
       __pyx_t_4 = __pyx_v_i;
       *((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_4 * __pyx_v_out.strides[0]) )) = 0.0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":50
+      /* "abovedata_backtesting/exits/cython_exits.py":62
  *         else:
  *             out[i] = 0.0
  *             in_position = False             # <<<<<<<<<<<<<<
@@ -16842,7 +17054,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
       __pyx_v_in_position = 0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":51
+      /* "abovedata_backtesting/exits/cython_exits.py":63
  *             out[i] = 0.0
  *             in_position = False
  *             days_held = 0             # <<<<<<<<<<<<<<
@@ -16854,7 +17066,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
     __pyx_L5:;
   }
 
-  /* "abovedata_backtesting/exits/cython_exits.py":16
+  /* "abovedata_backtesting/exits/cython_exits.py":28
  * 
  * 
  * @cython.cfunc             # <<<<<<<<<<<<<<
@@ -16869,7 +17081,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
   return __pyx_r;
 }
 
-/* "abovedata_backtesting/exits/cython_exits.py":54
+/* "abovedata_backtesting/exits/cython_exits.py":66
  * 
  * 
  * def fixed_holding_exit_cy(             # <<<<<<<<<<<<<<
@@ -16878,16 +17090,16 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_ho
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_1fixed_holding_exit_cy(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_3fixed_holding_exit_cy(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_fixed_holding_exit_cy, "Apply fixed holding period exit logic.\n\n    Parameters\n    ----------\n    positions : (N,) float64 array of raw positions from entry rule\n    signal_date_mask : (N,) uint8 array, 1 where date is a signal_date\n    holding_days : max days to hold before exiting\n\n    Returns\n    -------\n    (N,) float64 array of modified positions\n    ");
-static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_1fixed_holding_exit_cy = {"fixed_holding_exit_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_1fixed_holding_exit_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_fixed_holding_exit_cy};
-static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_1fixed_holding_exit_cy(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_2fixed_holding_exit_cy, "Apply fixed holding period exit logic.\n\n    Parameters\n    ----------\n    positions : (N,) float64 array of raw positions from entry rule\n    signal_date_mask : (N,) uint8 array, 1 where date is a signal_date\n    holding_days : max days to hold before exiting\n\n    Returns\n    -------\n    (N,) float64 array of modified positions\n    ");
+static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_3fixed_holding_exit_cy = {"fixed_holding_exit_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_3fixed_holding_exit_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_2fixed_holding_exit_cy};
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_3fixed_holding_exit_cy(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -16919,47 +17131,47 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_positions,&__pyx_mstate_global->__pyx_n_u_signal_date_mask,&__pyx_mstate_global->__pyx_n_u_holding_days,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 54, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 66, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 54, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 66, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 54, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 66, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 54, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 66, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fixed_holding_exit_cy", 0) < (0)) __PYX_ERR(0, 54, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fixed_holding_exit_cy", 0) < (0)) __PYX_ERR(0, 66, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fixed_holding_exit_cy", 1, 3, 3, i); __PYX_ERR(0, 54, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fixed_holding_exit_cy", 1, 3, 3, i); __PYX_ERR(0, 66, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 3)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 54, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 66, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 54, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 66, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 54, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 66, __pyx_L3_error)
     }
     __pyx_v_positions = values[0];
     __pyx_v_signal_date_mask = values[1];
-    if (__Pyx_PyInt_FromNumber(&values[2], "holding_days", 0) < (0)) __PYX_ERR(0, 57, __pyx_L3_error)
+    if (__Pyx_PyInt_FromNumber(&values[2], "holding_days", 0) < (0)) __PYX_ERR(0, 69, __pyx_L3_error)
     __pyx_v_holding_days = ((PyObject*)values[2]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fixed_holding_exit_cy", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 54, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("fixed_holding_exit_cy", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 66, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -16970,8 +17182,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_holding_days), (&PyLong_Type), 0, "holding_days", 2))) __PYX_ERR(0, 57, __pyx_L1_error)
-  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_fixed_holding_exit_cy(__pyx_self, __pyx_v_positions, __pyx_v_signal_date_mask, __pyx_v_holding_days);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_holding_days), (&PyLong_Type), 0, "holding_days", 2))) __PYX_ERR(0, 69, __pyx_L1_error)
+  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2fixed_holding_exit_cy(__pyx_self, __pyx_v_positions, __pyx_v_signal_date_mask, __pyx_v_holding_days);
 
   /* function exit code */
   goto __pyx_L0;
@@ -16990,7 +17202,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_fixed_holding_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_signal_date_mask, PyObject *__pyx_v_holding_days) {
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2fixed_holding_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_signal_date_mask, PyObject *__pyx_v_holding_days) {
   PyObject *__pyx_v_pos = NULL;
   PyObject *__pyx_v_mask = NULL;
   PyObject *__pyx_v_out = NULL;
@@ -16999,9 +17211,9 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_fixed_ho
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
+  size_t __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
   __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
   __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
@@ -17012,176 +17224,161 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_fixed_ho
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("fixed_holding_exit_cy", 0);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":71
+  /* "abovedata_backtesting/exits/cython_exits.py":83
  *     (N,) float64 array of modified positions
  *     """
- *     pos = np.array(positions, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
- *     mask = np.array(signal_date_mask, dtype=np.uint8, copy=True)
+ *     pos = _as_f64(positions)             # <<<<<<<<<<<<<<
+ *     mask = np.ascontiguousarray(signal_date_mask, dtype=np.uint8)
  *     out = np.empty(pos.shape[0], dtype=np.float64)
 */
   __pyx_t_2 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 83, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
     assert(__pyx_t_2);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
     __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_2, __pyx_v_positions};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 71, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 71, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 71, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_positions};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __pyx_v_pos = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":72
+  /* "abovedata_backtesting/exits/cython_exits.py":84
  *     """
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     mask = np.array(signal_date_mask, dtype=np.uint8, copy=True)             # <<<<<<<<<<<<<<
+ *     pos = _as_f64(positions)
+ *     mask = np.ascontiguousarray(signal_date_mask, dtype=np.uint8)             # <<<<<<<<<<<<<<
  *     out = np.empty(pos.shape[0], dtype=np.float64)
  *     _fixed_holding_exit(pos, mask, holding_days, out)
 */
-  __pyx_t_4 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 72, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 72, __pyx_L1_error)
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_ascontiguousarray); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 72, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_uint8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 72, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_uint8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
   if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-    assert(__pyx_t_4);
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+    assert(__pyx_t_3);
     PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
-    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_3);
     __Pyx_INCREF(__pyx__function);
     __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
-    __pyx_t_6 = 0;
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_4, __pyx_v_signal_date_mask};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 72, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_2, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 72, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 72, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_3, __pyx_v_signal_date_mask};
+    __pyx_t_2 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_2, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 84, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_2);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __pyx_v_mask = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":73
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     mask = np.array(signal_date_mask, dtype=np.uint8, copy=True)
+  /* "abovedata_backtesting/exits/cython_exits.py":85
+ *     pos = _as_f64(positions)
+ *     mask = np.ascontiguousarray(signal_date_mask, dtype=np.uint8)
  *     out = np.empty(pos.shape[0], dtype=np.float64)             # <<<<<<<<<<<<<<
  *     _fixed_holding_exit(pos, mask, holding_days, out)
  *     return out
 */
   __pyx_t_5 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 73, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_pos, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 73, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 73, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_pos, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
     assert(__pyx_t_5);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
     __Pyx_INCREF(__pyx_t_5);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_t_4};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 73, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_7, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 73, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_t_3};
+    __pyx_t_2 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_7, __pyx_t_2, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 85, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_2);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __pyx_v_out = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":74
- *     mask = np.array(signal_date_mask, dtype=np.uint8, copy=True)
+  /* "abovedata_backtesting/exits/cython_exits.py":86
+ *     mask = np.ascontiguousarray(signal_date_mask, dtype=np.uint8)
  *     out = np.empty(pos.shape[0], dtype=np.float64)
  *     _fixed_holding_exit(pos, mask, holding_days, out)             # <<<<<<<<<<<<<<
  *     return out
  * 
 */
-  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_pos, 0); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 86, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_8.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 74, __pyx_L1_error)
+    __PYX_ERR(0, 86, __pyx_L1_error)
   }
-  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char(__pyx_v_mask, PyBUF_WRITABLE); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(__pyx_v_mask, 0); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 86, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_9.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 74, __pyx_L1_error)
+    __PYX_ERR(0, 86, __pyx_L1_error)
   }
-  __pyx_t_10 = __Pyx_PyLong_As_int(__pyx_v_holding_days); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 74, __pyx_L1_error)
-  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out, PyBUF_WRITABLE); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_t_10 = __Pyx_PyLong_As_int(__pyx_v_holding_days); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out, PyBUF_WRITABLE); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 86, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_11.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 74, __pyx_L1_error)
+    __PYX_ERR(0, 86, __pyx_L1_error)
   }
-  __pyx_t_1 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_holding_exit(__pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_t_11); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__fixed_holding_exit(__pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_t_11); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
   __pyx_t_8.memview = NULL; __pyx_t_8.data = NULL;
@@ -17191,7 +17388,7 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_fixed_ho
   __pyx_t_11.memview = NULL; __pyx_t_11.data = NULL;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":75
+  /* "abovedata_backtesting/exits/cython_exits.py":87
  *     out = np.empty(pos.shape[0], dtype=np.float64)
  *     _fixed_holding_exit(pos, mask, holding_days, out)
  *     return out             # <<<<<<<<<<<<<<
@@ -17203,7 +17400,7 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_fixed_ho
   __pyx_r = __pyx_v_out;
   goto __pyx_L0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":54
+  /* "abovedata_backtesting/exits/cython_exits.py":66
  * 
  * 
  * def fixed_holding_exit_cy(             # <<<<<<<<<<<<<<
@@ -17216,8 +17413,8 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_fixed_ho
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
@@ -17233,7 +17430,7 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_fixed_ho
   return __pyx_r;
 }
 
-/* "abovedata_backtesting/exits/cython_exits.py":78
+/* "abovedata_backtesting/exits/cython_exits.py":90
  * 
  * 
  * @cython.cfunc             # <<<<<<<<<<<<<<
@@ -17265,7 +17462,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
   int __pyx_t_6;
   __Pyx_RefNannySetupContext("_trailing_stop_exit", 0);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":90
+  /* "abovedata_backtesting/exits/cython_exits.py":102
  *     out_exit: cython.double[:],
  * ) -> None:
  *     n: cython.Py_ssize_t = positions.shape[0]             # <<<<<<<<<<<<<<
@@ -17274,7 +17471,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
   __pyx_v_n = (__pyx_v_positions.shape[0]);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":92
+  /* "abovedata_backtesting/exits/cython_exits.py":104
  *     n: cython.Py_ssize_t = positions.shape[0]
  *     i: cython.Py_ssize_t
  *     peak: cython.double = 0.0             # <<<<<<<<<<<<<<
@@ -17283,7 +17480,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
   __pyx_v_peak = 0.0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":93
+  /* "abovedata_backtesting/exits/cython_exits.py":105
  *     i: cython.Py_ssize_t
  *     peak: cython.double = 0.0
  *     trough: cython.double = 0.0             # <<<<<<<<<<<<<<
@@ -17292,7 +17489,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
   __pyx_v_trough = 0.0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":94
+  /* "abovedata_backtesting/exits/cython_exits.py":106
  *     peak: cython.double = 0.0
  *     trough: cython.double = 0.0
  *     in_position: cython.bint = False             # <<<<<<<<<<<<<<
@@ -17301,7 +17498,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
   __pyx_v_in_position = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":95
+  /* "abovedata_backtesting/exits/cython_exits.py":107
  *     trough: cython.double = 0.0
  *     in_position: cython.bint = False
  *     direction: cython.double = 0.0             # <<<<<<<<<<<<<<
@@ -17310,7 +17507,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
   __pyx_v_direction = 0.0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":104
+  /* "abovedata_backtesting/exits/cython_exits.py":116
  *     low: cython.double
  * 
  *     for i in range(n):             # <<<<<<<<<<<<<<
@@ -17322,7 +17519,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "abovedata_backtesting/exits/cython_exits.py":105
+    /* "abovedata_backtesting/exits/cython_exits.py":117
  * 
  *     for i in range(n):
  *         pos = positions[i]             # <<<<<<<<<<<<<<
@@ -17330,9 +17527,9 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
  *         high = highs[i]
 */
     __pyx_t_4 = __pyx_v_i;
-    __pyx_v_pos = (*((double *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_4 * __pyx_v_positions.strides[0]) )));
+    __pyx_v_pos = (*((double const  *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_4 * __pyx_v_positions.strides[0]) )));
 
-    /* "abovedata_backtesting/exits/cython_exits.py":106
+    /* "abovedata_backtesting/exits/cython_exits.py":118
  *     for i in range(n):
  *         pos = positions[i]
  *         close = closes[i]             # <<<<<<<<<<<<<<
@@ -17340,9 +17537,9 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
  *         low = lows[i]
 */
     __pyx_t_4 = __pyx_v_i;
-    __pyx_v_close = (*((double *) ( /* dim=0 */ (__pyx_v_closes.data + __pyx_t_4 * __pyx_v_closes.strides[0]) )));
+    __pyx_v_close = (*((double const  *) ( /* dim=0 */ (__pyx_v_closes.data + __pyx_t_4 * __pyx_v_closes.strides[0]) )));
 
-    /* "abovedata_backtesting/exits/cython_exits.py":107
+    /* "abovedata_backtesting/exits/cython_exits.py":119
  *         pos = positions[i]
  *         close = closes[i]
  *         high = highs[i]             # <<<<<<<<<<<<<<
@@ -17350,9 +17547,9 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
  * 
 */
     __pyx_t_4 = __pyx_v_i;
-    __pyx_v_high = (*((double *) ( /* dim=0 */ (__pyx_v_highs.data + __pyx_t_4 * __pyx_v_highs.strides[0]) )));
+    __pyx_v_high = (*((double const  *) ( /* dim=0 */ (__pyx_v_highs.data + __pyx_t_4 * __pyx_v_highs.strides[0]) )));
 
-    /* "abovedata_backtesting/exits/cython_exits.py":108
+    /* "abovedata_backtesting/exits/cython_exits.py":120
  *         close = closes[i]
  *         high = highs[i]
  *         low = lows[i]             # <<<<<<<<<<<<<<
@@ -17360,9 +17557,9 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
  *         if (pos > 0.01 or pos < -0.01) and not in_position:
 */
     __pyx_t_4 = __pyx_v_i;
-    __pyx_v_low = (*((double *) ( /* dim=0 */ (__pyx_v_lows.data + __pyx_t_4 * __pyx_v_lows.strides[0]) )));
+    __pyx_v_low = (*((double const  *) ( /* dim=0 */ (__pyx_v_lows.data + __pyx_t_4 * __pyx_v_lows.strides[0]) )));
 
-    /* "abovedata_backtesting/exits/cython_exits.py":110
+    /* "abovedata_backtesting/exits/cython_exits.py":122
  *         low = lows[i]
  * 
  *         if (pos > 0.01 or pos < -0.01) and not in_position:             # <<<<<<<<<<<<<<
@@ -17386,7 +17583,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
     __pyx_L6_bool_binop_done:;
     if (__pyx_t_5) {
 
-      /* "abovedata_backtesting/exits/cython_exits.py":112
+      /* "abovedata_backtesting/exits/cython_exits.py":124
  *         if (pos > 0.01 or pos < -0.01) and not in_position:
  *             # New entry
  *             in_position = True             # <<<<<<<<<<<<<<
@@ -17395,7 +17592,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
       __pyx_v_in_position = 1;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":113
+      /* "abovedata_backtesting/exits/cython_exits.py":125
  *             # New entry
  *             in_position = True
  *             if pos > 0:             # <<<<<<<<<<<<<<
@@ -17405,7 +17602,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       __pyx_t_5 = (__pyx_v_pos > 0.0);
       if (__pyx_t_5) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":114
+        /* "abovedata_backtesting/exits/cython_exits.py":126
  *             in_position = True
  *             if pos > 0:
  *                 direction = 1.0             # <<<<<<<<<<<<<<
@@ -17414,7 +17611,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         __pyx_v_direction = 1.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":115
+        /* "abovedata_backtesting/exits/cython_exits.py":127
  *             if pos > 0:
  *                 direction = 1.0
  *                 peak = high             # <<<<<<<<<<<<<<
@@ -17423,7 +17620,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         __pyx_v_peak = __pyx_v_high;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":113
+        /* "abovedata_backtesting/exits/cython_exits.py":125
  *             # New entry
  *             in_position = True
  *             if pos > 0:             # <<<<<<<<<<<<<<
@@ -17433,7 +17630,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         goto __pyx_L9;
       }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":117
+      /* "abovedata_backtesting/exits/cython_exits.py":129
  *                 peak = high
  *             else:
  *                 direction = -1.0             # <<<<<<<<<<<<<<
@@ -17443,7 +17640,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       /*else*/ {
         __pyx_v_direction = -1.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":118
+        /* "abovedata_backtesting/exits/cython_exits.py":130
  *             else:
  *                 direction = -1.0
  *                 trough = low             # <<<<<<<<<<<<<<
@@ -17454,7 +17651,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       }
       __pyx_L9:;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":119
+      /* "abovedata_backtesting/exits/cython_exits.py":131
  *                 direction = -1.0
  *                 trough = low
  *             out_pos[i] = pos             # <<<<<<<<<<<<<<
@@ -17464,7 +17661,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       __pyx_t_4 = __pyx_v_i;
       *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = __pyx_v_pos;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":120
+      /* "abovedata_backtesting/exits/cython_exits.py":132
  *                 trough = low
  *             out_pos[i] = pos
  *             out_exit[i] = close             # <<<<<<<<<<<<<<
@@ -17474,7 +17671,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       __pyx_t_4 = __pyx_v_i;
       *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_close;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":110
+      /* "abovedata_backtesting/exits/cython_exits.py":122
  *         low = lows[i]
  * 
  *         if (pos > 0.01 or pos < -0.01) and not in_position:             # <<<<<<<<<<<<<<
@@ -17484,7 +17681,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       goto __pyx_L5;
     }
 
-    /* "abovedata_backtesting/exits/cython_exits.py":122
+    /* "abovedata_backtesting/exits/cython_exits.py":134
  *             out_exit[i] = close
  * 
  *         elif in_position:             # <<<<<<<<<<<<<<
@@ -17493,7 +17690,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
     if (__pyx_v_in_position) {
 
-      /* "abovedata_backtesting/exits/cython_exits.py":123
+      /* "abovedata_backtesting/exits/cython_exits.py":135
  * 
  *         elif in_position:
  *             should_exit = False             # <<<<<<<<<<<<<<
@@ -17502,7 +17699,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
       __pyx_v_should_exit = 0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":124
+      /* "abovedata_backtesting/exits/cython_exits.py":136
  *         elif in_position:
  *             should_exit = False
  *             stop_exit_price = close             # <<<<<<<<<<<<<<
@@ -17511,7 +17708,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
       __pyx_v_stop_exit_price = __pyx_v_close;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":126
+      /* "abovedata_backtesting/exits/cython_exits.py":138
  *             stop_exit_price = close
  * 
  *             if direction > 0:             # <<<<<<<<<<<<<<
@@ -17521,7 +17718,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       __pyx_t_5 = (__pyx_v_direction > 0.0);
       if (__pyx_t_5) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":127
+        /* "abovedata_backtesting/exits/cython_exits.py":139
  * 
  *             if direction > 0:
  *                 if high > peak:             # <<<<<<<<<<<<<<
@@ -17531,7 +17728,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         __pyx_t_5 = (__pyx_v_high > __pyx_v_peak);
         if (__pyx_t_5) {
 
-          /* "abovedata_backtesting/exits/cython_exits.py":128
+          /* "abovedata_backtesting/exits/cython_exits.py":140
  *             if direction > 0:
  *                 if high > peak:
  *                     peak = high             # <<<<<<<<<<<<<<
@@ -17540,7 +17737,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
           __pyx_v_peak = __pyx_v_high;
 
-          /* "abovedata_backtesting/exits/cython_exits.py":127
+          /* "abovedata_backtesting/exits/cython_exits.py":139
  * 
  *             if direction > 0:
  *                 if high > peak:             # <<<<<<<<<<<<<<
@@ -17549,7 +17746,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         }
 
-        /* "abovedata_backtesting/exits/cython_exits.py":129
+        /* "abovedata_backtesting/exits/cython_exits.py":141
  *                 if high > peak:
  *                     peak = high
  *                 stop_price = peak * (1.0 - trailing_stop_pct)             # <<<<<<<<<<<<<<
@@ -17558,7 +17755,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         __pyx_v_stop_price = (__pyx_v_peak * (1.0 - __pyx_v_trailing_stop_pct));
 
-        /* "abovedata_backtesting/exits/cython_exits.py":130
+        /* "abovedata_backtesting/exits/cython_exits.py":142
  *                     peak = high
  *                 stop_price = peak * (1.0 - trailing_stop_pct)
  *                 if low <= stop_price:             # <<<<<<<<<<<<<<
@@ -17568,7 +17765,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         __pyx_t_5 = (__pyx_v_low <= __pyx_v_stop_price);
         if (__pyx_t_5) {
 
-          /* "abovedata_backtesting/exits/cython_exits.py":131
+          /* "abovedata_backtesting/exits/cython_exits.py":143
  *                 stop_price = peak * (1.0 - trailing_stop_pct)
  *                 if low <= stop_price:
  *                     should_exit = True             # <<<<<<<<<<<<<<
@@ -17577,7 +17774,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
           __pyx_v_should_exit = 1;
 
-          /* "abovedata_backtesting/exits/cython_exits.py":132
+          /* "abovedata_backtesting/exits/cython_exits.py":144
  *                 if low <= stop_price:
  *                     should_exit = True
  *                     stop_exit_price = stop_price             # <<<<<<<<<<<<<<
@@ -17586,7 +17783,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
           __pyx_v_stop_exit_price = __pyx_v_stop_price;
 
-          /* "abovedata_backtesting/exits/cython_exits.py":130
+          /* "abovedata_backtesting/exits/cython_exits.py":142
  *                     peak = high
  *                 stop_price = peak * (1.0 - trailing_stop_pct)
  *                 if low <= stop_price:             # <<<<<<<<<<<<<<
@@ -17595,7 +17792,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         }
 
-        /* "abovedata_backtesting/exits/cython_exits.py":126
+        /* "abovedata_backtesting/exits/cython_exits.py":138
  *             stop_exit_price = close
  * 
  *             if direction > 0:             # <<<<<<<<<<<<<<
@@ -17605,7 +17802,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         goto __pyx_L10;
       }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":134
+      /* "abovedata_backtesting/exits/cython_exits.py":146
  *                     stop_exit_price = stop_price
  *             else:
  *                 if low < trough:             # <<<<<<<<<<<<<<
@@ -17616,7 +17813,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         __pyx_t_5 = (__pyx_v_low < __pyx_v_trough);
         if (__pyx_t_5) {
 
-          /* "abovedata_backtesting/exits/cython_exits.py":135
+          /* "abovedata_backtesting/exits/cython_exits.py":147
  *             else:
  *                 if low < trough:
  *                     trough = low             # <<<<<<<<<<<<<<
@@ -17625,7 +17822,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
           __pyx_v_trough = __pyx_v_low;
 
-          /* "abovedata_backtesting/exits/cython_exits.py":134
+          /* "abovedata_backtesting/exits/cython_exits.py":146
  *                     stop_exit_price = stop_price
  *             else:
  *                 if low < trough:             # <<<<<<<<<<<<<<
@@ -17634,7 +17831,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         }
 
-        /* "abovedata_backtesting/exits/cython_exits.py":136
+        /* "abovedata_backtesting/exits/cython_exits.py":148
  *                 if low < trough:
  *                     trough = low
  *                 stop_price = trough * (1.0 + trailing_stop_pct)             # <<<<<<<<<<<<<<
@@ -17643,7 +17840,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         __pyx_v_stop_price = (__pyx_v_trough * (1.0 + __pyx_v_trailing_stop_pct));
 
-        /* "abovedata_backtesting/exits/cython_exits.py":137
+        /* "abovedata_backtesting/exits/cython_exits.py":149
  *                     trough = low
  *                 stop_price = trough * (1.0 + trailing_stop_pct)
  *                 if high >= stop_price:             # <<<<<<<<<<<<<<
@@ -17653,7 +17850,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         __pyx_t_5 = (__pyx_v_high >= __pyx_v_stop_price);
         if (__pyx_t_5) {
 
-          /* "abovedata_backtesting/exits/cython_exits.py":138
+          /* "abovedata_backtesting/exits/cython_exits.py":150
  *                 stop_price = trough * (1.0 + trailing_stop_pct)
  *                 if high >= stop_price:
  *                     should_exit = True             # <<<<<<<<<<<<<<
@@ -17662,7 +17859,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
           __pyx_v_should_exit = 1;
 
-          /* "abovedata_backtesting/exits/cython_exits.py":139
+          /* "abovedata_backtesting/exits/cython_exits.py":151
  *                 if high >= stop_price:
  *                     should_exit = True
  *                     stop_exit_price = stop_price             # <<<<<<<<<<<<<<
@@ -17671,7 +17868,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
           __pyx_v_stop_exit_price = __pyx_v_stop_price;
 
-          /* "abovedata_backtesting/exits/cython_exits.py":137
+          /* "abovedata_backtesting/exits/cython_exits.py":149
  *                     trough = low
  *                 stop_price = trough * (1.0 + trailing_stop_pct)
  *                 if high >= stop_price:             # <<<<<<<<<<<<<<
@@ -17682,7 +17879,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       }
       __pyx_L10:;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":141
+      /* "abovedata_backtesting/exits/cython_exits.py":153
  *                     stop_exit_price = stop_price
  * 
  *             if should_exit or (pos > -0.01 and pos < 0.01):             # <<<<<<<<<<<<<<
@@ -17705,7 +17902,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       __pyx_L16_bool_binop_done:;
       if (__pyx_t_5) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":142
+        /* "abovedata_backtesting/exits/cython_exits.py":154
  * 
  *             if should_exit or (pos > -0.01 and pos < 0.01):
  *                 out_pos[i] = 0.0             # <<<<<<<<<<<<<<
@@ -17715,7 +17912,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         __pyx_t_4 = __pyx_v_i;
         *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = 0.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":143
+        /* "abovedata_backtesting/exits/cython_exits.py":155
  *             if should_exit or (pos > -0.01 and pos < 0.01):
  *                 out_pos[i] = 0.0
  *                 if should_exit:             # <<<<<<<<<<<<<<
@@ -17724,7 +17921,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         if (__pyx_v_should_exit) {
 
-          /* "abovedata_backtesting/exits/cython_exits.py":144
+          /* "abovedata_backtesting/exits/cython_exits.py":156
  *                 out_pos[i] = 0.0
  *                 if should_exit:
  *                     out_exit[i] = stop_exit_price             # <<<<<<<<<<<<<<
@@ -17734,7 +17931,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
           __pyx_t_4 = __pyx_v_i;
           *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_stop_exit_price;
 
-          /* "abovedata_backtesting/exits/cython_exits.py":143
+          /* "abovedata_backtesting/exits/cython_exits.py":155
  *             if should_exit or (pos > -0.01 and pos < 0.01):
  *                 out_pos[i] = 0.0
  *                 if should_exit:             # <<<<<<<<<<<<<<
@@ -17744,7 +17941,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
           goto __pyx_L19;
         }
 
-        /* "abovedata_backtesting/exits/cython_exits.py":146
+        /* "abovedata_backtesting/exits/cython_exits.py":158
  *                     out_exit[i] = stop_exit_price
  *                 else:
  *                     out_exit[i] = close             # <<<<<<<<<<<<<<
@@ -17757,7 +17954,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         }
         __pyx_L19:;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":147
+        /* "abovedata_backtesting/exits/cython_exits.py":159
  *                 else:
  *                     out_exit[i] = close
  *                 in_position = False             # <<<<<<<<<<<<<<
@@ -17766,7 +17963,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         __pyx_v_in_position = 0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":148
+        /* "abovedata_backtesting/exits/cython_exits.py":160
  *                     out_exit[i] = close
  *                 in_position = False
  *                 peak = 0.0             # <<<<<<<<<<<<<<
@@ -17775,7 +17972,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         __pyx_v_peak = 0.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":149
+        /* "abovedata_backtesting/exits/cython_exits.py":161
  *                 in_position = False
  *                 peak = 0.0
  *                 trough = 0.0             # <<<<<<<<<<<<<<
@@ -17784,7 +17981,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
         __pyx_v_trough = 0.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":141
+        /* "abovedata_backtesting/exits/cython_exits.py":153
  *                     stop_exit_price = stop_price
  * 
  *             if should_exit or (pos > -0.01 and pos < 0.01):             # <<<<<<<<<<<<<<
@@ -17794,7 +17991,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         goto __pyx_L15;
       }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":151
+      /* "abovedata_backtesting/exits/cython_exits.py":163
  *                 trough = 0.0
  *             else:
  *                 out_pos[i] = pos             # <<<<<<<<<<<<<<
@@ -17805,7 +18002,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
         __pyx_t_4 = __pyx_v_i;
         *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = __pyx_v_pos;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":152
+        /* "abovedata_backtesting/exits/cython_exits.py":164
  *             else:
  *                 out_pos[i] = pos
  *                 out_exit[i] = close             # <<<<<<<<<<<<<<
@@ -17817,7 +18014,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       }
       __pyx_L15:;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":122
+      /* "abovedata_backtesting/exits/cython_exits.py":134
  *             out_exit[i] = close
  * 
  *         elif in_position:             # <<<<<<<<<<<<<<
@@ -17827,7 +18024,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       goto __pyx_L5;
     }
 
-    /* "abovedata_backtesting/exits/cython_exits.py":154
+    /* "abovedata_backtesting/exits/cython_exits.py":166
  *                 out_exit[i] = close
  *         else:
  *             out_pos[i] = pos             # <<<<<<<<<<<<<<
@@ -17838,7 +18035,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
       __pyx_t_4 = __pyx_v_i;
       *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = __pyx_v_pos;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":155
+      /* "abovedata_backtesting/exits/cython_exits.py":167
  *         else:
  *             out_pos[i] = pos
  *             out_exit[i] = close             # <<<<<<<<<<<<<<
@@ -17851,7 +18048,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
     __pyx_L5:;
   }
 
-  /* "abovedata_backtesting/exits/cython_exits.py":78
+  /* "abovedata_backtesting/exits/cython_exits.py":90
  * 
  * 
  * @cython.cfunc             # <<<<<<<<<<<<<<
@@ -17866,7 +18063,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
   return __pyx_r;
 }
 
-/* "abovedata_backtesting/exits/cython_exits.py":158
+/* "abovedata_backtesting/exits/cython_exits.py":170
  * 
  * 
  * def trailing_stop_exit_cy(             # <<<<<<<<<<<<<<
@@ -17875,16 +18072,16 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_3trailing_stop_exit_cy(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_5trailing_stop_exit_cy(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_2trailing_stop_exit_cy, "Apply trailing stop exit logic.\n\n    Returns\n    -------\n    (new_positions, exit_prices) \342\200\224 both (N,) float64 arrays\n    ");
-static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_3trailing_stop_exit_cy = {"trailing_stop_exit_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_3trailing_stop_exit_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_2trailing_stop_exit_cy};
-static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_3trailing_stop_exit_cy(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_4trailing_stop_exit_cy, "Apply trailing stop exit logic.\n\n    Returns\n    -------\n    (new_positions, exit_prices) \342\200\224 both (N,) float64 arrays\n    ");
+static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_5trailing_stop_exit_cy = {"trailing_stop_exit_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_5trailing_stop_exit_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_4trailing_stop_exit_cy};
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_5trailing_stop_exit_cy(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -17918,60 +18115,60 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_positions,&__pyx_mstate_global->__pyx_n_u_closes,&__pyx_mstate_global->__pyx_n_u_highs,&__pyx_mstate_global->__pyx_n_u_lows,&__pyx_mstate_global->__pyx_n_u_trailing_stop_pct,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 158, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 170, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  5:
         values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 158, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 170, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 158, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 170, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 158, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 170, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 158, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 170, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 158, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 170, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "trailing_stop_exit_cy", 0) < (0)) __PYX_ERR(0, 158, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "trailing_stop_exit_cy", 0) < (0)) __PYX_ERR(0, 170, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 5; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("trailing_stop_exit_cy", 1, 5, 5, i); __PYX_ERR(0, 158, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("trailing_stop_exit_cy", 1, 5, 5, i); __PYX_ERR(0, 170, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 5)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 158, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 170, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 158, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 170, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 158, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 170, __pyx_L3_error)
       values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 158, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 170, __pyx_L3_error)
       values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 158, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 170, __pyx_L3_error)
     }
     __pyx_v_positions = values[0];
     __pyx_v_closes = values[1];
     __pyx_v_highs = values[2];
     __pyx_v_lows = values[3];
-    __pyx_v_trailing_stop_pct = __Pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_trailing_stop_pct == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 163, __pyx_L3_error)
+    __pyx_v_trailing_stop_pct = __Pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_trailing_stop_pct == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 175, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("trailing_stop_exit_cy", 1, 5, 5, __pyx_nargs); __PYX_ERR(0, 158, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("trailing_stop_exit_cy", 1, 5, 5, __pyx_nargs); __PYX_ERR(0, 170, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -17982,7 +18179,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailing_stop_exit_cy(__pyx_self, __pyx_v_positions, __pyx_v_closes, __pyx_v_highs, __pyx_v_lows, __pyx_v_trailing_stop_pct);
+  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4trailing_stop_exit_cy(__pyx_self, __pyx_v_positions, __pyx_v_closes, __pyx_v_highs, __pyx_v_lows, __pyx_v_trailing_stop_pct);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -17992,7 +18189,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailing_stop_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, double __pyx_v_trailing_stop_pct) {
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4trailing_stop_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, double __pyx_v_trailing_stop_pct) {
   PyObject *__pyx_v_n = NULL;
   PyObject *__pyx_v_pos = NULL;
   PyObject *__pyx_v_cl = NULL;
@@ -18005,9 +18202,9 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailin
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
+  size_t __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
+  PyObject *__pyx_t_6 = NULL;
   __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
   __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
   __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
@@ -18019,339 +18216,283 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailin
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("trailing_stop_exit_cy", 0);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":171
+  /* "abovedata_backtesting/exits/cython_exits.py":183
  *     (new_positions, exit_prices)  both (N,) float64 arrays
  *     """
  *     n = positions.shape[0]             # <<<<<<<<<<<<<<
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     cl = np.array(closes, dtype=np.float64, copy=True)
+ *     pos = _as_f64(positions)
+ *     cl = _as_f64(closes)
 */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_positions, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_positions, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_n = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":172
+  /* "abovedata_backtesting/exits/cython_exits.py":184
  *     """
  *     n = positions.shape[0]
- *     pos = np.array(positions, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
- *     cl = np.array(closes, dtype=np.float64, copy=True)
- *     hi = np.array(highs, dtype=np.float64, copy=True)
+ *     pos = _as_f64(positions)             # <<<<<<<<<<<<<<
+ *     cl = _as_f64(closes)
+ *     hi = _as_f64(highs)
 */
   __pyx_t_1 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 172, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 172, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 172, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 172, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_3);
     assert(__pyx_t_1);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
     __Pyx_INCREF(__pyx_t_1);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_1, __pyx_v_positions};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 172, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 172, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 172, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_v_positions};
+    __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 172, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
   __pyx_v_pos = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":173
+  /* "abovedata_backtesting/exits/cython_exits.py":185
  *     n = positions.shape[0]
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     cl = np.array(closes, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
- *     hi = np.array(highs, dtype=np.float64, copy=True)
- *     lo = np.array(lows, dtype=np.float64, copy=True)
+ *     pos = _as_f64(positions)
+ *     cl = _as_f64(closes)             # <<<<<<<<<<<<<<
+ *     hi = _as_f64(highs)
+ *     lo = _as_f64(lows)
 */
-  __pyx_t_4 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 173, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 173, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 173, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-    assert(__pyx_t_4);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
-    __Pyx_INCREF(__pyx_t_4);
+  if (unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_3);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_1, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_4, __pyx_v_closes};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 173, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_1, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 173, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 173, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_closes};
+    __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 173, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
   __pyx_v_cl = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":174
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     cl = np.array(closes, dtype=np.float64, copy=True)
- *     hi = np.array(highs, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
- *     lo = np.array(lows, dtype=np.float64, copy=True)
+  /* "abovedata_backtesting/exits/cython_exits.py":186
+ *     pos = _as_f64(positions)
+ *     cl = _as_f64(closes)
+ *     hi = _as_f64(highs)             # <<<<<<<<<<<<<<
+ *     lo = _as_f64(lows)
  *     out_pos = np.empty(n, dtype=np.float64)
 */
-  __pyx_t_5 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 174, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __pyx_t_1 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 186, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 174, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-    assert(__pyx_t_5);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_1);
-    __Pyx_INCREF(__pyx_t_5);
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_1);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_1);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_1, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_5, __pyx_v_highs};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 174, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_4, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 174, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 174, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_v_highs};
+    __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 186, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
   __pyx_v_hi = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":175
- *     cl = np.array(closes, dtype=np.float64, copy=True)
- *     hi = np.array(highs, dtype=np.float64, copy=True)
- *     lo = np.array(lows, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
+  /* "abovedata_backtesting/exits/cython_exits.py":187
+ *     cl = _as_f64(closes)
+ *     hi = _as_f64(highs)
+ *     lo = _as_f64(lows)             # <<<<<<<<<<<<<<
  *     out_pos = np.empty(n, dtype=np.float64)
  *     out_exit = np.empty(n, dtype=np.float64)
 */
-  __pyx_t_1 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
-    assert(__pyx_t_1);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
-    __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_3);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_1, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_1, __pyx_v_lows};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 175, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 175, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 175, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 175, __pyx_L1_error)
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_lows};
+    __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
   __pyx_v_lo = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":176
- *     hi = np.array(highs, dtype=np.float64, copy=True)
- *     lo = np.array(lows, dtype=np.float64, copy=True)
+  /* "abovedata_backtesting/exits/cython_exits.py":188
+ *     hi = _as_f64(highs)
+ *     lo = _as_f64(lows)
  *     out_pos = np.empty(n, dtype=np.float64)             # <<<<<<<<<<<<<<
  *     out_exit = np.empty(n, dtype=np.float64)
  *     _trailing_stop_exit(pos, cl, hi, lo, trailing_stop_pct, out_pos, out_exit)
 */
-  __pyx_t_4 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __pyx_t_1 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 188, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 188, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 188, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 188, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
   if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-    assert(__pyx_t_4);
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_5);
+    assert(__pyx_t_1);
     PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
-    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_1);
     __Pyx_INCREF(__pyx__function);
     __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
-    __pyx_t_6 = 0;
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_4, __pyx_v_n};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 176, __pyx_L1_error)
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_1, __pyx_v_n};
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 188, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_1, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 176, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 188, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 176, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 188, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
   __pyx_v_out_pos = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":177
- *     lo = np.array(lows, dtype=np.float64, copy=True)
+  /* "abovedata_backtesting/exits/cython_exits.py":189
+ *     lo = _as_f64(lows)
  *     out_pos = np.empty(n, dtype=np.float64)
  *     out_exit = np.empty(n, dtype=np.float64)             # <<<<<<<<<<<<<<
  *     _trailing_stop_exit(pos, cl, hi, lo, trailing_stop_pct, out_pos, out_exit)
  *     return out_pos, out_exit
 */
   __pyx_t_5 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 189, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 189, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 189, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 189, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
     assert(__pyx_t_5);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_1);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
     __Pyx_INCREF(__pyx_t_5);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_1, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
     PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_v_n};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 177, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 189, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_4, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 177, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_1, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 177, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
   __pyx_v_out_exit = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":178
+  /* "abovedata_backtesting/exits/cython_exits.py":190
  *     out_pos = np.empty(n, dtype=np.float64)
  *     out_exit = np.empty(n, dtype=np.float64)
  *     _trailing_stop_exit(pos, cl, hi, lo, trailing_stop_pct, out_pos, out_exit)             # <<<<<<<<<<<<<<
  *     return out_pos, out_exit
  * 
 */
-  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_pos, 0); if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 190, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_7.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 178, __pyx_L1_error)
+    __PYX_ERR(0, 190, __pyx_L1_error)
   }
-  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_cl, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_cl, 0); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 190, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_8.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 178, __pyx_L1_error)
+    __PYX_ERR(0, 190, __pyx_L1_error)
   }
-  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_hi, PyBUF_WRITABLE); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_hi, 0); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 190, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_9.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 178, __pyx_L1_error)
+    __PYX_ERR(0, 190, __pyx_L1_error)
   }
-  __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_lo, PyBUF_WRITABLE); if (unlikely(!__pyx_t_10.memview)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_lo, 0); if (unlikely(!__pyx_t_10.memview)) __PYX_ERR(0, 190, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_10.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 178, __pyx_L1_error)
+    __PYX_ERR(0, 190, __pyx_L1_error)
   }
-  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 190, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_11.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 178, __pyx_L1_error)
+    __PYX_ERR(0, 190, __pyx_L1_error)
   }
-  __pyx_t_12 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out_exit, PyBUF_WRITABLE); if (unlikely(!__pyx_t_12.memview)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __pyx_t_12 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out_exit, PyBUF_WRITABLE); if (unlikely(!__pyx_t_12.memview)) __PYX_ERR(0, 190, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_12.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 178, __pyx_L1_error)
+    __PYX_ERR(0, 190, __pyx_L1_error)
   }
-  __pyx_t_2 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing_stop_exit(__pyx_t_7, __pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_v_trailing_stop_pct, __pyx_t_11, __pyx_t_12); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing_stop_exit(__pyx_t_7, __pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_v_trailing_stop_pct, __pyx_t_11, __pyx_t_12); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 190, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_7, 1);
   __pyx_t_7.memview = NULL; __pyx_t_7.data = NULL;
@@ -18367,7 +18508,7 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailin
   __pyx_t_12.memview = NULL; __pyx_t_12.data = NULL;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":179
+  /* "abovedata_backtesting/exits/cython_exits.py":191
  *     out_exit = np.empty(n, dtype=np.float64)
  *     _trailing_stop_exit(pos, cl, hi, lo, trailing_stop_pct, out_pos, out_exit)
  *     return out_pos, out_exit             # <<<<<<<<<<<<<<
@@ -18375,19 +18516,19 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailin
  * 
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 191, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_v_out_pos);
   __Pyx_GIVEREF(__pyx_v_out_pos);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_out_pos) != (0)) __PYX_ERR(0, 179, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_out_pos) != (0)) __PYX_ERR(0, 191, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_out_exit);
   __Pyx_GIVEREF(__pyx_v_out_exit);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_out_exit) != (0)) __PYX_ERR(0, 179, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_out_exit) != (0)) __PYX_ERR(0, 191, __pyx_L1_error);
   __pyx_r = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":158
+  /* "abovedata_backtesting/exits/cython_exits.py":170
  * 
  * 
  * def trailing_stop_exit_cy(             # <<<<<<<<<<<<<<
@@ -18400,8 +18541,8 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailin
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_7, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
@@ -18423,7 +18564,7 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailin
   return __pyx_r;
 }
 
-/* "abovedata_backtesting/exits/cython_exits.py":182
+/* "abovedata_backtesting/exits/cython_exits.py":194
  * 
  * 
  * @cython.cfunc             # <<<<<<<<<<<<<<
@@ -18431,583 +18572,3402 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_2trailin
  * @cython.wraparound(False)
 */
 
-static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__stop_loss_take_profit_exit(__Pyx_memviewslice __pyx_v_positions, __Pyx_memviewslice __pyx_v_closes, __Pyx_memviewslice __pyx_v_highs, __Pyx_memviewslice __pyx_v_lows, double __pyx_v_stop_loss_pct, double __pyx_v_take_profit_pct, __Pyx_memviewslice __pyx_v_out_pos, __Pyx_memviewslice __pyx_v_out_exit) {
+static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing_stop_exit_multi(__Pyx_memviewslice __pyx_v_positions, __Pyx_memviewslice __pyx_v_closes, __Pyx_memviewslice __pyx_v_highs, __Pyx_memviewslice __pyx_v_lows, __Pyx_memviewslice __pyx_v_trailing_stop_pcts, __Pyx_memviewslice __pyx_v_out_pos, __Pyx_memviewslice __pyx_v_out_exit) {
   Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_n_params;
   Py_ssize_t __pyx_v_i;
-  double __pyx_v_entry_price;
-  int __pyx_v_in_position;
-  double __pyx_v_direction;
+  Py_ssize_t __pyx_v_k;
+  __Pyx_memviewslice __pyx_v_peak = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_trough = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_direction = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_in_position = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_should_exit;
+  double __pyx_v_stop_price;
+  double __pyx_v_stop_exit_price;
   double __pyx_v_pos;
   double __pyx_v_close;
   double __pyx_v_high;
   double __pyx_v_low;
-  double __pyx_v_stop_ret;
-  double __pyx_v_tp_ret;
-  int __pyx_v_stop_hit;
-  int __pyx_v_tp_hit;
+  int __pyx_v_pos_active;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  Py_ssize_t __pyx_t_1;
-  Py_ssize_t __pyx_t_2;
-  Py_ssize_t __pyx_t_3;
-  Py_ssize_t __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  size_t __pyx_t_7;
+  __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("_stop_loss_take_profit_exit", 0);
+  __Pyx_RefNannySetupContext("_trailing_stop_exit_multi", 0);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":195
- *     out_exit: cython.double[:],
+  /* "abovedata_backtesting/exits/cython_exits.py":206
+ *     out_exit: cython.double[:, :],
  * ) -> None:
  *     n: cython.Py_ssize_t = positions.shape[0]             # <<<<<<<<<<<<<<
+ *     n_params: cython.Py_ssize_t = trailing_stop_pcts.shape[0]
  *     i: cython.Py_ssize_t
- *     entry_price: cython.double = 0.0
 */
   __pyx_v_n = (__pyx_v_positions.shape[0]);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":197
+  /* "abovedata_backtesting/exits/cython_exits.py":207
+ * ) -> None:
  *     n: cython.Py_ssize_t = positions.shape[0]
+ *     n_params: cython.Py_ssize_t = trailing_stop_pcts.shape[0]             # <<<<<<<<<<<<<<
  *     i: cython.Py_ssize_t
- *     entry_price: cython.double = 0.0             # <<<<<<<<<<<<<<
- *     in_position: cython.bint = False
- *     direction: cython.double = 0.0
+ *     k: cython.Py_ssize_t
 */
-  __pyx_v_entry_price = 0.0;
+  __pyx_v_n_params = (__pyx_v_trailing_stop_pcts.shape[0]);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":198
+  /* "abovedata_backtesting/exits/cython_exits.py":210
  *     i: cython.Py_ssize_t
- *     entry_price: cython.double = 0.0
- *     in_position: cython.bint = False             # <<<<<<<<<<<<<<
- *     direction: cython.double = 0.0
- *     pos: cython.double
-*/
-  __pyx_v_in_position = 0;
-
-  /* "abovedata_backtesting/exits/cython_exits.py":199
- *     entry_price: cython.double = 0.0
- *     in_position: cython.bint = False
- *     direction: cython.double = 0.0             # <<<<<<<<<<<<<<
- *     pos: cython.double
- *     close: cython.double
-*/
-  __pyx_v_direction = 0.0;
-
-  /* "abovedata_backtesting/exits/cython_exits.py":209
- *     tp_hit: cython.bint
- * 
- *     for i in range(n):             # <<<<<<<<<<<<<<
- *         pos = positions[i]
- *         close = closes[i]
+ *     k: cython.Py_ssize_t
+ *     peak: cython.double[:] = np.zeros(n_params, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     trough: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     direction: cython.double[:] = np.zeros(n_params, dtype=np.float64)
 */
-  __pyx_t_1 = __pyx_v_n;
-  __pyx_t_2 = __pyx_t_1;
-  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
-    __pyx_v_i = __pyx_t_3;
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyLong_FromSsize_t(__pyx_v_n_params); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_7 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+    __pyx_t_7 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_3};
+    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 210, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 210, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 210, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_peak = __pyx_t_8;
+  __pyx_t_8.memview = NULL;
+  __pyx_t_8.data = NULL;
 
-    /* "abovedata_backtesting/exits/cython_exits.py":210
- * 
- *     for i in range(n):
- *         pos = positions[i]             # <<<<<<<<<<<<<<
- *         close = closes[i]
- *         high = highs[i]
+  /* "abovedata_backtesting/exits/cython_exits.py":211
+ *     k: cython.Py_ssize_t
+ *     peak: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     trough: cython.double[:] = np.zeros(n_params, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     direction: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     in_position: cython.uchar[:] = np.zeros(n_params, dtype=np.uint8)
 */
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_v_pos = (*((double *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_4 * __pyx_v_positions.strides[0]) )));
-
-    /* "abovedata_backtesting/exits/cython_exits.py":211
- *     for i in range(n):
- *         pos = positions[i]
- *         close = closes[i]             # <<<<<<<<<<<<<<
- *         high = highs[i]
- *         low = lows[i]
+  __pyx_t_4 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyLong_FromSsize_t(__pyx_v_n_params); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_7 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    assert(__pyx_t_4);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_7 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_4, __pyx_t_5};
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 211, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_2, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 211, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_trough = __pyx_t_8;
+  __pyx_t_8.memview = NULL;
+  __pyx_t_8.data = NULL;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":212
+ *     peak: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     trough: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     direction: cython.double[:] = np.zeros(n_params, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     in_position: cython.uchar[:] = np.zeros(n_params, dtype=np.uint8)
+ *     should_exit: cython.bint
 */
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_v_close = (*((double *) ( /* dim=0 */ (__pyx_v_closes.data + __pyx_t_4 * __pyx_v_closes.strides[0]) )));
-
-    /* "abovedata_backtesting/exits/cython_exits.py":212
+  __pyx_t_6 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyLong_FromSsize_t(__pyx_v_n_params); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_7 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
+    assert(__pyx_t_6);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+    __pyx_t_7 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_6, __pyx_t_3};
+    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 212, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_4, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 212, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 212, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_direction = __pyx_t_8;
+  __pyx_t_8.memview = NULL;
+  __pyx_t_8.data = NULL;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":213
+ *     trough: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     direction: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     in_position: cython.uchar[:] = np.zeros(n_params, dtype=np.uint8)             # <<<<<<<<<<<<<<
+ *     should_exit: cython.bint
+ *     stop_price: cython.double
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyLong_FromSsize_t(__pyx_v_n_params); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_uint8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_7 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+    __pyx_t_7 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_5};
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_in_position = __pyx_t_9;
+  __pyx_t_9.memview = NULL;
+  __pyx_t_9.data = NULL;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":223
+ *     pos_active: cython.bint
+ * 
+ *     for i in range(n):             # <<<<<<<<<<<<<<
+ *         pos = positions[i]
+ *         close = closes[i]
+*/
+  __pyx_t_10 = __pyx_v_n;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_i = __pyx_t_12;
+
+    /* "abovedata_backtesting/exits/cython_exits.py":224
+ * 
+ *     for i in range(n):
+ *         pos = positions[i]             # <<<<<<<<<<<<<<
+ *         close = closes[i]
+ *         high = highs[i]
+*/
+    __pyx_t_13 = __pyx_v_i;
+    __pyx_v_pos = (*((double const  *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_13 * __pyx_v_positions.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":225
+ *     for i in range(n):
+ *         pos = positions[i]
+ *         close = closes[i]             # <<<<<<<<<<<<<<
+ *         high = highs[i]
+ *         low = lows[i]
+*/
+    __pyx_t_13 = __pyx_v_i;
+    __pyx_v_close = (*((double const  *) ( /* dim=0 */ (__pyx_v_closes.data + __pyx_t_13 * __pyx_v_closes.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":226
  *         pos = positions[i]
  *         close = closes[i]
  *         high = highs[i]             # <<<<<<<<<<<<<<
  *         low = lows[i]
- * 
+ *         pos_active = pos > 0.01 or pos < -0.01
 */
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_v_high = (*((double *) ( /* dim=0 */ (__pyx_v_highs.data + __pyx_t_4 * __pyx_v_highs.strides[0]) )));
+    __pyx_t_13 = __pyx_v_i;
+    __pyx_v_high = (*((double const  *) ( /* dim=0 */ (__pyx_v_highs.data + __pyx_t_13 * __pyx_v_highs.strides[0]) )));
 
-    /* "abovedata_backtesting/exits/cython_exits.py":213
+    /* "abovedata_backtesting/exits/cython_exits.py":227
  *         close = closes[i]
  *         high = highs[i]
  *         low = lows[i]             # <<<<<<<<<<<<<<
+ *         pos_active = pos > 0.01 or pos < -0.01
  * 
- *         if (pos > 0.01 or pos < -0.01) and not in_position:
 */
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_v_low = (*((double *) ( /* dim=0 */ (__pyx_v_lows.data + __pyx_t_4 * __pyx_v_lows.strides[0]) )));
+    __pyx_t_13 = __pyx_v_i;
+    __pyx_v_low = (*((double const  *) ( /* dim=0 */ (__pyx_v_lows.data + __pyx_t_13 * __pyx_v_lows.strides[0]) )));
 
-    /* "abovedata_backtesting/exits/cython_exits.py":215
+    /* "abovedata_backtesting/exits/cython_exits.py":228
+ *         high = highs[i]
  *         low = lows[i]
+ *         pos_active = pos > 0.01 or pos < -0.01             # <<<<<<<<<<<<<<
  * 
- *         if (pos > 0.01 or pos < -0.01) and not in_position:             # <<<<<<<<<<<<<<
- *             # New entry
- *             in_position = True
+ *         for k in range(n_params):
 */
-    __pyx_t_6 = (__pyx_v_pos > 0.01);
-    if (!__pyx_t_6) {
-    } else {
-      goto __pyx_L7_next_and;
-    }
-    __pyx_t_6 = (__pyx_v_pos < -0.01);
-    if (__pyx_t_6) {
+    __pyx_t_15 = (__pyx_v_pos > 0.01);
+    if (!__pyx_t_15) {
     } else {
-      __pyx_t_5 = __pyx_t_6;
-      goto __pyx_L6_bool_binop_done;
+      __pyx_t_14 = __pyx_t_15;
+      goto __pyx_L5_bool_binop_done;
     }
-    __pyx_L7_next_and:;
-    __pyx_t_6 = (!__pyx_v_in_position);
-    __pyx_t_5 = __pyx_t_6;
-    __pyx_L6_bool_binop_done:;
-    if (__pyx_t_5) {
+    __pyx_t_15 = (__pyx_v_pos < -0.01);
+    __pyx_t_14 = __pyx_t_15;
+    __pyx_L5_bool_binop_done:;
+    __pyx_v_pos_active = __pyx_t_14;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":217
- *         if (pos > 0.01 or pos < -0.01) and not in_position:
- *             # New entry
- *             in_position = True             # <<<<<<<<<<<<<<
- *             entry_price = close
- *             if pos > 0:
+    /* "abovedata_backtesting/exits/cython_exits.py":230
+ *         pos_active = pos > 0.01 or pos < -0.01
+ * 
+ *         for k in range(n_params):             # <<<<<<<<<<<<<<
+ *             if pos_active and not in_position[k]:
+ *                 # New entry
 */
-      __pyx_v_in_position = 1;
+    __pyx_t_16 = __pyx_v_n_params;
+    __pyx_t_17 = __pyx_t_16;
+    for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+      __pyx_v_k = __pyx_t_18;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":218
- *             # New entry
- *             in_position = True
- *             entry_price = close             # <<<<<<<<<<<<<<
- *             if pos > 0:
- *                 direction = 1.0
+      /* "abovedata_backtesting/exits/cython_exits.py":231
+ * 
+ *         for k in range(n_params):
+ *             if pos_active and not in_position[k]:             # <<<<<<<<<<<<<<
+ *                 # New entry
+ *                 in_position[k] = 1
 */
-      __pyx_v_entry_price = __pyx_v_close;
-
-      /* "abovedata_backtesting/exits/cython_exits.py":219
- *             in_position = True
- *             entry_price = close
- *             if pos > 0:             # <<<<<<<<<<<<<<
- *                 direction = 1.0
- *             else:
+      if (__pyx_v_pos_active) {
+      } else {
+        __pyx_t_14 = __pyx_v_pos_active;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_13 = __pyx_v_k;
+      __pyx_t_15 = (!((*((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_13 * __pyx_v_in_position.strides[0]) ))) != 0));
+      __pyx_t_14 = __pyx_t_15;
+      __pyx_L10_bool_binop_done:;
+      if (__pyx_t_14) {
+
+        /* "abovedata_backtesting/exits/cython_exits.py":233
+ *             if pos_active and not in_position[k]:
+ *                 # New entry
+ *                 in_position[k] = 1             # <<<<<<<<<<<<<<
+ *                 if pos > 0:
+ *                     direction[k] = 1.0
+*/
+        __pyx_t_13 = __pyx_v_k;
+        *((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_13 * __pyx_v_in_position.strides[0]) )) = 1;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":234
+ *                 # New entry
+ *                 in_position[k] = 1
+ *                 if pos > 0:             # <<<<<<<<<<<<<<
+ *                     direction[k] = 1.0
+ *                     peak[k] = high
+*/
+        __pyx_t_14 = (__pyx_v_pos > 0.0);
+        if (__pyx_t_14) {
+
+          /* "abovedata_backtesting/exits/cython_exits.py":235
+ *                 in_position[k] = 1
+ *                 if pos > 0:
+ *                     direction[k] = 1.0             # <<<<<<<<<<<<<<
+ *                     peak[k] = high
+ *                 else:
 */
-      __pyx_t_5 = (__pyx_v_pos > 0.0);
-      if (__pyx_t_5) {
+          __pyx_t_13 = __pyx_v_k;
+          *((double *) ( /* dim=0 */ (__pyx_v_direction.data + __pyx_t_13 * __pyx_v_direction.strides[0]) )) = 1.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":220
- *             entry_price = close
- *             if pos > 0:
- *                 direction = 1.0             # <<<<<<<<<<<<<<
- *             else:
- *                 direction = -1.0
+          /* "abovedata_backtesting/exits/cython_exits.py":236
+ *                 if pos > 0:
+ *                     direction[k] = 1.0
+ *                     peak[k] = high             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     direction[k] = -1.0
 */
-        __pyx_v_direction = 1.0;
+          __pyx_t_13 = __pyx_v_k;
+          *((double *) ( /* dim=0 */ (__pyx_v_peak.data + __pyx_t_13 * __pyx_v_peak.strides[0]) )) = __pyx_v_high;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":219
- *             in_position = True
- *             entry_price = close
- *             if pos > 0:             # <<<<<<<<<<<<<<
- *                 direction = 1.0
- *             else:
+          /* "abovedata_backtesting/exits/cython_exits.py":234
+ *                 # New entry
+ *                 in_position[k] = 1
+ *                 if pos > 0:             # <<<<<<<<<<<<<<
+ *                     direction[k] = 1.0
+ *                     peak[k] = high
 */
-        goto __pyx_L9;
-      }
+          goto __pyx_L12;
+        }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":222
- *                 direction = 1.0
- *             else:
- *                 direction = -1.0             # <<<<<<<<<<<<<<
- *             out_pos[i] = pos
- *             out_exit[i] = close
+        /* "abovedata_backtesting/exits/cython_exits.py":238
+ *                     peak[k] = high
+ *                 else:
+ *                     direction[k] = -1.0             # <<<<<<<<<<<<<<
+ *                     trough[k] = low
+ *                 out_pos[k, i] = pos
 */
-      /*else*/ {
-        __pyx_v_direction = -1.0;
-      }
-      __pyx_L9:;
+        /*else*/ {
+          __pyx_t_13 = __pyx_v_k;
+          *((double *) ( /* dim=0 */ (__pyx_v_direction.data + __pyx_t_13 * __pyx_v_direction.strides[0]) )) = -1.0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":223
- *             else:
- *                 direction = -1.0
- *             out_pos[i] = pos             # <<<<<<<<<<<<<<
- *             out_exit[i] = close
- * 
+          /* "abovedata_backtesting/exits/cython_exits.py":239
+ *                 else:
+ *                     direction[k] = -1.0
+ *                     trough[k] = low             # <<<<<<<<<<<<<<
+ *                 out_pos[k, i] = pos
+ *                 out_exit[k, i] = close
 */
-      __pyx_t_4 = __pyx_v_i;
-      *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = __pyx_v_pos;
+          __pyx_t_13 = __pyx_v_k;
+          *((double *) ( /* dim=0 */ (__pyx_v_trough.data + __pyx_t_13 * __pyx_v_trough.strides[0]) )) = __pyx_v_low;
+        }
+        __pyx_L12:;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":224
- *                 direction = -1.0
- *             out_pos[i] = pos
- *             out_exit[i] = close             # <<<<<<<<<<<<<<
+        /* "abovedata_backtesting/exits/cython_exits.py":240
+ *                     direction[k] = -1.0
+ *                     trough[k] = low
+ *                 out_pos[k, i] = pos             # <<<<<<<<<<<<<<
+ *                 out_exit[k, i] = close
  * 
- *         elif in_position:
 */
-      __pyx_t_4 = __pyx_v_i;
-      *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_close;
+        __pyx_t_13 = __pyx_v_k;
+        __pyx_t_19 = __pyx_v_i;
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_13 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_19 * __pyx_v_out_pos.strides[1]) )) = __pyx_v_pos;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":215
- *         low = lows[i]
+        /* "abovedata_backtesting/exits/cython_exits.py":241
+ *                     trough[k] = low
+ *                 out_pos[k, i] = pos
+ *                 out_exit[k, i] = close             # <<<<<<<<<<<<<<
  * 
- *         if (pos > 0.01 or pos < -0.01) and not in_position:             # <<<<<<<<<<<<<<
- *             # New entry
- *             in_position = True
+ *             elif in_position[k]:
 */
-      goto __pyx_L5;
-    }
+        __pyx_t_19 = __pyx_v_k;
+        __pyx_t_13 = __pyx_v_i;
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_19 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_13 * __pyx_v_out_exit.strides[1]) )) = __pyx_v_close;
 
-    /* "abovedata_backtesting/exits/cython_exits.py":226
- *             out_exit[i] = close
+        /* "abovedata_backtesting/exits/cython_exits.py":231
  * 
- *         elif in_position:             # <<<<<<<<<<<<<<
- *             if direction > 0:
- *                 stop_ret = low / entry_price - 1.0
+ *         for k in range(n_params):
+ *             if pos_active and not in_position[k]:             # <<<<<<<<<<<<<<
+ *                 # New entry
+ *                 in_position[k] = 1
 */
-    if (__pyx_v_in_position) {
+        goto __pyx_L9;
+      }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":227
+      /* "abovedata_backtesting/exits/cython_exits.py":243
+ *                 out_exit[k, i] = close
  * 
- *         elif in_position:
- *             if direction > 0:             # <<<<<<<<<<<<<<
- *                 stop_ret = low / entry_price - 1.0
- *                 tp_ret = high / entry_price - 1.0
+ *             elif in_position[k]:             # <<<<<<<<<<<<<<
+ *                 should_exit = False
+ *                 stop_exit_price = close
 */
-      __pyx_t_5 = (__pyx_v_direction > 0.0);
-      if (__pyx_t_5) {
+      __pyx_t_13 = __pyx_v_k;
+      __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_13 * __pyx_v_in_position.strides[0]) ))) != 0);
+      if (__pyx_t_14) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":228
- *         elif in_position:
- *             if direction > 0:
- *                 stop_ret = low / entry_price - 1.0             # <<<<<<<<<<<<<<
- *                 tp_ret = high / entry_price - 1.0
- *             else:
+        /* "abovedata_backtesting/exits/cython_exits.py":244
+ * 
+ *             elif in_position[k]:
+ *                 should_exit = False             # <<<<<<<<<<<<<<
+ *                 stop_exit_price = close
+ * 
 */
-        if (unlikely(__pyx_v_entry_price == 0)) {
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          __PYX_ERR(0, 228, __pyx_L1_error)
-        }
-        __pyx_v_stop_ret = ((__pyx_v_low / __pyx_v_entry_price) - 1.0);
+        __pyx_v_should_exit = 0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":229
- *             if direction > 0:
- *                 stop_ret = low / entry_price - 1.0
- *                 tp_ret = high / entry_price - 1.0             # <<<<<<<<<<<<<<
- *             else:
- *                 stop_ret = -(high / entry_price - 1.0)
+        /* "abovedata_backtesting/exits/cython_exits.py":245
+ *             elif in_position[k]:
+ *                 should_exit = False
+ *                 stop_exit_price = close             # <<<<<<<<<<<<<<
+ * 
+ *                 if direction[k] > 0:
 */
-        if (unlikely(__pyx_v_entry_price == 0)) {
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          __PYX_ERR(0, 229, __pyx_L1_error)
-        }
-        __pyx_v_tp_ret = ((__pyx_v_high / __pyx_v_entry_price) - 1.0);
+        __pyx_v_stop_exit_price = __pyx_v_close;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":227
+        /* "abovedata_backtesting/exits/cython_exits.py":247
+ *                 stop_exit_price = close
  * 
- *         elif in_position:
- *             if direction > 0:             # <<<<<<<<<<<<<<
- *                 stop_ret = low / entry_price - 1.0
- *                 tp_ret = high / entry_price - 1.0
+ *                 if direction[k] > 0:             # <<<<<<<<<<<<<<
+ *                     if high > peak[k]:
+ *                         peak[k] = high
 */
-        goto __pyx_L10;
-      }
+        __pyx_t_13 = __pyx_v_k;
+        __pyx_t_14 = ((*((double *) ( /* dim=0 */ (__pyx_v_direction.data + __pyx_t_13 * __pyx_v_direction.strides[0]) ))) > 0.0);
+        if (__pyx_t_14) {
 
-      /* "abovedata_backtesting/exits/cython_exits.py":231
- *                 tp_ret = high / entry_price - 1.0
- *             else:
- *                 stop_ret = -(high / entry_price - 1.0)             # <<<<<<<<<<<<<<
- *                 tp_ret = -(low / entry_price - 1.0)
+          /* "abovedata_backtesting/exits/cython_exits.py":248
  * 
+ *                 if direction[k] > 0:
+ *                     if high > peak[k]:             # <<<<<<<<<<<<<<
+ *                         peak[k] = high
+ *                     stop_price = peak[k] * (1.0 - trailing_stop_pcts[k])
 */
-      /*else*/ {
-        if (unlikely(__pyx_v_entry_price == 0)) {
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          __PYX_ERR(0, 231, __pyx_L1_error)
-        }
-        __pyx_v_stop_ret = (-((__pyx_v_high / __pyx_v_entry_price) - 1.0));
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_14 = (__pyx_v_high > (*((double *) ( /* dim=0 */ (__pyx_v_peak.data + __pyx_t_13 * __pyx_v_peak.strides[0]) ))));
+          if (__pyx_t_14) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":232
- *             else:
- *                 stop_ret = -(high / entry_price - 1.0)
- *                 tp_ret = -(low / entry_price - 1.0)             # <<<<<<<<<<<<<<
- * 
- *             stop_hit = stop_ret <= stop_loss_pct
+            /* "abovedata_backtesting/exits/cython_exits.py":249
+ *                 if direction[k] > 0:
+ *                     if high > peak[k]:
+ *                         peak[k] = high             # <<<<<<<<<<<<<<
+ *                     stop_price = peak[k] * (1.0 - trailing_stop_pcts[k])
+ *                     if low <= stop_price:
 */
-        if (unlikely(__pyx_v_entry_price == 0)) {
-          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-          __PYX_ERR(0, 232, __pyx_L1_error)
-        }
-        __pyx_v_tp_ret = (-((__pyx_v_low / __pyx_v_entry_price) - 1.0));
-      }
-      __pyx_L10:;
+            __pyx_t_13 = __pyx_v_k;
+            *((double *) ( /* dim=0 */ (__pyx_v_peak.data + __pyx_t_13 * __pyx_v_peak.strides[0]) )) = __pyx_v_high;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":234
- *                 tp_ret = -(low / entry_price - 1.0)
- * 
- *             stop_hit = stop_ret <= stop_loss_pct             # <<<<<<<<<<<<<<
- *             tp_hit = tp_ret >= take_profit_pct
+            /* "abovedata_backtesting/exits/cython_exits.py":248
  * 
+ *                 if direction[k] > 0:
+ *                     if high > peak[k]:             # <<<<<<<<<<<<<<
+ *                         peak[k] = high
+ *                     stop_price = peak[k] * (1.0 - trailing_stop_pcts[k])
 */
-      __pyx_v_stop_hit = (__pyx_v_stop_ret <= __pyx_v_stop_loss_pct);
+          }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":235
+          /* "abovedata_backtesting/exits/cython_exits.py":250
+ *                     if high > peak[k]:
+ *                         peak[k] = high
+ *                     stop_price = peak[k] * (1.0 - trailing_stop_pcts[k])             # <<<<<<<<<<<<<<
+ *                     if low <= stop_price:
+ *                         should_exit = True
+*/
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_19 = __pyx_v_k;
+          __pyx_v_stop_price = ((*((double *) ( /* dim=0 */ (__pyx_v_peak.data + __pyx_t_13 * __pyx_v_peak.strides[0]) ))) * (1.0 - (*((double const  *) ( /* dim=0 */ (__pyx_v_trailing_stop_pcts.data + __pyx_t_19 * __pyx_v_trailing_stop_pcts.strides[0]) )))));
+
+          /* "abovedata_backtesting/exits/cython_exits.py":251
+ *                         peak[k] = high
+ *                     stop_price = peak[k] * (1.0 - trailing_stop_pcts[k])
+ *                     if low <= stop_price:             # <<<<<<<<<<<<<<
+ *                         should_exit = True
+ *                         stop_exit_price = stop_price
+*/
+          __pyx_t_14 = (__pyx_v_low <= __pyx_v_stop_price);
+          if (__pyx_t_14) {
+
+            /* "abovedata_backtesting/exits/cython_exits.py":252
+ *                     stop_price = peak[k] * (1.0 - trailing_stop_pcts[k])
+ *                     if low <= stop_price:
+ *                         should_exit = True             # <<<<<<<<<<<<<<
+ *                         stop_exit_price = stop_price
+ *                 else:
+*/
+            __pyx_v_should_exit = 1;
+
+            /* "abovedata_backtesting/exits/cython_exits.py":253
+ *                     if low <= stop_price:
+ *                         should_exit = True
+ *                         stop_exit_price = stop_price             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     if low < trough[k]:
+*/
+            __pyx_v_stop_exit_price = __pyx_v_stop_price;
+
+            /* "abovedata_backtesting/exits/cython_exits.py":251
+ *                         peak[k] = high
+ *                     stop_price = peak[k] * (1.0 - trailing_stop_pcts[k])
+ *                     if low <= stop_price:             # <<<<<<<<<<<<<<
+ *                         should_exit = True
+ *                         stop_exit_price = stop_price
+*/
+          }
+
+          /* "abovedata_backtesting/exits/cython_exits.py":247
+ *                 stop_exit_price = close
  * 
- *             stop_hit = stop_ret <= stop_loss_pct
- *             tp_hit = tp_ret >= take_profit_pct             # <<<<<<<<<<<<<<
+ *                 if direction[k] > 0:             # <<<<<<<<<<<<<<
+ *                     if high > peak[k]:
+ *                         peak[k] = high
+*/
+          goto __pyx_L13;
+        }
+
+        /* "abovedata_backtesting/exits/cython_exits.py":255
+ *                         stop_exit_price = stop_price
+ *                 else:
+ *                     if low < trough[k]:             # <<<<<<<<<<<<<<
+ *                         trough[k] = low
+ *                     stop_price = trough[k] * (1.0 + trailing_stop_pcts[k])
+*/
+        /*else*/ {
+          __pyx_t_19 = __pyx_v_k;
+          __pyx_t_14 = (__pyx_v_low < (*((double *) ( /* dim=0 */ (__pyx_v_trough.data + __pyx_t_19 * __pyx_v_trough.strides[0]) ))));
+          if (__pyx_t_14) {
+
+            /* "abovedata_backtesting/exits/cython_exits.py":256
+ *                 else:
+ *                     if low < trough[k]:
+ *                         trough[k] = low             # <<<<<<<<<<<<<<
+ *                     stop_price = trough[k] * (1.0 + trailing_stop_pcts[k])
+ *                     if high >= stop_price:
+*/
+            __pyx_t_19 = __pyx_v_k;
+            *((double *) ( /* dim=0 */ (__pyx_v_trough.data + __pyx_t_19 * __pyx_v_trough.strides[0]) )) = __pyx_v_low;
+
+            /* "abovedata_backtesting/exits/cython_exits.py":255
+ *                         stop_exit_price = stop_price
+ *                 else:
+ *                     if low < trough[k]:             # <<<<<<<<<<<<<<
+ *                         trough[k] = low
+ *                     stop_price = trough[k] * (1.0 + trailing_stop_pcts[k])
+*/
+          }
+
+          /* "abovedata_backtesting/exits/cython_exits.py":257
+ *                     if low < trough[k]:
+ *                         trough[k] = low
+ *                     stop_price = trough[k] * (1.0 + trailing_stop_pcts[k])             # <<<<<<<<<<<<<<
+ *                     if high >= stop_price:
+ *                         should_exit = True
+*/
+          __pyx_t_19 = __pyx_v_k;
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_v_stop_price = ((*((double *) ( /* dim=0 */ (__pyx_v_trough.data + __pyx_t_19 * __pyx_v_trough.strides[0]) ))) * (1.0 + (*((double const  *) ( /* dim=0 */ (__pyx_v_trailing_stop_pcts.data + __pyx_t_13 * __pyx_v_trailing_stop_pcts.strides[0]) )))));
+
+          /* "abovedata_backtesting/exits/cython_exits.py":258
+ *                         trough[k] = low
+ *                     stop_price = trough[k] * (1.0 + trailing_stop_pcts[k])
+ *                     if high >= stop_price:             # <<<<<<<<<<<<<<
+ *                         should_exit = True
+ *                         stop_exit_price = stop_price
+*/
+          __pyx_t_14 = (__pyx_v_high >= __pyx_v_stop_price);
+          if (__pyx_t_14) {
+
+            /* "abovedata_backtesting/exits/cython_exits.py":259
+ *                     stop_price = trough[k] * (1.0 + trailing_stop_pcts[k])
+ *                     if high >= stop_price:
+ *                         should_exit = True             # <<<<<<<<<<<<<<
+ *                         stop_exit_price = stop_price
  * 
- *             if stop_hit:
 */
-      __pyx_v_tp_hit = (__pyx_v_tp_ret >= __pyx_v_take_profit_pct);
+            __pyx_v_should_exit = 1;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":237
- *             tp_hit = tp_ret >= take_profit_pct
+            /* "abovedata_backtesting/exits/cython_exits.py":260
+ *                     if high >= stop_price:
+ *                         should_exit = True
+ *                         stop_exit_price = stop_price             # <<<<<<<<<<<<<<
  * 
- *             if stop_hit:             # <<<<<<<<<<<<<<
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
+ *                 if should_exit or not pos_active:
 */
-      if (__pyx_v_stop_hit) {
+            __pyx_v_stop_exit_price = __pyx_v_stop_price;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":238
+            /* "abovedata_backtesting/exits/cython_exits.py":258
+ *                         trough[k] = low
+ *                     stop_price = trough[k] * (1.0 + trailing_stop_pcts[k])
+ *                     if high >= stop_price:             # <<<<<<<<<<<<<<
+ *                         should_exit = True
+ *                         stop_exit_price = stop_price
+*/
+          }
+        }
+        __pyx_L13:;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":262
+ *                         stop_exit_price = stop_price
  * 
- *             if stop_hit:
- *                 out_pos[i] = 0.0             # <<<<<<<<<<<<<<
- *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
- *                 in_position = False
+ *                 if should_exit or not pos_active:             # <<<<<<<<<<<<<<
+ *                     out_pos[k, i] = 0.0
+ *                     if should_exit:
 */
-        __pyx_t_4 = __pyx_v_i;
-        *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = 0.0;
+        if (!__pyx_v_should_exit) {
+        } else {
+          __pyx_t_14 = __pyx_v_should_exit;
+          goto __pyx_L19_bool_binop_done;
+        }
+        __pyx_t_15 = (!__pyx_v_pos_active);
+        __pyx_t_14 = __pyx_t_15;
+        __pyx_L19_bool_binop_done:;
+        if (__pyx_t_14) {
+
+          /* "abovedata_backtesting/exits/cython_exits.py":263
+ * 
+ *                 if should_exit or not pos_active:
+ *                     out_pos[k, i] = 0.0             # <<<<<<<<<<<<<<
+ *                     if should_exit:
+ *                         out_exit[k, i] = stop_exit_price
+*/
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_19 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_13 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_19 * __pyx_v_out_pos.strides[1]) )) = 0.0;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":264
+ *                 if should_exit or not pos_active:
+ *                     out_pos[k, i] = 0.0
+ *                     if should_exit:             # <<<<<<<<<<<<<<
+ *                         out_exit[k, i] = stop_exit_price
+ *                     else:
+*/
+          if (__pyx_v_should_exit) {
+
+            /* "abovedata_backtesting/exits/cython_exits.py":265
+ *                     out_pos[k, i] = 0.0
+ *                     if should_exit:
+ *                         out_exit[k, i] = stop_exit_price             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         out_exit[k, i] = close
+*/
+            __pyx_t_19 = __pyx_v_k;
+            __pyx_t_13 = __pyx_v_i;
+            *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_19 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_13 * __pyx_v_out_exit.strides[1]) )) = __pyx_v_stop_exit_price;
+
+            /* "abovedata_backtesting/exits/cython_exits.py":264
+ *                 if should_exit or not pos_active:
+ *                     out_pos[k, i] = 0.0
+ *                     if should_exit:             # <<<<<<<<<<<<<<
+ *                         out_exit[k, i] = stop_exit_price
+ *                     else:
+*/
+            goto __pyx_L21;
+          }
 
-        /* "abovedata_backtesting/exits/cython_exits.py":239
- *             if stop_hit:
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)             # <<<<<<<<<<<<<<
- *                 in_position = False
- *             elif tp_hit:
+          /* "abovedata_backtesting/exits/cython_exits.py":267
+ *                         out_exit[k, i] = stop_exit_price
+ *                     else:
+ *                         out_exit[k, i] = close             # <<<<<<<<<<<<<<
+ *                     in_position[k] = 0
+ *                     peak[k] = 0.0
+*/
+          /*else*/ {
+            __pyx_t_13 = __pyx_v_k;
+            __pyx_t_19 = __pyx_v_i;
+            *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_13 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_19 * __pyx_v_out_exit.strides[1]) )) = __pyx_v_close;
+          }
+          __pyx_L21:;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":268
+ *                     else:
+ *                         out_exit[k, i] = close
+ *                     in_position[k] = 0             # <<<<<<<<<<<<<<
+ *                     peak[k] = 0.0
+ *                     trough[k] = 0.0
+*/
+          __pyx_t_19 = __pyx_v_k;
+          *((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_19 * __pyx_v_in_position.strides[0]) )) = 0;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":269
+ *                         out_exit[k, i] = close
+ *                     in_position[k] = 0
+ *                     peak[k] = 0.0             # <<<<<<<<<<<<<<
+ *                     trough[k] = 0.0
+ *                 else:
 */
-        __pyx_t_4 = __pyx_v_i;
-        *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = (__pyx_v_entry_price * (1.0 + (__pyx_v_stop_loss_pct * __pyx_v_direction)));
+          __pyx_t_19 = __pyx_v_k;
+          *((double *) ( /* dim=0 */ (__pyx_v_peak.data + __pyx_t_19 * __pyx_v_peak.strides[0]) )) = 0.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":240
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
- *                 in_position = False             # <<<<<<<<<<<<<<
- *             elif tp_hit:
- *                 out_pos[i] = 0.0
+          /* "abovedata_backtesting/exits/cython_exits.py":270
+ *                     in_position[k] = 0
+ *                     peak[k] = 0.0
+ *                     trough[k] = 0.0             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     out_pos[k, i] = pos
 */
-        __pyx_v_in_position = 0;
+          __pyx_t_19 = __pyx_v_k;
+          *((double *) ( /* dim=0 */ (__pyx_v_trough.data + __pyx_t_19 * __pyx_v_trough.strides[0]) )) = 0.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":237
- *             tp_hit = tp_ret >= take_profit_pct
+          /* "abovedata_backtesting/exits/cython_exits.py":262
+ *                         stop_exit_price = stop_price
  * 
- *             if stop_hit:             # <<<<<<<<<<<<<<
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
+ *                 if should_exit or not pos_active:             # <<<<<<<<<<<<<<
+ *                     out_pos[k, i] = 0.0
+ *                     if should_exit:
 */
-        goto __pyx_L11;
-      }
+          goto __pyx_L18;
+        }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":241
- *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
- *                 in_position = False
- *             elif tp_hit:             # <<<<<<<<<<<<<<
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
+        /* "abovedata_backtesting/exits/cython_exits.py":272
+ *                     trough[k] = 0.0
+ *                 else:
+ *                     out_pos[k, i] = pos             # <<<<<<<<<<<<<<
+ *                     out_exit[k, i] = close
+ *             else:
 */
-      if (__pyx_v_tp_hit) {
+        /*else*/ {
+          __pyx_t_19 = __pyx_v_k;
+          __pyx_t_13 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_19 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_13 * __pyx_v_out_pos.strides[1]) )) = __pyx_v_pos;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":242
- *                 in_position = False
- *             elif tp_hit:
- *                 out_pos[i] = 0.0             # <<<<<<<<<<<<<<
- *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
- *                 in_position = False
+          /* "abovedata_backtesting/exits/cython_exits.py":273
+ *                 else:
+ *                     out_pos[k, i] = pos
+ *                     out_exit[k, i] = close             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out_pos[k, i] = pos
 */
-        __pyx_t_4 = __pyx_v_i;
-        *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = 0.0;
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_19 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_13 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_19 * __pyx_v_out_exit.strides[1]) )) = __pyx_v_close;
+        }
+        __pyx_L18:;
 
         /* "abovedata_backtesting/exits/cython_exits.py":243
- *             elif tp_hit:
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)             # <<<<<<<<<<<<<<
- *                 in_position = False
- *             elif pos > -0.01 and pos < 0.01:
+ *                 out_exit[k, i] = close
+ * 
+ *             elif in_position[k]:             # <<<<<<<<<<<<<<
+ *                 should_exit = False
+ *                 stop_exit_price = close
 */
-        __pyx_t_4 = __pyx_v_i;
-        *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = (__pyx_v_entry_price * (1.0 + (__pyx_v_take_profit_pct * __pyx_v_direction)));
+        goto __pyx_L9;
+      }
 
-        /* "abovedata_backtesting/exits/cython_exits.py":244
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
- *                 in_position = False             # <<<<<<<<<<<<<<
- *             elif pos > -0.01 and pos < 0.01:
- *                 out_pos[i] = 0.0
+      /* "abovedata_backtesting/exits/cython_exits.py":275
+ *                     out_exit[k, i] = close
+ *             else:
+ *                 out_pos[k, i] = pos             # <<<<<<<<<<<<<<
+ *                 out_exit[k, i] = close
+ * 
+*/
+      /*else*/ {
+        __pyx_t_19 = __pyx_v_k;
+        __pyx_t_13 = __pyx_v_i;
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_19 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_13 * __pyx_v_out_pos.strides[1]) )) = __pyx_v_pos;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":276
+ *             else:
+ *                 out_pos[k, i] = pos
+ *                 out_exit[k, i] = close             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+        __pyx_t_13 = __pyx_v_k;
+        __pyx_t_19 = __pyx_v_i;
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_13 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_19 * __pyx_v_out_exit.strides[1]) )) = __pyx_v_close;
+      }
+      __pyx_L9:;
+    }
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":194
+ * 
+ * 
+ * @cython.cfunc             # <<<<<<<<<<<<<<
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits._trailing_stop_exit_multi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_peak, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_trough, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_direction, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_in_position, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "abovedata_backtesting/exits/cython_exits.py":279
+ * 
+ * 
+ * def trailing_stop_exit_multi_cy(             # <<<<<<<<<<<<<<
+ *     positions: NDArray[np.float64],
+ *     closes: NDArray[np.float64],
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_7trailing_stop_exit_multi_cy(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_6trailing_stop_exit_multi_cy, "Apply trailing stop exit logic for K stop levels in one pass.\n\n    Parameters\n    ----------\n    positions, closes, highs, lows : (N,) float64 arrays\n    trailing_stop_pcts : (K,) float64 array of retracement levels\n\n    Returns\n    -------\n    (new_positions, exit_prices) \342\200\224 both (K, N) float64 arrays; row k equals\n    ``trailing_stop_exit_cy(..., trailing_stop_pcts[k])``\n    ");
+static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_7trailing_stop_exit_multi_cy = {"trailing_stop_exit_multi_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_7trailing_stop_exit_multi_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_6trailing_stop_exit_multi_cy};
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_7trailing_stop_exit_multi_cy(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_positions = 0;
+  PyObject *__pyx_v_closes = 0;
+  PyObject *__pyx_v_highs = 0;
+  PyObject *__pyx_v_lows = 0;
+  PyObject *__pyx_v_trailing_stop_pcts = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[5] = {0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("trailing_stop_exit_multi_cy (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_positions,&__pyx_mstate_global->__pyx_n_u_closes,&__pyx_mstate_global->__pyx_n_u_highs,&__pyx_mstate_global->__pyx_n_u_lows,&__pyx_mstate_global->__pyx_n_u_trailing_stop_pcts,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 279, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 279, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 279, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 279, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 279, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 279, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "trailing_stop_exit_multi_cy", 0) < (0)) __PYX_ERR(0, 279, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 5; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("trailing_stop_exit_multi_cy", 1, 5, 5, i); __PYX_ERR(0, 279, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 5)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 279, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 279, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 279, __pyx_L3_error)
+      values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 279, __pyx_L3_error)
+      values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 279, __pyx_L3_error)
+    }
+    __pyx_v_positions = values[0];
+    __pyx_v_closes = values[1];
+    __pyx_v_highs = values[2];
+    __pyx_v_lows = values[3];
+    __pyx_v_trailing_stop_pcts = values[4];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("trailing_stop_exit_multi_cy", 1, 5, 5, __pyx_nargs); __PYX_ERR(0, 279, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits.trailing_stop_exit_multi_cy", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6trailing_stop_exit_multi_cy(__pyx_self, __pyx_v_positions, __pyx_v_closes, __pyx_v_highs, __pyx_v_lows, __pyx_v_trailing_stop_pcts);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6trailing_stop_exit_multi_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, PyObject *__pyx_v_trailing_stop_pcts) {
+  PyObject *__pyx_v_pcts = NULL;
+  PyObject *__pyx_v_shape = NULL;
+  PyObject *__pyx_v_out_pos = NULL;
+  PyObject *__pyx_v_out_exit = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_10 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_11 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_12 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_13 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("trailing_stop_exit_multi_cy", 0);
+
+  /* "abovedata_backtesting/exits/cython_exits.py":298
+ *     ``trailing_stop_exit_cy(..., trailing_stop_pcts[k])``
+ *     """
+ *     pcts = _as_f64(trailing_stop_pcts)             # <<<<<<<<<<<<<<
+ *     shape = (pcts.shape[0], positions.shape[0])
+ *     out_pos = np.empty(shape, dtype=np.float64)
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_trailing_stop_pcts};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_v_pcts = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":299
+ *     """
+ *     pcts = _as_f64(trailing_stop_pcts)
+ *     shape = (pcts.shape[0], positions.shape[0])             # <<<<<<<<<<<<<<
+ *     out_pos = np.empty(shape, dtype=np.float64)
+ *     out_exit = np.empty(shape, dtype=np.float64)
+*/
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_pcts, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_positions, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_3);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3) != (0)) __PYX_ERR(0, 299, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2) != (0)) __PYX_ERR(0, 299, __pyx_L1_error);
+  __pyx_t_3 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_shape = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":300
+ *     pcts = _as_f64(trailing_stop_pcts)
+ *     shape = (pcts.shape[0], positions.shape[0])
+ *     out_pos = np.empty(shape, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     out_exit = np.empty(shape, dtype=np.float64)
+ *     _trailing_stop_exit_multi(
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_v_shape};
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 300, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 300, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 300, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_v_out_pos = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":301
+ *     shape = (pcts.shape[0], positions.shape[0])
+ *     out_pos = np.empty(shape, dtype=np.float64)
+ *     out_exit = np.empty(shape, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     _trailing_stop_exit_multi(
+ *         _as_f64(positions),
+*/
+  __pyx_t_5 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+    assert(__pyx_t_5);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_v_shape};
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 301, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_2, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 301, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 301, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_v_out_exit = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":303
+ *     out_exit = np.empty(shape, dtype=np.float64)
+ *     _trailing_stop_exit_multi(
+ *         _as_f64(positions),             # <<<<<<<<<<<<<<
+ *         _as_f64(closes),
+ *         _as_f64(highs),
+*/
+  __pyx_t_6 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 303, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_6);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_v_positions};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 303, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(((PyObject *) __pyx_t_7.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 303, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":304
+ *     _trailing_stop_exit_multi(
+ *         _as_f64(positions),
+ *         _as_f64(closes),             # <<<<<<<<<<<<<<
+ *         _as_f64(highs),
+ *         _as_f64(lows),
+*/
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_6);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_closes};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 304, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(((PyObject *) __pyx_t_8.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 304, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":305
+ *         _as_f64(positions),
+ *         _as_f64(closes),
+ *         _as_f64(highs),             # <<<<<<<<<<<<<<
+ *         _as_f64(lows),
+ *         pcts,
+*/
+  __pyx_t_6 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 305, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_6);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_v_highs};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 305, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 305, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(((PyObject *) __pyx_t_9.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 305, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":306
+ *         _as_f64(closes),
+ *         _as_f64(highs),
+ *         _as_f64(lows),             # <<<<<<<<<<<<<<
+ *         pcts,
+ *         out_pos,
+*/
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_6);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_lows};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_10.memview)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(((PyObject *) __pyx_t_10.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 306, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":307
+ *         _as_f64(highs),
+ *         _as_f64(lows),
+ *         pcts,             # <<<<<<<<<<<<<<
+ *         out_pos,
+ *         out_exit,
+*/
+  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_pcts, 0); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 307, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_11.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 307, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":308
+ *         _as_f64(lows),
+ *         pcts,
+ *         out_pos,             # <<<<<<<<<<<<<<
+ *         out_exit,
+ *     )
+*/
+  __pyx_t_12 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_v_out_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_12.memview)) __PYX_ERR(0, 308, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_12.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 308, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":309
+ *         pcts,
+ *         out_pos,
+ *         out_exit,             # <<<<<<<<<<<<<<
+ *     )
+ *     return out_pos, out_exit
+*/
+  __pyx_t_13 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_v_out_exit, PyBUF_WRITABLE); if (unlikely(!__pyx_t_13.memview)) __PYX_ERR(0, 309, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_13.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 309, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":302
+ *     out_pos = np.empty(shape, dtype=np.float64)
+ *     out_exit = np.empty(shape, dtype=np.float64)
+ *     _trailing_stop_exit_multi(             # <<<<<<<<<<<<<<
+ *         _as_f64(positions),
+ *         _as_f64(closes),
+*/
+  __pyx_t_1 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__trailing_stop_exit_multi(__pyx_t_7, __pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_t_11, __pyx_t_12, __pyx_t_13); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_7, 1);
+  __pyx_t_7.memview = NULL; __pyx_t_7.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
+  __pyx_t_8.memview = NULL; __pyx_t_8.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
+  __pyx_t_9.memview = NULL; __pyx_t_9.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_10, 1);
+  __pyx_t_10.memview = NULL; __pyx_t_10.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_11, 1);
+  __pyx_t_11.memview = NULL; __pyx_t_11.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_12, 1);
+  __pyx_t_12.memview = NULL; __pyx_t_12.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_13, 1);
+  __pyx_t_13.memview = NULL; __pyx_t_13.data = NULL;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":311
+ *         out_exit,
+ *     )
+ *     return out_pos, out_exit             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_out_pos);
+  __Pyx_GIVEREF(__pyx_v_out_pos);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_out_pos) != (0)) __PYX_ERR(0, 311, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_out_exit);
+  __Pyx_GIVEREF(__pyx_v_out_exit);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_out_exit) != (0)) __PYX_ERR(0, 311, __pyx_L1_error);
+  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":279
+ * 
+ * 
+ * def trailing_stop_exit_multi_cy(             # <<<<<<<<<<<<<<
+ *     positions: NDArray[np.float64],
+ *     closes: NDArray[np.float64],
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_7, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_10, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_11, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_12, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_13, 1);
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits.trailing_stop_exit_multi_cy", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_pcts);
+  __Pyx_XDECREF(__pyx_v_shape);
+  __Pyx_XDECREF(__pyx_v_out_pos);
+  __Pyx_XDECREF(__pyx_v_out_exit);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "abovedata_backtesting/exits/cython_exits.py":314
+ * 
+ * 
+ * @cython.cfunc             # <<<<<<<<<<<<<<
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+*/
+
+static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__stop_loss_take_profit_exit(__Pyx_memviewslice __pyx_v_positions, __Pyx_memviewslice __pyx_v_closes, __Pyx_memviewslice __pyx_v_highs, __Pyx_memviewslice __pyx_v_lows, double __pyx_v_stop_loss_pct, double __pyx_v_take_profit_pct, __Pyx_memviewslice __pyx_v_out_pos, __Pyx_memviewslice __pyx_v_out_exit) {
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_i;
+  double __pyx_v_entry_price;
+  int __pyx_v_in_position;
+  double __pyx_v_direction;
+  double __pyx_v_pos;
+  double __pyx_v_close;
+  double __pyx_v_high;
+  double __pyx_v_low;
+  double __pyx_v_stop_ret;
+  double __pyx_v_tp_ret;
+  int __pyx_v_stop_hit;
+  int __pyx_v_tp_hit;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_stop_loss_take_profit_exit", 0);
+
+  /* "abovedata_backtesting/exits/cython_exits.py":327
+ *     out_exit: cython.double[:],
+ * ) -> None:
+ *     n: cython.Py_ssize_t = positions.shape[0]             # <<<<<<<<<<<<<<
+ *     i: cython.Py_ssize_t
+ *     entry_price: cython.double = 0.0
+*/
+  __pyx_v_n = (__pyx_v_positions.shape[0]);
+
+  /* "abovedata_backtesting/exits/cython_exits.py":329
+ *     n: cython.Py_ssize_t = positions.shape[0]
+ *     i: cython.Py_ssize_t
+ *     entry_price: cython.double = 0.0             # <<<<<<<<<<<<<<
+ *     in_position: cython.bint = False
+ *     direction: cython.double = 0.0
+*/
+  __pyx_v_entry_price = 0.0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":330
+ *     i: cython.Py_ssize_t
+ *     entry_price: cython.double = 0.0
+ *     in_position: cython.bint = False             # <<<<<<<<<<<<<<
+ *     direction: cython.double = 0.0
+ *     pos: cython.double
+*/
+  __pyx_v_in_position = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":331
+ *     entry_price: cython.double = 0.0
+ *     in_position: cython.bint = False
+ *     direction: cython.double = 0.0             # <<<<<<<<<<<<<<
+ *     pos: cython.double
+ *     close: cython.double
+*/
+  __pyx_v_direction = 0.0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":341
+ *     tp_hit: cython.bint
+ * 
+ *     for i in range(n):             # <<<<<<<<<<<<<<
+ *         pos = positions[i]
+ *         close = closes[i]
+*/
+  __pyx_t_1 = __pyx_v_n;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "abovedata_backtesting/exits/cython_exits.py":342
+ * 
+ *     for i in range(n):
+ *         pos = positions[i]             # <<<<<<<<<<<<<<
+ *         close = closes[i]
+ *         high = highs[i]
+*/
+    __pyx_t_4 = __pyx_v_i;
+    __pyx_v_pos = (*((double const  *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_4 * __pyx_v_positions.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":343
+ *     for i in range(n):
+ *         pos = positions[i]
+ *         close = closes[i]             # <<<<<<<<<<<<<<
+ *         high = highs[i]
+ *         low = lows[i]
+*/
+    __pyx_t_4 = __pyx_v_i;
+    __pyx_v_close = (*((double const  *) ( /* dim=0 */ (__pyx_v_closes.data + __pyx_t_4 * __pyx_v_closes.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":344
+ *         pos = positions[i]
+ *         close = closes[i]
+ *         high = highs[i]             # <<<<<<<<<<<<<<
+ *         low = lows[i]
+ * 
+*/
+    __pyx_t_4 = __pyx_v_i;
+    __pyx_v_high = (*((double const  *) ( /* dim=0 */ (__pyx_v_highs.data + __pyx_t_4 * __pyx_v_highs.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":345
+ *         close = closes[i]
+ *         high = highs[i]
+ *         low = lows[i]             # <<<<<<<<<<<<<<
+ * 
+ *         if (pos > 0.01 or pos < -0.01) and not in_position:
+*/
+    __pyx_t_4 = __pyx_v_i;
+    __pyx_v_low = (*((double const  *) ( /* dim=0 */ (__pyx_v_lows.data + __pyx_t_4 * __pyx_v_lows.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":347
+ *         low = lows[i]
+ * 
+ *         if (pos > 0.01 or pos < -0.01) and not in_position:             # <<<<<<<<<<<<<<
+ *             # New entry
+ *             in_position = True
+*/
+    __pyx_t_6 = (__pyx_v_pos > 0.01);
+    if (!__pyx_t_6) {
+    } else {
+      goto __pyx_L7_next_and;
+    }
+    __pyx_t_6 = (__pyx_v_pos < -0.01);
+    if (__pyx_t_6) {
+    } else {
+      __pyx_t_5 = __pyx_t_6;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_L7_next_and:;
+    __pyx_t_6 = (!__pyx_v_in_position);
+    __pyx_t_5 = __pyx_t_6;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_5) {
+
+      /* "abovedata_backtesting/exits/cython_exits.py":349
+ *         if (pos > 0.01 or pos < -0.01) and not in_position:
+ *             # New entry
+ *             in_position = True             # <<<<<<<<<<<<<<
+ *             entry_price = close
+ *             if pos > 0:
+*/
+      __pyx_v_in_position = 1;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":350
+ *             # New entry
+ *             in_position = True
+ *             entry_price = close             # <<<<<<<<<<<<<<
+ *             if pos > 0:
+ *                 direction = 1.0
+*/
+      __pyx_v_entry_price = __pyx_v_close;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":351
+ *             in_position = True
+ *             entry_price = close
+ *             if pos > 0:             # <<<<<<<<<<<<<<
+ *                 direction = 1.0
+ *             else:
+*/
+      __pyx_t_5 = (__pyx_v_pos > 0.0);
+      if (__pyx_t_5) {
+
+        /* "abovedata_backtesting/exits/cython_exits.py":352
+ *             entry_price = close
+ *             if pos > 0:
+ *                 direction = 1.0             # <<<<<<<<<<<<<<
+ *             else:
+ *                 direction = -1.0
+*/
+        __pyx_v_direction = 1.0;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":351
+ *             in_position = True
+ *             entry_price = close
+ *             if pos > 0:             # <<<<<<<<<<<<<<
+ *                 direction = 1.0
+ *             else:
+*/
+        goto __pyx_L9;
+      }
+
+      /* "abovedata_backtesting/exits/cython_exits.py":354
+ *                 direction = 1.0
+ *             else:
+ *                 direction = -1.0             # <<<<<<<<<<<<<<
+ *             out_pos[i] = pos
+ *             out_exit[i] = close
+*/
+      /*else*/ {
+        __pyx_v_direction = -1.0;
+      }
+      __pyx_L9:;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":355
+ *             else:
+ *                 direction = -1.0
+ *             out_pos[i] = pos             # <<<<<<<<<<<<<<
+ *             out_exit[i] = close
+ * 
+*/
+      __pyx_t_4 = __pyx_v_i;
+      *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = __pyx_v_pos;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":356
+ *                 direction = -1.0
+ *             out_pos[i] = pos
+ *             out_exit[i] = close             # <<<<<<<<<<<<<<
+ * 
+ *         elif in_position:
+*/
+      __pyx_t_4 = __pyx_v_i;
+      *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_close;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":347
+ *         low = lows[i]
+ * 
+ *         if (pos > 0.01 or pos < -0.01) and not in_position:             # <<<<<<<<<<<<<<
+ *             # New entry
+ *             in_position = True
+*/
+      goto __pyx_L5;
+    }
+
+    /* "abovedata_backtesting/exits/cython_exits.py":358
+ *             out_exit[i] = close
+ * 
+ *         elif in_position:             # <<<<<<<<<<<<<<
+ *             if direction > 0:
+ *                 stop_ret = low / entry_price - 1.0
+*/
+    if (__pyx_v_in_position) {
+
+      /* "abovedata_backtesting/exits/cython_exits.py":359
+ * 
+ *         elif in_position:
+ *             if direction > 0:             # <<<<<<<<<<<<<<
+ *                 stop_ret = low / entry_price - 1.0
+ *                 tp_ret = high / entry_price - 1.0
+*/
+      __pyx_t_5 = (__pyx_v_direction > 0.0);
+      if (__pyx_t_5) {
+
+        /* "abovedata_backtesting/exits/cython_exits.py":360
+ *         elif in_position:
+ *             if direction > 0:
+ *                 stop_ret = low / entry_price - 1.0             # <<<<<<<<<<<<<<
+ *                 tp_ret = high / entry_price - 1.0
+ *             else:
+*/
+        if (unlikely(__pyx_v_entry_price == 0)) {
+          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+          __PYX_ERR(0, 360, __pyx_L1_error)
+        }
+        __pyx_v_stop_ret = ((__pyx_v_low / __pyx_v_entry_price) - 1.0);
+
+        /* "abovedata_backtesting/exits/cython_exits.py":361
+ *             if direction > 0:
+ *                 stop_ret = low / entry_price - 1.0
+ *                 tp_ret = high / entry_price - 1.0             # <<<<<<<<<<<<<<
+ *             else:
+ *                 stop_ret = -(high / entry_price - 1.0)
+*/
+        if (unlikely(__pyx_v_entry_price == 0)) {
+          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+          __PYX_ERR(0, 361, __pyx_L1_error)
+        }
+        __pyx_v_tp_ret = ((__pyx_v_high / __pyx_v_entry_price) - 1.0);
+
+        /* "abovedata_backtesting/exits/cython_exits.py":359
+ * 
+ *         elif in_position:
+ *             if direction > 0:             # <<<<<<<<<<<<<<
+ *                 stop_ret = low / entry_price - 1.0
+ *                 tp_ret = high / entry_price - 1.0
+*/
+        goto __pyx_L10;
+      }
+
+      /* "abovedata_backtesting/exits/cython_exits.py":363
+ *                 tp_ret = high / entry_price - 1.0
+ *             else:
+ *                 stop_ret = -(high / entry_price - 1.0)             # <<<<<<<<<<<<<<
+ *                 tp_ret = -(low / entry_price - 1.0)
+ * 
+*/
+      /*else*/ {
+        if (unlikely(__pyx_v_entry_price == 0)) {
+          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+          __PYX_ERR(0, 363, __pyx_L1_error)
+        }
+        __pyx_v_stop_ret = (-((__pyx_v_high / __pyx_v_entry_price) - 1.0));
+
+        /* "abovedata_backtesting/exits/cython_exits.py":364
+ *             else:
+ *                 stop_ret = -(high / entry_price - 1.0)
+ *                 tp_ret = -(low / entry_price - 1.0)             # <<<<<<<<<<<<<<
+ * 
+ *             stop_hit = stop_ret <= stop_loss_pct
+*/
+        if (unlikely(__pyx_v_entry_price == 0)) {
+          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+          __PYX_ERR(0, 364, __pyx_L1_error)
+        }
+        __pyx_v_tp_ret = (-((__pyx_v_low / __pyx_v_entry_price) - 1.0));
+      }
+      __pyx_L10:;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":366
+ *                 tp_ret = -(low / entry_price - 1.0)
+ * 
+ *             stop_hit = stop_ret <= stop_loss_pct             # <<<<<<<<<<<<<<
+ *             tp_hit = tp_ret >= take_profit_pct
+ * 
+*/
+      __pyx_v_stop_hit = (__pyx_v_stop_ret <= __pyx_v_stop_loss_pct);
+
+      /* "abovedata_backtesting/exits/cython_exits.py":367
+ * 
+ *             stop_hit = stop_ret <= stop_loss_pct
+ *             tp_hit = tp_ret >= take_profit_pct             # <<<<<<<<<<<<<<
+ * 
+ *             if stop_hit:
+*/
+      __pyx_v_tp_hit = (__pyx_v_tp_ret >= __pyx_v_take_profit_pct);
+
+      /* "abovedata_backtesting/exits/cython_exits.py":369
+ *             tp_hit = tp_ret >= take_profit_pct
+ * 
+ *             if stop_hit:             # <<<<<<<<<<<<<<
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
+*/
+      if (__pyx_v_stop_hit) {
+
+        /* "abovedata_backtesting/exits/cython_exits.py":370
+ * 
+ *             if stop_hit:
+ *                 out_pos[i] = 0.0             # <<<<<<<<<<<<<<
+ *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
+ *                 in_position = False
+*/
+        __pyx_t_4 = __pyx_v_i;
+        *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = 0.0;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":371
+ *             if stop_hit:
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)             # <<<<<<<<<<<<<<
+ *                 in_position = False
+ *             elif tp_hit:
+*/
+        __pyx_t_4 = __pyx_v_i;
+        *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = (__pyx_v_entry_price * (1.0 + (__pyx_v_stop_loss_pct * __pyx_v_direction)));
+
+        /* "abovedata_backtesting/exits/cython_exits.py":372
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
+ *                 in_position = False             # <<<<<<<<<<<<<<
+ *             elif tp_hit:
+ *                 out_pos[i] = 0.0
+*/
+        __pyx_v_in_position = 0;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":369
+ *             tp_hit = tp_ret >= take_profit_pct
+ * 
+ *             if stop_hit:             # <<<<<<<<<<<<<<
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
+*/
+        goto __pyx_L11;
+      }
+
+      /* "abovedata_backtesting/exits/cython_exits.py":373
+ *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
+ *                 in_position = False
+ *             elif tp_hit:             # <<<<<<<<<<<<<<
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
+*/
+      if (__pyx_v_tp_hit) {
+
+        /* "abovedata_backtesting/exits/cython_exits.py":374
+ *                 in_position = False
+ *             elif tp_hit:
+ *                 out_pos[i] = 0.0             # <<<<<<<<<<<<<<
+ *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
+ *                 in_position = False
+*/
+        __pyx_t_4 = __pyx_v_i;
+        *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = 0.0;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":375
+ *             elif tp_hit:
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)             # <<<<<<<<<<<<<<
+ *                 in_position = False
+ *             elif pos > -0.01 and pos < 0.01:
+*/
+        __pyx_t_4 = __pyx_v_i;
+        *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = (__pyx_v_entry_price * (1.0 + (__pyx_v_take_profit_pct * __pyx_v_direction)));
+
+        /* "abovedata_backtesting/exits/cython_exits.py":376
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
+ *                 in_position = False             # <<<<<<<<<<<<<<
+ *             elif pos > -0.01 and pos < 0.01:
+ *                 out_pos[i] = 0.0
+*/
+        __pyx_v_in_position = 0;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":373
+ *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
+ *                 in_position = False
+ *             elif tp_hit:             # <<<<<<<<<<<<<<
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
+*/
+        goto __pyx_L11;
+      }
+
+      /* "abovedata_backtesting/exits/cython_exits.py":377
+ *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
+ *                 in_position = False
+ *             elif pos > -0.01 and pos < 0.01:             # <<<<<<<<<<<<<<
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = close
+*/
+      __pyx_t_6 = (__pyx_v_pos > -0.01);
+      if (__pyx_t_6) {
+      } else {
+        __pyx_t_5 = __pyx_t_6;
+        goto __pyx_L12_bool_binop_done;
+      }
+      __pyx_t_6 = (__pyx_v_pos < 0.01);
+      __pyx_t_5 = __pyx_t_6;
+      __pyx_L12_bool_binop_done:;
+      if (__pyx_t_5) {
+
+        /* "abovedata_backtesting/exits/cython_exits.py":378
+ *                 in_position = False
+ *             elif pos > -0.01 and pos < 0.01:
+ *                 out_pos[i] = 0.0             # <<<<<<<<<<<<<<
+ *                 out_exit[i] = close
+ *                 in_position = False
+*/
+        __pyx_t_4 = __pyx_v_i;
+        *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = 0.0;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":379
+ *             elif pos > -0.01 and pos < 0.01:
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = close             # <<<<<<<<<<<<<<
+ *                 in_position = False
+ *             else:
+*/
+        __pyx_t_4 = __pyx_v_i;
+        *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_close;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":380
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = close
+ *                 in_position = False             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out_pos[i] = pos
+*/
+        __pyx_v_in_position = 0;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":377
+ *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
+ *                 in_position = False
+ *             elif pos > -0.01 and pos < 0.01:             # <<<<<<<<<<<<<<
+ *                 out_pos[i] = 0.0
+ *                 out_exit[i] = close
+*/
+        goto __pyx_L11;
+      }
+
+      /* "abovedata_backtesting/exits/cython_exits.py":382
+ *                 in_position = False
+ *             else:
+ *                 out_pos[i] = pos             # <<<<<<<<<<<<<<
+ *                 out_exit[i] = close
+ *         else:
+*/
+      /*else*/ {
+        __pyx_t_4 = __pyx_v_i;
+        *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = __pyx_v_pos;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":383
+ *             else:
+ *                 out_pos[i] = pos
+ *                 out_exit[i] = close             # <<<<<<<<<<<<<<
+ *         else:
+ *             out_pos[i] = pos
+*/
+        __pyx_t_4 = __pyx_v_i;
+        *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_close;
+      }
+      __pyx_L11:;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":358
+ *             out_exit[i] = close
+ * 
+ *         elif in_position:             # <<<<<<<<<<<<<<
+ *             if direction > 0:
+ *                 stop_ret = low / entry_price - 1.0
+*/
+      goto __pyx_L5;
+    }
+
+    /* "abovedata_backtesting/exits/cython_exits.py":385
+ *                 out_exit[i] = close
+ *         else:
+ *             out_pos[i] = pos             # <<<<<<<<<<<<<<
+ *             out_exit[i] = close
+ *             if pos > -0.01 and pos < 0.01:
+*/
+    /*else*/ {
+      __pyx_t_4 = __pyx_v_i;
+      *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = __pyx_v_pos;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":386
+ *         else:
+ *             out_pos[i] = pos
+ *             out_exit[i] = close             # <<<<<<<<<<<<<<
+ *             if pos > -0.01 and pos < 0.01:
+ *                 in_position = False
+*/
+      __pyx_t_4 = __pyx_v_i;
+      *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_close;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":387
+ *             out_pos[i] = pos
+ *             out_exit[i] = close
+ *             if pos > -0.01 and pos < 0.01:             # <<<<<<<<<<<<<<
+ *                 in_position = False
+ * 
+*/
+      __pyx_t_6 = (__pyx_v_pos > -0.01);
+      if (__pyx_t_6) {
+      } else {
+        __pyx_t_5 = __pyx_t_6;
+        goto __pyx_L15_bool_binop_done;
+      }
+      __pyx_t_6 = (__pyx_v_pos < 0.01);
+      __pyx_t_5 = __pyx_t_6;
+      __pyx_L15_bool_binop_done:;
+      if (__pyx_t_5) {
+
+        /* "abovedata_backtesting/exits/cython_exits.py":388
+ *             out_exit[i] = close
+ *             if pos > -0.01 and pos < 0.01:
+ *                 in_position = False             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+        __pyx_v_in_position = 0;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":387
+ *             out_pos[i] = pos
+ *             out_exit[i] = close
+ *             if pos > -0.01 and pos < 0.01:             # <<<<<<<<<<<<<<
+ *                 in_position = False
+ * 
+*/
+      }
+    }
+    __pyx_L5:;
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":314
+ * 
+ * 
+ * @cython.cfunc             # <<<<<<<<<<<<<<
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits._stop_loss_take_profit_exit", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "abovedata_backtesting/exits/cython_exits.py":391
+ * 
+ * 
+ * def stop_loss_take_profit_exit_cy(             # <<<<<<<<<<<<<<
+ *     positions: NDArray[np.float64],
+ *     closes: NDArray[np.float64],
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_9stop_loss_take_profit_exit_cy(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_8stop_loss_take_profit_exit_cy, "Apply stop-loss / take-profit exit logic.\n\n    Returns\n    -------\n    (new_positions, exit_prices) \342\200\224 both (N,) float64 arrays\n    ");
+static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_9stop_loss_take_profit_exit_cy = {"stop_loss_take_profit_exit_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_9stop_loss_take_profit_exit_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_8stop_loss_take_profit_exit_cy};
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_9stop_loss_take_profit_exit_cy(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_positions = 0;
+  PyObject *__pyx_v_closes = 0;
+  PyObject *__pyx_v_highs = 0;
+  PyObject *__pyx_v_lows = 0;
+  double __pyx_v_stop_loss_pct;
+  double __pyx_v_take_profit_pct;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[6] = {0,0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("stop_loss_take_profit_exit_cy (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_positions,&__pyx_mstate_global->__pyx_n_u_closes,&__pyx_mstate_global->__pyx_n_u_highs,&__pyx_mstate_global->__pyx_n_u_lows,&__pyx_mstate_global->__pyx_n_u_stop_loss_pct,&__pyx_mstate_global->__pyx_n_u_take_profit_pct,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 391, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  6:
+        values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 391, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 391, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 391, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 391, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 391, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 391, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "stop_loss_take_profit_exit_cy", 0) < (0)) __PYX_ERR(0, 391, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 6; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("stop_loss_take_profit_exit_cy", 1, 6, 6, i); __PYX_ERR(0, 391, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 6)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 391, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 391, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 391, __pyx_L3_error)
+      values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 391, __pyx_L3_error)
+      values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 391, __pyx_L3_error)
+      values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 391, __pyx_L3_error)
+    }
+    __pyx_v_positions = values[0];
+    __pyx_v_closes = values[1];
+    __pyx_v_highs = values[2];
+    __pyx_v_lows = values[3];
+    __pyx_v_stop_loss_pct = __Pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_stop_loss_pct == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 396, __pyx_L3_error)
+    __pyx_v_take_profit_pct = __Pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_take_profit_pct == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 397, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("stop_loss_take_profit_exit_cy", 1, 6, 6, __pyx_nargs); __PYX_ERR(0, 391, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits.stop_loss_take_profit_exit_cy", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_8stop_loss_take_profit_exit_cy(__pyx_self, __pyx_v_positions, __pyx_v_closes, __pyx_v_highs, __pyx_v_lows, __pyx_v_stop_loss_pct, __pyx_v_take_profit_pct);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_8stop_loss_take_profit_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, double __pyx_v_stop_loss_pct, double __pyx_v_take_profit_pct) {
+  PyObject *__pyx_v_n = NULL;
+  PyObject *__pyx_v_pos = NULL;
+  PyObject *__pyx_v_cl = NULL;
+  PyObject *__pyx_v_hi = NULL;
+  PyObject *__pyx_v_lo = NULL;
+  PyObject *__pyx_v_out_pos = NULL;
+  PyObject *__pyx_v_out_exit = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_10 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_11 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_12 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("stop_loss_take_profit_exit_cy", 0);
+
+  /* "abovedata_backtesting/exits/cython_exits.py":405
+ *     (new_positions, exit_prices)  both (N,) float64 arrays
+ *     """
+ *     n = positions.shape[0]             # <<<<<<<<<<<<<<
+ *     pos = _as_f64(positions)
+ *     cl = _as_f64(closes)
+*/
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_positions, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_n = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":406
+ *     """
+ *     n = positions.shape[0]
+ *     pos = _as_f64(positions)             # <<<<<<<<<<<<<<
+ *     cl = _as_f64(closes)
+ *     hi = _as_f64(highs)
+*/
+  __pyx_t_1 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 406, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_1);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_v_positions};
+    __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 406, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v_pos = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":407
+ *     n = positions.shape[0]
+ *     pos = _as_f64(positions)
+ *     cl = _as_f64(closes)             # <<<<<<<<<<<<<<
+ *     hi = _as_f64(highs)
+ *     lo = _as_f64(lows)
+*/
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 407, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_1, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_closes};
+    __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 407, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v_cl = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":408
+ *     pos = _as_f64(positions)
+ *     cl = _as_f64(closes)
+ *     hi = _as_f64(highs)             # <<<<<<<<<<<<<<
+ *     lo = _as_f64(lows)
+ *     out_pos = np.empty(n, dtype=np.float64)
+*/
+  __pyx_t_1 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 408, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_1);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_v_highs};
+    __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 408, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v_hi = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":409
+ *     cl = _as_f64(closes)
+ *     hi = _as_f64(highs)
+ *     lo = _as_f64(lows)             # <<<<<<<<<<<<<<
+ *     out_pos = np.empty(n, dtype=np.float64)
+ *     out_exit = np.empty(n, dtype=np.float64)
+*/
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_1, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_lows};
+    __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 409, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v_lo = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":410
+ *     hi = _as_f64(highs)
+ *     lo = _as_f64(lows)
+ *     out_pos = np.empty(n, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     out_exit = np.empty(n, dtype=np.float64)
+ *     _stop_loss_take_profit_exit(
+*/
+  __pyx_t_1 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 410, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 410, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 410, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 410, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_5);
+    assert(__pyx_t_1);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_1, __pyx_v_n};
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 410, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 410, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 410, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v_out_pos = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":411
+ *     lo = _as_f64(lows)
+ *     out_pos = np.empty(n, dtype=np.float64)
+ *     out_exit = np.empty(n, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     _stop_loss_take_profit_exit(
+ *         pos,
+*/
+  __pyx_t_5 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+    assert(__pyx_t_5);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_v_n};
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 411, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_1, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 411, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 411, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v_out_exit = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":413
+ *     out_exit = np.empty(n, dtype=np.float64)
+ *     _stop_loss_take_profit_exit(
+ *         pos,             # <<<<<<<<<<<<<<
+ *         cl,
+ *         hi,
+*/
+  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_pos, 0); if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 413, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_7.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 413, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":414
+ *     _stop_loss_take_profit_exit(
+ *         pos,
+ *         cl,             # <<<<<<<<<<<<<<
+ *         hi,
+ *         lo,
+*/
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_cl, 0); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 414, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_8.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 414, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":415
+ *         pos,
+ *         cl,
+ *         hi,             # <<<<<<<<<<<<<<
+ *         lo,
+ *         stop_loss_pct,
+*/
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_hi, 0); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 415, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_9.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 415, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":416
+ *         cl,
+ *         hi,
+ *         lo,             # <<<<<<<<<<<<<<
+ *         stop_loss_pct,
+ *         take_profit_pct,
+*/
+  __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_lo, 0); if (unlikely(!__pyx_t_10.memview)) __PYX_ERR(0, 416, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_10.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 416, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":419
+ *         stop_loss_pct,
+ *         take_profit_pct,
+ *         out_pos,             # <<<<<<<<<<<<<<
+ *         out_exit,
+ *     )
+*/
+  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 419, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_11.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 419, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":420
+ *         take_profit_pct,
+ *         out_pos,
+ *         out_exit,             # <<<<<<<<<<<<<<
+ *     )
+ *     return out_pos, out_exit
+*/
+  __pyx_t_12 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out_exit, PyBUF_WRITABLE); if (unlikely(!__pyx_t_12.memview)) __PYX_ERR(0, 420, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_12.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 420, __pyx_L1_error)
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":412
+ *     out_pos = np.empty(n, dtype=np.float64)
+ *     out_exit = np.empty(n, dtype=np.float64)
+ *     _stop_loss_take_profit_exit(             # <<<<<<<<<<<<<<
+ *         pos,
+ *         cl,
+*/
+  __pyx_t_2 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__stop_loss_take_profit_exit(__pyx_t_7, __pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_v_stop_loss_pct, __pyx_v_take_profit_pct, __pyx_t_11, __pyx_t_12); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_7, 1);
+  __pyx_t_7.memview = NULL; __pyx_t_7.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
+  __pyx_t_8.memview = NULL; __pyx_t_8.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
+  __pyx_t_9.memview = NULL; __pyx_t_9.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_10, 1);
+  __pyx_t_10.memview = NULL; __pyx_t_10.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_11, 1);
+  __pyx_t_11.memview = NULL; __pyx_t_11.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_12, 1);
+  __pyx_t_12.memview = NULL; __pyx_t_12.data = NULL;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":422
+ *         out_exit,
+ *     )
+ *     return out_pos, out_exit             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 422, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_out_pos);
+  __Pyx_GIVEREF(__pyx_v_out_pos);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_out_pos) != (0)) __PYX_ERR(0, 422, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_out_exit);
+  __Pyx_GIVEREF(__pyx_v_out_exit);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_out_exit) != (0)) __PYX_ERR(0, 422, __pyx_L1_error);
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":391
+ * 
+ * 
+ * def stop_loss_take_profit_exit_cy(             # <<<<<<<<<<<<<<
+ *     positions: NDArray[np.float64],
+ *     closes: NDArray[np.float64],
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_7, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_10, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_11, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_12, 1);
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits.stop_loss_take_profit_exit_cy", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_n);
+  __Pyx_XDECREF(__pyx_v_pos);
+  __Pyx_XDECREF(__pyx_v_cl);
+  __Pyx_XDECREF(__pyx_v_hi);
+  __Pyx_XDECREF(__pyx_v_lo);
+  __Pyx_XDECREF(__pyx_v_out_pos);
+  __Pyx_XDECREF(__pyx_v_out_exit);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "abovedata_backtesting/exits/cython_exits.py":425
+ * 
+ * 
+ * @cython.cfunc             # <<<<<<<<<<<<<<
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+*/
+
+static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__stop_loss_take_profit_exit_multi(__Pyx_memviewslice __pyx_v_positions, __Pyx_memviewslice __pyx_v_closes, __Pyx_memviewslice __pyx_v_highs, __Pyx_memviewslice __pyx_v_lows, __Pyx_memviewslice __pyx_v_stop_loss_pcts, __Pyx_memviewslice __pyx_v_take_profit_pcts, __Pyx_memviewslice __pyx_v_out_pos, __Pyx_memviewslice __pyx_v_out_exit) {
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_n_params;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_k;
+  __Pyx_memviewslice __pyx_v_entry_price = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_direction = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_in_position = { 0, 0, { 0 }, { 0 }, { 0 } };
+  double __pyx_v_pos;
+  double __pyx_v_close;
+  double __pyx_v_high;
+  double __pyx_v_low;
+  int __pyx_v_pos_active;
+  double __pyx_v_stop_ret;
+  double __pyx_v_tp_ret;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  size_t __pyx_t_7;
+  __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  double __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_stop_loss_take_profit_exit_multi", 0);
+
+  /* "abovedata_backtesting/exits/cython_exits.py":438
+ *     out_exit: cython.double[:, :],
+ * ) -> None:
+ *     n: cython.Py_ssize_t = positions.shape[0]             # <<<<<<<<<<<<<<
+ *     n_params: cython.Py_ssize_t = stop_loss_pcts.shape[0]
+ *     i: cython.Py_ssize_t
+*/
+  __pyx_v_n = (__pyx_v_positions.shape[0]);
+
+  /* "abovedata_backtesting/exits/cython_exits.py":439
+ * ) -> None:
+ *     n: cython.Py_ssize_t = positions.shape[0]
+ *     n_params: cython.Py_ssize_t = stop_loss_pcts.shape[0]             # <<<<<<<<<<<<<<
+ *     i: cython.Py_ssize_t
+ *     k: cython.Py_ssize_t
+*/
+  __pyx_v_n_params = (__pyx_v_stop_loss_pcts.shape[0]);
+
+  /* "abovedata_backtesting/exits/cython_exits.py":442
+ *     i: cython.Py_ssize_t
+ *     k: cython.Py_ssize_t
+ *     entry_price: cython.double[:] = np.zeros(n_params, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     direction: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     in_position: cython.uchar[:] = np.zeros(n_params, dtype=np.uint8)
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyLong_FromSsize_t(__pyx_v_n_params); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_7 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+    __pyx_t_7 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_3};
+    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_entry_price = __pyx_t_8;
+  __pyx_t_8.memview = NULL;
+  __pyx_t_8.data = NULL;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":443
+ *     k: cython.Py_ssize_t
+ *     entry_price: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     direction: cython.double[:] = np.zeros(n_params, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     in_position: cython.uchar[:] = np.zeros(n_params, dtype=np.uint8)
+ *     pos: cython.double
+*/
+  __pyx_t_4 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyLong_FromSsize_t(__pyx_v_n_params); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_7 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    assert(__pyx_t_4);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_7 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_4, __pyx_t_5};
+    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_2, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_direction = __pyx_t_8;
+  __pyx_t_8.memview = NULL;
+  __pyx_t_8.data = NULL;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":444
+ *     entry_price: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     direction: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+ *     in_position: cython.uchar[:] = np.zeros(n_params, dtype=np.uint8)             # <<<<<<<<<<<<<<
+ *     pos: cython.double
+ *     close: cython.double
+*/
+  __pyx_t_6 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyLong_FromSsize_t(__pyx_v_n_params); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_uint8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_7 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
+    assert(__pyx_t_6);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+    __pyx_t_7 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_6, __pyx_t_3};
+    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_4, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_in_position = __pyx_t_9;
+  __pyx_t_9.memview = NULL;
+  __pyx_t_9.data = NULL;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":453
+ *     tp_ret: cython.double
+ * 
+ *     for i in range(n):             # <<<<<<<<<<<<<<
+ *         pos = positions[i]
+ *         close = closes[i]
+*/
+  __pyx_t_10 = __pyx_v_n;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_i = __pyx_t_12;
+
+    /* "abovedata_backtesting/exits/cython_exits.py":454
+ * 
+ *     for i in range(n):
+ *         pos = positions[i]             # <<<<<<<<<<<<<<
+ *         close = closes[i]
+ *         high = highs[i]
+*/
+    __pyx_t_13 = __pyx_v_i;
+    __pyx_v_pos = (*((double const  *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_13 * __pyx_v_positions.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":455
+ *     for i in range(n):
+ *         pos = positions[i]
+ *         close = closes[i]             # <<<<<<<<<<<<<<
+ *         high = highs[i]
+ *         low = lows[i]
+*/
+    __pyx_t_13 = __pyx_v_i;
+    __pyx_v_close = (*((double const  *) ( /* dim=0 */ (__pyx_v_closes.data + __pyx_t_13 * __pyx_v_closes.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":456
+ *         pos = positions[i]
+ *         close = closes[i]
+ *         high = highs[i]             # <<<<<<<<<<<<<<
+ *         low = lows[i]
+ *         pos_active = pos > 0.01 or pos < -0.01
+*/
+    __pyx_t_13 = __pyx_v_i;
+    __pyx_v_high = (*((double const  *) ( /* dim=0 */ (__pyx_v_highs.data + __pyx_t_13 * __pyx_v_highs.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":457
+ *         close = closes[i]
+ *         high = highs[i]
+ *         low = lows[i]             # <<<<<<<<<<<<<<
+ *         pos_active = pos > 0.01 or pos < -0.01
+ * 
+*/
+    __pyx_t_13 = __pyx_v_i;
+    __pyx_v_low = (*((double const  *) ( /* dim=0 */ (__pyx_v_lows.data + __pyx_t_13 * __pyx_v_lows.strides[0]) )));
+
+    /* "abovedata_backtesting/exits/cython_exits.py":458
+ *         high = highs[i]
+ *         low = lows[i]
+ *         pos_active = pos > 0.01 or pos < -0.01             # <<<<<<<<<<<<<<
+ * 
+ *         for k in range(n_params):
+*/
+    __pyx_t_15 = (__pyx_v_pos > 0.01);
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_14 = __pyx_t_15;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_15 = (__pyx_v_pos < -0.01);
+    __pyx_t_14 = __pyx_t_15;
+    __pyx_L5_bool_binop_done:;
+    __pyx_v_pos_active = __pyx_t_14;
+
+    /* "abovedata_backtesting/exits/cython_exits.py":460
+ *         pos_active = pos > 0.01 or pos < -0.01
+ * 
+ *         for k in range(n_params):             # <<<<<<<<<<<<<<
+ *             if pos_active and not in_position[k]:
+ *                 # New entry
+*/
+    __pyx_t_16 = __pyx_v_n_params;
+    __pyx_t_17 = __pyx_t_16;
+    for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+      __pyx_v_k = __pyx_t_18;
+
+      /* "abovedata_backtesting/exits/cython_exits.py":461
+ * 
+ *         for k in range(n_params):
+ *             if pos_active and not in_position[k]:             # <<<<<<<<<<<<<<
+ *                 # New entry
+ *                 in_position[k] = 1
+*/
+      if (__pyx_v_pos_active) {
+      } else {
+        __pyx_t_14 = __pyx_v_pos_active;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_13 = __pyx_v_k;
+      __pyx_t_15 = (!((*((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_13 * __pyx_v_in_position.strides[0]) ))) != 0));
+      __pyx_t_14 = __pyx_t_15;
+      __pyx_L10_bool_binop_done:;
+      if (__pyx_t_14) {
+
+        /* "abovedata_backtesting/exits/cython_exits.py":463
+ *             if pos_active and not in_position[k]:
+ *                 # New entry
+ *                 in_position[k] = 1             # <<<<<<<<<<<<<<
+ *                 entry_price[k] = close
+ *                 if pos > 0:
+*/
+        __pyx_t_13 = __pyx_v_k;
+        *((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_13 * __pyx_v_in_position.strides[0]) )) = 1;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":464
+ *                 # New entry
+ *                 in_position[k] = 1
+ *                 entry_price[k] = close             # <<<<<<<<<<<<<<
+ *                 if pos > 0:
+ *                     direction[k] = 1.0
+*/
+        __pyx_t_13 = __pyx_v_k;
+        *((double *) ( /* dim=0 */ (__pyx_v_entry_price.data + __pyx_t_13 * __pyx_v_entry_price.strides[0]) )) = __pyx_v_close;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":465
+ *                 in_position[k] = 1
+ *                 entry_price[k] = close
+ *                 if pos > 0:             # <<<<<<<<<<<<<<
+ *                     direction[k] = 1.0
+ *                 else:
+*/
+        __pyx_t_14 = (__pyx_v_pos > 0.0);
+        if (__pyx_t_14) {
+
+          /* "abovedata_backtesting/exits/cython_exits.py":466
+ *                 entry_price[k] = close
+ *                 if pos > 0:
+ *                     direction[k] = 1.0             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     direction[k] = -1.0
+*/
+          __pyx_t_13 = __pyx_v_k;
+          *((double *) ( /* dim=0 */ (__pyx_v_direction.data + __pyx_t_13 * __pyx_v_direction.strides[0]) )) = 1.0;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":465
+ *                 in_position[k] = 1
+ *                 entry_price[k] = close
+ *                 if pos > 0:             # <<<<<<<<<<<<<<
+ *                     direction[k] = 1.0
+ *                 else:
+*/
+          goto __pyx_L12;
+        }
+
+        /* "abovedata_backtesting/exits/cython_exits.py":468
+ *                     direction[k] = 1.0
+ *                 else:
+ *                     direction[k] = -1.0             # <<<<<<<<<<<<<<
+ *                 out_pos[k, i] = pos
+ *                 out_exit[k, i] = close
+*/
+        /*else*/ {
+          __pyx_t_13 = __pyx_v_k;
+          *((double *) ( /* dim=0 */ (__pyx_v_direction.data + __pyx_t_13 * __pyx_v_direction.strides[0]) )) = -1.0;
+        }
+        __pyx_L12:;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":469
+ *                 else:
+ *                     direction[k] = -1.0
+ *                 out_pos[k, i] = pos             # <<<<<<<<<<<<<<
+ *                 out_exit[k, i] = close
+ * 
 */
-        __pyx_v_in_position = 0;
+        __pyx_t_13 = __pyx_v_k;
+        __pyx_t_19 = __pyx_v_i;
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_13 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_19 * __pyx_v_out_pos.strides[1]) )) = __pyx_v_pos;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":241
- *                 out_exit[i] = entry_price * (1.0 + stop_loss_pct * direction)
- *                 in_position = False
- *             elif tp_hit:             # <<<<<<<<<<<<<<
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
+        /* "abovedata_backtesting/exits/cython_exits.py":470
+ *                     direction[k] = -1.0
+ *                 out_pos[k, i] = pos
+ *                 out_exit[k, i] = close             # <<<<<<<<<<<<<<
+ * 
+ *             elif in_position[k]:
 */
-        goto __pyx_L11;
-      }
+        __pyx_t_19 = __pyx_v_k;
+        __pyx_t_13 = __pyx_v_i;
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_19 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_13 * __pyx_v_out_exit.strides[1]) )) = __pyx_v_close;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":245
- *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
- *                 in_position = False
- *             elif pos > -0.01 and pos < 0.01:             # <<<<<<<<<<<<<<
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = close
+        /* "abovedata_backtesting/exits/cython_exits.py":461
+ * 
+ *         for k in range(n_params):
+ *             if pos_active and not in_position[k]:             # <<<<<<<<<<<<<<
+ *                 # New entry
+ *                 in_position[k] = 1
 */
-      __pyx_t_6 = (__pyx_v_pos > -0.01);
-      if (__pyx_t_6) {
-      } else {
-        __pyx_t_5 = __pyx_t_6;
-        goto __pyx_L12_bool_binop_done;
+        goto __pyx_L9;
       }
-      __pyx_t_6 = (__pyx_v_pos < 0.01);
-      __pyx_t_5 = __pyx_t_6;
-      __pyx_L12_bool_binop_done:;
-      if (__pyx_t_5) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":246
- *                 in_position = False
- *             elif pos > -0.01 and pos < 0.01:
- *                 out_pos[i] = 0.0             # <<<<<<<<<<<<<<
- *                 out_exit[i] = close
- *                 in_position = False
+      /* "abovedata_backtesting/exits/cython_exits.py":472
+ *                 out_exit[k, i] = close
+ * 
+ *             elif in_position[k]:             # <<<<<<<<<<<<<<
+ *                 if direction[k] > 0:
+ *                     stop_ret = low / entry_price[k] - 1.0
 */
-        __pyx_t_4 = __pyx_v_i;
-        *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = 0.0;
+      __pyx_t_13 = __pyx_v_k;
+      __pyx_t_14 = ((*((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_13 * __pyx_v_in_position.strides[0]) ))) != 0);
+      if (__pyx_t_14) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":247
- *             elif pos > -0.01 and pos < 0.01:
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = close             # <<<<<<<<<<<<<<
- *                 in_position = False
- *             else:
+        /* "abovedata_backtesting/exits/cython_exits.py":473
+ * 
+ *             elif in_position[k]:
+ *                 if direction[k] > 0:             # <<<<<<<<<<<<<<
+ *                     stop_ret = low / entry_price[k] - 1.0
+ *                     tp_ret = high / entry_price[k] - 1.0
 */
-        __pyx_t_4 = __pyx_v_i;
-        *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_close;
+        __pyx_t_13 = __pyx_v_k;
+        __pyx_t_14 = ((*((double *) ( /* dim=0 */ (__pyx_v_direction.data + __pyx_t_13 * __pyx_v_direction.strides[0]) ))) > 0.0);
+        if (__pyx_t_14) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":248
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = close
- *                 in_position = False             # <<<<<<<<<<<<<<
- *             else:
- *                 out_pos[i] = pos
+          /* "abovedata_backtesting/exits/cython_exits.py":474
+ *             elif in_position[k]:
+ *                 if direction[k] > 0:
+ *                     stop_ret = low / entry_price[k] - 1.0             # <<<<<<<<<<<<<<
+ *                     tp_ret = high / entry_price[k] - 1.0
+ *                 else:
 */
-        __pyx_v_in_position = 0;
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_20 = (*((double *) ( /* dim=0 */ (__pyx_v_entry_price.data + __pyx_t_13 * __pyx_v_entry_price.strides[0]) )));
+          if (unlikely(__pyx_t_20 == 0)) {
+            PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+            __PYX_ERR(0, 474, __pyx_L1_error)
+          }
+          __pyx_v_stop_ret = ((__pyx_v_low / __pyx_t_20) - 1.0);
 
-        /* "abovedata_backtesting/exits/cython_exits.py":245
- *                 out_exit[i] = entry_price * (1.0 + take_profit_pct * direction)
- *                 in_position = False
- *             elif pos > -0.01 and pos < 0.01:             # <<<<<<<<<<<<<<
- *                 out_pos[i] = 0.0
- *                 out_exit[i] = close
+          /* "abovedata_backtesting/exits/cython_exits.py":475
+ *                 if direction[k] > 0:
+ *                     stop_ret = low / entry_price[k] - 1.0
+ *                     tp_ret = high / entry_price[k] - 1.0             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     stop_ret = -(high / entry_price[k] - 1.0)
 */
-        goto __pyx_L11;
-      }
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_20 = (*((double *) ( /* dim=0 */ (__pyx_v_entry_price.data + __pyx_t_13 * __pyx_v_entry_price.strides[0]) )));
+          if (unlikely(__pyx_t_20 == 0)) {
+            PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+            __PYX_ERR(0, 475, __pyx_L1_error)
+          }
+          __pyx_v_tp_ret = ((__pyx_v_high / __pyx_t_20) - 1.0);
 
-      /* "abovedata_backtesting/exits/cython_exits.py":250
- *                 in_position = False
- *             else:
- *                 out_pos[i] = pos             # <<<<<<<<<<<<<<
- *                 out_exit[i] = close
- *         else:
+          /* "abovedata_backtesting/exits/cython_exits.py":473
+ * 
+ *             elif in_position[k]:
+ *                 if direction[k] > 0:             # <<<<<<<<<<<<<<
+ *                     stop_ret = low / entry_price[k] - 1.0
+ *                     tp_ret = high / entry_price[k] - 1.0
 */
-      /*else*/ {
-        __pyx_t_4 = __pyx_v_i;
-        *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = __pyx_v_pos;
+          goto __pyx_L13;
+        }
 
-        /* "abovedata_backtesting/exits/cython_exits.py":251
- *             else:
- *                 out_pos[i] = pos
- *                 out_exit[i] = close             # <<<<<<<<<<<<<<
- *         else:
- *             out_pos[i] = pos
+        /* "abovedata_backtesting/exits/cython_exits.py":477
+ *                     tp_ret = high / entry_price[k] - 1.0
+ *                 else:
+ *                     stop_ret = -(high / entry_price[k] - 1.0)             # <<<<<<<<<<<<<<
+ *                     tp_ret = -(low / entry_price[k] - 1.0)
+ * 
 */
-        __pyx_t_4 = __pyx_v_i;
-        *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_close;
-      }
-      __pyx_L11:;
+        /*else*/ {
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_20 = (*((double *) ( /* dim=0 */ (__pyx_v_entry_price.data + __pyx_t_13 * __pyx_v_entry_price.strides[0]) )));
+          if (unlikely(__pyx_t_20 == 0)) {
+            PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+            __PYX_ERR(0, 477, __pyx_L1_error)
+          }
+          __pyx_v_stop_ret = (-((__pyx_v_high / __pyx_t_20) - 1.0));
 
-      /* "abovedata_backtesting/exits/cython_exits.py":226
- *             out_exit[i] = close
+          /* "abovedata_backtesting/exits/cython_exits.py":478
+ *                 else:
+ *                     stop_ret = -(high / entry_price[k] - 1.0)
+ *                     tp_ret = -(low / entry_price[k] - 1.0)             # <<<<<<<<<<<<<<
  * 
- *         elif in_position:             # <<<<<<<<<<<<<<
- *             if direction > 0:
- *                 stop_ret = low / entry_price - 1.0
+ *                 if stop_ret <= stop_loss_pcts[k]:
 */
-      goto __pyx_L5;
-    }
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_20 = (*((double *) ( /* dim=0 */ (__pyx_v_entry_price.data + __pyx_t_13 * __pyx_v_entry_price.strides[0]) )));
+          if (unlikely(__pyx_t_20 == 0)) {
+            PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+            __PYX_ERR(0, 478, __pyx_L1_error)
+          }
+          __pyx_v_tp_ret = (-((__pyx_v_low / __pyx_t_20) - 1.0));
+        }
+        __pyx_L13:;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":480
+ *                     tp_ret = -(low / entry_price[k] - 1.0)
+ * 
+ *                 if stop_ret <= stop_loss_pcts[k]:             # <<<<<<<<<<<<<<
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (
+*/
+        __pyx_t_13 = __pyx_v_k;
+        __pyx_t_14 = (__pyx_v_stop_ret <= (*((double const  *) ( /* dim=0 */ (__pyx_v_stop_loss_pcts.data + __pyx_t_13 * __pyx_v_stop_loss_pcts.strides[0]) ))));
+        if (__pyx_t_14) {
+
+          /* "abovedata_backtesting/exits/cython_exits.py":481
+ * 
+ *                 if stop_ret <= stop_loss_pcts[k]:
+ *                     out_pos[k, i] = 0.0             # <<<<<<<<<<<<<<
+ *                     out_exit[k, i] = entry_price[k] * (
+ *                         1.0 + stop_loss_pcts[k] * direction[k]
+*/
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_19 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_13 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_19 * __pyx_v_out_pos.strides[1]) )) = 0.0;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":482
+ *                 if stop_ret <= stop_loss_pcts[k]:
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (             # <<<<<<<<<<<<<<
+ *                         1.0 + stop_loss_pcts[k] * direction[k]
+ *                     )
+*/
+          __pyx_t_19 = __pyx_v_k;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":483
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (
+ *                         1.0 + stop_loss_pcts[k] * direction[k]             # <<<<<<<<<<<<<<
+ *                     )
+ *                     in_position[k] = 0
+*/
+          __pyx_t_13 = __pyx_v_k;
+          __pyx_t_21 = __pyx_v_k;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":482
+ *                 if stop_ret <= stop_loss_pcts[k]:
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (             # <<<<<<<<<<<<<<
+ *                         1.0 + stop_loss_pcts[k] * direction[k]
+ *                     )
+*/
+          __pyx_t_22 = __pyx_v_k;
+          __pyx_t_23 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_22 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_23 * __pyx_v_out_exit.strides[1]) )) = ((*((double *) ( /* dim=0 */ (__pyx_v_entry_price.data + __pyx_t_19 * __pyx_v_entry_price.strides[0]) ))) * (1.0 + ((*((double const  *) ( /* dim=0 */ (__pyx_v_stop_loss_pcts.data + __pyx_t_13 * __pyx_v_stop_loss_pcts.strides[0]) ))) * (*((double *) ( /* dim=0 */ (__pyx_v_direction.data + __pyx_t_21 * __pyx_v_direction.strides[0]) ))))));
+
+          /* "abovedata_backtesting/exits/cython_exits.py":485
+ *                         1.0 + stop_loss_pcts[k] * direction[k]
+ *                     )
+ *                     in_position[k] = 0             # <<<<<<<<<<<<<<
+ *                 elif tp_ret >= take_profit_pcts[k]:
+ *                     out_pos[k, i] = 0.0
+*/
+          __pyx_t_21 = __pyx_v_k;
+          *((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_21 * __pyx_v_in_position.strides[0]) )) = 0;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":480
+ *                     tp_ret = -(low / entry_price[k] - 1.0)
+ * 
+ *                 if stop_ret <= stop_loss_pcts[k]:             # <<<<<<<<<<<<<<
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (
+*/
+          goto __pyx_L14;
+        }
 
-    /* "abovedata_backtesting/exits/cython_exits.py":253
- *                 out_exit[i] = close
- *         else:
- *             out_pos[i] = pos             # <<<<<<<<<<<<<<
- *             out_exit[i] = close
- *             if pos > -0.01 and pos < 0.01:
+        /* "abovedata_backtesting/exits/cython_exits.py":486
+ *                     )
+ *                     in_position[k] = 0
+ *                 elif tp_ret >= take_profit_pcts[k]:             # <<<<<<<<<<<<<<
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (
+*/
+        __pyx_t_21 = __pyx_v_k;
+        __pyx_t_14 = (__pyx_v_tp_ret >= (*((double const  *) ( /* dim=0 */ (__pyx_v_take_profit_pcts.data + __pyx_t_21 * __pyx_v_take_profit_pcts.strides[0]) ))));
+        if (__pyx_t_14) {
+
+          /* "abovedata_backtesting/exits/cython_exits.py":487
+ *                     in_position[k] = 0
+ *                 elif tp_ret >= take_profit_pcts[k]:
+ *                     out_pos[k, i] = 0.0             # <<<<<<<<<<<<<<
+ *                     out_exit[k, i] = entry_price[k] * (
+ *                         1.0 + take_profit_pcts[k] * direction[k]
+*/
+          __pyx_t_21 = __pyx_v_k;
+          __pyx_t_13 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_21 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_13 * __pyx_v_out_pos.strides[1]) )) = 0.0;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":488
+ *                 elif tp_ret >= take_profit_pcts[k]:
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (             # <<<<<<<<<<<<<<
+ *                         1.0 + take_profit_pcts[k] * direction[k]
+ *                     )
+*/
+          __pyx_t_13 = __pyx_v_k;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":489
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (
+ *                         1.0 + take_profit_pcts[k] * direction[k]             # <<<<<<<<<<<<<<
+ *                     )
+ *                     in_position[k] = 0
+*/
+          __pyx_t_21 = __pyx_v_k;
+          __pyx_t_19 = __pyx_v_k;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":488
+ *                 elif tp_ret >= take_profit_pcts[k]:
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (             # <<<<<<<<<<<<<<
+ *                         1.0 + take_profit_pcts[k] * direction[k]
+ *                     )
+*/
+          __pyx_t_23 = __pyx_v_k;
+          __pyx_t_22 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_23 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_22 * __pyx_v_out_exit.strides[1]) )) = ((*((double *) ( /* dim=0 */ (__pyx_v_entry_price.data + __pyx_t_13 * __pyx_v_entry_price.strides[0]) ))) * (1.0 + ((*((double const  *) ( /* dim=0 */ (__pyx_v_take_profit_pcts.data + __pyx_t_21 * __pyx_v_take_profit_pcts.strides[0]) ))) * (*((double *) ( /* dim=0 */ (__pyx_v_direction.data + __pyx_t_19 * __pyx_v_direction.strides[0]) ))))));
+
+          /* "abovedata_backtesting/exits/cython_exits.py":491
+ *                         1.0 + take_profit_pcts[k] * direction[k]
+ *                     )
+ *                     in_position[k] = 0             # <<<<<<<<<<<<<<
+ *                 elif not pos_active:
+ *                     out_pos[k, i] = 0.0
+*/
+          __pyx_t_19 = __pyx_v_k;
+          *((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_19 * __pyx_v_in_position.strides[0]) )) = 0;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":486
+ *                     )
+ *                     in_position[k] = 0
+ *                 elif tp_ret >= take_profit_pcts[k]:             # <<<<<<<<<<<<<<
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = entry_price[k] * (
+*/
+          goto __pyx_L14;
+        }
+
+        /* "abovedata_backtesting/exits/cython_exits.py":492
+ *                     )
+ *                     in_position[k] = 0
+ *                 elif not pos_active:             # <<<<<<<<<<<<<<
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = close
+*/
+        __pyx_t_14 = (!__pyx_v_pos_active);
+        if (__pyx_t_14) {
+
+          /* "abovedata_backtesting/exits/cython_exits.py":493
+ *                     in_position[k] = 0
+ *                 elif not pos_active:
+ *                     out_pos[k, i] = 0.0             # <<<<<<<<<<<<<<
+ *                     out_exit[k, i] = close
+ *                     in_position[k] = 0
+*/
+          __pyx_t_19 = __pyx_v_k;
+          __pyx_t_21 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_19 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_21 * __pyx_v_out_pos.strides[1]) )) = 0.0;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":494
+ *                 elif not pos_active:
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = close             # <<<<<<<<<<<<<<
+ *                     in_position[k] = 0
+ *                 else:
 */
-    /*else*/ {
-      __pyx_t_4 = __pyx_v_i;
-      *((double *) ( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_4 * __pyx_v_out_pos.strides[0]) )) = __pyx_v_pos;
+          __pyx_t_21 = __pyx_v_k;
+          __pyx_t_19 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_21 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_19 * __pyx_v_out_exit.strides[1]) )) = __pyx_v_close;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":254
- *         else:
- *             out_pos[i] = pos
- *             out_exit[i] = close             # <<<<<<<<<<<<<<
- *             if pos > -0.01 and pos < 0.01:
- *                 in_position = False
+          /* "abovedata_backtesting/exits/cython_exits.py":495
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = close
+ *                     in_position[k] = 0             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     out_pos[k, i] = pos
 */
-      __pyx_t_4 = __pyx_v_i;
-      *((double *) ( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_4 * __pyx_v_out_exit.strides[0]) )) = __pyx_v_close;
+          __pyx_t_19 = __pyx_v_k;
+          *((unsigned char *) ( /* dim=0 */ (__pyx_v_in_position.data + __pyx_t_19 * __pyx_v_in_position.strides[0]) )) = 0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":255
- *             out_pos[i] = pos
- *             out_exit[i] = close
- *             if pos > -0.01 and pos < 0.01:             # <<<<<<<<<<<<<<
- *                 in_position = False
+          /* "abovedata_backtesting/exits/cython_exits.py":492
+ *                     )
+ *                     in_position[k] = 0
+ *                 elif not pos_active:             # <<<<<<<<<<<<<<
+ *                     out_pos[k, i] = 0.0
+ *                     out_exit[k, i] = close
+*/
+          goto __pyx_L14;
+        }
+
+        /* "abovedata_backtesting/exits/cython_exits.py":497
+ *                     in_position[k] = 0
+ *                 else:
+ *                     out_pos[k, i] = pos             # <<<<<<<<<<<<<<
+ *                     out_exit[k, i] = close
+ *             else:
+*/
+        /*else*/ {
+          __pyx_t_19 = __pyx_v_k;
+          __pyx_t_21 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_19 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_21 * __pyx_v_out_pos.strides[1]) )) = __pyx_v_pos;
+
+          /* "abovedata_backtesting/exits/cython_exits.py":498
+ *                 else:
+ *                     out_pos[k, i] = pos
+ *                     out_exit[k, i] = close             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out_pos[k, i] = pos
+*/
+          __pyx_t_21 = __pyx_v_k;
+          __pyx_t_19 = __pyx_v_i;
+          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_21 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_19 * __pyx_v_out_exit.strides[1]) )) = __pyx_v_close;
+        }
+        __pyx_L14:;
+
+        /* "abovedata_backtesting/exits/cython_exits.py":472
+ *                 out_exit[k, i] = close
  * 
+ *             elif in_position[k]:             # <<<<<<<<<<<<<<
+ *                 if direction[k] > 0:
+ *                     stop_ret = low / entry_price[k] - 1.0
 */
-      __pyx_t_6 = (__pyx_v_pos > -0.01);
-      if (__pyx_t_6) {
-      } else {
-        __pyx_t_5 = __pyx_t_6;
-        goto __pyx_L15_bool_binop_done;
+        goto __pyx_L9;
       }
-      __pyx_t_6 = (__pyx_v_pos < 0.01);
-      __pyx_t_5 = __pyx_t_6;
-      __pyx_L15_bool_binop_done:;
-      if (__pyx_t_5) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":256
- *             out_exit[i] = close
- *             if pos > -0.01 and pos < 0.01:
- *                 in_position = False             # <<<<<<<<<<<<<<
- * 
+      /* "abovedata_backtesting/exits/cython_exits.py":500
+ *                     out_exit[k, i] = close
+ *             else:
+ *                 out_pos[k, i] = pos             # <<<<<<<<<<<<<<
+ *                 out_exit[k, i] = close
  * 
 */
-        __pyx_v_in_position = 0;
+      /*else*/ {
+        __pyx_t_19 = __pyx_v_k;
+        __pyx_t_21 = __pyx_v_i;
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_pos.data + __pyx_t_19 * __pyx_v_out_pos.strides[0]) ) + __pyx_t_21 * __pyx_v_out_pos.strides[1]) )) = __pyx_v_pos;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":255
- *             out_pos[i] = pos
- *             out_exit[i] = close
- *             if pos > -0.01 and pos < 0.01:             # <<<<<<<<<<<<<<
- *                 in_position = False
+        /* "abovedata_backtesting/exits/cython_exits.py":501
+ *             else:
+ *                 out_pos[k, i] = pos
+ *                 out_exit[k, i] = close             # <<<<<<<<<<<<<<
+ * 
  * 
 */
+        __pyx_t_21 = __pyx_v_k;
+        __pyx_t_19 = __pyx_v_i;
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_out_exit.data + __pyx_t_21 * __pyx_v_out_exit.strides[0]) ) + __pyx_t_19 * __pyx_v_out_exit.strides[1]) )) = __pyx_v_close;
       }
+      __pyx_L9:;
     }
-    __pyx_L5:;
   }
 
-  /* "abovedata_backtesting/exits/cython_exits.py":182
+  /* "abovedata_backtesting/exits/cython_exits.py":425
  * 
  * 
  * @cython.cfunc             # <<<<<<<<<<<<<<
@@ -19019,33 +21979,44 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__stop_los
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits._stop_loss_take_profit_exit", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits._stop_loss_take_profit_exit_multi", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_entry_price, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_direction, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_in_position, 1);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "abovedata_backtesting/exits/cython_exits.py":259
+/* "abovedata_backtesting/exits/cython_exits.py":504
  * 
  * 
- * def stop_loss_take_profit_exit_cy(             # <<<<<<<<<<<<<<
+ * def stop_loss_take_profit_exit_multi_cy(             # <<<<<<<<<<<<<<
  *     positions: NDArray[np.float64],
  *     closes: NDArray[np.float64],
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_5stop_loss_take_profit_exit_cy(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_11stop_loss_take_profit_exit_multi_cy(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_4stop_loss_take_profit_exit_cy, "Apply stop-loss / take-profit exit logic.\n\n    Returns\n    -------\n    (new_positions, exit_prices) \342\200\224 both (N,) float64 arrays\n    ");
-static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_5stop_loss_take_profit_exit_cy = {"stop_loss_take_profit_exit_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_5stop_loss_take_profit_exit_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_4stop_loss_take_profit_exit_cy};
-static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_5stop_loss_take_profit_exit_cy(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_10stop_loss_take_profit_exit_multi_cy, "Apply stop-loss / take-profit exit logic for K (sl, tp) pairs in one pass.\n\n    Parameters\n    ----------\n    positions, closes, highs, lows : (N,) float64 arrays\n    stop_loss_pcts : (K,) float64 array (negative, e.g. -0.10)\n    take_profit_pcts : (K,) float64 array (positive, e.g. 0.20)\n\n    Returns\n    -------\n    (new_positions, exit_prices) \342\200\224 both (K, N) float64 arrays; row k equals\n    ``stop_loss_take_profit_exit_cy(..., stop_loss_pcts[k], take_profit_pcts[k])``\n    ");
+static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_11stop_loss_take_profit_exit_multi_cy = {"stop_loss_take_profit_exit_multi_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_11stop_loss_take_profit_exit_multi_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_10stop_loss_take_profit_exit_multi_cy};
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_11stop_loss_take_profit_exit_multi_cy(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -19056,8 +22027,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   PyObject *__pyx_v_closes = 0;
   PyObject *__pyx_v_highs = 0;
   PyObject *__pyx_v_lows = 0;
-  double __pyx_v_stop_loss_pct;
-  double __pyx_v_take_profit_pct;
+  PyObject *__pyx_v_stop_loss_pcts = 0;
+  PyObject *__pyx_v_take_profit_pcts = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
@@ -19068,7 +22039,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("stop_loss_take_profit_exit_cy (wrapper)", 0);
+  __Pyx_RefNannySetupContext("stop_loss_take_profit_exit_multi_cy (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -19078,80 +22049,80 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_positions,&__pyx_mstate_global->__pyx_n_u_closes,&__pyx_mstate_global->__pyx_n_u_highs,&__pyx_mstate_global->__pyx_n_u_lows,&__pyx_mstate_global->__pyx_n_u_stop_loss_pct,&__pyx_mstate_global->__pyx_n_u_take_profit_pct,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_positions,&__pyx_mstate_global->__pyx_n_u_closes,&__pyx_mstate_global->__pyx_n_u_highs,&__pyx_mstate_global->__pyx_n_u_lows,&__pyx_mstate_global->__pyx_n_u_stop_loss_pcts,&__pyx_mstate_global->__pyx_n_u_take_profit_pcts,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 259, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 504, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  6:
         values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 259, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 504, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  5:
         values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 259, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 504, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 259, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 504, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 259, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 504, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 259, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 504, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 259, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 504, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "stop_loss_take_profit_exit_cy", 0) < (0)) __PYX_ERR(0, 259, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "stop_loss_take_profit_exit_multi_cy", 0) < (0)) __PYX_ERR(0, 504, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 6; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("stop_loss_take_profit_exit_cy", 1, 6, 6, i); __PYX_ERR(0, 259, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("stop_loss_take_profit_exit_multi_cy", 1, 6, 6, i); __PYX_ERR(0, 504, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 6)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 259, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 504, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 259, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 504, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 259, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 504, __pyx_L3_error)
       values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 259, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 504, __pyx_L3_error)
       values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 259, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 504, __pyx_L3_error)
       values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 259, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 504, __pyx_L3_error)
     }
     __pyx_v_positions = values[0];
     __pyx_v_closes = values[1];
     __pyx_v_highs = values[2];
     __pyx_v_lows = values[3];
-    __pyx_v_stop_loss_pct = __Pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_stop_loss_pct == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 264, __pyx_L3_error)
-    __pyx_v_take_profit_pct = __Pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_take_profit_pct == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 265, __pyx_L3_error)
+    __pyx_v_stop_loss_pcts = values[4];
+    __pyx_v_take_profit_pcts = values[5];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("stop_loss_take_profit_exit_cy", 1, 6, 6, __pyx_nargs); __PYX_ERR(0, 259, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("stop_loss_take_profit_exit_multi_cy", 1, 6, 6, __pyx_nargs); __PYX_ERR(0, 504, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits.stop_loss_take_profit_exit_cy", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits.stop_loss_take_profit_exit_multi_cy", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4stop_loss_take_profit_exit_cy(__pyx_self, __pyx_v_positions, __pyx_v_closes, __pyx_v_highs, __pyx_v_lows, __pyx_v_stop_loss_pct, __pyx_v_take_profit_pct);
+  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_10stop_loss_take_profit_exit_multi_cy(__pyx_self, __pyx_v_positions, __pyx_v_closes, __pyx_v_highs, __pyx_v_lows, __pyx_v_stop_loss_pcts, __pyx_v_take_profit_pcts);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -19161,12 +22132,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4stop_loss_take_profit_exit_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, double __pyx_v_stop_loss_pct, double __pyx_v_take_profit_pct) {
-  PyObject *__pyx_v_n = NULL;
-  PyObject *__pyx_v_pos = NULL;
-  PyObject *__pyx_v_cl = NULL;
-  PyObject *__pyx_v_hi = NULL;
-  PyObject *__pyx_v_lo = NULL;
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_10stop_loss_take_profit_exit_multi_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_closes, PyObject *__pyx_v_highs, PyObject *__pyx_v_lows, PyObject *__pyx_v_stop_loss_pcts, PyObject *__pyx_v_take_profit_pcts) {
+  PyObject *__pyx_v_sl = NULL;
+  PyObject *__pyx_v_tp = NULL;
+  PyObject *__pyx_v_shape = NULL;
   PyObject *__pyx_v_out_pos = NULL;
   PyObject *__pyx_v_out_exit = NULL;
   PyObject *__pyx_r = NULL;
@@ -19174,374 +22143,495 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4stop_lo
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
-  __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8[5];
   __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
   __Pyx_memviewslice __pyx_t_10 = { 0, 0, { 0 }, { 0 }, { 0 } };
   __Pyx_memviewslice __pyx_t_11 = { 0, 0, { 0 }, { 0 }, { 0 } };
   __Pyx_memviewslice __pyx_t_12 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_13 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_14 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_15 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_16 = { 0, 0, { 0 }, { 0 }, { 0 } };
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("stop_loss_take_profit_exit_cy", 0);
+  __Pyx_RefNannySetupContext("stop_loss_take_profit_exit_multi_cy", 0);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":273
- *     (new_positions, exit_prices)  both (N,) float64 arrays
+  /* "abovedata_backtesting/exits/cython_exits.py":525
+ *     ``stop_loss_take_profit_exit_cy(..., stop_loss_pcts[k], take_profit_pcts[k])``
  *     """
- *     n = positions.shape[0]             # <<<<<<<<<<<<<<
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     cl = np.array(closes, dtype=np.float64, copy=True)
+ *     sl = _as_f64(stop_loss_pcts)             # <<<<<<<<<<<<<<
+ *     tp = _as_f64(take_profit_pcts)
+ *     if sl.shape != tp.shape:
 */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_positions, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_stop_loss_pcts};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 525, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_v_sl = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":526
+ *     """
+ *     sl = _as_f64(stop_loss_pcts)
+ *     tp = _as_f64(take_profit_pcts)             # <<<<<<<<<<<<<<
+ *     if sl.shape != tp.shape:
+ *         raise ValueError(
+*/
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_take_profit_pcts};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 526, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_v_tp = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":527
+ *     sl = _as_f64(stop_loss_pcts)
+ *     tp = _as_f64(take_profit_pcts)
+ *     if sl.shape != tp.shape:             # <<<<<<<<<<<<<<
+ *         raise ValueError(
+ *             f"stop_loss_pcts {sl.shape} and take_profit_pcts {tp.shape} differ"
+*/
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sl, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 527, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_tp, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 527, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_NE); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 527, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_n = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 527, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(__pyx_t_5)) {
 
-  /* "abovedata_backtesting/exits/cython_exits.py":274
- *     """
- *     n = positions.shape[0]
- *     pos = np.array(positions, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
- *     cl = np.array(closes, dtype=np.float64, copy=True)
- *     hi = np.array(highs, dtype=np.float64, copy=True)
+    /* "abovedata_backtesting/exits/cython_exits.py":528
+ *     tp = _as_f64(take_profit_pcts)
+ *     if sl.shape != tp.shape:
+ *         raise ValueError(             # <<<<<<<<<<<<<<
+ *             f"stop_loss_pcts {sl.shape} and take_profit_pcts {tp.shape} differ"
+ *         )
+*/
+    __pyx_t_2 = NULL;
+
+    /* "abovedata_backtesting/exits/cython_exits.py":529
+ *     if sl.shape != tp.shape:
+ *         raise ValueError(
+ *             f"stop_loss_pcts {sl.shape} and take_profit_pcts {tp.shape} differ"             # <<<<<<<<<<<<<<
+ *         )
+ *     shape = (sl.shape[0], positions.shape[0])
+*/
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sl, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_t_1, __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_tp, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = __Pyx_PyObject_FormatSimple(__pyx_t_1, __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_8[0] = __pyx_mstate_global->__pyx_kp_u_stop_loss_pcts_2;
+    __pyx_t_8[1] = __pyx_t_6;
+    __pyx_t_8[2] = __pyx_mstate_global->__pyx_kp_u_and_take_profit_pcts;
+    __pyx_t_8[3] = __pyx_t_7;
+    __pyx_t_8[4] = __pyx_mstate_global->__pyx_kp_u_differ;
+    __pyx_t_1 = __Pyx_PyUnicode_Join(__pyx_t_8, 5, 15 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6) + 22 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_7) + 7, 127 | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_7));
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_4 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_t_1};
+      __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 528, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 528, __pyx_L1_error)
+
+    /* "abovedata_backtesting/exits/cython_exits.py":527
+ *     sl = _as_f64(stop_loss_pcts)
+ *     tp = _as_f64(take_profit_pcts)
+ *     if sl.shape != tp.shape:             # <<<<<<<<<<<<<<
+ *         raise ValueError(
+ *             f"stop_loss_pcts {sl.shape} and take_profit_pcts {tp.shape} differ"
+*/
+  }
+
+  /* "abovedata_backtesting/exits/cython_exits.py":531
+ *             f"stop_loss_pcts {sl.shape} and take_profit_pcts {tp.shape} differ"
+ *         )
+ *     shape = (sl.shape[0], positions.shape[0])             # <<<<<<<<<<<<<<
+ *     out_pos = np.empty(shape, dtype=np.float64)
+ *     out_exit = np.empty(shape, dtype=np.float64)
 */
-  __pyx_t_1 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sl, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 531, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 274, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_3, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_positions, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 531, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 274, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_3, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1) != (0)) __PYX_ERR(0, 531, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2) != (0)) __PYX_ERR(0, 531, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_shape = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":532
+ *         )
+ *     shape = (sl.shape[0], positions.shape[0])
+ *     out_pos = np.empty(shape, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     out_exit = np.empty(shape, dtype=np.float64)
+ *     _stop_loss_take_profit_exit_multi(
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
-    assert(__pyx_t_1);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
-    __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_7);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
+    __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_1, __pyx_v_positions};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 274, __pyx_L1_error)
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_v_shape};
+    __pyx_t_1 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 532, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_1, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 532, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_7, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_1);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 532, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 274, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 274, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 274, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
   }
-  __pyx_v_pos = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __pyx_v_out_pos = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":275
- *     n = positions.shape[0]
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     cl = np.array(closes, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
- *     hi = np.array(highs, dtype=np.float64, copy=True)
- *     lo = np.array(lows, dtype=np.float64, copy=True)
+  /* "abovedata_backtesting/exits/cython_exits.py":533
+ *     shape = (sl.shape[0], positions.shape[0])
+ *     out_pos = np.empty(shape, dtype=np.float64)
+ *     out_exit = np.empty(shape, dtype=np.float64)             # <<<<<<<<<<<<<<
+ *     _stop_loss_take_profit_exit_multi(
+ *         _as_f64(positions),
 */
-  __pyx_t_4 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 275, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 275, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 275, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 275, __pyx_L1_error)
+  __pyx_t_7 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 533, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-    assert(__pyx_t_4);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
-    __Pyx_INCREF(__pyx_t_4);
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+    assert(__pyx_t_7);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_7);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_4, __pyx_v_closes};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 275, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_1, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 275, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 275, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_7, __pyx_v_shape};
+    __pyx_t_1 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 533, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_2, __pyx_t_1, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 533, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_1);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 533, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
   }
-  __pyx_v_cl = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __pyx_v_out_exit = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":276
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     cl = np.array(closes, dtype=np.float64, copy=True)
- *     hi = np.array(highs, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
- *     lo = np.array(lows, dtype=np.float64, copy=True)
- *     out_pos = np.empty(n, dtype=np.float64)
+  /* "abovedata_backtesting/exits/cython_exits.py":535
+ *     out_exit = np.empty(shape, dtype=np.float64)
+ *     _stop_loss_take_profit_exit_multi(
+ *         _as_f64(positions),             # <<<<<<<<<<<<<<
+ *         _as_f64(closes),
+ *         _as_f64(highs),
 */
-  __pyx_t_5 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 276, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __pyx_t_6 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 535, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 276, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 276, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
   if (unlikely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-    assert(__pyx_t_5);
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+    assert(__pyx_t_6);
     PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_1);
-    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_6);
     __Pyx_INCREF(__pyx__function);
     __Pyx_DECREF_SET(__pyx_t_1, __pyx__function);
-    __pyx_t_6 = 0;
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_5, __pyx_v_highs};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_4, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 276, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 276, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_v_positions};
+    __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 535, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_t_3, 0); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 535, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(((PyObject *) __pyx_t_9.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 535, __pyx_L1_error)
   }
-  __pyx_v_hi = __pyx_t_2;
-  __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":277
- *     cl = np.array(closes, dtype=np.float64, copy=True)
- *     hi = np.array(highs, dtype=np.float64, copy=True)
- *     lo = np.array(lows, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
- *     out_pos = np.empty(n, dtype=np.float64)
- *     out_exit = np.empty(n, dtype=np.float64)
+  /* "abovedata_backtesting/exits/cython_exits.py":536
+ *     _stop_loss_take_profit_exit_multi(
+ *         _as_f64(positions),
+ *         _as_f64(closes),             # <<<<<<<<<<<<<<
+ *         _as_f64(highs),
+ *         _as_f64(lows),
 */
   __pyx_t_1 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 277, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 277, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 277, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 277, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_6);
     assert(__pyx_t_1);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
     __Pyx_INCREF(__pyx_t_1);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_1, __pyx_v_lows};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 277, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 277, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 277, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_v_closes};
+    __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 536, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_t_3, 0); if (unlikely(!__pyx_t_10.memview)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(((PyObject *) __pyx_t_10.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 536, __pyx_L1_error)
   }
-  __pyx_v_lo = __pyx_t_2;
-  __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":278
- *     hi = np.array(highs, dtype=np.float64, copy=True)
- *     lo = np.array(lows, dtype=np.float64, copy=True)
- *     out_pos = np.empty(n, dtype=np.float64)             # <<<<<<<<<<<<<<
- *     out_exit = np.empty(n, dtype=np.float64)
- *     _stop_loss_take_profit_exit(
+  /* "abovedata_backtesting/exits/cython_exits.py":537
+ *         _as_f64(positions),
+ *         _as_f64(closes),
+ *         _as_f64(highs),             # <<<<<<<<<<<<<<
+ *         _as_f64(lows),
+ *         sl,
 */
-  __pyx_t_4 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __pyx_t_6 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 537, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-    assert(__pyx_t_4);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
-    __Pyx_INCREF(__pyx_t_4);
+  if (unlikely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+    assert(__pyx_t_6);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_6);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_1, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_4, __pyx_v_n};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_1, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 278, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_v_highs};
+    __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 537, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_t_3, 0); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(((PyObject *) __pyx_t_11.memview) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+    __PYX_ERR(0, 537, __pyx_L1_error)
   }
-  __pyx_v_out_pos = __pyx_t_2;
-  __pyx_t_2 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":279
- *     lo = np.array(lows, dtype=np.float64, copy=True)
- *     out_pos = np.empty(n, dtype=np.float64)
- *     out_exit = np.empty(n, dtype=np.float64)             # <<<<<<<<<<<<<<
- *     _stop_loss_take_profit_exit(
- *         pos, cl, hi, lo, stop_loss_pct, take_profit_pct,
+  /* "abovedata_backtesting/exits/cython_exits.py":538
+ *         _as_f64(closes),
+ *         _as_f64(highs),
+ *         _as_f64(lows),             # <<<<<<<<<<<<<<
+ *         sl,
+ *         tp,
 */
-  __pyx_t_5 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 279, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 279, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 279, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 279, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_1 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_1))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-    assert(__pyx_t_5);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_1);
-    __Pyx_INCREF(__pyx_t_5);
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_6);
+    assert(__pyx_t_1);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_1);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_1, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_v_n};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 279, __pyx_L1_error)
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_v_lows};
+    __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 538, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_4, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 279, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_1, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
   }
-  __pyx_v_out_exit = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "abovedata_backtesting/exits/cython_exits.py":281
- *     out_exit = np.empty(n, dtype=np.float64)
- *     _stop_loss_take_profit_exit(
- *         pos, cl, hi, lo, stop_loss_pct, take_profit_pct,             # <<<<<<<<<<<<<<
- *         out_pos, out_exit,
- *     )
-*/
-  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 281, __pyx_L1_error)
-  if (unlikely(((PyObject *) __pyx_t_7.memview) == Py_None)) {
+  __pyx_t_12 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_t_3, 0); if (unlikely(!__pyx_t_12.memview)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(((PyObject *) __pyx_t_12.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 281, __pyx_L1_error)
+    __PYX_ERR(0, 538, __pyx_L1_error)
   }
-  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_cl, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 281, __pyx_L1_error)
-  if (unlikely(((PyObject *) __pyx_t_8.memview) == Py_None)) {
+
+  /* "abovedata_backtesting/exits/cython_exits.py":539
+ *         _as_f64(highs),
+ *         _as_f64(lows),
+ *         sl,             # <<<<<<<<<<<<<<
+ *         tp,
+ *         out_pos,
+*/
+  __pyx_t_13 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_sl, 0); if (unlikely(!__pyx_t_13.memview)) __PYX_ERR(0, 539, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_13.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 281, __pyx_L1_error)
+    __PYX_ERR(0, 539, __pyx_L1_error)
   }
-  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_hi, PyBUF_WRITABLE); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 281, __pyx_L1_error)
-  if (unlikely(((PyObject *) __pyx_t_9.memview) == Py_None)) {
+
+  /* "abovedata_backtesting/exits/cython_exits.py":540
+ *         _as_f64(lows),
+ *         sl,
+ *         tp,             # <<<<<<<<<<<<<<
+ *         out_pos,
+ *         out_exit,
+*/
+  __pyx_t_14 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_tp, 0); if (unlikely(!__pyx_t_14.memview)) __PYX_ERR(0, 540, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_14.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 281, __pyx_L1_error)
+    __PYX_ERR(0, 540, __pyx_L1_error)
   }
-  __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_lo, PyBUF_WRITABLE); if (unlikely(!__pyx_t_10.memview)) __PYX_ERR(0, 281, __pyx_L1_error)
-  if (unlikely(((PyObject *) __pyx_t_10.memview) == Py_None)) {
+
+  /* "abovedata_backtesting/exits/cython_exits.py":541
+ *         sl,
+ *         tp,
+ *         out_pos,             # <<<<<<<<<<<<<<
+ *         out_exit,
+ *     )
+*/
+  __pyx_t_15 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_v_out_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_15.memview)) __PYX_ERR(0, 541, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_15.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 281, __pyx_L1_error)
+    __PYX_ERR(0, 541, __pyx_L1_error)
   }
 
-  /* "abovedata_backtesting/exits/cython_exits.py":282
- *     _stop_loss_take_profit_exit(
- *         pos, cl, hi, lo, stop_loss_pct, take_profit_pct,
- *         out_pos, out_exit,             # <<<<<<<<<<<<<<
+  /* "abovedata_backtesting/exits/cython_exits.py":542
+ *         tp,
+ *         out_pos,
+ *         out_exit,             # <<<<<<<<<<<<<<
  *     )
  *     return out_pos, out_exit
 */
-  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 282, __pyx_L1_error)
-  if (unlikely(((PyObject *) __pyx_t_11.memview) == Py_None)) {
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_v_out_exit, PyBUF_WRITABLE); if (unlikely(!__pyx_t_16.memview)) __PYX_ERR(0, 542, __pyx_L1_error)
+  if (unlikely(((PyObject *) __pyx_t_16.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 282, __pyx_L1_error)
-  }
-  __pyx_t_12 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out_exit, PyBUF_WRITABLE); if (unlikely(!__pyx_t_12.memview)) __PYX_ERR(0, 282, __pyx_L1_error)
-  if (unlikely(((PyObject *) __pyx_t_12.memview) == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 282, __pyx_L1_error)
+    __PYX_ERR(0, 542, __pyx_L1_error)
   }
 
-  /* "abovedata_backtesting/exits/cython_exits.py":280
- *     out_pos = np.empty(n, dtype=np.float64)
- *     out_exit = np.empty(n, dtype=np.float64)
- *     _stop_loss_take_profit_exit(             # <<<<<<<<<<<<<<
- *         pos, cl, hi, lo, stop_loss_pct, take_profit_pct,
- *         out_pos, out_exit,
+  /* "abovedata_backtesting/exits/cython_exits.py":534
+ *     out_pos = np.empty(shape, dtype=np.float64)
+ *     out_exit = np.empty(shape, dtype=np.float64)
+ *     _stop_loss_take_profit_exit_multi(             # <<<<<<<<<<<<<<
+ *         _as_f64(positions),
+ *         _as_f64(closes),
 */
-  __pyx_t_2 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__stop_loss_take_profit_exit(__pyx_t_7, __pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_v_stop_loss_pct, __pyx_v_take_profit_pct, __pyx_t_11, __pyx_t_12); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 280, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_7, 1);
-  __pyx_t_7.memview = NULL; __pyx_t_7.data = NULL;
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
-  __pyx_t_8.memview = NULL; __pyx_t_8.data = NULL;
+  __pyx_t_3 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__stop_loss_take_profit_exit_multi(__pyx_t_9, __pyx_t_10, __pyx_t_11, __pyx_t_12, __pyx_t_13, __pyx_t_14, __pyx_t_15, __pyx_t_16); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
   __pyx_t_9.memview = NULL; __pyx_t_9.data = NULL;
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_10, 1);
@@ -19550,32 +22640,40 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4stop_lo
   __pyx_t_11.memview = NULL; __pyx_t_11.data = NULL;
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_12, 1);
   __pyx_t_12.memview = NULL; __pyx_t_12.data = NULL;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_13, 1);
+  __pyx_t_13.memview = NULL; __pyx_t_13.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_14, 1);
+  __pyx_t_14.memview = NULL; __pyx_t_14.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_15, 1);
+  __pyx_t_15.memview = NULL; __pyx_t_15.data = NULL;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_16, 1);
+  __pyx_t_16.memview = NULL; __pyx_t_16.data = NULL;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":284
- *         out_pos, out_exit,
+  /* "abovedata_backtesting/exits/cython_exits.py":544
+ *         out_exit,
  *     )
  *     return out_pos, out_exit             # <<<<<<<<<<<<<<
  * 
  * 
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 284, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 544, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_out_pos);
   __Pyx_GIVEREF(__pyx_v_out_pos);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_out_pos) != (0)) __PYX_ERR(0, 284, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_out_pos) != (0)) __PYX_ERR(0, 544, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_out_exit);
   __Pyx_GIVEREF(__pyx_v_out_exit);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_out_exit) != (0)) __PYX_ERR(0, 284, __pyx_L1_error);
-  __pyx_r = ((PyObject*)__pyx_t_2);
-  __pyx_t_2 = 0;
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_out_exit) != (0)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __pyx_r = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":259
+  /* "abovedata_backtesting/exits/cython_exits.py":504
  * 
  * 
- * def stop_loss_take_profit_exit_cy(             # <<<<<<<<<<<<<<
+ * def stop_loss_take_profit_exit_multi_cy(             # <<<<<<<<<<<<<<
  *     positions: NDArray[np.float64],
  *     closes: NDArray[np.float64],
 */
@@ -19585,22 +22683,22 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4stop_lo
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_7, 1);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_10, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_11, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_12, 1);
-  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits.stop_loss_take_profit_exit_cy", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_13, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_14, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_15, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_16, 1);
+  __Pyx_AddTraceback("abovedata_backtesting.exits.cython_exits.stop_loss_take_profit_exit_multi_cy", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_n);
-  __Pyx_XDECREF(__pyx_v_pos);
-  __Pyx_XDECREF(__pyx_v_cl);
-  __Pyx_XDECREF(__pyx_v_hi);
-  __Pyx_XDECREF(__pyx_v_lo);
+  __Pyx_XDECREF(__pyx_v_sl);
+  __Pyx_XDECREF(__pyx_v_tp);
+  __Pyx_XDECREF(__pyx_v_shape);
   __Pyx_XDECREF(__pyx_v_out_pos);
   __Pyx_XDECREF(__pyx_v_out_exit);
   __Pyx_XGIVEREF(__pyx_r);
@@ -19608,7 +22706,7 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_4stop_lo
   return __pyx_r;
 }
 
-/* "abovedata_backtesting/exits/cython_exits.py":287
+/* "abovedata_backtesting/exits/cython_exits.py":547
  * 
  * 
  * @cython.cfunc             # <<<<<<<<<<<<<<
@@ -19636,7 +22734,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
   int __pyx_t_6;
   __Pyx_RefNannySetupContext("_enforce_max_entries", 0);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":296
+  /* "abovedata_backtesting/exits/cython_exits.py":556
  *     out: cython.double[:],
  * ) -> None:
  *     n: cython.Py_ssize_t = positions.shape[0]             # <<<<<<<<<<<<<<
@@ -19645,7 +22743,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
   __pyx_v_n = (__pyx_v_positions.shape[0]);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":298
+  /* "abovedata_backtesting/exits/cython_exits.py":558
  *     n: cython.Py_ssize_t = positions.shape[0]
  *     i: cython.Py_ssize_t
  *     in_trade: cython.bint = False             # <<<<<<<<<<<<<<
@@ -19654,7 +22752,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
   __pyx_v_in_trade = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":299
+  /* "abovedata_backtesting/exits/cython_exits.py":559
  *     i: cython.Py_ssize_t
  *     in_trade: cython.bint = False
  *     current_sid: cython.int = 0             # <<<<<<<<<<<<<<
@@ -19663,7 +22761,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
   __pyx_v_current_sid = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":300
+  /* "abovedata_backtesting/exits/cython_exits.py":560
  *     in_trade: cython.bint = False
  *     current_sid: cython.int = 0
  *     suppressed: cython.bint = False             # <<<<<<<<<<<<<<
@@ -19672,7 +22770,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
   __pyx_v_suppressed = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":301
+  /* "abovedata_backtesting/exits/cython_exits.py":561
  *     current_sid: cython.int = 0
  *     suppressed: cython.bint = False
  *     entry_count: cython.int = 0             # <<<<<<<<<<<<<<
@@ -19681,7 +22779,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
   __pyx_v_entry_count = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":306
+  /* "abovedata_backtesting/exits/cython_exits.py":566
  *     pos_active: cython.bint
  * 
  *     for i in range(n):             # <<<<<<<<<<<<<<
@@ -19693,7 +22791,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "abovedata_backtesting/exits/cython_exits.py":307
+    /* "abovedata_backtesting/exits/cython_exits.py":567
  * 
  *     for i in range(n):
  *         sid = signal_ids[i]             # <<<<<<<<<<<<<<
@@ -19701,9 +22799,9 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
  * 
 */
     __pyx_t_4 = __pyx_v_i;
-    __pyx_v_sid = (*((int *) ( /* dim=0 */ (__pyx_v_signal_ids.data + __pyx_t_4 * __pyx_v_signal_ids.strides[0]) )));
+    __pyx_v_sid = (*((int const  *) ( /* dim=0 */ (__pyx_v_signal_ids.data + __pyx_t_4 * __pyx_v_signal_ids.strides[0]) )));
 
-    /* "abovedata_backtesting/exits/cython_exits.py":308
+    /* "abovedata_backtesting/exits/cython_exits.py":568
  *     for i in range(n):
  *         sid = signal_ids[i]
  *         pos = positions[i]             # <<<<<<<<<<<<<<
@@ -19711,9 +22809,9 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
  *         if sid != current_sid:
 */
     __pyx_t_4 = __pyx_v_i;
-    __pyx_v_pos = (*((double *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_4 * __pyx_v_positions.strides[0]) )));
+    __pyx_v_pos = (*((double const  *) ( /* dim=0 */ (__pyx_v_positions.data + __pyx_t_4 * __pyx_v_positions.strides[0]) )));
 
-    /* "abovedata_backtesting/exits/cython_exits.py":310
+    /* "abovedata_backtesting/exits/cython_exits.py":570
  *         pos = positions[i]
  * 
  *         if sid != current_sid:             # <<<<<<<<<<<<<<
@@ -19723,7 +22821,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
     __pyx_t_5 = (__pyx_v_sid != __pyx_v_current_sid);
     if (__pyx_t_5) {
 
-      /* "abovedata_backtesting/exits/cython_exits.py":311
+      /* "abovedata_backtesting/exits/cython_exits.py":571
  * 
  *         if sid != current_sid:
  *             current_sid = sid             # <<<<<<<<<<<<<<
@@ -19732,7 +22830,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
       __pyx_v_current_sid = __pyx_v_sid;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":312
+      /* "abovedata_backtesting/exits/cython_exits.py":572
  *         if sid != current_sid:
  *             current_sid = sid
  *             entry_count = 0             # <<<<<<<<<<<<<<
@@ -19741,7 +22839,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
       __pyx_v_entry_count = 0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":313
+      /* "abovedata_backtesting/exits/cython_exits.py":573
  *             current_sid = sid
  *             entry_count = 0
  *             in_trade = False             # <<<<<<<<<<<<<<
@@ -19750,7 +22848,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
       __pyx_v_in_trade = 0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":314
+      /* "abovedata_backtesting/exits/cython_exits.py":574
  *             entry_count = 0
  *             in_trade = False
  *             suppressed = False             # <<<<<<<<<<<<<<
@@ -19759,7 +22857,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
       __pyx_v_suppressed = 0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":310
+      /* "abovedata_backtesting/exits/cython_exits.py":570
  *         pos = positions[i]
  * 
  *         if sid != current_sid:             # <<<<<<<<<<<<<<
@@ -19768,7 +22866,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
     }
 
-    /* "abovedata_backtesting/exits/cython_exits.py":316
+    /* "abovedata_backtesting/exits/cython_exits.py":576
  *             suppressed = False
  * 
  *         if suppressed:             # <<<<<<<<<<<<<<
@@ -19777,7 +22875,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
     if (__pyx_v_suppressed) {
 
-      /* "abovedata_backtesting/exits/cython_exits.py":317
+      /* "abovedata_backtesting/exits/cython_exits.py":577
  * 
  *         if suppressed:
  *             out[i] = 0.0             # <<<<<<<<<<<<<<
@@ -19787,7 +22885,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
       __pyx_t_4 = __pyx_v_i;
       *((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_4 * __pyx_v_out.strides[0]) )) = 0.0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":318
+      /* "abovedata_backtesting/exits/cython_exits.py":578
  *         if suppressed:
  *             out[i] = 0.0
  *             continue             # <<<<<<<<<<<<<<
@@ -19796,7 +22894,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
       goto __pyx_L3_continue;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":316
+      /* "abovedata_backtesting/exits/cython_exits.py":576
  *             suppressed = False
  * 
  *         if suppressed:             # <<<<<<<<<<<<<<
@@ -19805,7 +22903,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
     }
 
-    /* "abovedata_backtesting/exits/cython_exits.py":320
+    /* "abovedata_backtesting/exits/cython_exits.py":580
  *             continue
  * 
  *         pos_active = pos > 0.01 or pos < -0.01             # <<<<<<<<<<<<<<
@@ -19823,7 +22921,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
     __pyx_L7_bool_binop_done:;
     __pyx_v_pos_active = __pyx_t_5;
 
-    /* "abovedata_backtesting/exits/cython_exits.py":322
+    /* "abovedata_backtesting/exits/cython_exits.py":582
  *         pos_active = pos > 0.01 or pos < -0.01
  * 
  *         if pos_active and not in_trade:             # <<<<<<<<<<<<<<
@@ -19840,7 +22938,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
     __pyx_L10_bool_binop_done:;
     if (__pyx_t_5) {
 
-      /* "abovedata_backtesting/exits/cython_exits.py":323
+      /* "abovedata_backtesting/exits/cython_exits.py":583
  * 
  *         if pos_active and not in_trade:
  *             entry_count += 1             # <<<<<<<<<<<<<<
@@ -19849,7 +22947,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
       __pyx_v_entry_count = (__pyx_v_entry_count + 1);
 
-      /* "abovedata_backtesting/exits/cython_exits.py":324
+      /* "abovedata_backtesting/exits/cython_exits.py":584
  *         if pos_active and not in_trade:
  *             entry_count += 1
  *             if entry_count > max_entries_per_signal:             # <<<<<<<<<<<<<<
@@ -19859,7 +22957,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
       __pyx_t_5 = (__pyx_v_entry_count > __pyx_v_max_entries_per_signal);
       if (__pyx_t_5) {
 
-        /* "abovedata_backtesting/exits/cython_exits.py":325
+        /* "abovedata_backtesting/exits/cython_exits.py":585
  *             entry_count += 1
  *             if entry_count > max_entries_per_signal:
  *                 suppressed = True             # <<<<<<<<<<<<<<
@@ -19868,7 +22966,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
         __pyx_v_suppressed = 1;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":326
+        /* "abovedata_backtesting/exits/cython_exits.py":586
  *             if entry_count > max_entries_per_signal:
  *                 suppressed = True
  *                 out[i] = 0.0             # <<<<<<<<<<<<<<
@@ -19878,7 +22976,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
         __pyx_t_4 = __pyx_v_i;
         *((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_4 * __pyx_v_out.strides[0]) )) = 0.0;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":327
+        /* "abovedata_backtesting/exits/cython_exits.py":587
  *                 suppressed = True
  *                 out[i] = 0.0
  *                 continue             # <<<<<<<<<<<<<<
@@ -19887,7 +22985,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
         goto __pyx_L3_continue;
 
-        /* "abovedata_backtesting/exits/cython_exits.py":324
+        /* "abovedata_backtesting/exits/cython_exits.py":584
  *         if pos_active and not in_trade:
  *             entry_count += 1
  *             if entry_count > max_entries_per_signal:             # <<<<<<<<<<<<<<
@@ -19896,7 +22994,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
       }
 
-      /* "abovedata_backtesting/exits/cython_exits.py":328
+      /* "abovedata_backtesting/exits/cython_exits.py":588
  *                 out[i] = 0.0
  *                 continue
  *             in_trade = True             # <<<<<<<<<<<<<<
@@ -19905,7 +23003,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
       __pyx_v_in_trade = 1;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":329
+      /* "abovedata_backtesting/exits/cython_exits.py":589
  *                 continue
  *             in_trade = True
  *             out[i] = pos             # <<<<<<<<<<<<<<
@@ -19915,7 +23013,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
       __pyx_t_4 = __pyx_v_i;
       *((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_4 * __pyx_v_out.strides[0]) )) = __pyx_v_pos;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":322
+      /* "abovedata_backtesting/exits/cython_exits.py":582
  *         pos_active = pos > 0.01 or pos < -0.01
  * 
  *         if pos_active and not in_trade:             # <<<<<<<<<<<<<<
@@ -19925,7 +23023,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
       goto __pyx_L9;
     }
 
-    /* "abovedata_backtesting/exits/cython_exits.py":330
+    /* "abovedata_backtesting/exits/cython_exits.py":590
  *             in_trade = True
  *             out[i] = pos
  *         elif not pos_active and in_trade:             # <<<<<<<<<<<<<<
@@ -19942,7 +23040,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
     __pyx_L13_bool_binop_done:;
     if (__pyx_t_5) {
 
-      /* "abovedata_backtesting/exits/cython_exits.py":331
+      /* "abovedata_backtesting/exits/cython_exits.py":591
  *             out[i] = pos
  *         elif not pos_active and in_trade:
  *             in_trade = False             # <<<<<<<<<<<<<<
@@ -19951,7 +23049,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
       __pyx_v_in_trade = 0;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":332
+      /* "abovedata_backtesting/exits/cython_exits.py":592
  *         elif not pos_active and in_trade:
  *             in_trade = False
  *             out[i] = pos             # <<<<<<<<<<<<<<
@@ -19961,7 +23059,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
       __pyx_t_4 = __pyx_v_i;
       *((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_4 * __pyx_v_out.strides[0]) )) = __pyx_v_pos;
 
-      /* "abovedata_backtesting/exits/cython_exits.py":330
+      /* "abovedata_backtesting/exits/cython_exits.py":590
  *             in_trade = True
  *             out[i] = pos
  *         elif not pos_active and in_trade:             # <<<<<<<<<<<<<<
@@ -19971,7 +23069,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
       goto __pyx_L9;
     }
 
-    /* "abovedata_backtesting/exits/cython_exits.py":334
+    /* "abovedata_backtesting/exits/cython_exits.py":594
  *             out[i] = pos
  *         else:
  *             out[i] = pos             # <<<<<<<<<<<<<<
@@ -19986,7 +23084,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
     __pyx_L3_continue:;
   }
 
-  /* "abovedata_backtesting/exits/cython_exits.py":287
+  /* "abovedata_backtesting/exits/cython_exits.py":547
  * 
  * 
  * @cython.cfunc             # <<<<<<<<<<<<<<
@@ -20001,7 +23099,7 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
   return __pyx_r;
 }
 
-/* "abovedata_backtesting/exits/cython_exits.py":337
+/* "abovedata_backtesting/exits/cython_exits.py":597
  * 
  * 
  * def enforce_max_entries_cy(             # <<<<<<<<<<<<<<
@@ -20010,16 +23108,16 @@ static PyObject *__pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_7enforce_max_entries_cy(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_13enforce_max_entries_cy(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_6enforce_max_entries_cy, "Enforce maximum entries per signal period.\n\n    Returns\n    -------\n    (N,) float64 array of modified positions\n    ");
-static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_7enforce_max_entries_cy = {"enforce_max_entries_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_7enforce_max_entries_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_6enforce_max_entries_cy};
-static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_7enforce_max_entries_cy(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_21abovedata_backtesting_5exits_12cython_exits_12enforce_max_entries_cy, "Enforce maximum entries per signal period.\n\n    Returns\n    -------\n    (N,) float64 array of modified positions\n    ");
+static PyMethodDef __pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_13enforce_max_entries_cy = {"enforce_max_entries_cy", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_13enforce_max_entries_cy, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_21abovedata_backtesting_5exits_12cython_exits_12enforce_max_entries_cy};
+static PyObject *__pyx_pw_21abovedata_backtesting_5exits_12cython_exits_13enforce_max_entries_cy(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -20051,47 +23149,47 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_positions,&__pyx_mstate_global->__pyx_n_u_signal_ids,&__pyx_mstate_global->__pyx_n_u_max_entries_per_signal,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 337, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 597, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 337, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 597, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 337, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 597, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 337, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 597, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "enforce_max_entries_cy", 0) < (0)) __PYX_ERR(0, 337, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "enforce_max_entries_cy", 0) < (0)) __PYX_ERR(0, 597, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("enforce_max_entries_cy", 1, 3, 3, i); __PYX_ERR(0, 337, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("enforce_max_entries_cy", 1, 3, 3, i); __PYX_ERR(0, 597, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 3)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 337, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 597, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 337, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 597, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 337, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 597, __pyx_L3_error)
     }
     __pyx_v_positions = values[0];
     __pyx_v_signal_ids = values[1];
-    if (__Pyx_PyInt_FromNumber(&values[2], "max_entries_per_signal", 0) < (0)) __PYX_ERR(0, 340, __pyx_L3_error)
+    if (__Pyx_PyInt_FromNumber(&values[2], "max_entries_per_signal", 0) < (0)) __PYX_ERR(0, 600, __pyx_L3_error)
     __pyx_v_max_entries_per_signal = ((PyObject*)values[2]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("enforce_max_entries_cy", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 337, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("enforce_max_entries_cy", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 597, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -20102,8 +23200,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_max_entries_per_signal), (&PyLong_Type), 0, "max_entries_per_signal", 2))) __PYX_ERR(0, 340, __pyx_L1_error)
-  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6enforce_max_entries_cy(__pyx_self, __pyx_v_positions, __pyx_v_signal_ids, __pyx_v_max_entries_per_signal);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_max_entries_per_signal), (&PyLong_Type), 0, "max_entries_per_signal", 2))) __PYX_ERR(0, 600, __pyx_L1_error)
+  __pyx_r = __pyx_pf_21abovedata_backtesting_5exits_12cython_exits_12enforce_max_entries_cy(__pyx_self, __pyx_v_positions, __pyx_v_signal_ids, __pyx_v_max_entries_per_signal);
 
   /* function exit code */
   goto __pyx_L0;
@@ -20122,7 +23220,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6enforce_max_entries_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_signal_ids, PyObject *__pyx_v_max_entries_per_signal) {
+static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_12enforce_max_entries_cy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_positions, PyObject *__pyx_v_signal_ids, PyObject *__pyx_v_max_entries_per_signal) {
   PyObject *__pyx_v_pos = NULL;
   PyObject *__pyx_v_sids = NULL;
   PyObject *__pyx_v_out = NULL;
@@ -20131,9 +23229,9 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6enforce
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
+  size_t __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
   __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
   __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
@@ -20144,175 +23242,160 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6enforce
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("enforce_max_entries_cy", 0);
 
-  /* "abovedata_backtesting/exits/cython_exits.py":348
+  /* "abovedata_backtesting/exits/cython_exits.py":608
  *     (N,) float64 array of modified positions
  *     """
- *     pos = np.array(positions, dtype=np.float64, copy=True)             # <<<<<<<<<<<<<<
- *     sids = np.array(signal_ids, dtype=np.int32, copy=True)
+ *     pos = _as_f64(positions)             # <<<<<<<<<<<<<<
+ *     sids = np.ascontiguousarray(signal_ids, dtype=np.int32)
  *     out = np.empty(pos.shape[0], dtype=np.float64)
 */
   __pyx_t_2 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 348, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 348, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 348, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_as_f64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 608, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 348, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
     assert(__pyx_t_2);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
     __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_2, __pyx_v_positions};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 348, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_5, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 348, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 348, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_positions};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 348, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 608, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __pyx_v_pos = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":349
+  /* "abovedata_backtesting/exits/cython_exits.py":609
  *     """
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     sids = np.array(signal_ids, dtype=np.int32, copy=True)             # <<<<<<<<<<<<<<
+ *     pos = _as_f64(positions)
+ *     sids = np.ascontiguousarray(signal_ids, dtype=np.int32)             # <<<<<<<<<<<<<<
  *     out = np.empty(pos.shape[0], dtype=np.float64)
  *     _enforce_max_entries(pos, sids, max_entries_per_signal, out)
 */
-  __pyx_t_4 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 349, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_array); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_ascontiguousarray); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 609, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 349, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 609, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
   if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-    assert(__pyx_t_4);
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+    assert(__pyx_t_3);
     PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
-    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_3);
     __Pyx_INCREF(__pyx__function);
     __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
-    __pyx_t_6 = 0;
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_4, __pyx_v_signal_ids};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 349, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_2, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 349, __pyx_L1_error)
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_copy, Py_True, __pyx_t_3, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 349, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_3, __pyx_v_signal_ids};
+    __pyx_t_2 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 609, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_6, __pyx_t_2, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 609, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_2);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 609, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __pyx_v_sids = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":350
- *     pos = np.array(positions, dtype=np.float64, copy=True)
- *     sids = np.array(signal_ids, dtype=np.int32, copy=True)
+  /* "abovedata_backtesting/exits/cython_exits.py":610
+ *     pos = _as_f64(positions)
+ *     sids = np.ascontiguousarray(signal_ids, dtype=np.int32)
  *     out = np.empty(pos.shape[0], dtype=np.float64)             # <<<<<<<<<<<<<<
  *     _enforce_max_entries(pos, sids, max_entries_per_signal, out)
  *     return out
 */
   __pyx_t_5 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 350, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 350, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 610, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_pos, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 350, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 350, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 350, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_empty); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 610, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_pos, __pyx_mstate_global->__pyx_n_u_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 610, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 610, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 350, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 610, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 610, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_6 = 1;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
     assert(__pyx_t_5);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
     __Pyx_INCREF(__pyx_t_5);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+    __pyx_t_4 = 0;
   }
   #endif
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_t_4};
-    __pyx_t_3 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 350, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_7, __pyx_t_3, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 350, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_3);
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_5, __pyx_t_3};
+    __pyx_t_2 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 610, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_dtype, __pyx_t_7, __pyx_t_2, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 610, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_2);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 610, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __pyx_v_out = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":351
- *     sids = np.array(signal_ids, dtype=np.int32, copy=True)
+  /* "abovedata_backtesting/exits/cython_exits.py":611
+ *     sids = np.ascontiguousarray(signal_ids, dtype=np.int32)
  *     out = np.empty(pos.shape[0], dtype=np.float64)
  *     _enforce_max_entries(pos, sids, max_entries_per_signal, out)             # <<<<<<<<<<<<<<
  *     return out
 */
-  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_pos, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 351, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(__pyx_v_pos, 0); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 611, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_8.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 351, __pyx_L1_error)
+    __PYX_ERR(0, 611, __pyx_L1_error)
   }
-  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_int(__pyx_v_sids, PyBUF_WRITABLE); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 351, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_ds_int__const__(__pyx_v_sids, 0); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 611, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_9.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 351, __pyx_L1_error)
+    __PYX_ERR(0, 611, __pyx_L1_error)
   }
-  __pyx_t_10 = __Pyx_PyLong_As_int(__pyx_v_max_entries_per_signal); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 351, __pyx_L1_error)
-  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out, PyBUF_WRITABLE); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 351, __pyx_L1_error)
+  __pyx_t_10 = __Pyx_PyLong_As_int(__pyx_v_max_entries_per_signal); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 611, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_out, PyBUF_WRITABLE); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 611, __pyx_L1_error)
   if (unlikely(((PyObject *) __pyx_t_11.memview) == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-    __PYX_ERR(0, 351, __pyx_L1_error)
+    __PYX_ERR(0, 611, __pyx_L1_error)
   }
-  __pyx_t_1 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_max_entries(__pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_t_11); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 351, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_21abovedata_backtesting_5exits_12cython_exits__enforce_max_entries(__pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_t_11); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 611, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
   __pyx_t_8.memview = NULL; __pyx_t_8.data = NULL;
@@ -20322,7 +23405,7 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6enforce
   __pyx_t_11.memview = NULL; __pyx_t_11.data = NULL;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":352
+  /* "abovedata_backtesting/exits/cython_exits.py":612
  *     out = np.empty(pos.shape[0], dtype=np.float64)
  *     _enforce_max_entries(pos, sids, max_entries_per_signal, out)
  *     return out             # <<<<<<<<<<<<<<
@@ -20332,7 +23415,7 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6enforce
   __pyx_r = __pyx_v_out;
   goto __pyx_L0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":337
+  /* "abovedata_backtesting/exits/cython_exits.py":597
  * 
  * 
  * def enforce_max_entries_cy(             # <<<<<<<<<<<<<<
@@ -20345,8 +23428,8 @@ static PyObject *__pyx_pf_21abovedata_backtesting_5exits_12cython_exits_6enforce
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_8, 1);
   __PYX_XCLEAR_MEMVIEW(&__pyx_t_9, 1);
@@ -22195,20 +25278,20 @@ __Pyx_RefNannySetupContext("PyInit_cython_exits", 0);
   if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_Enum, __pyx_t_4) < (0)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":12
+  /* "abovedata_backtesting/exits/cython_exits.py":19
  * 
  * import cython
  * import numpy as np             # <<<<<<<<<<<<<<
  * from numpy.typing import NDArray
  * 
 */
-  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_numpy, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_numpy, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 19, __pyx_L1_error)
   __pyx_t_4 = __pyx_t_1;
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_np, __pyx_t_4) < (0)) __PYX_ERR(0, 12, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_np, __pyx_t_4) < (0)) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":13
+  /* "abovedata_backtesting/exits/cython_exits.py":20
  * import cython
  * import numpy as np
  * from numpy.typing import NDArray             # <<<<<<<<<<<<<<
@@ -22217,127 +25300,199 @@ __Pyx_RefNannySetupContext("PyInit_cython_exits", 0);
 */
   {
     PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_NDArray};
-    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_numpy_typing, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 13, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_numpy_typing, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 20, __pyx_L1_error)
   }
   __pyx_t_4 = __pyx_t_1;
   __Pyx_GOTREF(__pyx_t_4);
   {
     PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_NDArray};
     __pyx_t_9 = 0; {
-      __pyx_t_5 = __Pyx_ImportFrom(__pyx_t_4, __pyx_imported_names[__pyx_t_9]); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 13, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_ImportFrom(__pyx_t_4, __pyx_imported_names[__pyx_t_9]); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 20, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
-      if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_imported_names[__pyx_t_9], __pyx_t_5) < (0)) __PYX_ERR(0, 13, __pyx_L1_error)
+      if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_imported_names[__pyx_t_9], __pyx_t_5) < (0)) __PYX_ERR(0, 20, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":54
+  /* "abovedata_backtesting/exits/cython_exits.py":23
+ * 
+ * 
+ * def _as_f64(arr: NDArray[np.floating]) -> NDArray[np.float64]:             # <<<<<<<<<<<<<<
+ *     """Contiguous float64 view of ``arr``; copies only when required."""
+ *     return np.ascontiguousarray(arr, dtype=np.float64)
+*/
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_arr, __pyx_mstate_global->__pyx_kp_u_NDArray_np_floating) < (0)) __PYX_ERR(0, 23, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_1_as_f64, 0, __pyx_mstate_global->__pyx_n_u_as_f64, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_5);
+  #endif
+  __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_5, __pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_as_f64, __pyx_t_5) < (0)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":66
  * 
  * 
  * def fixed_holding_exit_cy(             # <<<<<<<<<<<<<<
  *     positions: NDArray[np.float64],
  *     signal_date_mask: NDArray[np.uint8],
 */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_signal_date_mask, __pyx_mstate_global->__pyx_kp_u_NDArray_np_uint8) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_holding_days, __pyx_mstate_global->__pyx_n_u_int) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_3fixed_holding_exit_cy, 0, __pyx_mstate_global->__pyx_n_u_fixed_holding_exit_cy, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_4);
+  #endif
+  __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_4, __pyx_t_5);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fixed_holding_exit_cy, __pyx_t_4) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":170
+ * 
+ * 
+ * def trailing_stop_exit_cy(             # <<<<<<<<<<<<<<
+ *     positions: NDArray[np.float64],
+ *     closes: NDArray[np.float64],
+*/
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 54, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_signal_date_mask, __pyx_mstate_global->__pyx_kp_u_NDArray_np_uint8) < (0)) __PYX_ERR(0, 54, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_holding_days, __pyx_mstate_global->__pyx_n_u_int) < (0)) __PYX_ERR(0, 54, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 54, __pyx_L1_error)
-  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_1fixed_holding_exit_cy, 0, __pyx_mstate_global->__pyx_n_u_fixed_holding_exit_cy, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 54, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_closes, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_highs, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_lows, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_trailing_stop_pct, __pyx_mstate_global->__pyx_n_u_float) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_tuple_NDArray_np_float64_NDArray) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_5trailing_stop_exit_cy, 0, __pyx_mstate_global->__pyx_n_u_trailing_stop_exit_cy, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_5);
   #endif
   __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_5, __pyx_t_4);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fixed_holding_exit_cy, __pyx_t_5) < (0)) __PYX_ERR(0, 54, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_trailing_stop_exit_cy, __pyx_t_5) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":158
+  /* "abovedata_backtesting/exits/cython_exits.py":279
  * 
  * 
- * def trailing_stop_exit_cy(             # <<<<<<<<<<<<<<
+ * def trailing_stop_exit_multi_cy(             # <<<<<<<<<<<<<<
  *     positions: NDArray[np.float64],
  *     closes: NDArray[np.float64],
 */
-  __pyx_t_5 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 279, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 158, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_closes, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 158, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_highs, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 158, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_lows, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 158, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_trailing_stop_pct, __pyx_mstate_global->__pyx_n_u_float) < (0)) __PYX_ERR(0, 158, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_tuple_NDArray_np_float64_NDArray) < (0)) __PYX_ERR(0, 158, __pyx_L1_error)
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_3trailing_stop_exit_cy, 0, __pyx_mstate_global->__pyx_n_u_trailing_stop_exit_cy, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 158, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 279, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_closes, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 279, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_highs, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 279, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_lows, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 279, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_trailing_stop_pcts, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 279, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_tuple_NDArray_np_float64_NDArray) < (0)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_7trailing_stop_exit_multi_cy, 0, __pyx_mstate_global->__pyx_n_u_trailing_stop_exit_multi_cy, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 279, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_4);
   #endif
   __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_4, __pyx_t_5);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_trailing_stop_exit_cy, __pyx_t_4) < (0)) __PYX_ERR(0, 158, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_trailing_stop_exit_multi_cy, __pyx_t_4) < (0)) __PYX_ERR(0, 279, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":259
+  /* "abovedata_backtesting/exits/cython_exits.py":391
  * 
  * 
  * def stop_loss_take_profit_exit_cy(             # <<<<<<<<<<<<<<
  *     positions: NDArray[np.float64],
  *     closes: NDArray[np.float64],
 */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 259, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 391, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 259, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_closes, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 259, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_highs, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 259, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_lows, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 259, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_stop_loss_pct, __pyx_mstate_global->__pyx_n_u_float) < (0)) __PYX_ERR(0, 259, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_take_profit_pct, __pyx_mstate_global->__pyx_n_u_float) < (0)) __PYX_ERR(0, 259, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_tuple_NDArray_np_float64_NDArray) < (0)) __PYX_ERR(0, 259, __pyx_L1_error)
-  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_5stop_loss_take_profit_exit_cy, 0, __pyx_mstate_global->__pyx_n_u_stop_loss_take_profit_exit_cy, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 259, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 391, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_closes, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 391, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_highs, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 391, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_lows, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 391, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_stop_loss_pct, __pyx_mstate_global->__pyx_n_u_float) < (0)) __PYX_ERR(0, 391, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_take_profit_pct, __pyx_mstate_global->__pyx_n_u_float) < (0)) __PYX_ERR(0, 391, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_tuple_NDArray_np_float64_NDArray) < (0)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_9stop_loss_take_profit_exit_cy, 0, __pyx_mstate_global->__pyx_n_u_stop_loss_take_profit_exit_cy, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 391, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_5);
   #endif
   __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_5, __pyx_t_4);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_stop_loss_take_profit_exit_cy, __pyx_t_5) < (0)) __PYX_ERR(0, 259, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_stop_loss_take_profit_exit_cy, __pyx_t_5) < (0)) __PYX_ERR(0, 391, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "abovedata_backtesting/exits/cython_exits.py":337
+  /* "abovedata_backtesting/exits/cython_exits.py":504
  * 
  * 
- * def enforce_max_entries_cy(             # <<<<<<<<<<<<<<
+ * def stop_loss_take_profit_exit_multi_cy(             # <<<<<<<<<<<<<<
  *     positions: NDArray[np.float64],
- *     signal_ids: NDArray[np.int32],
+ *     closes: NDArray[np.float64],
 */
-  __pyx_t_5 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 504, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 337, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_signal_ids, __pyx_mstate_global->__pyx_kp_u_NDArray_np_int32) < (0)) __PYX_ERR(0, 337, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_max_entries_per_signal, __pyx_mstate_global->__pyx_n_u_int) < (0)) __PYX_ERR(0, 337, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 337, __pyx_L1_error)
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_7enforce_max_entries_cy, 0, __pyx_mstate_global->__pyx_n_u_enforce_max_entries_cy, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 337, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_closes, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_highs, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_lows, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_stop_loss_pcts, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_take_profit_pcts, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_tuple_NDArray_np_float64_NDArray) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_11stop_loss_take_profit_exit_multi_cy, 0, __pyx_mstate_global->__pyx_n_u_stop_loss_take_profit_exit_multi, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[5])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 504, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_4);
   #endif
   __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_4, __pyx_t_5);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_enforce_max_entries_cy, __pyx_t_4) < (0)) __PYX_ERR(0, 337, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_stop_loss_take_profit_exit_multi, __pyx_t_4) < (0)) __PYX_ERR(0, 504, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "abovedata_backtesting/exits/cython_exits.py":597
+ * 
+ * 
+ * def enforce_max_entries_cy(             # <<<<<<<<<<<<<<
+ *     positions: NDArray[np.float64],
+ *     signal_ids: NDArray[np.int32],
+*/
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 597, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_positions, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 597, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_signal_ids, __pyx_mstate_global->__pyx_kp_u_NDArray_np_int32) < (0)) __PYX_ERR(0, 597, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_max_entries_per_signal, __pyx_mstate_global->__pyx_n_u_int) < (0)) __PYX_ERR(0, 597, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_kp_u_NDArray_np_float64) < (0)) __PYX_ERR(0, 597, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_CyFunction_New(&__pyx_mdef_21abovedata_backtesting_5exits_12cython_exits_13enforce_max_entries_cy, 0, __pyx_mstate_global->__pyx_n_u_enforce_max_entries_cy, NULL, __pyx_mstate_global->__pyx_n_u_abovedata_backtesting_exits_cyth, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 597, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_5);
+  #endif
+  __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_5, __pyx_t_4);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_enforce_max_entries_cy, __pyx_t_5) < (0)) __PYX_ERR(0, 597, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
   /* "abovedata_backtesting/exits/cython_exits.py":1
  * """Cython-accelerated exit strategy kernels (pure-Python mode).             # <<<<<<<<<<<<<<
  * 
  * Works as regular Python when not compiled. When compiled with Cython,
 */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_4) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_5) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
   /*--- Wrapped vars code ---*/
 
@@ -22472,34 +25627,34 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 8; } index[] = {{2},{68},{35},{54},{37},{60},{24},{52},{26},{34},{29},{33},{45},{22},{15},{19},{17},{17},{179},{37},{30},{32},{1},{1},{1},{1},{1},{8},{5},{6},{15},{23},{25},{7},{6},{2},{6},{35},{9},{30},{50},{8},{47},{20},{32},{22},{47},{30},{37},{5},{8},{7},{20},{8},{15},{3},{40},{15},{5},{18},{4},{1},{2},{9},{17},{18},{6},{4},{5},{8},{5},{15},{5},{6},{22},{9},{5},{21},{5},{5},{7},{6},{7},{8},{12},{2},{5},{12},{2},{10},{5},{3},{5},{13},{5},{8},{2},{4},{8},{4},{22},{7},{4},{10},{1},{4},{8},{4},{7},{2},{5},{12},{3},{3},{8},{7},{4},{3},{3},{9},{14},{11},{10},{19},{14},{12},{10},{17},{13},{8},{6},{12},{10},{12},{19},{5},{4},{16},{10},{4},{5},{4},{4},{13},{29},{6},{15},{8},{21},{17},{5},{6},{6},{6},{1},{100},{100},{178},{184},{1}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1627 bytes) */
-const char* const cstring = "BZh91AY&SY\"\371\254\247\000\000\352\377\377\377\177\377\326\367\367\377\177\277'\377\n\277\377\377\360@@@@@@@@@\000@@@\000@\000P\006\036\\Zc\020w1\245\326\241;\266\002QS\323Jzh\304\311\242\233L\214D\361\032jh\r\006\231\000\000z@\323@mF\232i\223\3216\232j\t$\2314\311=S\323Rf\324\206\200\320\r\000\000\000\000\000\000h\000\000\0004\320B4&\215\021G\247\240)\341M\007\224=M4\014\200\000\000\000\003\324\000=\023\324\034\000\003@\003@\032\000\0004b\000\006\200\000\000\000\006\200\tB\023T\330 S\364\006\244\003OP\000h\323@\000\000\001\240\000\001\221\350\233QB`\357\242ke\024\313\254\031A\306\310\211\231PIA\304P\330\030\222\320HXb\320\233\003\306\010\014<p\225\016/\025_?\311!\000Qq\004(\022\224\240\306\307a\022\022fnF\271]\262+\2010p\262\344&z\350F\350\333M{\355\276a0\014\302\316\025\374\373\037\324\337\327iv\327\243\267t\377x\262\353\002\337\"H\365XK\263b\212\205\350ZY\335\225B\263\277\351E\274\336\207\317\356sgzc\353J!\352\025\177l\325\017z\225\376\344\307\021\003\247;Z\034\266k\355\016,\305\273\263\203\323d\356Z\320\253L>\014U\231\004\342p\371\232t\272\262\322x\202o\232Bh\346\006\230\322\310wj\347\374cx2\205\005&\345\322 0\304\346\363I\2652\326\2357\231\003\023[\317\006\213n.\276\027\013\345\3235\323\312<\264@\324\361\352\005d\002A+28a\373\232\020\0243IV\377\273\351zp\224\\}\307\360\010\310\212Y\317\004\234\025\037\256Y\237\276%\027s\367\244\275<z\240\215\335d\332Q\262Ii\311\304\322\341\034S7]\336u\247}\014\222\345j;,5\222\265\031o\031\010fA\337\017\277\221r\316\200K7\210\300\006j2&\256(NS\237\263\343\330\"6\332\216\351\007\205\331\201\245\322y\251\034\241\236\344\240\200\340\327\226\004\2044s\033\004\250o\261hrZ\006\n\010\241I\031\261\202\260\035\020s\326\242OR\352E\364M\334V\020\231\255\277\204f\313J\213I\366\271\003i9\2579\230\230\245\334\317\324\034\034\336\004\306r\003\007\025\317\007\324\345\236\345%\313A\032\326\301\246\030\322\253\342\314\214\256\240XL\375\340\307\320\225b\345@\216B\\\363\006\334\302Jb\244\036\003\205\024\221t\r\003&\347\025\2345\254\3115\227\322""\022>\021\261\230N \301H\217\202\320\277\3558y\206CL\267v\334^\2100\033\252\024\242\3473H\004p\321n\232\002\203\242\302\241K0\320\0249\353X\242v\231j\023C-\322\302\320$\312PS|0d(G\224\352\302A\244@z[\301\377T1\252\354\256\227'\211\223L\236Y\347\2650O\002\310C\007i\262\3019\335\233hk\001l\\\nu\020\t\023[YiT\327\225\256\330\206\245\226\001{YN\342\206\210-\242I\210\351\005\024\003\233\034\331m\254\013\002/c\215\264s\027\265x:\220\226fu\tc5\006\231\357\311)\261|\026\2033f\276IMQ\362\212\212\025\326\302\346\235\265\325\214;R\245$#\t\355\"\251\002P\216y\037R\343\\\217L\272\027U\344\010\333v\203\024\034x\275\244\342NHAR\262\261\367\025\210\225u\253\332,k\330\250\342\325@mQ1\324I\004\313\216@\\\213\230m\305J\013t$\344\314\t\002\347\021u\354\0308l\375h\250\353\276\010\344\022g@\202\000\265\"\241\333F\251&\350\302-\331\245\274\340\321\004N\216\234iC\254\014\331\003\004\220\027\025Q5\003|i\240\007\302]4r\266s%\251+\341\333\305\255\024D\024\254\300\215x\211\273\"\214\030|\n\325\355vI\003 \254\302M\265N\304H\301d\nH\324Y%$\025m\226g\000\255\314\212f:\246&\227ap\224q\032\240\034uI*\201 o!\344\250\202\344i\240\244\254$\202F\037\307D\207E\022\025\222\010=9\352\346\236\030\212\361\351\302\214\022\271\027\031X\352N\tR\327 Jm\210H\353\004 \3230\214\356\240\310D'\013*\320\302*\330W\020\034bI\305\254\230\246$\3143\013G/TK\"\305B\206\362\262\334\226\24345n\226\302V\376\365\010\336.ZJ .\346\2356\330li\326\2566\032\373\023}\226\020rG\\' \332\305\354\2300\023,\004\\\372\031\306;\204R\211\241df\004\364\035U\357\231\237\030\r\221\302\020\211#\000\264TN\300\3168\306#\203%\030\002(\253n\321\222\304\235\031\221V\037\026gu*V\030Tk\276$\037FI\247y\221\2707+A\271\030\004\3575\334D\260\025y\036{a\030\024\310iq\220\270\215\014\032\367U\257a\010\304\214L\353\270\010\277Q\316Sl\020\037^!\334P\256B@\020\250\233\307C--[`\013mU\261\027\300\321\224\321K\"\346\031\222\225\256$T\312\233\333\036\323\274\212\211z2\322\275_y\"\250\316\313\235 +Dai<\242\272\3053d\347J\300\232\215J8?!U\270\016v\206g\372\203\2419Y""%\243\225G\262\335\244M\2205\335\267\001\261\024\313)\231<}\\K\013\341T'\224\3520s^1\244g\212\003\305X\261\005[b\207m\331\312\360PI\3579E\241\260\030Nt*\031*\241\236E\357\244\022\252\034\206J*\310\242\322\306\321\374h7\274\r \322\027\214E8\204\376yO\321\270[/\211\301\222y)\351\021\301<\007\030\234\244\233XM\243\000`,\034Z\242r\030o\224n\027\3163\256p\363\305\240c\r\374R\020\2075r\271\022g\030\202\341\235@*\305;\274\020\020\3018\3221\017\343\036\3349\217y\310\246\331\346\314Cg_d\333\273\r[G@\3105X3A\211\242j\016\264[\265\262b\312\177\031\3301\214\005\351\353[d\310\013a\377\027rE8P\220\"\371\254\247";
-    PyObject *data = __Pyx_DecompressString(cstring, 1627, 2);
+    const struct { const unsigned int length: 8; } index[] = {{2},{68},{35},{54},{37},{60},{24},{52},{26},{34},{29},{33},{45},{22},{15},{19},{20},{17},{17},{179},{37},{30},{32},{1},{1},{1},{1},{1},{8},{5},{22},{6},{15},{23},{25},{7},{7},{6},{2},{6},{35},{9},{30},{50},{8},{47},{15},{20},{32},{22},{47},{30},{37},{5},{8},{7},{20},{8},{15},{3},{40},{15},{3},{7},{17},{18},{4},{1},{2},{9},{17},{18},{6},{5},{8},{5},{15},{5},{6},{22},{9},{5},{21},{5},{5},{7},{6},{7},{8},{12},{2},{5},{12},{2},{10},{5},{3},{5},{13},{5},{8},{2},{4},{8},{4},{22},{7},{4},{10},{1},{4},{8},{4},{7},{2},{5},{12},{3},{3},{8},{7},{4},{4},{3},{3},{9},{14},{11},{10},{19},{14},{12},{10},{17},{13},{8},{6},{12},{10},{12},{19},{5},{4},{16},{10},{4},{2},{5},{4},{4},{13},{14},{29},{35},{6},{15},{16},{8},{2},{21},{27},{17},{18},{5},{6},{6},{6},{1},{5},{85},{85},{26},{133},{142},{130},{184},{1}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1773 bytes) */
+const char* const cstring = "BZh91AY&SY+}\0222\000\001.\177\377\377\377\377\366\367\367\375\367\277#\377\n\277\377\377\360@@@@@@@@@\000@@@\000@\000`\006\277\027\210C\020BJQ\005U\204%\"d\203F\206\215S\324\374\251\264\332\223\310\3655\036\247\244\036\240\000\000\017P4d\3204\3651\241\017\324\320j\034\000\003@\003@\032\000\0004b\000\006\200\000\000\000\006\200\034\000\003@\003@\032\000\0004b\000\006\200\000\000\000\006\200\tM\020  $\324\3324\231\244\332\232\000\365\031\000\006\200\032\000\000\006\215\003C\324\315!\300\0004\0004\001\240\000\003F \000h\000\000\000\000h\000\222@M\t\210\232d\323\021\032i\350\231C@\033M\020\000\000\000\000\000d\017S\322\\im'G\272\227|\017\3450\r\337\027G\366tF'\374%\322\303\014\303$\234\302\304'\022\210d\026H\022\001<z]\006d\224\002\020\007\003\207 \334\007\241\365h\014\024\215\320\360'\005*\023\000\340v\261K\020t\336\341x\030y$\352b\271\252]\305\327\272\262z#M\027!@\250i\016.];\010\310[$\250\277\314\333\342\214d\177\221\332_\247_\375\347Zc\365\345^\263\366z\331[\265;\362\270|\350\222=\330\363\325^\3470\037\262\366\273\222\230\017\022\371'\374\\\371\254\331{\035\316\256\271[W^\223\234\261\035\377\253\364\251d\351\370\351\013Q3\267\256/$\243FW\222.\323\034\225\232\355\335\\_\013'\212\222\214\344\242P\305gY\313C\223\247\322y\330U\316C\262\243\245|W<\351\350g\205\335A\226\264d\2578(\002\202\204vJ>I\240nGJ9\334\305E\024\367\032Z\\\022 \271\313\273a\215\200\257eQDk\013cZ\225F\033\037/\242\014Kj\214z}\346\013\014\217\025s\305\253\341\363\373\262~\005 \363k1\270\321\034G\313\272P\311D\337\215\355\002\345=\324I\035\273\222\276\t\321\225\033\266\312\034\252\316X\257f\t\232^J\325\027\266\356GZU\216\225,Q\275-\315\3101\340\302Ti\354\333\341\251H\210\033\242t\373\0358\334\330\301]\034P\004E\320\315\273\3036\361V\2573\253q9\363\242\322\223Mw\322\210\025\261\244\252\364~\247\214N\2315\n\034s\035\362\333B\245\"\234I,\013\252\226\213\236\313q\354\304\016+\t&\242\254$\211\272w\233\022f2\303\000\241#\t$gf\350jy\262UZ\373\025\303\2174,\317\337\\\303n\324e\264\351,.\177?z/\016\347-\205B""\034\035\227\300\032\033u\265\271\367\262\340e\310\024\326\326\234\301\251g\3206$\346~\003F\306\207\\y\372\025\264\336\302'\306\034%\231\014\274\006\222\303U\341\000\0360\304\233\21098\270ua\273\274\326+/\205\301(]\034\367\225\234\324\323N\177\r\343\367-\303\343\2336\252t\"\014Y\214\204$s\304\206\322\252\023\021\303g0\253\t\216\315\311\307DA\250rK\231s\225\275SiVT\357T\027\205 t\305\270\010!!\010\345I\340\241\024A+o\341\320\356\342B\305\367_l\222\341\206\334\244\251\256\273\325\022\350=\t\301(\254<\322\327(\215\3466\203\334\371\246\344@\221W\276\036\33073m\362\215$Z\353\203(\272\337\363\2219\250\327F\322q\211\234\026\214/\332\342tE\270N\014sq\271\214m,\3561\021\246]\030\212`i6\241\nf\255c\212\35336\334(\225\030\254\332a\205\276\335F\3369\233\000\355Cie\026\001a$]\271j\277\007Za\313\262P\273\200\342S\005\2048\257{\004&r\354\200V\256\006Z\031\365\301\236\226\2065p\032\371\365\347\201G!\250\342gK3\014\322:\322\n\301\327\006\230\330\310\257\032\255\"\004\203\031\023\307(h$\021\247\227<\016\031f\322BJ\266\030\230^\323\300\224j\333F\337\020\2339\337\312\265\374B\263\023\255\244\335\026\262\3614laM$\017\245\334\233\203\250e\250\033\221\331jr\262\272\312n\204\274\2739\244\214B\212\245Y\3219WhX\374\312\2511\010\223X\332\374\324\006E\263\024\337\267:%\033\335!\224\t:\302\223s!<n\304H\023\343\014\352\307%J\2669\340R}\362\300c\245\203Q\334(,\221\t8J\324\371\242\251Q\231\206a\210s\212\203\246\212\n\252\004`\016\202\275\253\317i,4\006&\n^+\313\260z\34436\251\005h\337#'\320\214]c\204\350\353\016\305X\305\203B\236\360\225\312d\3071fs\004\311\211\345\213$$7c&\262\274\301n\"\207fE\231\254\026\332\rn\246e\255\221m\333\251\216\243A\2377\021\035V\\\256\251\252|\254\262\010\314\374Y+\016\254\221\262<\000q\240\343^@\325\305\223-\306\260\006NH\302\017\270\320c\300E\327&\215*\254\np\271\371!Z5\315\3613\256\272dC@=\235\233\360\332\033\ti86<,\304;\275\374\265G\235$\321\014\3579i\211\312x\322\023B\036V\224\326'6)RZ\3666\336|4po\341c\235=\003w\233\370\242\231\230]=V\177VTha6\322\233'\262\014""\221\262D\032e\2438\221\031\365\031\022E5=\262\317\2348\371,So\210%\315\322JE\223\354(\010vnz\327\017k\357\233\027\242\364\317s?\203\260\317If3\272\316\204\231\261\305\313\310M\237\025\244\260\324U\246Z\214\211`c\006\306P\234\032\272\257u\000\220\211\306\303-\230\333\002\252\205i\261\360!^\311#\026\253\261]\331`F;\243\277Gs\273\221@\301F\316\221\334E\253M\303P\374\201\334\226\314Gv\367uCN\351[@,oM\221i\233C\307\2731\245N\335\235\202\210(%w\001\005\222\332 \367\243\005 C6\216\\!i~a\315\365\247\002\002{\344\337+\242\223\337\023\272\300MU\004XU\302\357\tt\364b\376;\313\362aZ\340\374R\371X2\232\306\352\033@\236o\300\030\000W@<a\274\003\343\346e\034\230\215p\342\231F`\356j\345\014\357\261\270\204\002\211Cr\023\320\244K\022\035\332\247l\331\342&\224U_I\275\306\027\216B\241\264H\234g\001\217b\261\263l\233^\014E\362\330\375\342\\\324\316\256\035?u\365\341\212\316\251\375\223\251\r*\tR\323c\264\303\242(\025r\360\342\334\036\242\301\214K\343\030QZ\257\307.\\\332\216\341G\330fJ\347\t\215!\332\016\200\202M>\331\263\303\203\314{V*\274\241\177\342\356H\247\n\022\005o\242F@";
+    PyObject *data = __Pyx_DecompressString(cstring, 1773, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1447 bytes) */
-const char* const cstring = "x\332\315UMo\024G\020\215\023\333\002\314\227\301\030\204\022\321D\201\205\010\026\014\004\221\304qd\300H\226\022 \301\341\202P\253\247\247f\267\361L\367\270\273g\275\313)\307=\316q\216s\334\243\217\034\363\0238\3161?!?!\325=\263\33658\234#\331\263=\335U]\257^\275\252\371\201\254\3071\tE\002\322\010%\rI5p\010\205\354L6\311\225\220$\231\261$\000\"d\010}\010\t\223!\221\312\022\023\0134\177\230E\021h\322\023\260KB\005\306\037A?U\006\210\261Z\204`\0361I\224\214\007\204k`\026\010#A\355d\273\314\022a\010W\322\212N\2462\203AH\002\211\322\2036z\271\253\2301\242#\211U\004\235\303\233\376\236\332\302\205l\214\232\213w\265\260,\210\2411\250AEZ%\237\362\365i\221]a\273\304\016R \255f\337j&\215Oc\342R\233\241\207@\252\354\024w\217\247\t\0235\t\265\321F\222\332\0011]\206W\333,Ep\221\322\204\017lW\3116\323\232\r6=\000\225Y\242\"\022\250L\206\206\\c}\274\345Jx}\363\343X5\371Y\232*m!\334\224=\026\013\254\222\n\341\206#\036\215\261H-\336\"\030\247\205\301\\\"\255\033\244\203^c\343\032\016r\355\303\254\376\352\023|\351\022D\010O\037\257;X\257d\332\216b\305\354\375{\257\247\266\204\264w\357Lod\270\363\340\365S\205\374\373z>\362\2519\022B\210E\000\032+\203\274;- 2_tI\236o<\277y\357\301=\257%\ro\020\263\301\224\002\036c\271QC\216\210L\304\026\021\272\232\2306\331\214\310@eD\002\346\206ZH\321n\332\301vA\022\003\326-H\313\027\220Y$\213\242;\n\272\325\024C\364\300y?a\261\201\366\263\003\214#\344F\225\214s0\343\022\274\260\220\222\204\r<\351\330\004oA\253Iu\376\220^nx%J\270\007\032\325d!q\357*pI\265\327Z\327\177faH\245\243\307%K\220\241\333}\256\342\330\301\301j\266Y\300W\247\032\300\031\325`\327>\334\036\353n-\024\306\305\005\037\275\303\3115W\333\216\227\234\313\300u0\364-H\353\373i\322\314\302\324.\241Ci\304[ \253?\221\333\037\tR*,]\304\262\330\022J5\204\031\007JI\230\371D\245\2227\261\224=\301b<\345B\n\213\207u\272kF\363[,P=\010\231e4`|\333\202\301*vnA_Xs\253\216B\375K;\035\254\326\003\"<\220\364\307{N\310\373\271\0378\337\337\365\235\365\352\020\345\3368L\316\257\263\375\272\2618V\334""\017%gD\034\356\366!\247u\303\270\220\315Lk\257\277x\264\271\271\021\307\"5\30241(}>\350\343\377cT:}\212%\370\035\242\027\260\223\201\344\340\272\253=i4\254\372\241D\265kn\246\211\032\203\240\265>=Pf\006\222\013\325\346J\343\340\020\022L\300\014p\036cI\\KP:^t\300\272j\273W4\243\002[B3\016.$\217q\272\031\256\322\001\307\036\3002\206\0167\r]\313\371\007\025\206\326\225\0057\3050\r\0342 Q/\250\210\204\365)JL\0130\224\343Y\226\370V\007\255\225\216\004~(hW\305\356k\342\263@\223(f\035\343K\320\324\001\357I\360\245\236P\224F\231\344\0167\"6\326\345K\273\242+:]3\276'd\003#BJE\342F\037\376\272\301\211\323\307\217$\207u\237\215Z\337\215\310c\025\253]d$a\230<>\315\3664\364\0244u_\030\026\343\230w3\336\rR4Sa\026\343\257\224,q?\365\023[\t\237\260\213\217\024\023N\007\376\321\256\207\0142\205\321\361\317'\354~\361\353\221\"\317\251J\335J!\"\327\361\224\246\250\022\336\005\276m\262\244~k\022vKO\274_e2\025|\033Ql\310\261]\317\177\337\034K;\031\213kT\223\036\335_5\362\231l@\337-;\302\340\004\326`3\215\2078.\233\274p\3254\274_7`\246\326\343\373|\033`\rL\315\030V\304\202g\264y\367'oQ\311L\243'\244\306*\377OQiH5N\371\375\027\313\266\201\246ZE\302\216\005\202\255\225q;}\220:=\272\316\240N\265\"v*\360W4\036\0077\321\332\177\214\2207d=K\035:\374\336e`\372\177\316T\247NW\247\027\253/\277\252\346\346\3779\371\331\334\302\360\353\341\223\374r\376c\021\225\017\3137{s{\277U\263\013\303;\303\227\371J\376K9_\006\243#\365\346\261\306\362n\036\025\353\305V\271\\\352\321b5{\241\230)\316\025\321\373oV\337\255;\317\225:\306\362\371\352\314Y\027\343\342\247c\274_\272ZF\243\207\243\356\036\274[\371\317 \347\363\235b\256xY\256\355-N\3058~\242Z8^\035[\250\316_h\2629:<\232/\243\355\314\344\246\003A\217\016\317\014\357\347\213\371\265\342j\371y\371\355h\303\3357\336l\025\313\205./\216\276\333\233\231l^-\346\213\240<6\2722\332\251fO\016\203|>g\271\361\356\227\253\331SC\355\343}Q\334/\317\224+c\240[\345R\271\365\376\372\352\273\315\277|\246\337\347\353\037 >\273T\235[\376\277\200\276T\354TGN\014\267\362\245|""\253\2704\232\251\216,\346\213\177\327\270\237\375\013\rC@\020";
-    PyObject *data = __Pyx_DecompressString(cstring, 1447, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1589 bytes) */
+const char* const cstring = "x\332\265UKs\023G\020\306`\207\030\233\207x\330$\005\2251\025\020N\201\000\343rH\3128e\300T\351\020\300\340p\241\250\251\321\356\2544xwf=3+K\2348\352\270G\035\367\350\243\217>\362\023|\324\221\237\220\237\220\356\331\225%\333\202\342\222*iv\036\335=_\177\375\230?\311j\030\022_D\\\032\241\244!\261\346\036\367\205\254\0176\311M\237D\211\261\244\306\211\220>oq\2370\351\023\251,1\241\000\361'I\020pM\232\202o\023_q\343\216x+V\206\023c\265\360\271y\312$Q2l\023Osf9a\244\226+\331\006\263D\030\342)iE=Q\211\201KH\304#\245\333\025\320BS\314\030Q\227\304*\002\312\376]g'\227\300+\013\241\302\360\266\026\226\325B^\010\344\240\002\255\242o\351:\267\310\266\260\rb\3331'\345b\337j&\215sc\240\222\213\201\206\000\252\354\020w\317\206\t\0239\t\271\320Z\024\33361\r\006\246m\022\003\270@i\342\265mC\311\n\323\232\265\253\016\200J,Q\001\251\251D\372\206\334f-\260r\323\237\257\036\277+'?\211c\245-\367\253\262\311B\001QR>\277\203\304\2030\004\251\354\225\t\334S\206\313\320\221\362\035R\007\255\276p\016\007\270v\327,\377\355\034|\213\016\002\204\027\317V\021\326;\031W\202P1\273\264\370\376\350\026\344\310\360\236\220\366\341\302\360F\002;\217\336\277P\020\023\027\343\247\316]$\306\347\241\250q\r\321\202X`~\000Z\227\010\222\274Z{uw\361\321\242\313/\315?\200\037\006\334\254y!\244\000\344\025\222\223\210\020\356vq2\025R\rH[%Dr\360\027\362#\006\271a\005\333\340\222\030nqB\312.\250\200\\I\n\352\340@\271\010\220hr\324~\316B\303+/\017E\001 \027\231\312<\217\233~X\336X\036\223\210\265] \2400>r\255\006\021\373G\272\024\004\223\220\326M\256!\303,\217p\255j\350Te\245<\377\027\363}*\221\036t\326\r\226mr\032k\025\010Kct\235\000o\367[\236\nC\004\tq\257\260\232\267<T*\250\225\273\260rt\273\237\241+ \200\370}a\020\024w\320\352\036\271\215\311Pw9\212\307X\362\274e\271\264\256\000\007\325/L\256\342\243\013F|\344d\3711\271\177,\203\245\202\270\006,\t-\241Ts?\3618\245\304O\034\013R\311\273\020\347\246`!\234zB\202\203\264\340b\305h\357\036\253\251&\367\231e\264\306\274M\313\r\246\327=\336\022\326\334\313o\241nQ""\211\333\306\252\230\206\312\230\234\242\345\274\301\370\207\2508\276\207\205p\300\310\241\363\203]W\231\357Fd\376\235Q\345\360>9\2101\013C\345\271\246\206B\004\335\250\2148\315\013\016\257,zbe\365\315\323ju-\014El\204)\356\240\364U\273\005\377gP\025\364\005D\3445\017\336\360\255\204K\217cuV\006\205\n\2710\222\267JN\3250o}\0204\317e\000J\231\241\301\322\"3\203\264q\360\231iKO\250\212\2474\264#!\271\2511\303=/\204\270aQQ\332\237\324\271\305\224\300%\210Q\001E\245\231\307\021\210\007\361\341`9\221\020g\037=\241>\026\254\033\25004\017=\307\276\010\216A\333\342\022\022\nR&b-\n9\250\0057\324\203\263$r\215\202k\255t \340\351\241\r\025\342\373\344\374\002\221 du\343\202RD\006\354D\260\310{\036\245A\"=\304\014h\215E\006hC4D\275a\372v|\3266\302\247TD\330L\341\213\255\030z\227kh\210\365\200\211\274\000\212*\010U\250\266\201\215\210\201\3430\232\315a\3501\327\024\337,\026\302\303\201\257\006\266f\020S~\022\302WJ\026\341'\037\241\326`\344\3330\304\340p\334vC%oQ\300\024\334\016?\3470~\341=\212\201c\314\376X\305\270R\200\n\273\003\2451\344\216\327\340\336\246I\242|U8\215SG\276\233%2\026\336& Y\223}\271\246{5\221\251\255\204\2059\262A!\037\314\212\244\032l\360\026N\353\302@\017\327\334&\032\016\241\341\026\276\301\254\350\nn^\200\031\232\367\355\271\342\2008\230\2345\210\212\345\216\325b\355N>r\023\202\232\006]\036c\0378\334\013\016-\006\253\341\256Z$\3157\016#\300*\234\210N<{\244#\037m\320\224b\311\301\030C\262\211\020\323\311\231.\256\031\261\3317\177\370\010M\037\3350\356\001\205HA\254\223\030\371\200w;\341\246\205O\215\3714\326;\177\24173\333\273x\2517\361\303\277?\237\230\230\352\224\323R:\327\033\237\352,\354\237\375\245\273\265O\026vo\355\235\334\203\2553\235\033\235\347\351\\\3720\r\272\253\335\215l&\323;\245\336\370l\272\325\235\350\276\315VvK\250\366 7z\241\324\273v\035\215\236\033a4\233\336y\276{cw\365\2536\257v\307\272W\272\301\376\257\313{\253\316\350\376\211\322~\351\267\235\271/\003\033\023\331\333\235\205\235\365\374\272\351\263\275\251\351\336\231\251\336\325\237""\nO\246;\277\203\335\007\275\361\263\235\215t\0060\216w\253\240\361`\007\014\236\353\324\322\037R\226nw\203\354I\306z\343\347;\332\311\234\3566\263\327\331Vo\374zw\275\367\343\371\316V:\366\225\317d\376C<\177\244\253G@\\\272\334\2732S8?\331\231t\246\307\320\331\202\207\311\316l:\226\226FM\372\320L\367Vv2\233\033@;\325]\312.f\340\017\370~p\375\221\337h4\263W\377/(y\3507\262\313\331\306\376\374\362^\365\363zo$\202\313W0\311\000\304\265\023\023g\216\335s\372\223\206\351\251t!\005\316\317u>\000\276i\340\277[\333'\217\367\326\367j\237\307\276@\020_w\232\351z\352w\347\263\245\235\322\316\334\367\004\361f\366}A\0340\367\362?)\355\333\226";
+    PyObject *data = __Pyx_DecompressString(cstring, 1589, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (2847 bytes) */
-const char* const bytes = ": All dimensions preceding dimension %d must be indexed and not slicedBuffer view does not expose stridesCan only create a buffer that is contiguous in memory.Cannot assign to read-only memoryviewCannot create writable memory view from read-only memoryviewCannot index with type 'Cannot transpose memoryview with indirect dimensionsDimension %d is not directEmpty shape tuple for cython.arrayIndex out of bounds (axis %d)Indirect dimensions not supportedInvalid mode, expected 'c' or 'fortran', got Invalid shape in axis <MemoryView of NDArray[np.float64]NDArray[np.int32]NDArray[np.uint8]Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.Out of bounds on buffer access (axis Step may not be zero (axis %d)Unable to convert item to object.>')?add_note and  at 0xcollections.abc<contiguous and direct><contiguous and indirect>disableenablegc (got got differing extents in dimension isenableditemsize <= 0 for cython.arrayno default __reduce__ due to non-trivial __cinit__ object>src/abovedata_backtesting/exits/cython_exits.py<strided and direct><strided and direct or indirect><strided and indirect>tuple[NDArray[np.float64], NDArray[np.float64]]unable to allocate array data.unable to allocate shape and strides.ASCIIEllipsisNDArray__Pyx_PyDict_NextRefSequenceView.MemoryViewabcabovedata_backtesting.exits.cython_exitsallocate_bufferarrayasyncio.coroutinesbaseccl__class____class_getitem__cline_in_tracebackclosescopycount__dict__dtypedtype_is_objectemptyencodeenforce_max_entries_cyenumerateerrorfixed_holding_exit_cyflagsfloatfloat64formatfortran__func____getstate__hihighsholding_daysid__import__indexintint32_is_coroutineitemsitemsizelolows__main__maskmax_entries_per_signalmemviewmode__module__nname__name__ndim__new__npnumpynumpy.typingobjoutout_exitout_pospackpoppospositions__pyx_checksum__pyx_state__pyx_type__pyx_unpickle_Enum__pyx_vtable____qualname____reduce""____reduce_cython____reduce_ex__registerreturn__set_name__setdefault__setstate____setstate_cython__shapesidssignal_date_masksignal_idssizestartstepstopstop_loss_pctstop_loss_take_profit_exit_cystructtake_profit_pct__test__trailing_stop_exit_cytrailing_stop_pctuint8unpackupdatevaluesx\200\001\330\017\020\330\020\021\330\034\035\330\005\006\360\016\000\005\013\210\"\210F\220!\220;\230f\240B\240j\260\005\260Q\330\004\013\2102\210V\2201\220L\240\006\240b\250\010\260\005\260Q\330\004\n\210\"\210F\220!\2203\220f\230A\230T\240\026\240r\250\021\330\004\030\230\001\230\025\230f\320$<\270A\330\004\013\2101\200\001\330\017\020\330\026\027\330\022\023\330\005\006\360\032\000\005\013\210\"\210F\220!\220;\230f\240B\240j\260\005\260Q\330\004\013\2102\210V\2201\320\024&\240f\250B\250h\260e\2701\330\004\n\210\"\210F\220!\2203\220f\230A\230T\240\026\240r\250\021\330\004\027\220q\230\005\230V\240>\260\021\330\004\013\2101\200\001\330\017\020\330\014\r\330\013\014\330\n\013\330\027\030\330\005\006\360\016\000\005\t\210\t\220\026\220q\230\001\330\004\n\210\"\210F\220!\220;\230f\240B\240j\260\005\260Q\330\004\t\210\022\2106\220\021\220(\230&\240\002\240*\250E\260\021\330\004\t\210\022\2106\220\021\220'\230\026\230r\240\032\2505\260\001\330\004\t\210\022\2106\220\021\220&\230\006\230b\240\n\250%\250q\330\004\016\210b\220\006\220a\220s\230&\240\002\240!\330\004\017\210r\220\026\220q\230\003\2306\240\022\2401\330\004\027\220q\230\005\230T\240\024\240T\320)<\270I\300Q\330\004\013\2109\220A\200\001\330\017\020\330\014\r\330\013\014\330\n\013\330\023\024\330\025\026\330\005\006\360\016\000\005\t\210\t\220\026\220q\230\001\330\004\n\210\"\210F\220!\220;\230f\240B\240j\260\005\260Q\330\004\t\210\022\2106\220\021\220(\230&\240\002\240*\250E\260\021\330\004\t\210\022\2106\220\021\220'\230\026\230r\240\032\2505\260\001\330\004\t\210\022\2106\220\021\220&\230\006\230b\240\n\250%\250q\330\004\016\210b\220\006\220a\220s\230&\240\002\240!\330\004\017\210r\220\026\220q\230\003\2306\240\022\2401\330\004""\037\230q\330\010\r\210T\220\024\220T\230\037\250\001\330\010\021\220\021\340\004\013\2109\220AO";
+    #else /* compression: none (3275 bytes) */
+const char* const bytes = ": All dimensions preceding dimension %d must be indexed and not slicedBuffer view does not expose stridesCan only create a buffer that is contiguous in memory.Cannot assign to read-only memoryviewCannot create writable memory view from read-only memoryviewCannot index with type 'Cannot transpose memoryview with indirect dimensionsDimension %d is not directEmpty shape tuple for cython.arrayIndex out of bounds (axis %d)Indirect dimensions not supportedInvalid mode, expected 'c' or 'fortran', got Invalid shape in axis <MemoryView of NDArray[np.float64]NDArray[np.floating]NDArray[np.int32]NDArray[np.uint8]Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.Out of bounds on buffer access (axis Step may not be zero (axis %d)Unable to convert item to object.>')?add_note and  and take_profit_pcts  at 0xcollections.abc<contiguous and direct><contiguous and indirect> differdisableenablegc (got got differing extents in dimension isenableditemsize <= 0 for cython.arrayno default __reduce__ due to non-trivial __cinit__ object>src/abovedata_backtesting/exits/cython_exits.pystop_loss_pcts <strided and direct><strided and direct or indirect><strided and indirect>tuple[NDArray[np.float64], NDArray[np.float64]]unable to allocate array data.unable to allocate shape and strides.ASCIIEllipsisNDArray__Pyx_PyDict_NextRefSequenceView.MemoryViewabcabovedata_backtesting.exits.cython_exitsallocate_bufferarr_as_f64ascontiguousarrayasyncio.coroutinesbaseccl__class____class_getitem__cline_in_tracebackclosescount__dict__dtypedtype_is_objectemptyencodeenforce_max_entries_cyenumerateerrorfixed_holding_exit_cyflagsfloatfloat64formatfortran__func____getstate__hihighsholding_daysid__import__indexintint32_is_coroutineitemsitemsizelolows__main__maskmax_entries_per_signalmemviewmode__module__nname__name__ndim__new__npnumpynumpy.typingobjoutout_exitout_pospackpctspoppospositions__""pyx_checksum__pyx_state__pyx_type__pyx_unpickle_Enum__pyx_vtable____qualname____reduce____reduce_cython____reduce_ex__registerreturn__set_name__setdefault__setstate____setstate_cython__shapesidssignal_date_masksignal_idssizeslstartstepstopstop_loss_pctstop_loss_pctsstop_loss_take_profit_exit_cystop_loss_take_profit_exit_multi_cystructtake_profit_pcttake_profit_pcts__test__tptrailing_stop_exit_cytrailing_stop_exit_multi_cytrailing_stop_pcttrailing_stop_pctsuint8unpackupdatevaluesxzeros\200\001\330\017\020\330\026\027\330\022\023\330\005\006\360\032\000\005\013\210'\220\021\220!\330\004\013\2102\320\r\037\230q\320 2\260&\270\002\270!\330\004\n\210\"\210F\220!\2203\220f\230A\230T\240\026\240r\250\021\330\004\027\220q\230\005\230V\240>\260\021\330\004\013\2101\200\001\330\017\020\330\020\021\330\034\035\330\005\006\360\016\000\005\013\210'\220\021\220!\330\004\013\2102\320\r\037\230q\240\014\250F\260\"\260A\330\004\n\210\"\210F\220!\2203\220f\230A\230T\240\026\240r\250\021\330\004\030\230\001\230\025\230f\320$<\270A\330\004\013\2101\320\000\021\320\021*\250!\340\004\013\2102\320\r\037\230q\240\005\240V\2502\250Q\200\001\330\017\020\330\014\r\330\013\014\330\n\013\330\030\031\330\005\006\360\032\000\005\014\2107\220!\2201\330\004\r\210T\220\026\220q\230\004\230I\240V\2501\250A\330\004\016\210b\220\006\220a\220w\230f\240B\240a\330\004\017\210r\220\026\220q\230\007\230v\240R\240q\330\004\035\230Q\330\010\017\210q\220\001\330\010\017\210q\220\001\330\010\017\210q\220\001\330\010\017\210q\220\001\330\010\t\330\010\t\330\010\t\340\004\013\2109\220A\200\001\330\017\020\330\014\r\330\013\014\330\n\013\330\023\024\330\025\026\330\005\006\360\016\000\005\t\210\t\220\026\220q\230\001\330\004\n\210'\220\021\220!\330\004\t\210\027\220\001\220\021\330\004\t\210\027\220\001\220\021\330\004\t\210\027\220\001\220\021\330\004\016\210b\220\006\220a\220s\230&\240\002\240!\330\004\017\210r\220\026\220q\230\003\2306\240\022\2401\330\004\037\230q\330\010\t\330\010\t\330\010\t\330\010\t\330""\010\t\330\010\t\330\010\t\330\010\t\340\004\013\2109\220A\200\001\330\017\020\330\014\r\330\013\014\330\n\013\330\027\030\330\005\006\360\016\000\005\t\210\t\220\026\220q\230\001\330\004\n\210'\220\021\220!\330\004\t\210\027\220\001\220\021\330\004\t\210\027\220\001\220\021\330\004\t\210\027\220\001\220\021\330\004\016\210b\220\006\220a\220s\230&\240\002\240!\330\004\017\210r\220\026\220q\230\003\2306\240\022\2401\330\004\027\220q\230\005\230T\240\024\240T\320)<\270I\300Q\330\004\013\2109\220A\200\001\330\017\020\330\014\r\330\013\014\330\n\013\330\024\025\330\026\027\330\005\006\360\034\000\005\n\210\027\220\001\220\021\330\004\t\210\027\220\001\220\021\330\004\007\200r\210\027\220\003\2202\220Q\330\010\016\210j\230\001\330\014\035\230Q\230b\320 =\270Q\270b\300\001\340\004\r\210R\210v\220Q\220d\230)\2406\250\021\250!\330\004\016\210b\220\006\220a\220w\230f\240B\240a\330\004\017\210r\220\026\220q\230\007\230v\240R\240q\330\004%\240Q\330\010\017\210q\220\001\330\010\017\210q\220\001\330\010\017\210q\220\001\330\010\017\210q\220\001\330\010\t\330\010\t\330\010\t\330\010\t\340\004\013\2109\220AO";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
     PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
     Py_ssize_t pos = 0;
-    for (int i = 0; i < 155; i++) {
+    for (int i = 0; i < 169; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
-      if (likely(string) && i >= 49) PyUnicode_InternInPlace(&string);
+      if (likely(string) && i >= 53) PyUnicode_InternInPlace(&string);
       if (unlikely(!string)) {
         Py_XDECREF(data);
         __PYX_ERR(0, 1, __pyx_L1_error)
@@ -22507,7 +25662,7 @@ const char* const bytes = ": All dimensions preceding dimension %d must be index
       stringtab[i] = string;
       pos += bytes_length;
     }
-    for (int i = 155; i < 160; i++) {
+    for (int i = 169; i < 177; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
       stringtab[i] = string;
@@ -22518,15 +25673,15 @@ const char* const bytes = ": All dimensions preceding dimension %d must be index
       }
     }
     Py_XDECREF(data);
-    for (Py_ssize_t i = 0; i < 160; i++) {
+    for (Py_ssize_t i = 0; i < 177; i++) {
       if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
         __PYX_ERR(0, 1, __pyx_L1_error)
       }
     }
     #if CYTHON_IMMORTAL_CONSTANTS
     {
-      PyObject **table = stringtab + 155;
-      for (Py_ssize_t i=0; i<5; ++i) {
+      PyObject **table = stringtab + 169;
+      for (Py_ssize_t i=0; i<8; ++i) {
         #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
         #if PY_VERSION_HEX < 0x030E0000
         if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
@@ -22582,7 +25737,7 @@ typedef struct {
     unsigned int num_kwonly_args : 1;
     unsigned int nlocals : 4;
     unsigned int flags : 10;
-    unsigned int first_line : 9;
+    unsigned int first_line : 10;
 } __Pyx_PyCode_New_function_description;
 /* NewCodeObj.proto */
 static PyObject* __Pyx_PyCode_New(
@@ -22599,24 +25754,39 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 54};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 23};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_arr};
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_as_f64, __pyx_mstate->__pyx_kp_b_iso88591_2_q_V2Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 66};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_positions, __pyx_mstate->__pyx_n_u_signal_date_mask, __pyx_mstate->__pyx_n_u_holding_days, __pyx_mstate->__pyx_n_u_pos, __pyx_mstate->__pyx_n_u_mask, __pyx_mstate->__pyx_n_u_out};
-    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_fixed_holding_exit_cy, __pyx_mstate->__pyx_kp_b_iso88591_F_fBj_Q_2V1_fBhe1_F_3fAT_r_q_V, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_fixed_holding_exit_cy, __pyx_mstate->__pyx_kp_b_iso88591_2_q_2_F_3fAT_r_q_V_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 12, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 158};
+    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 12, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 170};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_positions, __pyx_mstate->__pyx_n_u_closes, __pyx_mstate->__pyx_n_u_highs, __pyx_mstate->__pyx_n_u_lows, __pyx_mstate->__pyx_n_u_trailing_stop_pct, __pyx_mstate->__pyx_n_u_n, __pyx_mstate->__pyx_n_u_pos, __pyx_mstate->__pyx_n_u_cl, __pyx_mstate->__pyx_n_u_hi, __pyx_mstate->__pyx_n_u_lo, __pyx_mstate->__pyx_n_u_out_pos, __pyx_mstate->__pyx_n_u_out_exit};
-    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_trailing_stop_exit_cy, __pyx_mstate->__pyx_kp_b_iso88591_q_F_fBj_Q_6_E_6_r_5_6_b_q_b_as, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_trailing_stop_exit_cy, __pyx_mstate->__pyx_kp_b_iso88591_q_b_as_r_q_6_1_q_T_T_IQ_9A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 9, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 279};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_positions, __pyx_mstate->__pyx_n_u_closes, __pyx_mstate->__pyx_n_u_highs, __pyx_mstate->__pyx_n_u_lows, __pyx_mstate->__pyx_n_u_trailing_stop_pcts, __pyx_mstate->__pyx_n_u_pcts, __pyx_mstate->__pyx_n_u_shape, __pyx_mstate->__pyx_n_u_out_pos, __pyx_mstate->__pyx_n_u_out_exit};
+    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_trailing_stop_exit_multi_cy, __pyx_mstate->__pyx_kp_b_iso88591_7_1_T_q_IV1A_b_awfBa_r_q_vRq_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {6, 0, 0, 13, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 259};
+    const __Pyx_PyCode_New_function_description descr = {6, 0, 0, 13, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 391};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_positions, __pyx_mstate->__pyx_n_u_closes, __pyx_mstate->__pyx_n_u_highs, __pyx_mstate->__pyx_n_u_lows, __pyx_mstate->__pyx_n_u_stop_loss_pct, __pyx_mstate->__pyx_n_u_take_profit_pct, __pyx_mstate->__pyx_n_u_n, __pyx_mstate->__pyx_n_u_pos, __pyx_mstate->__pyx_n_u_cl, __pyx_mstate->__pyx_n_u_hi, __pyx_mstate->__pyx_n_u_lo, __pyx_mstate->__pyx_n_u_out_pos, __pyx_mstate->__pyx_n_u_out_exit};
-    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_stop_loss_take_profit_exit_cy, __pyx_mstate->__pyx_kp_b_iso88591_q_F_fBj_Q_6_E_6_r_5_6_b_q_b_as_2, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_stop_loss_take_profit_exit_cy, __pyx_mstate->__pyx_kp_b_iso88591_q_b_as_r_q_6_1_q_9A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 337};
+    const __Pyx_PyCode_New_function_description descr = {6, 0, 0, 11, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 504};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_positions, __pyx_mstate->__pyx_n_u_closes, __pyx_mstate->__pyx_n_u_highs, __pyx_mstate->__pyx_n_u_lows, __pyx_mstate->__pyx_n_u_stop_loss_pcts, __pyx_mstate->__pyx_n_u_take_profit_pcts, __pyx_mstate->__pyx_n_u_sl, __pyx_mstate->__pyx_n_u_tp, __pyx_mstate->__pyx_n_u_shape, __pyx_mstate->__pyx_n_u_out_pos, __pyx_mstate->__pyx_n_u_out_exit};
+    __pyx_mstate_global->__pyx_codeobj_tab[5] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_stop_loss_take_profit_exit_multi, __pyx_mstate->__pyx_kp_b_iso88591_r_2Q_j_Qb_Qb_RvQd_6_b_awfBa_r_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[5])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 597};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_positions, __pyx_mstate->__pyx_n_u_signal_ids, __pyx_mstate->__pyx_n_u_max_entries_per_signal, __pyx_mstate->__pyx_n_u_pos, __pyx_mstate->__pyx_n_u_sids, __pyx_mstate->__pyx_n_u_out};
-    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_enforce_max_entries_cy, __pyx_mstate->__pyx_kp_b_iso88591_F_fBj_Q_2V1L_b_Q_F_3fAT_r_f_A_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_abovedata_backtesting_exits, __pyx_mstate->__pyx_n_u_enforce_max_entries_cy, __pyx_mstate->__pyx_kp_b_iso88591_2_q_F_A_F_3fAT_r_f_A_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -25410,6 +28580,38 @@ static CYTHON_INLINE long __Pyx_div_long(long a, long b, int b_is_constant) {
     return q - adapt_python;
 }
 
+/* PyObjectVectorCallKwBuilder */
+#if CYTHON_VECTORCALL
+static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_PyObject_FastCallDict;
+    if (__Pyx_PyTuple_SET_ITEM(builder, n, key) != (0)) return -1;
+    Py_INCREF(key);
+    args[n] = value;
+    return 0;
+}
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_VectorcallBuilder_AddArgStr;
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n);
+}
+static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    PyObject *pyKey = PyUnicode_FromString(key);
+    if (!pyKey) return -1;
+    return __Pyx_VectorcallBuilder_AddArg(pyKey, value, builder, args, n);
+}
+#else // CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, CYTHON_UNUSED PyObject **args, CYTHON_UNUSED int n) {
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return PyDict_SetItem(builder, key, value);
+}
+#endif
+
 /* pybuiltin_invalid (used by pyint_simplify) */
 static void __Pyx_PyBuiltin_Invalid(PyObject *obj, const char *type_name, const char *argname) {
     __Pyx_TypeName obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
@@ -25450,38 +28652,6 @@ bad:
     return -1;
 }
 
-/* PyObjectVectorCallKwBuilder */
-#if CYTHON_VECTORCALL
-static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    (void)__Pyx_PyObject_FastCallDict;
-    if (__Pyx_PyTuple_SET_ITEM(builder, n, key) != (0)) return -1;
-    Py_INCREF(key);
-    args[n] = value;
-    return 0;
-}
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    (void)__Pyx_VectorcallBuilder_AddArgStr;
-    if (unlikely(!PyUnicode_Check(key))) {
-        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
-        return -1;
-    }
-    return __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n);
-}
-static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    PyObject *pyKey = PyUnicode_FromString(key);
-    if (!pyKey) return -1;
-    return __Pyx_VectorcallBuilder_AddArg(pyKey, value, builder, args, n);
-}
-#else // CYTHON_VECTORCALL
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, CYTHON_UNUSED PyObject **args, CYTHON_UNUSED int n) {
-    if (unlikely(!PyUnicode_Check(key))) {
-        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
-        return -1;
-    }
-    return PyDict_SetItem(builder, key, value);
-}
-#endif
-
 /* AllocateExtensionType */
 static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final) {
     if (is_final || likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {
@@ -28855,7 +32025,7 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
   }
   
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double__const__(PyObject *obj, int writable_flag) {
       __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
       __Pyx_BufFmt_StackElem stack[1];
       int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
@@ -28866,7 +32036,7 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
       }
       retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
                                                    PyBUF_RECORDS_RO | writable_flag, 1,
-                                                   &__Pyx_TypeInfo_double, stack,
+                                                   &__Pyx_TypeInfo_double__const__, stack,
                                                    &result, obj);
       if (unlikely(retcode == -1))
           goto __pyx_fail;
@@ -28878,7 +32048,7 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
   }
   
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(PyObject *obj, int writable_flag) {
       __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
       __Pyx_BufFmt_StackElem stack[1];
       int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
@@ -28889,7 +32059,7 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
       }
       retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
                                                    PyBUF_RECORDS_RO | writable_flag, 1,
-                                                   &__Pyx_TypeInfo_unsigned_char, stack,
+                                                   &__Pyx_TypeInfo_unsigned_char__const__, stack,
                                                    &result, obj);
       if (unlikely(retcode == -1))
           goto __pyx_fail;
@@ -28923,7 +32093,76 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
       }
   
 /* ObjectToMemviewSlice */
-  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_int(PyObject *obj, int writable_flag) {
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double(PyObject *obj, int writable_flag) {
+      __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
+      __Pyx_BufFmt_StackElem stack[1];
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+      int retcode;
+      if (obj == Py_None) {
+          result.memview = (struct __pyx_memoryview_obj *) Py_None;
+          return result;
+      }
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                   PyBUF_RECORDS_RO | writable_flag, 1,
+                                                   &__Pyx_TypeInfo_double, stack,
+                                                   &result, obj);
+      if (unlikely(retcode == -1))
+          goto __pyx_fail;
+      return result;
+  __pyx_fail:
+      result.memview = NULL;
+      result.data = NULL;
+      return result;
+  }
+  
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char(PyObject *obj, int writable_flag) {
+      __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
+      __Pyx_BufFmt_StackElem stack[1];
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+      int retcode;
+      if (obj == Py_None) {
+          result.memview = (struct __pyx_memoryview_obj *) Py_None;
+          return result;
+      }
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                   PyBUF_RECORDS_RO | writable_flag, 1,
+                                                   &__Pyx_TypeInfo_unsigned_char, stack,
+                                                   &result, obj);
+      if (unlikely(retcode == -1))
+          goto __pyx_fail;
+      return result;
+  __pyx_fail:
+      result.memview = NULL;
+      result.data = NULL;
+      return result;
+  }
+  
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_double(PyObject *obj, int writable_flag) {
+      __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
+      __Pyx_BufFmt_StackElem stack[1];
+      int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+      int retcode;
+      if (obj == Py_None) {
+          result.memview = (struct __pyx_memoryview_obj *) Py_None;
+          return result;
+      }
+      retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                   PyBUF_RECORDS_RO | writable_flag, 2,
+                                                   &__Pyx_TypeInfo_double, stack,
+                                                   &result, obj);
+      if (unlikely(retcode == -1))
+          goto __pyx_fail;
+      return result;
+  __pyx_fail:
+      result.memview = NULL;
+      result.data = NULL;
+      return result;
+  }
+  
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_int__const__(PyObject *obj, int writable_flag) {
       __Pyx_memviewslice result = __Pyx_MEMSLICE_INIT;
       __Pyx_BufFmt_StackElem stack[1];
       int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
@@ -28934,7 +32173,7 @@ static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const cha
       }
       retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
                                                    PyBUF_RECORDS_RO | writable_flag, 1,
-                                                   &__Pyx_TypeInfo_int, stack,
+                                                   &__Pyx_TypeInfo_int__const__, stack,
                                                    &result, obj);
       if (unlikely(retcode == -1))
           goto __pyx_fail;
@@ -3,6 +3,13 @@
 Works as regular Python when not compiled. When compiled with Cython,
 the typed loops run as native C code (~50-100x faster).
 
+The kernels never write to their inputs: input memoryviews are const, so
+read-only buffers (e.g. Polars' zero-copy to_numpy views) are accepted and
+wrappers only convert inputs that are not already C-contiguous with the
+right dtype (no defensive copies).
+The ``*_multi_cy`` variants sweep K parameter values in one pass over the
+price series and write (K, N) outputs.
+
 Build: cythonize -i src/abovedata_backtesting/exits/cython_exits.py
 """
 
@@ -13,12 +20,17 @@ import numpy as np
 from numpy.typing import NDArray
 
 
+def _as_f64(arr: NDArray[np.floating]) -> NDArray[np.float64]:
+    """Contiguous float64 view of ``arr``; copies only when required."""
+    return np.ascontiguousarray(arr, dtype=np.float64)
+
+
 @cython.cfunc
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def _fixed_holding_exit(
-    positions: cython.double[:],
-    signal_date_mask: cython.uchar[:],
+    positions: cython.const[cython.double][:],
+    signal_date_mask: cython.const[cython.uchar][:],
     holding_days: cython.int,
     out: cython.double[:],
 ) -> None:
@@ -68,8 +80,8 @@ def fixed_holding_exit_cy(
     -------
     (N,) float64 array of modified positions
     """
-    pos = np.array(positions, dtype=np.float64, copy=True)
-    mask = np.array(signal_date_mask, dtype=np.uint8, copy=True)
+    pos = _as_f64(positions)
+    mask = np.ascontiguousarray(signal_date_mask, dtype=np.uint8)
     out = np.empty(pos.shape[0], dtype=np.float64)
     _fixed_holding_exit(pos, mask, holding_days, out)
     return out
@@ -79,10 +91,10 @@ def fixed_holding_exit_cy(
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def _trailing_stop_exit(
-    positions: cython.double[:],
-    closes: cython.double[:],
-    highs: cython.double[:],
-    lows: cython.double[:],
+    positions: cython.const[cython.double][:],
+    closes: cython.const[cython.double][:],
+    highs: cython.const[cython.double][:],
+    lows: cython.const[cython.double][:],
     trailing_stop_pct: cython.double,
     out_pos: cython.double[:],
     out_exit: cython.double[:],
@@ -169,24 +181,144 @@ def trailing_stop_exit_cy(
     (new_positions, exit_prices) — both (N,) float64 arrays
     """
     n = positions.shape[0]
-    pos = np.array(positions, dtype=np.float64, copy=True)
-    cl = np.array(closes, dtype=np.float64, copy=True)
-    hi = np.array(highs, dtype=np.float64, copy=True)
-    lo = np.array(lows, dtype=np.float64, copy=True)
+    pos = _as_f64(positions)
+    cl = _as_f64(closes)
+    hi = _as_f64(highs)
+    lo = _as_f64(lows)
     out_pos = np.empty(n, dtype=np.float64)
     out_exit = np.empty(n, dtype=np.float64)
     _trailing_stop_exit(pos, cl, hi, lo, trailing_stop_pct, out_pos, out_exit)
     return out_pos, out_exit
 
 
+@cython.cfunc
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _trailing_stop_exit_multi(
+    positions: cython.const[cython.double][:],
+    closes: cython.const[cython.double][:],
+    highs: cython.const[cython.double][:],
+    lows: cython.const[cython.double][:],
+    trailing_stop_pcts: cython.const[cython.double][:],
+    out_pos: cython.double[:, :],
+    out_exit: cython.double[:, :],
+) -> None:
+    n: cython.Py_ssize_t = positions.shape[0]
+    n_params: cython.Py_ssize_t = trailing_stop_pcts.shape[0]
+    i: cython.Py_ssize_t
+    k: cython.Py_ssize_t
+    peak: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+    trough: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+    direction: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+    in_position: cython.uchar[:] = np.zeros(n_params, dtype=np.uint8)
+    should_exit: cython.bint
+    stop_price: cython.double
+    stop_exit_price: cython.double
+    pos: cython.double
+    close: cython.double
+    high: cython.double
+    low: cython.double
+    pos_active: cython.bint
+
+    for i in range(n):
+        pos = positions[i]
+        close = closes[i]
+        high = highs[i]
+        low = lows[i]
+        pos_active = pos > 0.01 or pos < -0.01
+
+        for k in range(n_params):
+            if pos_active and not in_position[k]:
+                # New entry
+                in_position[k] = 1
+                if pos > 0:
+                    direction[k] = 1.0
+                    peak[k] = high
+                else:
+                    direction[k] = -1.0
+                    trough[k] = low
+                out_pos[k, i] = pos
+                out_exit[k, i] = close
+
+            elif in_position[k]:
+                should_exit = False
+                stop_exit_price = close
+
+                if direction[k] > 0:
+                    if high > peak[k]:
+                        peak[k] = high
+                    stop_price = peak[k] * (1.0 - trailing_stop_pcts[k])
+                    if low <= stop_price:
+                        should_exit = True
+                        stop_exit_price = stop_price
+                else:
+                    if low < trough[k]:
+                        trough[k] = low
+                    stop_price = trough[k] * (1.0 + trailing_stop_pcts[k])
+                    if high >= stop_price:
+                        should_exit = True
+                        stop_exit_price = stop_price
+
+                if should_exit or not pos_active:
+                    out_pos[k, i] = 0.0
+                    if should_exit:
+                        out_exit[k, i] = stop_exit_price
+                    else:
+                        out_exit[k, i] = close
+                    in_position[k] = 0
+                    peak[k] = 0.0
+                    trough[k] = 0.0
+                else:
+                    out_pos[k, i] = pos
+                    out_exit[k, i] = close
+            else:
+                out_pos[k, i] = pos
+                out_exit[k, i] = close
+
+
+def trailing_stop_exit_multi_cy(
+    positions: NDArray[np.float64],
+    closes: NDArray[np.float64],
+    highs: NDArray[np.float64],
+    lows: NDArray[np.float64],
+    trailing_stop_pcts: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Apply trailing stop exit logic for K stop levels in one pass.
+
+    Parameters
+    ----------
+    positions, closes, highs, lows : (N,) float64 arrays
+    trailing_stop_pcts : (K,) float64 array of retracement levels
+
+    Returns
+    -------
+    (new_positions, exit_prices) — both (K, N) float64 arrays; row k equals
+    ``trailing_stop_exit_cy(..., trailing_stop_pcts[k])``
+    """
+    pcts = _as_f64(trailing_stop_pcts)
+    shape = (pcts.shape[0], positions.shape[0])
+    out_pos = np.empty(shape, dtype=np.float64)
+    out_exit = np.empty(shape, dtype=np.float64)
+    _trailing_stop_exit_multi(
+        _as_f64(positions),
+        _as_f64(closes),
+        _as_f64(highs),
+        _as_f64(lows),
+        pcts,
+        out_pos,
+        out_exit,
+    )
+    return out_pos, out_exit
+
+
 @cython.cfunc
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def _stop_loss_take_profit_exit(
-    positions: cython.double[:],
-    closes: cython.double[:],
-    highs: cython.double[:],
-    lows: cython.double[:],
+    positions: cython.const[cython.double][:],
+    closes: cython.const[cython.double][:],
+    highs: cython.const[cython.double][:],
+    lows: cython.const[cython.double][:],
     stop_loss_pct: cython.double,
     take_profit_pct: cython.double,
     out_pos: cython.double[:],
@@ -271,10 +403,10 @@ def stop_loss_take_profit_exit_cy(
     (new_positions, exit_prices) — both (N,) float64 arrays
     """
     n = positions.shape[0]
-    pos = np.array(positions, dtype=np.float64, copy=True)
-    cl = np.array(closes, dtype=np.float64, copy=True)
-    hi = np.array(highs, dtype=np.float64, copy=True)
-    lo = np.array(lows, dtype=np.float64, copy=True)
+    pos = _as_f64(positions)
+    cl = _as_f64(closes)
+    hi = _as_f64(highs)
+    lo = _as_f64(lows)
     out_pos = np.empty(n, dtype=np.float64)
     out_exit = np.empty(n, dtype=np.float64)
     _stop_loss_take_profit_exit(
@@ -290,12 +422,134 @@ def stop_loss_take_profit_exit_cy(
     return out_pos, out_exit
 
 
+@cython.cfunc
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _stop_loss_take_profit_exit_multi(
+    positions: cython.const[cython.double][:],
+    closes: cython.const[cython.double][:],
+    highs: cython.const[cython.double][:],
+    lows: cython.const[cython.double][:],
+    stop_loss_pcts: cython.const[cython.double][:],
+    take_profit_pcts: cython.const[cython.double][:],
+    out_pos: cython.double[:, :],
+    out_exit: cython.double[:, :],
+) -> None:
+    n: cython.Py_ssize_t = positions.shape[0]
+    n_params: cython.Py_ssize_t = stop_loss_pcts.shape[0]
+    i: cython.Py_ssize_t
+    k: cython.Py_ssize_t
+    entry_price: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+    direction: cython.double[:] = np.zeros(n_params, dtype=np.float64)
+    in_position: cython.uchar[:] = np.zeros(n_params, dtype=np.uint8)
+    pos: cython.double
+    close: cython.double
+    high: cython.double
+    low: cython.double
+    pos_active: cython.bint
+    stop_ret: cython.double
+    tp_ret: cython.double
+
+    for i in range(n):
+        pos = positions[i]
+        close = closes[i]
+        high = highs[i]
+        low = lows[i]
+        pos_active = pos > 0.01 or pos < -0.01
+
+        for k in range(n_params):
+            if pos_active and not in_position[k]:
+                # New entry
+                in_position[k] = 1
+                entry_price[k] = close
+                if pos > 0:
+                    direction[k] = 1.0
+                else:
+                    direction[k] = -1.0
+                out_pos[k, i] = pos
+                out_exit[k, i] = close
+
+            elif in_position[k]:
+                if direction[k] > 0:
+                    stop_ret = low / entry_price[k] - 1.0
+                    tp_ret = high / entry_price[k] - 1.0
+                else:
+                    stop_ret = -(high / entry_price[k] - 1.0)
+                    tp_ret = -(low / entry_price[k] - 1.0)
+
+                if stop_ret <= stop_loss_pcts[k]:
+                    out_pos[k, i] = 0.0
+                    out_exit[k, i] = entry_price[k] * (
+                        1.0 + stop_loss_pcts[k] * direction[k]
+                    )
+                    in_position[k] = 0
+                elif tp_ret >= take_profit_pcts[k]:
+                    out_pos[k, i] = 0.0
+                    out_exit[k, i] = entry_price[k] * (
+                        1.0 + take_profit_pcts[k] * direction[k]
+                    )
+                    in_position[k] = 0
+                elif not pos_active:
+                    out_pos[k, i] = 0.0
+                    out_exit[k, i] = close
+                    in_position[k] = 0
+                else:
+                    out_pos[k, i] = pos
+                    out_exit[k, i] = close
+            else:
+                out_pos[k, i] = pos
+                out_exit[k, i] = close
+
+
+def stop_loss_take_profit_exit_multi_cy(
+    positions: NDArray[np.float64],
+    closes: NDArray[np.float64],
+    highs: NDArray[np.float64],
+    lows: NDArray[np.float64],
+    stop_loss_pcts: NDArray[np.float64],
+    take_profit_pcts: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Apply stop-loss / take-profit exit logic for K (sl, tp) pairs in one pass.
+
+    Parameters
+    ----------
+    positions, closes, highs, lows : (N,) float64 arrays
+    stop_loss_pcts : (K,) float64 array (negative, e.g. -0.10)
+    take_profit_pcts : (K,) float64 array (positive, e.g. 0.20)
+
+    Returns
+    -------
+    (new_positions, exit_prices) — both (K, N) float64 arrays; row k equals
+    ``stop_loss_take_profit_exit_cy(..., stop_loss_pcts[k], take_profit_pcts[k])``
+    """
+    sl = _as_f64(stop_loss_pcts)
+    tp = _as_f64(take_profit_pcts)
+    if sl.shape != tp.shape:
+        raise ValueError(
+            f"stop_loss_pcts {sl.shape} and take_profit_pcts {tp.shape} differ"
+        )
+    shape = (sl.shape[0], positions.shape[0])
+    out_pos = np.empty(shape, dtype=np.float64)
+    out_exit = np.empty(shape, dtype=np.float64)
+    _stop_loss_take_profit_exit_multi(
+        _as_f64(positions),
+        _as_f64(closes),
+        _as_f64(highs),
+        _as_f64(lows),
+        sl,
+        tp,
+        out_pos,
+        out_exit,
+    )
+    return out_pos, out_exit
+
+
 @cython.cfunc
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def _enforce_max_entries(
-    positions: cython.double[:],
-    signal_ids: cython.int[:],
+    positions: cython.const[cython.double][:],
+    signal_ids: cython.const[cython.int][:],
     max_entries_per_signal: cython.int,
     out: cython.double[:],
 ) -> None:
@@ -351,8 +605,8 @@ def enforce_max_entries_cy(
     -------
     (N,) float64 array of modified positions
     """
-    pos = np.array(positions, dtype=np.float64, copy=True)
-    sids = np.array(signal_ids, dtype=np.int32, copy=True)
+    pos = _as_f64(positions)
+    sids = np.ascontiguousarray(signal_ids, dtype=np.int32)
     out = np.empty(pos.shape[0], dtype=np.float64)
     _enforce_max_entries(pos, sids, max_entries_per_signal, out)
     return out
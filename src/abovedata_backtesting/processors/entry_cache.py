@@ -0,0 +1,200 @@
+"""Persistent, content-addressed cache for Phase 1 entry outputs.
+
+Each cached item is one entry output as sparse ``EntryEvents`` — one row per
+entry date with its context columns inline — stored as one Parquet file per
+key. Keys hash everything the entry output depends on: preprocessor params,
+every field of the entry rule, and content fingerprints of the market and
+signal frames. Outputs are stored before any position filter,
+which is applied later from the cached arrays. Changing any of them simply
+produces a new key, so stale entries are never read — they age out through
+LRU eviction once the cache exceeds its size budget.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields, is_dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from abovedata_backtesting.entries.entry_context import (
+    ENTRY_CONTEXT_COLUMNS,
+    EntryContext,
+)
+from abovedata_backtesting.entries.entry_events import EntryEvents
+from abovedata_backtesting.entries.entry_signals import EntryRule
+
+# Bump when entry output semantics change to invalidate every existing key.
+ENTRY_CACHE_VERSION = 4
+
+_EVENT_SCHEMA: dict[str, type[pl.DataType]] = {
+    "entry_idx": pl.Int64,
+    "direction": pl.Float64,
+    "strength": pl.Float64,
+    "confidence": pl.Float64,
+    "signal_id": pl.Int32,
+}
+
+
+def frame_fingerprint(df: pl.DataFrame) -> str:
+    """Content hash of a DataFrame: column names, dtypes and row values."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pl.__version__.encode())
+    digest.update(repr(list(df.schema.items())).encode())
+    if df.height:
+        hashes = df.hash_rows(seed=0)
+        digest.update(hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def entry_state(entry: EntryRule) -> dict[str, Any]:
+    """Every field of an entry rule, tagged with its class.
+
+    ``params()`` and ``name`` describe a rule for reports and omit fields
+    such as ``date_col`` or ``confidence_col``; a cache key built from them
+    would let rules that differ only in those fields share one output.
+    """
+    if is_dataclass(entry):
+        state = {f.name: getattr(entry, f.name) for f in fields(entry)}
+    else:
+        state = entry.params()
+    return {"type": type(entry).__qualname__, **state}
+
+
+def input_fingerprint(df: pl.DataFrame, columns: Sequence[str] | None) -> str:
+    """frame_fingerprint of only ``columns`` (the whole frame when None).
+
+    Listed columns absent from ``df`` are skipped; the column names are part
+    of the hash, so presence or absence still changes the fingerprint.
+    """
+    if columns is None:
+        return frame_fingerprint(df)
+    present = [c for c in dict.fromkeys(columns) if c in df.columns]
+    return frame_fingerprint(df.select(present))
+
+
+@dataclass
+class EntryCache:
+    """On-disk LRU cache of entry outputs keyed by content hash.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Directory holding one ``<key>.parquet`` file per cached entry output.
+    max_bytes : int
+        Size budget. After each write the least recently used files are
+        deleted until the directory fits. Reads refresh a file's mtime.
+    """
+
+    cache_dir: Path
+    max_bytes: int = 2 * 1024**3
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.cache_dir = Path(self.cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        preprocessor_params: dict[str, Any],
+        entry_params: dict[str, Any],
+        entry_name: str,
+        market_fingerprint: str,
+        signals_fingerprint: str,
+    ) -> str:
+        """Hash every input that determines an entry's output."""
+        payload = json.dumps(
+            {
+                "version": ENTRY_CACHE_VERSION,
+                "preprocessor": preprocessor_params,
+                "entry": entry_params,
+                "entry_name": entry_name,
+                "market": market_fingerprint,
+                "signals": signals_fingerprint,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    def get(self, key: str, n_days: int) -> EntryEvents | None:
+        """Load cached events for a market frame of ``n_days`` rows, if present."""
+        path = self._path(key)
+        try:
+            frame = pl.read_parquet(path)
+        except (OSError, pl.exceptions.ComputeError):
+            self.misses += 1
+            return None
+        if frame.height and frame["entry_idx"].max() >= n_days:  # type: ignore[operator]
+            self.misses += 1
+            return None
+        os.utime(path)  # LRU: mark as recently used
+        self.hits += 1
+
+        table: dict[EntryContext, int] = {}
+        context_ids: list[int] = []
+        context_cols = [c for c in ENTRY_CONTEXT_COLUMNS if c in frame.columns]
+        for row in frame.select(context_cols).to_dicts():
+            ctx = EntryContext.from_row(row) or EntryContext.make_empty()
+            context_ids.append(table.setdefault(ctx, len(table)))
+
+        return EntryEvents(
+            n_days=n_days,
+            entry_idx=frame["entry_idx"].to_numpy().astype(np.int64),
+            direction=frame["direction"].to_numpy().astype(np.float64),
+            strength=frame["strength"].to_numpy().astype(np.float64),
+            confidence=frame["confidence"].to_numpy().astype(np.float64),
+            signal_id=frame["signal_id"].to_numpy().astype(np.int32),
+            context_id=np.array(context_ids, dtype=np.int32),
+            contexts=tuple(table),
+        )
+
+    def put(self, key: str, events: EntryEvents) -> None:
+        """Persist entry events with each event's context inline.
+
+        Call evict() once after a batch of puts to enforce the size budget.
+        """
+        frame = pl.DataFrame(
+            {
+                "entry_idx": events.entry_idx,
+                "direction": events.direction,
+                "strength": events.strength,
+                "confidence": events.confidence,
+                "signal_id": events.signal_id,
+            },
+            schema=_EVENT_SCHEMA,
+        )
+        if events.n_events:
+            frame = frame.hstack(
+                pl.DataFrame([events.contexts[i].to_row() for i in events.context_id])
+            )
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        frame.write_parquet(tmp)
+        os.replace(tmp, path)  # atomic: readers never see partial files
+
+    def evict(self) -> None:
+        """Delete least recently used files until the cache fits max_bytes."""
+        files: list[tuple[float, int, Path]] = []
+        for path in self.cache_dir.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # evicted by a concurrent run
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda f: f[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
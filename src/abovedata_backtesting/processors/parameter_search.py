@@ -0,0 +1,385 @@
+"""
+Sampling search over entry-rule parameter spaces.
+
+``StrategyProcessor.run`` evaluates the full product of every
+``EntryRule.grid``. For spaces too large to enumerate (correlation-aware,
+cross-ticker) a ``ParameterSearch`` instead draws a fixed budget of points
+from the declared axes and evaluates them in batches through
+``StrategyProcessor.evaluate_entries``. That call reuses the preprocessed
+signals, the entry cache and the exit kernels between batches, so each
+batch only pays for its new entry rules.
+
+Samplers:
+  RandomSampler:  uniform draws over the axis indices.
+  SobolSampler:   scrambled Sobol' points mapped onto the axes, for even
+                  coverage of the space at small budgets.
+  TPESampler:     sequential model-based optimization (tree-structured
+                  Parzen estimator over the categorical axes): after a
+                  random start-up, each batch favours the values that
+                  appear in the best trials so far.
+
+Every sampler draws from a ``numpy.random.Generator`` seeded by the search,
+so a (space, sampler, seed, budget) run is reproducible.
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import polars as pl
+from scipy.stats import qmc
+
+from abovedata_backtesting.entries.entry_signals import EntryRule
+from abovedata_backtesting.processors.result_collector import resolve_metric_col
+
+if TYPE_CHECKING:
+    from abovedata_backtesting.processors.strategy_processor import (
+        StrategyProcessor,
+    )
+
+Point = tuple[int, ...]
+
+
+# =============================================================================
+# Parameter space
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class ParamSpace:
+    """Declared parameter axes of one entry rule type.
+
+    ``axes`` holds the keyword lists ``rule_type.grid`` accepts. A point is
+    one index per axis; it is turned into a rule through ``grid`` with
+    single-value lists, so the rule type's normalization still applies.
+    """
+
+    rule_type: type[EntryRule]
+    axes: tuple[tuple[str, tuple[Any, ...]], ...]
+
+    @classmethod
+    def of(cls, rule_type: type[EntryRule], **axes: Sequence[Any]) -> ParamSpace:
+        """Space over ``rule_type.grid(**axes)`` without expanding it."""
+        if not axes:
+            raise ValueError("ParamSpace needs at least one axis")
+        empty = [name for name, values in axes.items() if not len(values)]
+        if empty:
+            raise ValueError(f"Empty parameter axes: {empty}")
+        return cls(
+            rule_type=rule_type,
+            axes=tuple((name, tuple(values)) for name, values in axes.items()),
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(len(values) for _name, values in self.axes)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def params(self, point: Point) -> dict[str, Any]:
+        return {name: values[i] for (name, values), i in zip(self.axes, point)}
+
+    def rule(self, point: Point) -> EntryRule | None:
+        """The entry rule at ``point``; None where ``grid`` drops the point.
+
+        Some rule types skip invalid combinations in ``grid`` (e.g.
+        CrossTickerEntry with more min_peer_signals than peer_tickers).
+        """
+        rules = self.rule_type.grid(
+            **{name: [value] for name, value in self.params(point).items()}
+        )
+        return rules[0] if rules else None
+
+
+# =============================================================================
+# Samplers
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class Trial:
+    """One evaluated point; ``objective`` is NaN when no combo traded."""
+
+    point: Point
+    entry_name: str
+    objective: float
+
+
+class Sampler(ABC):
+    """Proposes points of a ParamSpace for ParameterSearch."""
+
+    def start(self, space: ParamSpace, rng: np.random.Generator) -> None:
+        """Reset sampler state for a new search over ``space``."""
+        self._space = space
+        self._rng = rng
+
+    @abstractmethod
+    def propose(self, n: int, history: Sequence[Trial]) -> list[Point]:
+        """Up to ``n`` points to evaluate next (may repeat earlier points)."""
+        ...
+
+    def _uniform(self, n: int) -> list[Point]:
+        draws = self._rng.integers(
+            0, self._space.shape, size=(n, len(self._space.axes))
+        )
+        return [tuple(int(i) for i in row) for row in draws]
+
+
+@dataclass
+class RandomSampler(Sampler):
+    """Uniform random sampling of the axis indices."""
+
+    def propose(self, n: int, history: Sequence[Trial]) -> list[Point]:
+        return self._uniform(n)
+
+
+@dataclass
+class SobolSampler(Sampler):
+    """Scrambled Sobol' sequence mapped onto the axis indices."""
+
+    def start(self, space: ParamSpace, rng: np.random.Generator) -> None:
+        super().start(space, rng)
+        self._engine = qmc.Sobol(d=len(space.axes), scramble=True, seed=rng)
+        self._buffer: list[Point] = []
+
+    def propose(self, n: int, history: Sequence[Trial]) -> list[Point]:
+        if len(self._buffer) < n:
+            need = n - len(self._buffer)
+            if self._engine.num_generated == 0:
+                # Sobol' balance properties want the first draw to be 2**m.
+                need = 1 << max(need - 1, 0).bit_length()
+            u = self._engine.random(need)
+            idx = np.minimum(
+                (u * self._space.shape).astype(np.int64),
+                np.asarray(self._space.shape) - 1,
+            )
+            self._buffer.extend(tuple(int(i) for i in row) for row in idx)
+        points, self._buffer = self._buffer[:n], self._buffer[n:]
+        return points
+
+
+@dataclass
+class TPESampler(Sampler):
+    """Tree-structured Parzen estimator over categorical axes.
+
+    Parameters
+    ----------
+    n_startup
+        Trials sampled uniformly before the model is used.
+    gamma
+        Fraction of scored trials treated as "good".
+    n_candidates
+        Candidates drawn from the good-trial model per proposed point; the
+        ones with the highest good/bad likelihood ratio are proposed.
+    prior_weight
+        Pseudo-count added to every axis value (keeps unseen values
+        reachable).
+    """
+
+    n_startup: int = 10
+    gamma: float = 0.25
+    n_candidates: int = 24
+    prior_weight: float = 1.0
+
+    def propose(self, n: int, history: Sequence[Trial]) -> list[Point]:
+        scored = [t for t in history if not math.isnan(t.objective)]
+        if len(scored) < self.n_startup:
+            return self._uniform(n)
+
+        ranked = sorted(scored, key=lambda t: t.objective, reverse=True)
+        n_good = max(1, math.ceil(self.gamma * len(ranked)))
+        good = np.asarray([t.point for t in ranked[:n_good]], dtype=np.int64)
+        bad = np.asarray([t.point for t in ranked[n_good:]], dtype=np.int64)
+
+        n_draw = n * self.n_candidates
+        candidates = np.empty((n_draw, len(self._space.axes)), dtype=np.int64)
+        log_ratio = np.zeros(n_draw, dtype=np.float64)
+        for a, size in enumerate(self._space.shape):
+            p_good = self._density(good[:, a], size)
+            p_bad = self._density(bad[:, a] if bad.size else bad, size)
+            drawn = self._rng.choice(size, size=n_draw, p=p_good)
+            candidates[:, a] = drawn
+            log_ratio += np.log(p_good[drawn]) - np.log(p_bad[drawn])
+
+        # Best likelihood ratio first; evaluated points are skipped and any
+        # shortfall (a converged model) is filled uniformly.
+        evaluated = {t.point for t in history}
+        points: list[Point] = []
+        for c in np.argsort(-log_ratio, kind="stable"):
+            point = tuple(int(i) for i in candidates[c])
+            if point not in evaluated and point not in points:
+                points.append(point)
+                if len(points) == n:
+                    return points
+        return points + self._uniform(n - len(points))
+
+    def _density(self, values: np.ndarray, size: int) -> np.ndarray:
+        counts = np.full(size, self.prior_weight, dtype=np.float64)
+        np.add.at(counts, values, 1.0)
+        return counts / counts.sum()
+
+
+# =============================================================================
+# Search driver
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """Outcome of a ParameterSearch.
+
+    ``trials`` has one row per evaluated point (axis values, entry name,
+    objective); ``summary`` holds every evaluated combo, sorted by the
+    search metric, in the same layout as ``StrategyProcessor.run``.
+    """
+
+    trials: pl.DataFrame
+    summary: pl.DataFrame
+    rules: dict[str, EntryRule]
+
+    def best_rules(self, n: int = 10) -> list[EntryRule]:
+        """Entry rules of the ``n`` best trials, e.g. to pass to add_entries."""
+        best = self.trials.drop_nans("objective").sort("objective", descending=True)
+        names = best.unique("entry_name", keep="first", maintain_order=True)
+        return [self.rules[name] for name in names["entry_name"].head(n)]
+
+
+@dataclass
+class ParameterSearch:
+    """Budgeted sampling search over one entry-rule parameter space.
+
+    Each batch of proposed points is evaluated with
+    ``processor.evaluate_entries`` against the processor's preprocessors,
+    position filters, exits and max_entries values. A trial's objective is
+    the best ``optimize_by`` value over its combos.
+
+    Usage:
+        search = ParameterSearch(
+            processor,
+            ParamSpace.of(
+                CorrelationAwareEntry,
+                corr_col=["contemp", "leading"],
+                min_confidence=[0.0, 0.2, 0.4],
+                entry_days_before=list(range(0, 30, 2)),
+            ),
+            TPESampler(),
+            budget=200,
+        )
+        result = search.run()
+    """
+
+    processor: StrategyProcessor
+    space: ParamSpace
+    sampler: Sampler = field(default_factory=SobolSampler)
+    budget: int = 100
+    batch_size: int = 16
+    seed: int = 0
+    optimize_by: str = "sharpe_ratio"
+    max_redraws: int = 20
+    # Spaces up to this size fall back to drawing from the unseen points
+    # when the sampler keeps proposing evaluated ones (nearly exhausted).
+    max_enumerated: int = 1 << 22
+
+    def run(self) -> SearchResult:
+        """Evaluate up to ``budget`` distinct points of the space."""
+        rng = np.random.default_rng(self.seed)
+        self.sampler.start(self.space, rng)
+        trials: list[Trial] = []
+        seen: set[Point] = set()
+        objectives: dict[str, float] = {}
+        rules: dict[str, EntryRule] = {}
+        summaries: list[pl.DataFrame] = []
+        limit = min(self.budget, self.space.size)
+
+        while len(trials) < limit:
+            want = min(self.batch_size, limit - len(trials))
+            points: list[Point] = []
+            for _ in range(self.max_redraws):
+                for point in self.sampler.propose(want - len(points), trials):
+                    if point not in seen:
+                        seen.add(point)
+                        points.append(point)
+                if len(points) == want:
+                    break
+            if len(points) < want and self.space.size <= self.max_enumerated:
+                points += self._draw_unseen(want - len(points), seen, rng)
+            if not points:
+                break
+
+            # Points the grid drops stay in ``seen`` but never become trials.
+            batch = [
+                (point, rule)
+                for point in points
+                if (rule := self.space.rule(point)) is not None
+            ]
+            if not batch:
+                continue
+            summary, _results = self.processor.evaluate_entries(
+                [rule for _point, rule in batch], self.optimize_by
+            )
+            if summary.height:
+                summaries.append(summary)
+                metric = resolve_metric_col(self.optimize_by, summary.columns)
+                best = summary.group_by("entry_name").agg(
+                    pl.col(metric).fill_nan(None).max()
+                )
+                objectives.update(zip(best["entry_name"], best[metric]))
+            for point, rule in batch:
+                rules.setdefault(rule.name, rule)
+                objective = objectives.get(rule.name)
+                trials.append(
+                    Trial(
+                        point,
+                        rule.name,
+                        math.nan if objective is None else float(objective),
+                    )
+                )
+
+        return SearchResult(
+            trials=self._trials_frame(trials),
+            summary=self._merge(summaries),
+            rules=rules,
+        )
+
+    def _draw_unseen(
+        self, n: int, seen: set[Point], rng: np.random.Generator
+    ) -> list[Point]:
+        """Up to ``n`` uniformly drawn points not in ``seen`` (adds them)."""
+        shape = self.space.shape
+        flat_seen = np.ravel_multi_index(np.asarray(list(seen)).T, shape)
+        unseen = np.setdiff1d(np.arange(self.space.size), flat_seen)
+        picked = rng.choice(unseen, size=min(n, unseen.size), replace=False)
+        points = [
+            tuple(int(i) for i in idx)
+            for idx in np.stack(np.unravel_index(np.sort(picked), shape), axis=1)
+        ]
+        seen.update(points)
+        return points
+
+    def _trials_frame(self, trials: list[Trial]) -> pl.DataFrame:
+        return pl.DataFrame(
+            [
+                {
+                    "trial": i,
+                    **self.space.params(t.point),
+                    "entry_name": t.entry_name,
+                    "objective": t.objective,
+                }
+                for i, t in enumerate(trials)
+            ],
+            infer_schema_length=None,
+        )
+
+    def _merge(self, summaries: list[pl.DataFrame]) -> pl.DataFrame:
+        if not summaries:
+            return pl.DataFrame()
+        summary = pl.concat(summaries, how="diagonal_relaxed")
+        metric = resolve_metric_col(self.optimize_by, summary.columns)
+        return summary.sort(metric, descending=True)
@@ -0,0 +1,278 @@
+"""Multi-ticker grid search over tickers × visible_cols.
+
+Runs one StrategyProcessor grid per (ticker, visible_col) job inside a single
+process:
+
+  - Benchmarks are built once per visible_col for the whole ticker list
+    (one market-data load for every ticker plus SPY), not once per job.
+  - Jobs run a few at a time, and every job submits its entry work to one
+    shared thread pool, so idle workers pick up entry tasks from whichever
+    ticker has work queued.
+  - Each ticker's combined summary is written to disk as soon as its last
+    visible_col finishes, and its results are then released.
+
+Usage
+-----
+>>> runner = PortfolioGridRunner(
+...     tickers=["DE", "CAT"],
+...     build_processor=partial(build_processor, signal_method="stl_p4_s7_robustTrue"),
+... )
+>>> index = runner.run()
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from abovedata_backtesting.benchmarks.benchmark_results import BenchmarkResults
+from abovedata_backtesting.data_loaders.load_signal_data import list_visible_cols
+from abovedata_backtesting.processors.benchmark_processor import (
+    BenchmarkConfig,
+    BenchmarkProcessor,
+)
+from abovedata_backtesting.processors.strategy_processor import (
+    GridSearchResult,
+    StrategyProcessor,
+)
+
+# (ticker, visible_col, benchmarks) → configured, not yet run, processor
+ProcessorFactory = Callable[[str, str, BenchmarkResults], StrategyProcessor]
+# (tickers, visible_col) → benchmarks covering every ticker
+BenchmarkFactory = Callable[[Sequence[str], str], BenchmarkResults]
+# One finished job: tagged summary, sorted results, and the processor that ran
+_JobOutcome = tuple[pl.DataFrame, list[GridSearchResult], StrategyProcessor | None]
+# (ticker, combined summary, job outcome per visible_col) → None
+TickerCallback = Callable[[str, pl.DataFrame, dict[str, _JobOutcome]], None]
+
+
+def build_portfolio_benchmarks(
+    tickers: Sequence[str], visible_col: str
+) -> BenchmarkResults:
+    """Run every ticker's benchmark strategies in one BenchmarkProcessor."""
+    config = BenchmarkConfig(tickers=tuple(tickers), signal_col=visible_col)
+    return BenchmarkProcessor(config).run()
+
+
+@dataclass
+class PortfolioGridRunner:
+    """Grid search over many tickers × visible_cols with shared workers.
+
+    Parameters
+    ----------
+    tickers : Sequence[str]
+        Tickers to run.
+    build_processor : ProcessorFactory
+        Builds the configured StrategyProcessor for one job. The runner sets
+        its ``entry_pool`` and calls ``run()``.
+    visible_cols : Sequence[str] | None
+        visible_col variants to run for every ticker. None = every variant
+        found on disk for each ticker (see list_visible_cols).
+    output_dir : Path | str
+        Per-ticker summaries go to ``{output_dir}/ticker={ticker}/summary.parquet``.
+    max_workers : int | None
+        Size of the shared entry pool. None = CPU count.
+    max_concurrent_jobs : int
+        (ticker, visible_col) grids in flight at once. Phase 2 of each grid
+        runs on its job thread, so this also bounds exit-evaluation
+        parallelism and peak memory.
+    on_ticker_done : TickerCallback | None
+        Called after a ticker's summary is written with each visible_col's
+        (summary, results, processor), e.g. to save trade-level results for
+        the best visible_col. The runner drops them once the callback returns.
+    """
+
+    tickers: Sequence[str]
+    build_processor: ProcessorFactory
+    visible_cols: Sequence[str] | None = None
+    signal_method: str = "stl_p4_s7_robustTrue"
+    output_dir: Path | str = Path("results") / "portfolio"
+    optimize_by: str = "sharpe_ratio"
+    max_workers: int | None = None
+    max_concurrent_jobs: int = 4
+    build_benchmarks: BenchmarkFactory = build_portfolio_benchmarks
+    on_ticker_done: TickerCallback | None = None
+    debug: bool = False
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    _pending: dict[str, dict[str, _JobOutcome]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def jobs(self) -> list[tuple[str, str]]:
+        """All (ticker, visible_col) pairs to run, in ticker order."""
+        return [
+            (ticker, vc)
+            for ticker in self.tickers
+            for vc in (
+                self.visible_cols
+                if self.visible_cols is not None
+                else list_visible_cols(ticker, method=self.signal_method)
+            )
+        ]
+
+    def run(self) -> pl.DataFrame:
+        """Run every job; return one index row per ticker.
+
+        Index columns: ticker, n_visible_cols, n_results, best_<optimize_by>,
+        best_visible_col, seconds, path, error. A failing job, or a failing
+        benchmark build for its visible_col, is recorded in ``error`` instead
+        of stopping the other tickers.
+        """
+        jobs = self.jobs()
+        by_ticker: dict[str, list[str]] = {}
+        for ticker, vc in jobs:
+            by_ticker.setdefault(ticker, []).append(vc)
+
+        benchmarks, benchmark_errors = self._build_all_benchmarks(jobs)
+        self._pending = {ticker: {} for ticker in by_ticker}
+        errors: dict[str, list[str]] = {ticker: [] for ticker in by_ticker}
+        started: dict[str, float] = {}
+        index_rows: list[dict[str, Any]] = []
+
+        def _complete(ticker: str, vc: str, outcome: _JobOutcome | None) -> None:
+            done = self._record(ticker, vc, outcome, len(by_ticker[ticker]))
+            if done is not None:
+                index_rows.append(
+                    self._finish_ticker(
+                        ticker,
+                        done,
+                        errors[ticker],
+                        time.perf_counter() - started[ticker],
+                    )
+                )
+
+        n_workers = self.max_workers or os.cpu_count() or 4
+        with (
+            ThreadPoolExecutor(max_workers=n_workers) as entry_pool,
+            ThreadPoolExecutor(max_workers=self.max_concurrent_jobs) as job_pool,
+        ):
+            futures: dict[Future[_JobOutcome], tuple[str, str]] = {}
+            for ticker, vc in jobs:
+                started.setdefault(ticker, time.perf_counter())
+                if vc in benchmark_errors:
+                    errors[ticker].append(f"{vc}: {benchmark_errors[vc]}")
+                    _complete(ticker, vc, None)
+                    continue
+                future = job_pool.submit(
+                    self._run_job, ticker, vc, benchmarks[vc], entry_pool
+                )
+                futures[future] = (ticker, vc)
+
+            for future in as_completed(futures):
+                ticker, vc = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as e:  # noqa: BLE001 — keep the universe running
+                    errors[ticker].append(f"{vc}: {type(e).__name__}: {e}")
+                    outcome = None
+                    if self.debug:
+                        print(f"[{ticker}/{vc}] failed: {e}")
+                _complete(ticker, vc, outcome)
+
+        return pl.DataFrame(index_rows).sort("ticker") if index_rows else pl.DataFrame()
+
+    # ── Internal ─────────────────────────────────────────────────────────
+
+    def _build_all_benchmarks(
+        self, jobs: list[tuple[str, str]]
+    ) -> tuple[dict[str, BenchmarkResults], dict[str, str]]:
+        """One benchmark run per visible_col, covering all of its tickers.
+
+        Returns the benchmarks and, for visible_cols whose build failed, the
+        error message (their jobs are not run).
+        """
+        tickers_by_vc: dict[str, list[str]] = {}
+        for ticker, vc in jobs:
+            tickers_by_vc.setdefault(vc, []).append(ticker)
+        benchmarks: dict[str, BenchmarkResults] = {}
+        errors: dict[str, str] = {}
+        for vc, tickers in tickers_by_vc.items():
+            try:
+                benchmarks[vc] = self.build_benchmarks(tickers, vc)
+            except Exception as e:  # noqa: BLE001 — keep the universe running
+                errors[vc] = f"benchmarks failed: {type(e).__name__}: {e}"
+                if self.debug:
+                    print(f"[benchmarks/{vc}] failed: {e}")
+        return benchmarks, errors
+
+    def _run_job(
+        self,
+        ticker: str,
+        visible_col: str,
+        benchmarks: BenchmarkResults,
+        entry_pool: ThreadPoolExecutor,
+    ) -> _JobOutcome:
+        processor = self.build_processor(ticker, visible_col, benchmarks)
+        processor.executor = "thread"
+        processor.entry_pool = entry_pool
+        summary, results = processor.run(optimize_by=self.optimize_by)
+        if self.debug:
+            print(f"[{ticker}/{visible_col}] {summary.height} results")
+        tagged = summary.with_columns(pl.lit(visible_col).alias("visible_col"))
+        return tagged, results, processor
+
+    def _record(
+        self,
+        ticker: str,
+        visible_col: str,
+        outcome: _JobOutcome | None,
+        n_expected: int,
+    ) -> dict[str, _JobOutcome] | None:
+        """Store one job's outcome; return the ticker's outcomes once complete."""
+        with self._lock:
+            pending = self._pending[ticker]
+            pending[visible_col] = outcome or (pl.DataFrame(), [], None)
+            if len(pending) < n_expected:
+                return None
+            return self._pending.pop(ticker)
+
+    def _finish_ticker(
+        self,
+        ticker: str,
+        outcomes: dict[str, _JobOutcome],
+        errors: list[str],
+        seconds: float,
+    ) -> dict[str, Any]:
+        """Write the ticker's combined summary and build its index row."""
+        summaries = [summary for summary, _, _ in outcomes.values() if summary.height]
+        best_col = f"best_{self.optimize_by}"
+        row: dict[str, Any] = {
+            "ticker": ticker,
+            "n_visible_cols": len(outcomes),
+            "n_results": 0,
+            best_col: None,
+            "best_visible_col": None,
+            "seconds": seconds,
+            "path": None,
+            "error": "; ".join(errors) or None,
+        }
+        if not summaries:
+            return row
+
+        combined = pl.concat(summaries, how="diagonal_relaxed")
+        if self.optimize_by in combined.columns:
+            combined = combined.sort(self.optimize_by, descending=True, nulls_last=True)
+            row[best_col] = combined[self.optimize_by][0]
+            row["best_visible_col"] = combined["visible_col"][0]
+
+        out_dir = Path(self.output_dir) / f"ticker={ticker}"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / "summary.parquet"
+        combined.write_parquet(path)
+        row["n_results"] = combined.height
+        row["path"] = str(path)
+
+        if self.on_ticker_done is not None:
+            self.on_ticker_done(ticker, combined, outcomes)
+        if self.debug:
+            print(f"[{ticker}] {combined.height} results → {path} ({seconds:.1f}s)")
+        return row
@@ -0,0 +1,190 @@
+"""
+Streaming top-K collector for grid-search results.
+
+A full ``GridSearchResult`` carries its ``TradeLog`` of ``Trade`` objects and
+a ``BacktestMetrics`` tree; holding one per combo costs gigabytes at 100K+
+combos. The collector keeps full results only for a bounded top-K heap per
+ranking metric. Every combo still gets a summary row: rows are buffered,
+converted to columnar frames every ``batch_rows`` results and, when
+``spill_dir`` is set, written out as Parquet parts, so the Python object
+footprint no longer grows with the grid. ``finish`` returns the full
+summary as a lazy scan over the parts and only materializes the rows of
+the kept results.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+
+if TYPE_CHECKING:
+    from abovedata_backtesting.processors.strategy_processor import (
+        GridSearchResult,
+    )
+
+
+_METRIC_ALIASES: dict[str, str] = {
+    "sharpe": "sharpe_ratio",
+    "sortino": "sortino_ratio",
+    "calmar": "calmar_ratio",
+    "alpha": "timing_alpha",
+    "return": "annualized_return",
+    "trades": "trade_n_trades",
+}
+
+
+def resolve_metric_col(name: str, columns: Sequence[str]) -> str:
+    """Resolve a metric name to a column name."""
+    if name in columns:
+        return name
+    resolved = _METRIC_ALIASES.get(name, name)
+    if resolved not in columns:
+        raise ValueError(f"Unknown metric '{name}'. Available: {list(columns)}")
+    return resolved
+
+
+def summary_row(result: GridSearchResult, idx: int) -> dict[str, Any]:
+    """Flatten one result into its summary row (``_original_idx`` = idx)."""
+    row: dict[str, Any] = {
+        "_original_idx": idx,
+        "pp_name": result.preprocessor_name,
+        "entry_name": result.entry_rule.name,
+        "exit_name": result.exit_rule.name,
+        "position_filter": result.position_filter,
+        "max_entries_per_signal": result.max_entries_per_signal,
+        # Trade log stats
+        **{f"trade_{k}": v for k, v in result.trade_log.summary().items()},
+        # Sanity
+        "is_suspicious": result.sanity.is_suspicious,
+        "sanity_flags": ", ".join(result.sanity.flags_list)
+        if result.sanity.is_suspicious
+        else "",
+    } | result.metrics.make_dict()
+    # Flatten entry/exit params
+    row.update({f"entry_{k}": v for k, v in result.entry_params.items()})
+    row.update({f"exit_{k}": v for k, v in result.exit_params.items()})
+    return row
+
+
+def _rank_value(value: Any) -> float:
+    """Heap key for a metric value; missing and NaN rank last."""
+    if value is None:
+        return -math.inf
+    value = float(value)
+    return -math.inf if math.isnan(value) else value
+
+
+@dataclass
+class TopKResultCollector:
+    """Bounded top-K result retention with streamed summary rows.
+
+    Parameters
+    ----------
+    top_k
+        Full results kept per ranking metric. A result ranked in the top-K
+        of several metrics is kept once.
+    rank_by
+        Metric names (summary columns or their aliases) to keep a top-K for.
+    spill_dir
+        Directory for the summary Parquet parts. None keeps the row batches
+        in memory as (columnar) DataFrames.
+    batch_rows
+        Rows buffered as dicts before they are converted and spilled.
+    """
+
+    top_k: int
+    rank_by: tuple[str, ...] = ("sharpe_ratio", "trade_total_return")
+    spill_dir: Path | None = None
+    batch_rows: int = 4096
+
+    n_results: int = field(default=0, init=False)
+    _rows: list[dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    _frames: list[pl.DataFrame] = field(default_factory=list, init=False, repr=False)
+    _parts: list[Path] = field(default_factory=list, init=False, repr=False)
+    _rank_cols: tuple[str, ...] | None = field(default=None, init=False, repr=False)
+    # Min-heap per metric column of (value, -seq, seq): ties evict later combos.
+    _heaps: dict[str, list[tuple[float, int, int]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _kept: dict[int, GridSearchResult] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _refs: dict[int, int] = field(default_factory=dict, init=False, repr=False)
+
+    def add(self, result: GridSearchResult) -> None:
+        """Record one result's summary row and offer it to every top-K heap."""
+        seq = self.n_results
+        self.n_results += 1
+        row = summary_row(result, seq)
+        self._rows.append(row)
+        if self._rank_cols is None:
+            self._rank_cols = tuple(
+                dict.fromkeys(resolve_metric_col(m, list(row)) for m in self.rank_by)
+            )
+        for col in self._rank_cols:
+            self._offer(col, (_rank_value(row.get(col)), -seq, seq), result)
+        if len(self._rows) >= self.batch_rows:
+            self._flush()
+
+    def finish(
+        self, optimize_by: str
+    ) -> tuple[pl.LazyFrame, pl.DataFrame, list[GridSearchResult]]:
+        """Summary of every combo sorted by ``optimize_by``, plus kept results.
+
+        Returns ``(summary_scan, kept_summary, results)``: a LazyFrame over
+        every summary row (scanning the spilled parts; nothing is read until
+        it is collected), the collected rows of the kept results, and the
+        kept results in the same order. Both summaries keep their
+        ``_original_idx`` column and sort with ``maintain_order`` so the kept
+        rows are in full-summary order.
+        """
+        self._flush()
+        parts = [pl.scan_parquet(path) for path in self._parts]
+        scans = [frame.lazy() for frame in self._frames] + parts
+        if not scans:
+            return pl.LazyFrame(), pl.DataFrame(), []
+        summary = pl.concat(scans, how="diagonal_relaxed")
+        sort_col = resolve_metric_col(optimize_by, summary.collect_schema().names())
+        summary = summary.sort(sort_col, descending=True, maintain_order=True)
+        kept_summary = summary.filter(
+            pl.col("_original_idx").is_in(list(self._kept))
+        ).collect()
+        results = [self._kept[i] for i in kept_summary["_original_idx"].to_list()]
+        return summary, kept_summary, results
+
+    def _offer(
+        self, col: str, item: tuple[float, int, int], result: GridSearchResult
+    ) -> None:
+        heap = self._heaps.setdefault(col, [])
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, item)
+        elif heap and item > heap[0]:
+            self._release(heapq.heapreplace(heap, item)[2])
+        else:
+            return
+        seq = item[2]
+        self._kept[seq] = result
+        self._refs[seq] = self._refs.get(seq, 0) + 1
+
+    def _release(self, seq: int) -> None:
+        self._refs[seq] -= 1
+        if not self._refs[seq]:
+            del self._refs[seq], self._kept[seq]
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        frame = pl.DataFrame(self._rows, infer_schema_length=None)
+        self._rows = []
+        if self.spill_dir is None:
+            self._frames.append(frame)
+            return
+        path = self.spill_dir / f"summary-{len(self._parts):05d}.parquet"
+        frame.write_parquet(path, mkdir=True)
+        self._parts.append(path)
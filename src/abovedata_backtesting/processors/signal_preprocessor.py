@@ -2,10 +2,13 @@
 
 Chains atomic SignalTransforms into an ordered pipeline that adds
 new columns to the quarterly signal DataFrame before entry rules see it.
+``apply_preprocessors`` runs a whole grid of pipelines as a prefix tree so
+shared leading transforms are computed once.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from itertools import product
 from typing import Any, Self, Sequence
@@ -87,13 +90,7 @@ class SignalPreprocessor:
         """
         original_cols = set(signals.columns)
         for transform in self.transforms:
-            new_cols = set(transform.output_columns())
-            overwritten = new_cols & original_cols
-            if overwritten:
-                raise ValueError(
-                    f"Transform {transform.name} would overwrite original columns: "
-                    f"{overwritten}. Transforms must create new columns only."
-                )
+            _check_no_overwrite(transform, original_cols)
             signals = transform.apply(signals, date_col)
         return signals
 
@@ -123,3 +120,99 @@ class SignalPreprocessor:
         for combo in product(*transform_lists):
             results.append(cls(transforms=tuple(combo)))
         return results
+
+
+def _check_no_overwrite(transform: SignalTransform, original_cols: set[str]) -> None:
+    overwritten = set(transform.output_columns()) & original_cols
+    if overwritten:
+        raise ValueError(
+            f"Transform {transform.name} would overwrite original columns: "
+            f"{overwritten}. Transforms must create new columns only."
+        )
+
+
+# ============================================================================
+# Prefix-tree execution
+# ============================================================================
+
+
+def apply_preprocessors(
+    preprocessors: Sequence[SignalPreprocessor | IdentityPreprocessor],
+    signals: pl.DataFrame,
+    date_col: str = "earnings_date",
+    max_workers: int | None = None,
+) -> dict[str, pl.DataFrame]:
+    """Apply many preprocessors, computing each shared transform prefix once.
+
+    Pipelines from ``SignalPreprocessor.grid`` share long prefixes (one
+    TimeShift feeding dozens of blends). The chains are merged into a
+    prefix tree keyed by transform tuples and evaluated level by level:
+    every node is one ``transform.apply`` on its parent's frame, and the
+    nodes of a level are independent, so they run on a thread pool
+    (Polars releases the GIL). Work scales with the number of unique
+    prefixes rather than the number of chains.
+
+    Parameters
+    ----------
+    preprocessors
+        Pipelines to evaluate. Duplicate names keep the first occurrence,
+        as the grid search does.
+    signals
+        Quarterly signal frame every pipeline starts from.
+    date_col
+        Date column passed to each transform.
+    max_workers
+        Thread pool size; ``1`` evaluates serially.
+
+    Returns
+    -------
+    dict[str, pl.DataFrame]
+        ``{preprocessor.name: transformed signals}``, equal to
+        ``pp.apply(signals, date_col)`` for each preprocessor.
+
+    Raises
+    ------
+    ValueError
+        If any transform would overwrite an original column (checked for
+        every chain, in order, before any transform runs).
+    """
+    original_cols = set(signals.columns)
+    chains: dict[str, tuple[SignalTransform, ...]] = {}
+    for pp in preprocessors:
+        if pp.name in chains:
+            continue
+        chain = pp.transforms if isinstance(pp, SignalPreprocessor) else ()
+        for transform in chain:
+            _check_no_overwrite(transform, original_cols)
+        chains[pp.name] = chain
+
+    leaves = set(chains.values())
+    frames: dict[tuple[SignalTransform, ...], pl.DataFrame] = {(): signals}
+    depth = max((len(chain) for chain in leaves), default=0)
+    pool = (
+        ThreadPoolExecutor(max_workers=max_workers)
+        if depth and max_workers != 1
+        else None
+    )
+
+    def _node(prefix: tuple[SignalTransform, ...]) -> pl.DataFrame:
+        return prefix[-1].apply(frames[prefix[:-1]], date_col)
+
+    try:
+        for level in range(1, depth + 1):
+            prefixes = list(
+                dict.fromkeys(c[:level] for c in chains.values() if len(c) >= level)
+            )
+            outputs = (
+                pool.map(_node, prefixes) if pool is not None else map(_node, prefixes)
+            )
+            computed = dict(zip(prefixes, outputs))
+            # Parents are only needed by this level unless a chain ends there.
+            for parent in {p[:-1] for p in prefixes} - leaves:
+                frames.pop(parent, None)
+            frames.update(computed)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return {name: frames[chain] for name, chain in chains.items()}
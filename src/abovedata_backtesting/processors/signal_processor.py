@@ -1,5 +1,11 @@
 import datetime
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from typing import Any, Literal
 
 import altair as alt
 import numpy as np
@@ -7,11 +13,21 @@ import numpy as np
 # --- Visualization Layer ---
 import polars as pl
 from rich.console import Console
-from statsmodels.tsa.seasonal import STL
+
+from abovedata_backtesting.processors.stl_residuals import (
+    DEFAULT_STL_PARAMS,
+    STLParams,
+    STLResidualEngine,
+    default_engine,
+)
 
 
 def compute_stl_residuals_stable(
-    df: pl.DataFrame, col: str, period: int = 4, min_burn_in: int = 8
+    df: pl.DataFrame,
+    col: str,
+    period: int = 4,
+    min_burn_in: int = 8,
+    engine: STLResidualEngine | None = None,
 ) -> pl.Series:
     """
     Computes residuals using a stable anchored approach:
@@ -19,39 +35,45 @@ def compute_stl_residuals_stable(
     2. Uses a robust fit to ensure trend/seasonal components don't overreact
        to a single anomalous UCC filing.
     3. Normalizes the resulting residuals to maintain a consistent signal scale.
+
+    Each expanding-window fit goes through ``engine`` (the shared default
+    engine if None), which memoizes fits by input prefix — see
+    processors/stl_residuals.py.
     """
     df = df.sort("earnings_date")
-    vals = df[col].to_numpy()
-    n = len(vals)
-    residuals = [None] * n
-
-    # We start only after we have enough data to define a 'regime'
-    for i in range(min_burn_in, n):
-        # Window includes all data from start to current T
-        window_data = vals[: i + 1]
-
-        # We use a longer trend window (trend=period*4+1) to force
-        # the model to be 'stiff' and not follow the noise.
-        stl = STL(
-            window_data,
-            period=period,
-            seasonal=7,  # Fixed seasonal length for stability
-            trend=13,  # Stiff trend to prevent 'End-point' wiggle
-            robust=True,
-        ).fit()
-
-        # Capture the last residual
-        res_val = stl.resid[-1]
-
-        # Normalization Step:
-        # Convert the raw residual into a Z-Score based on historical volatility.
-        # This prevents the 'expanding window' from having scale-drift.
-        prev_res_std = np.std(stl.resid[:-1]) if len(stl.resid) > 1 else 1.0
-        residuals[i] = res_val / (prev_res_std + 1e-9)
-
+    params = STLParams(period=period, min_burn_in=min_burn_in)
+    residuals = (engine or default_engine).residuals(df[col].to_numpy(), params)
     return pl.Series(f"{col}_resid", residuals)
 
 
+SegmentExecutor = Literal["serial", "process"]
+# (processed frame or None, formatted error or None, seconds)
+_SegmentOutcome = tuple[pl.DataFrame | None, str | None, float]
+
+
+def _init_segment_worker(fits: dict[bytes, float]) -> None:
+    """Process-pool initializer: start with the parent's STL fits."""
+    default_engine.seed(fits)
+
+
+def _process_segment(
+    segment_df: pl.DataFrame,
+    config: dict[str, Any],
+    stl_engine: STLResidualEngine | None = None,
+) -> _SegmentOutcome:
+    """Run one segment's sub-processor (module level so it pickles)."""
+    start = time.perf_counter()
+    try:
+        # We pass the filters down to the sub-processors
+        sub_processor = STLSignalProcessor(
+            df=segment_df, stl_engine=stl_engine, **config
+        )
+        frame, error = sub_processor.process(), None
+    except pl.exceptions.InvalidOperationError:
+        frame, error = None, traceback.format_exc()
+    return frame, error, time.perf_counter() - start
+
+
 @dataclass
 class STLSignalProcessor:
     """
@@ -69,40 +91,135 @@ class STLSignalProcessor:
     # NEW: Tactical Filter Constraints
     correlation_threshold: float = 0.8  # Only trust correlations above 0.8
     sigma_threshold: float = 1.0  # Signal must be > 1.0 std dev to matter
+    # Memoized STL fits; None = the module-wide default engine.
+    stl_engine: STLResidualEngine | None = None
 
     df_signals_agg: pl.DataFrame = field(init=False)
+    # Seconds per segment of the last process_by_segment call
+    segment_timings: dict[str, float] = field(default_factory=dict, init=False)
 
     def process_by_segment(
-        self, segment_col: str = "name", count_col: str = "count"
+        self,
+        segment_col: str = "name",
+        count_col: str = "count",
+        executor: SegmentExecutor = "serial",
+        max_workers: int | None = None,
+        verbose: bool = False,
     ) -> pl.DataFrame:
         """
         Partitions data and ensures each segment uses its own unit count
         instead of the global visible_col.
+
+        Parameters
+        ----------
+        executor : SegmentExecutor
+            "serial" runs segments one after another; "process" runs them on
+            a spawn process pool. Output order is the same either way.
+        max_workers : int | None
+            Process pool size cap (also used for the STL pre-fit). None = CPU
+            count.
+        verbose : bool
+            Print each segment's processing time as it finishes. Timings are
+            always kept in ``segment_timings``.
         """
         if segment_col not in self.df.columns:
             return self.process()
 
         segments = self.df.partition_by(segment_col, maintain_order=True)
-        processed_frames = []
+        names = [str(segment_df[segment_col][0]) for segment_df in segments]
         console = Console()
 
-        for segment_df in segments:
-            try:
-                # We pass the filters down to the sub-processors
-                sub_processor = STLSignalProcessor(
-                    df=segment_df,
-                    ticker=self.ticker,
-                    visible_col=count_col,
-                    ma_window=self.ma_window,
-                    momentum_threshold=self.momentum_threshold,
-                    correlation_threshold=self.correlation_threshold,
-                    sigma_threshold=self.sigma_threshold,
-                    is_medical=self.is_medical,
+        # Fit every (segment, column) prefix in one deduplicated batch, so
+        # ticker-level columns shared by all segments are fitted once and
+        # the engine can spread the remaining fits over its process pool.
+        stl_inputs = [
+            series
+            for segment_df in segments
+            for series in self._stl_inputs(segment_df, count_col)
+        ]
+        engine = self._engine
+        if executor == "process" and engine.executor == "serial":
+            engine = STLResidualEngine(executor="process", max_workers=max_workers)
+            engine.seed(self._engine.fits_for(stl_inputs))
+        engine.residuals_many(stl_inputs, DEFAULT_STL_PARAMS)
+        if engine is not self._engine:
+            self._engine.seed(engine.snapshot())
+
+        config = {
+            "ticker": self.ticker,
+            "visible_col": count_col,
+            "ma_window": self.ma_window,
+            "momentum_threshold": self.momentum_threshold,
+            "correlation_threshold": self.correlation_threshold,
+            "sigma_threshold": self.sigma_threshold,
+            "is_medical": self.is_medical,
+        }
+        outcomes: list[_SegmentOutcome]
+        if executor == "serial":
+            outcomes = []
+            for name, segment_df in zip(names, segments):
+                outcomes.append(
+                    _process_segment(segment_df, config, stl_engine=self._engine)
                 )
-                processed_frames.append(sub_processor.process())
-            except pl.exceptions.InvalidOperationError:
-                console.print_exception()
-        return pl.concat(processed_frames)
+                self._report_segment(console, name, outcomes[-1], verbose)
+        elif executor == "process":
+            outcomes = self._process_segments_parallel(
+                console, names, segments, config, stl_inputs, max_workers, verbose
+            )
+        else:
+            raise ValueError(
+                f"Unknown executor '{executor}'. Expected 'serial' or 'process'."
+            )
+
+        self.segment_timings = {
+            name: seconds for name, (_, _, seconds) in zip(names, outcomes)
+        }
+        if verbose:
+            console.print(
+                f"{self.ticker}: {len(segments)} segments in "
+                f"{sum(self.segment_timings.values()):.2f}s of segment time"
+            )
+        return pl.concat([frame for frame, _, _ in outcomes if frame is not None])
+
+    def _process_segments_parallel(
+        self,
+        console: Console,
+        names: list[str],
+        segments: list[pl.DataFrame],
+        config: dict[str, Any],
+        stl_inputs: list[np.ndarray],
+        max_workers: int | None,
+        verbose: bool,
+    ) -> list[_SegmentOutcome]:
+        """Run segments on a process pool whose workers start with the STL fits."""
+        n_workers = min(max_workers or os.cpu_count() or 4, len(segments))
+        outcomes: list[_SegmentOutcome | None] = [None] * len(segments)
+        # Spawn (not fork): Polars' thread pool is not fork-safe.
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_segment_worker,
+            initargs=(self._engine.fits_for(stl_inputs),),
+        ) as pool:
+            futures = {
+                pool.submit(_process_segment, segment_df, config): i
+                for i, segment_df in enumerate(segments)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                outcomes[i] = future.result()
+                self._report_segment(console, names[i], outcomes[i], verbose)
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    @staticmethod
+    def _report_segment(
+        console: Console, name: str, outcome: _SegmentOutcome, verbose: bool
+    ) -> None:
+        _, error, seconds = outcome
+        if error is not None:
+            console.print(f"[red]Segment {name!r} failed:[/red]\n{error}")
+        elif verbose:
+            console.print(f"  {name}: {seconds:.2f}s")
 
     def process(self) -> pl.DataFrame:
         """Executes the full transformation pipeline with noise filtering."""
@@ -120,15 +237,28 @@ class STLSignalProcessor:
         self.df = self.df.sort("earnings_date")
         return self
 
-    def _apply_stl_decomposition(self) -> "STLSignalProcessor":
-        target_cols = [self.visible_col, "total_revenue", "consensus"]
-        available_cols = [c for c in target_cols if c in self.df.columns]
+    @property
+    def _engine(self) -> STLResidualEngine:
+        return self.stl_engine or default_engine
 
-        for col in available_cols:
-            # Use expanding window STL to prevent look-ahead bias
+    @staticmethod
+    def _stl_columns(df: pl.DataFrame, visible_col: str) -> list[str]:
+        target_cols = [visible_col, "total_revenue", "consensus"]
+        return [c for c in target_cols if c in df.columns]
+
+    @classmethod
+    def _stl_inputs(cls, df: pl.DataFrame, visible_col: str) -> list[np.ndarray]:
+        """Sorted input series of every STL column, as the fits will see them."""
+        df = df.sort("earnings_date")
+        return [df[c].to_numpy() for c in cls._stl_columns(df, visible_col)]
+
+    def _apply_stl_decomposition(self) -> "STLSignalProcessor":
+        # Use expanding window STL to prevent look-ahead bias
+        for col in self._stl_columns(self.df, self.visible_col):
             self.df = self.df.with_columns(
-                # compute_stl_residuals_expanding(self.df, col, period=3)
-                compute_stl_residuals_stable(self.df, col, period=4)
+                compute_stl_residuals_stable(
+                    self.df, col, period=4, engine=self._engine
+                )
             )
         return self
 
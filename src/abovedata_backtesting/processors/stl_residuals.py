@@ -0,0 +1,214 @@
+"""Memoized, parallel expanding-window STL residuals.
+
+``compute_stl_residuals_stable`` refits a robust STL on ``vals[: i + 1]`` for
+every quarter i. Robust LOESS reweights the whole window on every fit, so a
+fit cannot be updated incrementally without changing its output. Instead,
+each fit is keyed by a hash of its exact input prefix and parameters:
+
+  - Refitting the same prefix is a cache hit. This happens for ticker-level
+    columns (total_revenue, consensus) repeated in every segment, and when
+    processing reruns after a new quarter arrives.
+  - Uncached fits are independent, so a batch of them (across quarters,
+    columns and segments) can be spread over a process pool.
+
+Every value comes from the same STL call on the same input array as the
+original loop, so results are bit-identical to it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+from statsmodels.tsa.seasonal import STL
+
+STLExecutor = Literal["serial", "process"]
+
+
+@dataclass(frozen=True, slots=True)
+class STLParams:
+    """STL settings of the anchored residual signal."""
+
+    period: int = 4
+    seasonal: int = 7  # Fixed seasonal length for stability
+    trend: int = 13  # Stiff trend to prevent 'End-point' wiggle
+    robust: bool = True
+    min_burn_in: int = 8
+
+
+DEFAULT_STL_PARAMS = STLParams()
+
+
+def fit_last_residual(window: NDArray[np.generic], params: STLParams) -> float:
+    """Fit STL on ``window`` and return its last residual as a z-score."""
+    stl = STL(
+        window,
+        period=params.period,
+        seasonal=params.seasonal,
+        trend=params.trend,
+        robust=params.robust,
+    ).fit()
+
+    # Capture the last residual
+    res_val = stl.resid[-1]
+
+    # Normalization Step:
+    # Convert the raw residual into a Z-Score based on historical volatility.
+    # This prevents the 'expanding window' from having scale-drift.
+    prev_res_std = np.std(stl.resid[:-1]) if len(stl.resid) > 1 else 1.0
+    return res_val / (prev_res_std + 1e-9)
+
+
+def _fit_batch(windows: list[NDArray[np.generic]], params: STLParams) -> list[float]:
+    """Process-pool task: fit a chunk of windows."""
+    return [fit_last_residual(w, params) for w in windows]
+
+
+def _prefix_key(vals: NDArray[np.generic], end: int, params: STLParams) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(params).encode())
+    digest.update(vals.dtype.str.encode())
+    digest.update(np.ascontiguousarray(vals[:end]).tobytes())
+    return digest.digest()
+
+
+@dataclass
+class STLResidualEngine:
+    """Expanding-window STL residuals with a fit cache and optional pool.
+
+    Parameters
+    ----------
+    executor : STLExecutor
+        "serial" fits in-process; "process" spreads uncached fits of a batch
+        over a spawn process pool.
+    max_workers : int | None
+        Process pool size cap. None = CPU count.
+    max_entries : int
+        LRU bound on cached fits (one float per entry).
+    """
+
+    executor: STLExecutor = "serial"
+    max_workers: int | None = None
+    max_entries: int = 1_000_000
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _cache: OrderedDict[bytes, float] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def residuals(
+        self, vals: NDArray[np.generic], params: STLParams = DEFAULT_STL_PARAMS
+    ) -> list[float | None]:
+        """Residual z-scores for one series (None during the burn-in)."""
+        return self.residuals_many([vals], params)[0]
+
+    def residuals_many(
+        self,
+        series: Sequence[NDArray[np.generic]],
+        params: STLParams = DEFAULT_STL_PARAMS,
+    ) -> list[list[float | None]]:
+        """Residual z-scores for several series, fitting each prefix once."""
+        keys: list[list[bytes]] = []
+        todo: dict[bytes, NDArray[np.generic]] = {}
+        with self._lock:
+            for vals in series:
+                series_keys = []
+                for i in range(params.min_burn_in, len(vals)):
+                    key = _prefix_key(vals, i + 1, params)
+                    series_keys.append(key)
+                    if key in self._cache:
+                        self._cache.move_to_end(key)
+                        self.hits += 1
+                    elif key not in todo:
+                        todo[key] = vals[: i + 1]
+                        self.misses += 1
+                    else:
+                        self.hits += 1
+                keys.append(series_keys)
+
+        fitted = dict(zip(todo, self._fit(list(todo.values()), params)))
+        with self._lock:
+            self._cache.update(fitted)
+            self._evict()
+
+        out: list[list[float | None]] = []
+        for vals, series_keys in zip(series, keys):
+            residuals: list[float | None] = [None] * len(vals)
+            for i, key in enumerate(series_keys, start=params.min_burn_in):
+                value = fitted.get(key)
+                residuals[i] = value if value is not None else self._cache[key]
+            out.append(residuals)
+        return out
+
+    def snapshot(self) -> dict[bytes, float]:
+        """Copy of the cached fits, e.g. to seed worker processes."""
+        with self._lock:
+            return dict(self._cache)
+
+    def fits_for(
+        self,
+        series: Sequence[NDArray[np.generic]],
+        params: STLParams = DEFAULT_STL_PARAMS,
+    ) -> dict[bytes, float]:
+        """Cached fits of every prefix of ``series`` (missing ones skipped)."""
+        with self._lock:
+            return {
+                key: self._cache[key]
+                for vals in series
+                for i in range(params.min_burn_in, len(vals))
+                if (key := _prefix_key(vals, i + 1, params)) in self._cache
+            }
+
+    def seed(self, fits: dict[bytes, float]) -> None:
+        """Add previously computed fits to the cache."""
+        with self._lock:
+            self._cache.update(fits)
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def _fit(
+        self, windows: list[NDArray[np.generic]], params: STLParams
+    ) -> list[float]:
+        n_workers = min(self.max_workers or os.cpu_count() or 4, len(windows))
+        if self.executor == "serial" or n_workers <= 1:
+            return _fit_batch(windows, params)
+        if self.executor != "process":
+            raise ValueError(
+                f"Unknown executor '{self.executor}'. Expected 'serial' or 'process'."
+            )
+
+        # Longest windows first so chunks finish at similar times.
+        order = sorted(range(len(windows)), key=lambda k: -len(windows[k]))
+        chunks = [order[w::n_workers] for w in range(n_workers)]
+        results: list[float] = [0.0] * len(windows)
+        # Spawn (not fork): Polars' thread pool is not fork-safe.
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(_fit_batch, [windows[k] for k in chunk], params)
+                for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, futures):
+                for k, value in zip(chunk, future.result()):
+                    results[k] = value
+        return results
+
+
+# Shared by compute_stl_residuals_stable when no engine is passed.
+default_engine = STLResidualEngine()
@@ -1,18 +1,38 @@
 """Strategy processor for grid search optimization over entry × exit combinations.
 
 Two-phase architecture for scalability to 100K+ permutations:
-  Phase 1: Build entry cache — one entry.apply() per unique (preprocessor, entry, pos_filter).
-  Phase 2: Apply exits — Cython-accelerated exit kernels over cached entry DataFrames.
+  Phase 1: Build entry cache — one entry.events() per unique (preprocessor, entry).
+  Phase 2: Apply exits — Cython-accelerated exit kernels over cached entry events,
+           with position filters applied to the cached daily arrays.
+
+Cached entries are sparse ``EntryEvents`` (one row per entry date), expanded
+to daily arrays per entry in Phase 2 and to full DataFrames only for the top
+results.
+Market columns are extracted once per run into a read-only ``MarketArrays``
+shared by every entry combo.
+
+Phase 1 runs on a selectable executor (see ``EntryExecutor``). The process
+executor ships the market data and preprocessed signal frames to each worker
+once via the pool initializer, so per-task payloads are just the entry rule.
 """
 
 from __future__ import annotations
 
 import datetime as dt
+import multiprocessing
 import os
-from collections.abc import Sequence
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from collections.abc import Callable, Sequence
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field, replace
 from itertools import product as itertools_product
+from pathlib import Path
 from typing import Any, Literal
 
 import numpy as np
@@ -25,10 +45,22 @@ from abovedata_backtesting.benchmarks.benchmark_results import (
     BenchmarkResults,
 )
 from abovedata_backtesting.data_loaders.load_market_data import MarketDataLoader
+from abovedata_backtesting.entries.entry_events import EntryEvents
 from abovedata_backtesting.entries.entry_signals import (
     EntryRule,
     enforce_max_entries_fast,
 )
+from abovedata_backtesting.entries.trading_calendar import TradingCalendar
+from abovedata_backtesting.exits.cython_batch import (
+    BATCH_METRICS,
+    EXIT_FIXED_HOLDING,
+    EXIT_SIGNAL_CHANGE,
+    EXIT_STOP_LOSS_TAKE_PROFIT,
+    EXIT_TRAILING_STOP,
+    N_TRADES_COL,
+    TOTAL_RETURN_COL,
+    evaluate_exit_grid_cy,
+)
 from abovedata_backtesting.exits.cython_exits import (
     enforce_max_entries_cy,
     fixed_holding_exit_cy,
@@ -43,80 +75,169 @@ from abovedata_backtesting.exits.exit_strategies import (
     TrailingStopExit,
 )
 from abovedata_backtesting.model.metrics import BacktestMetrics
+from abovedata_backtesting.processors.entry_cache import (
+    EntryCache,
+    entry_state,
+    frame_fingerprint,
+    input_fingerprint,
+)
+from abovedata_backtesting.processors.result_collector import (
+    TopKResultCollector,
+    resolve_metric_col,
+    summary_row,
+)
 from abovedata_backtesting.processors.signal_preprocessor import (
     IdentityPreprocessor,
     SignalPreprocessor,
+    apply_preprocessors,
+)
+from abovedata_backtesting.processors.successive_halving import (
+    PruningLog,
+    SuccessiveHalving,
+    entry_proxy,
+    top_mask,
+    window_start,
+)
+from abovedata_backtesting.processors.walk_forward import (
+    WalkForward,
+    WalkForwardResult,
+    best_row,
 )
 from abovedata_backtesting.trades.trade_log import TradeLog
 
 Preprocessor = SignalPreprocessor | IdentityPreprocessor
 
 
-@dataclass(slots=True)
-class _CachedArrays:
-    """Pre-extracted numpy arrays from a daily DataFrame for fast exit evaluation."""
+@dataclass(frozen=True, slots=True)
+class MarketArrays:
+    """Read-only market columns shared by every entry combo of a run.
 
-    positions: NDArray[np.float64]
+    Built once per run from the market data. Arrays are marked non-writeable
+    so exit kernels and metrics can share them without defensive copies.
+    """
+
+    dates: NDArray[np.datetime64]
     closes: NDArray[np.float64]
     highs: NDArray[np.float64]
     lows: NDArray[np.float64]
     asset_returns: NDArray[np.float64]
     benchmark_returns: NDArray[np.float64]
+
+    @classmethod
+    def from_frame(cls, market_data: pl.DataFrame) -> MarketArrays:
+        """Extract the market columns once as read-only numpy arrays."""
+
+        def _read_only(col: str, dtype: Any) -> NDArray[Any]:
+            arr = np.array(market_data[col].to_numpy(), dtype=dtype)
+            arr.setflags(write=False)
+            return arr
+
+        return cls(
+            dates=_read_only("date", "datetime64[D]"),
+            closes=_read_only("close", np.float64),
+            highs=_read_only("high", np.float64),
+            lows=_read_only("low", np.float64),
+            asset_returns=_read_only("asset_return", np.float64),
+            benchmark_returns=_read_only("benchmark_return", np.float64),
+        )
+
+    @property
+    def n_days(self) -> int:
+        return int(self.dates.shape[0])
+
+    def signal_date_mask(
+        self, signal_dates: frozenset[dt.date] | None
+    ) -> NDArray[np.uint8]:
+        """1 where the trading date is one of ``signal_dates``, else 0."""
+        if not signal_dates:
+            mask = np.zeros(self.n_days, dtype=np.uint8)
+        else:
+            wanted = np.array(sorted(signal_dates), dtype="datetime64[D]")
+            mask = np.isin(self.dates, wanted).astype(np.uint8)
+        mask.setflags(write=False)
+        return mask
+
+    def window(self, start: int, stop: int) -> MarketArrays:
+        """Read-only views of the ``[start, stop)`` trading-day range."""
+        return MarketArrays(
+            dates=self.dates[start:stop],
+            closes=self.closes[start:stop],
+            highs=self.highs[start:stop],
+            lows=self.lows[start:stop],
+            asset_returns=self.asset_returns[start:stop],
+            benchmark_returns=self.benchmark_returns[start:stop],
+        )
+
+
+@dataclass(slots=True)
+class _CachedArrays:
+    """Per-entry arrays for fast exit evaluation; market columns are shared."""
+
+    market: MarketArrays
+    positions: NDArray[np.float64]
     signal_ids: NDArray[np.int32]
     strengths: NDArray[np.float64]
     confs: NDArray[np.float64]
-    dates: list[dt.date]
     signal_date_mask: NDArray[np.uint8]
 
     @classmethod
-    def from_daily(
+    def from_events(
         cls,
-        daily: pl.DataFrame,
-        signal_dates: frozenset[dt.date] | None = None,
+        events: EntryEvents,
+        market: MarketArrays,
+        signal_date_mask: NDArray[np.uint8],
     ) -> _CachedArrays:
-        """Extract all arrays from a daily DataFrame once."""
-        dates = daily["date"].to_list()
+        """Expand entry events to daily arrays alongside the shared market."""
+        positions, signal_ids, strengths, confs = events.daily_arrays()
+        return cls(
+            market=market,
+            positions=positions,
+            signal_ids=signal_ids,
+            strengths=strengths,
+            confs=confs,
+            signal_date_mask=signal_date_mask,
+        )
 
-        signal_mask = np.zeros(len(dates), dtype=np.uint8)
-        if signal_dates:
-            for i, d in enumerate(dates):
-                if d in signal_dates:
-                    signal_mask[i] = 1
+    def with_position_filter(self, pos_filter: PositionFilter) -> _CachedArrays:
+        """Zero out positions excluded by the filter; other arrays are shared.
 
-        return cls(
-            positions=np.array(
-                daily["position"].to_numpy(), dtype=np.float64, copy=True
-            ),
-            closes=np.array(daily["close"].to_numpy(), dtype=np.float64, copy=True),
-            highs=np.array(daily["high"].to_numpy(), dtype=np.float64, copy=True),
-            lows=np.array(daily["low"].to_numpy(), dtype=np.float64, copy=True),
-            asset_returns=np.array(
-                daily["asset_return"].to_numpy(), dtype=np.float64, copy=True
-            ),
-            benchmark_returns=np.array(
-                daily["benchmark_return"].to_numpy(), dtype=np.float64, copy=True
-            ),
-            signal_ids=(
-                np.array(daily["signal_id"].to_numpy(), dtype=np.int32, copy=True)
-                if "signal_id" in daily.columns
-                else np.zeros(daily.height, dtype=np.int32)
-            ),
-            strengths=(
-                np.array(
-                    daily["signal_strength"].to_numpy(),
-                    dtype=np.float64,
-                    copy=True,
-                )
-                if "signal_strength" in daily.columns
-                else np.zeros(daily.height, dtype=np.float64)
-            ),
-            confs=(
-                np.array(daily["confidence"].to_numpy(), dtype=np.float64, copy=True)
-                if "confidence" in daily.columns
-                else np.zeros(daily.height, dtype=np.float64)
-            ),
-            dates=dates,
-            signal_date_mask=signal_mask,
+        Same result as expanding ``events.with_position_filter(pos_filter)``.
+        """
+        if pos_filter == "long_only":
+            positions = np.where(self.positions > 0, self.positions, 0.0)
+        elif pos_filter == "short_only":
+            positions = np.where(self.positions < 0, self.positions, 0.0)
+        else:
+            return self
+        return _CachedArrays(
+            market=self.market,
+            positions=positions,
+            signal_ids=self.signal_ids,
+            strengths=self.strengths,
+            confs=self.confs,
+            signal_date_mask=self.signal_date_mask,
+        )
+
+    def window(self, start: int, stop: int) -> _CachedArrays:
+        """Arrays of the ``[start, stop)`` range, on the matching market window.
+
+        Positions of the signal already active the day before ``start`` are
+        zeroed: it was entered before the window, so the window must not
+        re-enter it on its first day.
+        """
+        positions = self.positions[start:stop]
+        signal_ids = self.signal_ids[start:stop]
+        if start > 0 and self.signal_ids[start - 1] != 0:
+            positions = np.where(
+                signal_ids == self.signal_ids[start - 1], 0.0, positions
+            )
+        return _CachedArrays(
+            market=self.market.window(start, stop),
+            positions=positions,
+            signal_ids=signal_ids,
+            strengths=self.strengths[start:stop],
+            confs=self.confs[start:stop],
+            signal_date_mask=self.signal_date_mask[start:stop],
         )
 
 
@@ -126,6 +247,75 @@ class _CachedArrays:
 
 PositionFilter = Literal["long_short", "long_only", "short_only"]
 
+# Key: (pp_name, entry_name) → (unfiltered events, entry, preprocessor).
+# Position filters are applied in Phase 2, so they are not part of the key.
+_EntryCache = dict[
+    tuple[str, str],
+    tuple[EntryEvents, EntryRule, Preprocessor],
+]
+
+# Built entry: (cache key, events, entry, preprocessor)
+_BuiltEntry = tuple[tuple[str, str], EntryEvents, EntryRule, Preprocessor]
+
+# Entry combo to build: (pp_name, entry, preprocessor)
+_EntryCombo = tuple[str, EntryRule, Preprocessor]
+
+
+# =============================================================================
+# Entry Executors
+# =============================================================================
+
+# "thread":  ThreadPoolExecutor — default; Polars releases the GIL in C code.
+# "process": ProcessPoolExecutor — for Python-heavy entry rules that hold the
+#            GIL (per-row loops in CorrelationAwareEntry, CrossTickerEntry).
+# "serial":  In-process loop — deterministic, easiest to profile and debug.
+EntryExecutor = Literal["thread", "process", "serial"]
+
+# Per-process state for the "process" executor, set once by _init_entry_worker.
+_worker_market_data: pl.DataFrame | None = None
+_worker_signals: dict[str, pl.DataFrame] = {}
+_worker_calendar: TradingCalendar | None = None
+
+
+def _compute_entries(
+    market_data: pl.DataFrame,
+    pp_signals: pl.DataFrame,
+    entries: list[EntryRule],
+    calendar: TradingCalendar | None = None,
+) -> list[EntryEvents]:
+    """Run same-type entry rules in one batch_events() call.
+
+    Returns one unfiltered EntryEvents per entry, in order.
+    """
+    return type(entries[0]).batch_events(
+        entries, market_data, pp_signals, calendar=calendar
+    )
+
+
+def _init_entry_worker(
+    market_data: pl.DataFrame, preprocessed: dict[str, pl.DataFrame]
+) -> None:
+    """Pool initializer: receive the shared frames once per worker process."""
+    global _worker_market_data, _worker_signals, _worker_calendar
+    _worker_market_data = market_data
+    _worker_signals = preprocessed
+    _worker_calendar = TradingCalendar.from_market_data(market_data)
+
+
+def _compute_entries_in_worker(
+    pp_name: str, entries: list[EntryRule]
+) -> list[EntryEvents]:
+    """Process-pool task: evaluate entries against the worker's shared frames."""
+    if _worker_market_data is None:
+        raise RuntimeError("Entry worker used before _init_entry_worker ran")
+    return _compute_entries(
+        _worker_market_data,
+        _worker_signals[pp_name],
+        entries,
+        _worker_calendar,
+    )
+
+
 # =============================================================================
 # Sanity Validation
 # =============================================================================
@@ -319,6 +509,40 @@ class StrategyProcessor:
     end_date: dt.date | None = None
     sanity_config: SanityConfig = field(default_factory=SanityConfig)
     debug: bool = False
+    executor: EntryExecutor = "thread"
+    max_workers: int | None = None
+    # When set, Phase 2 scores every combo with the batched exit kernel and
+    # only builds GridSearchResults for the top-N by optimize_by and by
+    # trade total return. None = materialize every combo (legacy behavior).
+    # The kernel only pays off compiled (make build-cython).
+    materialize_top_n: int | None = None
+    # Persistent on-disk entry cache (see processors/entry_cache.py). None
+    # disables it; repeat runs with the same data and entry grid then skip
+    # entry.apply() entirely.
+    entry_cache_dir: Path | str | None = None
+    entry_cache_max_bytes: int = 2 * 1024**3
+    # When set, run() keeps full GridSearchResults (trade logs, metric
+    # trees) only for the top-K combos by optimize_by, sharpe and trade
+    # total return; the summary still has a row for every combo (see
+    # processors/result_collector.py). None = keep every result.
+    keep_top_k: int | None = None
+    # Parquet spill directory for the summary rows when keep_top_k is set.
+    # None keeps the row batches in memory as DataFrames. When set, run()
+    # returns only the kept results' summary rows and the full summary
+    # stays on disk, readable through ``summary_scan``.
+    summary_spill_dir: Path | str | None = None
+    # keep_top_k runs: lazy scan of the last run's full summary (sorted).
+    summary_scan: pl.LazyFrame | None = field(default=None, init=False, repr=False)
+    # Successive-halving search (see processors/successive_halving.py):
+    # prune (entry, filter) pairs on entry-only proxies and exit variants on
+    # a trailing window; only survivors get full evaluation. None = evaluate
+    # every combo. The decisions of the last run land in ``pruning_log``.
+    halving: SuccessiveHalving | None = None
+    pruning_log: pl.DataFrame | None = field(default=None, init=False, repr=False)
+    # Externally owned pool for the "thread" executor. Lets several
+    # processors (e.g. PortfolioGridRunner jobs) share one set of workers;
+    # run() submits to it but never shuts it down.
+    entry_pool: Executor | None = field(default=None, repr=False)
 
     _entry_rules: list[EntryRule] = field(default_factory=list, init=False, repr=False)
     _exit_rules: list[ExitRule] = field(default_factory=list, init=False, repr=False)
@@ -331,7 +555,15 @@ class StrategyProcessor:
     _market_data: pl.DataFrame = field(
         default_factory=pl.DataFrame, init=False, repr=False
     )
+    _market_arrays: MarketArrays | None = field(default=None, init=False, repr=False)
+    _calendar: TradingCalendar | None = field(default=None, init=False, repr=False)
     _benchmark_data: pl.DataFrame | None = field(default=None, init=False, repr=False)
+    # evaluate_entries() state: preprocessed signals and the entry cache
+    # accumulated across calls.
+    _search_signals: dict[str, pl.DataFrame] | None = field(
+        default=None, init=False, repr=False
+    )
+    _search_cache: _EntryCache = field(default_factory=dict, init=False, repr=False)
 
     _buy_hold_cache: dict[tuple[dt.date, dt.date], float] = field(
         default_factory=dict, init=False, repr=False
@@ -361,141 +593,841 @@ class StrategyProcessor:
         """Run full cartesian product of preprocessor × entry × exit rules.
 
         Two-phase architecture for performance:
-          Phase 1: Build entry cache — one entry.apply() per unique
-                   (preprocessor, entry_rule, position_filter) triple.
-          Phase 2: Apply all (exit_rule, max_entries) variants to each
-                   cached entry result using Cython-accelerated exit kernels.
+          Phase 1: Build entry cache — one entry.events() per unique
+                   (preprocessor, entry_rule) pair.
+          Phase 2: Apply all (position_filter, exit_rule, max_entries)
+                   variants to each cached entry result; filters are array
+                   transforms, exits use Cython-accelerated kernels.
+
+        With ``keep_top_k`` set, the returned results are only the retained
+        winners (in summary order) while the summary covers every combo; with
+        ``summary_spill_dir`` also set, the returned summary holds only the
+        winners' rows and the full summary is left on disk as
+        ``summary_scan``, so memory does not grow with the grid.
         """
         self._load_data()
         self._set_defaults()
+        self._check_rank_metric(optimize_by)
 
         results: list[GridSearchResult] = []
+        collector = self._make_collector(optimize_by)
+        emit = results.append if collector is None else collector.add
 
         # ── Phase 1: Build entry cache (parallel) ────────────────────
-        # Preprocessors run sequentially (few, fast, may share state),
-        # then entry.apply() calls run in parallel via ThreadPoolExecutor.
-        # Polars releases the GIL during C-level operations, so threads
-        # give real parallelism without serialization overhead.
-        preprocessed_cache: dict[str, pl.DataFrame] = {}
-        # Key: (pp_name, entry_name, pos_filter) → (daily_df, entry, preprocessor)
-        entry_cache: dict[
-            tuple[str, str, PositionFilter],
-            tuple[pl.DataFrame, EntryRule, Preprocessor],
-        ] = {}
-
-        # Pre-compute preprocessor outputs (few, fast — no parallelism needed)
-        for pp in self._preprocessors:
-            if pp.name not in preprocessed_cache:
-                preprocessed_cache[pp.name] = pp.apply(self.signals.clone())
+        # Preprocessors run as one prefix tree (shared transform prefixes
+        # computed once, sibling branches on threads), then entry.events()
+        # calls run on the configured executor.
+        preprocessed_cache = self._preprocess()
+        entry_cache = self._build_entries(self._entry_rules, preprocessed_cache)
 
-        # Deduplicate entry combos
-        entry_combos: list[tuple[str, EntryRule, PositionFilter, Preprocessor]] = []
-        seen_keys: set[tuple[str, str, PositionFilter]] = set()
-        for preprocessor, entry, pos_filter in itertools_product(
-            self._preprocessors,
-            self._entry_rules,
-            self._position_filters,
-        ):
-            cache_key = (preprocessor.name, entry.name, pos_filter)
-            if cache_key not in seen_keys:
-                seen_keys.add(cache_key)
-                entry_combos.append(
-                    (preprocessor.name, entry, pos_filter, preprocessor)
-                )
+        # ── Phase 2: Apply exits to cached entries ───────────────────
+        self._apply_exits(entry_cache, optimize_by, emit)
+
+        if collector is None:
+            summary_df = self._build_summary(results, optimize_by)
+            sorted_results = [results[i] for i in summary_df["_original_idx"].to_list()]
+        else:
+            summary_df, sorted_results = self._finish_collector(
+                collector, optimize_by, collect=self.summary_spill_dir is None
+            )
+
+        # ── Phase 3: Reconstruct daily_df for top results ────────────
+        # Rebuild DataFrames only for results that need them (robustness
+        # tests, reports). The rest stay as daily_df=None for memory.
+        self._rebuild_daily_df(sorted_results, entry_cache)
+
+        return summary_df.drop("_original_idx"), sorted_results
+
+    def evaluate_entries(
+        self,
+        entries: Sequence[EntryRule],
+        optimize_by: str = "sharpe_ratio",
+    ) -> tuple[pl.DataFrame, list[GridSearchResult]]:
+        """Incrementally evaluate entry rules against the configured grid.
+
+        Used by search drivers (see processors/parameter_search.py) that
+        propose entry rules in batches. The first call loads the market data
+        and preprocesses the signals; every call reuses them together with
+        the entry cache of earlier calls, so only (preprocessor, entry) pairs
+        not seen before are built. Each new pair is crossed with every
+        position filter, exit rule and max_entries value through the same
+        Phase 2 path as ``run`` (including ``materialize_top_n``,
+        ``halving`` and ``keep_top_k``).
+
+        Returns the summary and results of the newly evaluated combos only,
+        in the same form as ``run``; both are empty when nothing traded.
+        Rules added with ``add_entries`` are ignored.
+        """
+        if self._search_signals is None:
+            self._load_data()
+            self._set_defaults(require_entries=False)
+            self._search_signals = self._preprocess()
+        self._check_rank_metric(optimize_by)
+
+        by_name: dict[str, EntryRule] = {}
+        for entry in entries:
+            by_name.setdefault(entry.name, entry)
+        new_entries = [
+            entry
+            for entry in by_name.values()
+            if any(
+                (pp.name, entry.name) not in self._search_cache
+                for pp in self._preprocessors
+            )
+        ]
+        entry_cache = {
+            key: cached
+            for key, cached in self._build_entries(
+                new_entries, self._search_signals
+            ).items()
+            if key not in self._search_cache
+        }
+        self._search_cache.update(entry_cache)
+
+        results: list[GridSearchResult] = []
+        collector = self._make_collector(optimize_by)
+        emit = results.append if collector is None else collector.add
+        self._apply_exits(entry_cache, optimize_by, emit)
+
+        if not results and (collector is None or not collector.n_results):
+            return pl.DataFrame(), []
+        if collector is None:
+            summary_df = self._build_summary(results, optimize_by)
+            sorted_results = [results[i] for i in summary_df["_original_idx"].to_list()]
+        else:
+            # Search batches are small; their objectives need every row.
+            summary_df, sorted_results = self._finish_collector(
+                collector, optimize_by, collect=True
+            )
+        self._rebuild_daily_df(sorted_results, entry_cache)
+        return summary_df.drop("_original_idx"), sorted_results
 
-        n_workers = min(os.cpu_count() or 4, len(entry_combos))
-
-        def _compute_entry(
-            pp_name: str,
-            entry: EntryRule,
-            pos_filter: PositionFilter,
-        ) -> tuple[
-            tuple[str, str, PositionFilter],
-            pl.DataFrame | None,
-        ]:
-            pp_signals = preprocessed_cache[pp_name]
-            daily = entry.apply(self._market_data.clone(), pp_signals)
-            if "position" not in daily.columns:
-                return (pp_name, entry.name, pos_filter), None
-            daily = self._apply_position_filter(daily, pos_filter)
-            return (pp_name, entry.name, pos_filter), daily
-
-        with ThreadPoolExecutor(max_workers=n_workers) as pool:
-            futures = {
-                pool.submit(_compute_entry, pp_name, entry, pos_filter): (
-                    pp_name,
+    def walk_forward(
+        self,
+        config: WalkForward,
+        optimize_by: str = "sharpe_ratio",
+    ) -> WalkForwardResult:
+        """Walk-forward out-of-sample evaluation of the configured grid.
+
+        The entry cache is built once over the full timeline. Each fold of
+        ``config`` scores every (entry, filter, exit, max_entries) combo on
+        its train window with the batched exit kernel, then evaluates the
+        best one by ``optimize_by`` on the test window (see
+        processors/walk_forward.py). Only exits the kernel supports take
+        part in the selection.
+        """
+        self._load_data()
+        self._set_defaults()
+        market = self._require_market_arrays()
+        folds = config.folds(market.n_days)
+        if not folds:
+            raise ValueError(
+                f"{market.n_days} trading days are too few for {config} "
+                "(need train_days + test_days)"
+            )
+        batch_idx, exit_kinds, exit_params = _encode_exit_rules(self._exit_rules)
+        if not batch_idx:
+            raise ValueError("walk_forward needs an exit rule the exit kernel supports")
+        max_entries = np.asarray(self.max_entries_per_signal, dtype=np.int32)
+        rank_col = _batch_rank_col(optimize_by)
+        signal_mask = self._signal_mask()
+
+        entry_cache = self._build_entries(self._entry_rules, self._preprocess())
+
+        # ── Train windows: best (score, (cache key, filter), row) per fold ──
+        best: list[tuple[float, tuple[tuple[str, str], PositionFilter], int] | None]
+        best = [None] * len(folds)
+        for cache_key, (events, _entry, _preprocessor) in tqdm(
+            entry_cache.items(), desc="Scoring train folds", disable=not self.debug
+        ):
+            base_arrays = _CachedArrays.from_events(events, market, signal_mask)
+            for pos_filter in self._position_filters:
+                arrays = base_arrays.with_position_filter(pos_filter)
+                for f, fold in enumerate(folds):
+                    train = arrays.window(fold.train_start, fold.train_end)
+                    scores = evaluate_exit_grid_cy(
+                        train.positions,
+                        train.market.closes,
+                        train.market.highs,
+                        train.market.lows,
+                        train.market.asset_returns,
+                        train.signal_date_mask,
+                        train.signal_ids,
+                        exit_kinds,
+                        exit_params,
+                        max_entries,
+                    )
+                    row = best_row(
+                        scores, rank_col, N_TRADES_COL, config.min_train_trades
+                    )
+                    current = best[f]
+                    if row >= 0 and (
+                        current is None or scores[row, rank_col] > current[0]
+                    ):
+                        best[f] = (
+                            float(scores[row, rank_col]),
+                            (cache_key, pos_filter),
+                            row,
+                        )
+
+        # ── Test windows: evaluate each fold's winner ─────────────────
+        dates: list[dt.date] = market.dates.tolist()
+        rows: list[dict[str, Any]] = []
+        results: list[GridSearchResult | None] = []
+        for f, (fold, choice) in enumerate(zip(folds, best)):
+            row: dict[str, Any] = {
+                "fold": f,
+                "train_start": dates[fold.train_start],
+                "train_end": dates[fold.train_end - 1],
+                "test_start": dates[fold.test_start],
+                "test_end": dates[fold.test_end - 1],
+                "pp_name": None,
+                "entry_name": None,
+                "exit_name": None,
+                "position_filter": None,
+                "max_entries_per_signal": None,
+                "train_score": None,
+            }
+            result: GridSearchResult | None = None
+            if choice is not None:
+                score, (cache_key, pos_filter), local = choice
+                events, entry, preprocessor = entry_cache[cache_key]
+                exit_rule = self._exit_rules[batch_idx[local // len(max_entries)]]
+                n_max = int(max_entries[local % len(max_entries)])
+                filtered = events.with_position_filter(pos_filter)
+                arrays = _CachedArrays.from_events(filtered, market, signal_mask)
+                result = self._evaluate_arrays(
+                    arrays.window(fold.test_start, fold.test_end),
+                    filtered,
                     entry,
+                    exit_rule,
                     pos_filter,
+                    n_max,
                     preprocessor,
                 )
-                for pp_name, entry, pos_filter, preprocessor in entry_combos
+                row |= {
+                    "pp_name": cache_key[0],
+                    "entry_name": cache_key[1],
+                    "exit_name": exit_rule.name,
+                    "position_filter": pos_filter,
+                    "max_entries_per_signal": n_max,
+                    "train_score": score,
+                }
+            row |= {
+                "test_sharpe_ratio": (
+                    result.metrics.risk.sharpe_ratio if result else None
+                ),
+                "test_annualized_return": (
+                    result.metrics.returns.annualized_return if result else None
+                ),
+                "test_trade_total_return": (
+                    result.trade_log.total_return if result else None
+                ),
+                "test_trade_n_trades": result.trade_log.n_trades if result else None,
             }
-            with tqdm(
-                total=len(futures),
-                desc=f"Building entry cache ({n_workers} threads)",
-                disable=not self.debug,
-            ) as pbar:
-                for future in as_completed(futures):
-                    pp_name, entry, pos_filter, preprocessor = futures[future]
-                    cache_key, daily = future.result()
-                    if daily is not None:
-                        entry_cache[cache_key] = (daily, entry, preprocessor)
-                    pbar.update(1)
+            rows.append(row)
+            results.append(result)
 
-        # ── Phase 2: Apply exits to cached entries ───────────────────
+        if self.debug:
+            print(
+                f"Walk-forward: {len(folds)} folds x {len(entry_cache)} entries, "
+                f"ranked by {BATCH_METRICS[rank_col]}"
+            )
+        return WalkForwardResult(
+            folds=pl.DataFrame(rows, infer_schema_length=None), results=results
+        )
+
+    def evaluate_exits(
+        self,
+        result: GridSearchResult,
+        exit_rules: Sequence[ExitRule],
+    ) -> list[GridSearchResult | None]:
+        """Re-evaluate the entry of ``result`` under other exit rules.
+
+        Used by robustness ablations. The (preprocessor, entry) events are
+        built once and kept in the ``evaluate_entries`` cache, so further
+        calls for the same entry only run the exit kernels through
+        ``_evaluate_arrays``. The position filter and max_entries_per_signal
+        of ``result`` are kept.
+
+        Returns one result per exit rule, None where it did not trade.
+        """
+        if self._market_arrays is None:
+            self._load_data()
+            self._set_defaults(require_entries=False)
+        cache_key = (result.preprocessor_name, result.entry_rule.name)
+        if cache_key not in self._search_cache:
+            preprocessor = next(
+                (pp for pp in self._preprocessors if pp.name == cache_key[0]), None
+            )
+            if preprocessor is None:
+                raise ValueError(f"Unknown preprocessor {cache_key[0]!r}")
+            if self._search_signals is not None:
+                pp_signals = {cache_key[0]: self._search_signals[cache_key[0]]}
+            else:
+                pp_signals = apply_preprocessors([preprocessor], self.signals.clone())
+            for key, events, entry, pp in self._build_entry_cache(
+                [(cache_key[0], result.entry_rule, preprocessor)], pp_signals
+            ):
+                self._search_cache[key] = (events, entry, pp)
+
+        events, entry, preprocessor = self._search_cache[cache_key]
+        market = self._require_market_arrays()
+        filtered = events.with_position_filter(result.position_filter)
+        arrays = _CachedArrays.from_events(filtered, market, self._signal_mask())
+        # Fixed-holding exits reset their clock on their own signal dates.
+        masked: dict[frozenset[dt.date], _CachedArrays] = {}
+        results: list[GridSearchResult | None] = []
+        for exit_rule in exit_rules:
+            exit_arrays = arrays
+            if isinstance(exit_rule, FixedHoldingExit):
+                dates = exit_rule.signal_dates
+                if dates not in masked:
+                    masked[dates] = replace(
+                        arrays, signal_date_mask=market.signal_date_mask(dates)
+                    )
+                exit_arrays = masked[dates]
+            results.append(
+                self._evaluate_arrays(
+                    exit_arrays,
+                    filtered,
+                    entry,
+                    exit_rule,
+                    result.position_filter,
+                    result.max_entries_per_signal,
+                    preprocessor,
+                )
+            )
+        return results
+
+    def _signal_mask(self) -> NDArray[np.uint8]:
+        """Signal-date mask of the first FixedHoldingExit with signal_dates."""
         # Collect signal_dates from FixedHoldingExit rules for cache extraction
         signal_dates: frozenset[dt.date] | None = None
         for er in self._exit_rules:
             if isinstance(er, FixedHoldingExit) and er.signal_dates:
                 signal_dates = er.signal_dates
                 break
+        return self._require_market_arrays().signal_date_mask(signal_dates)
 
-        total_combos = (
-            len(entry_cache) * len(self._exit_rules) * len(self.max_entries_per_signal)
+    def _preprocess(self) -> dict[str, pl.DataFrame]:
+        """Preprocessed signal frame per preprocessor name."""
+        return apply_preprocessors(
+            self._preprocessors,
+            self.signals.clone(),
+            max_workers=1 if self.executor == "serial" else self.max_workers,
         )
 
+    def _build_entries(
+        self,
+        entries: Sequence[EntryRule],
+        preprocessed_cache: dict[str, pl.DataFrame],
+    ) -> _EntryCache:
+        """Phase 1: entry events for every (preprocessor, entry) pair."""
+        entry_cache: _EntryCache = {}
+
+        # Deduplicate entry combos
+        entry_combos: list[_EntryCombo] = []
+        seen_keys: set[tuple[str, str]] = set()
+        for preprocessor, entry in itertools_product(self._preprocessors, entries):
+            cache_key = (preprocessor.name, entry.name)
+            if cache_key not in seen_keys:
+                seen_keys.add(cache_key)
+                entry_combos.append((preprocessor.name, entry, preprocessor))
+
+        # Combos whose entry reads identical inputs are computed once and
+        # fanned out to every (preprocessor, entry) key that shares them.
+        shared = self._group_by_inputs(entry_combos, preprocessed_cache)
+        shared_by_key = {(group[0][0], group[0][1].name): group for group in shared}
+        for cache_key, events, _entry, _pp in self._build_entry_cache(
+            [group[0] for group in shared], preprocessed_cache
+        ):
+            for pp_name, entry, preprocessor in shared_by_key[cache_key]:
+                entry_cache[(pp_name, entry.name)] = (events, entry, preprocessor)
+        return entry_cache
+
+    def _apply_exits(
+        self,
+        entry_cache: _EntryCache,
+        optimize_by: str,
+        emit: Callable[[GridSearchResult], None],
+    ) -> None:
+        """Phase 2: evaluate exit variants of cached entries, ``emit`` results."""
+        market = self._require_market_arrays()
+        signal_mask = self._signal_mask()
+
+        if self.halving is not None:
+            log = self._evaluate_halving(
+                self.halving, entry_cache, signal_mask, optimize_by, emit
+            )
+            self.pruning_log = log.to_frame()
+            return
+        if self.materialize_top_n is not None:
+            self._evaluate_batched(entry_cache, signal_mask, optimize_by, emit)
+            return
+
+        total_combos = (
+            len(entry_cache)
+            * len(self._position_filters)
+            * len(self._exit_rules)
+            * len(self.max_entries_per_signal)
+        )
         with tqdm(
             total=total_combos, desc="Evaluating exits", disable=not self.debug
         ) as pbar:
-            for (
-                _pp_name,
-                _entry_name,
-                pos_filter,
-            ), (base_daily, entry, preprocessor) in entry_cache.items():
+            for events, entry, preprocessor in entry_cache.values():
                 # Pre-extract arrays once per entry cache key
-                arrays = _CachedArrays.from_daily(base_daily, signal_dates)
+                base_arrays = _CachedArrays.from_events(events, market, signal_mask)
+
+                for pos_filter in self._position_filters:
+                    arrays = base_arrays.with_position_filter(pos_filter)
+                    filtered = events.with_position_filter(pos_filter)
+                    for exit_rule in self._exit_rules:
+                        for max_entries in self.max_entries_per_signal:
+                            pbar.update(1)
+                            if result := self._evaluate_arrays(
+                                arrays,
+                                filtered,
+                                entry,
+                                exit_rule,
+                                pos_filter,
+                                max_entries,
+                                preprocessor,
+                            ):
+                                emit(result)
+
+    def _group_by_inputs(
+        self,
+        entry_combos: list[_EntryCombo],
+        preprocessed_cache: dict[str, pl.DataFrame],
+    ) -> list[list[_EntryCombo]]:
+        """Group combos by (entry, fingerprint of the columns it reads).
+
+        Each group's entry output is the same for every combo in it, so only
+        its first combo needs computing. Order follows ``entry_combos``.
+        """
+        fingerprints: dict[tuple[str, tuple[str, ...] | None], str] = {}
+        groups: dict[tuple[str, str], list[_EntryCombo]] = {}
+        for combo in entry_combos:
+            pp_name, entry, _preprocessor = combo
+            columns = entry.input_columns()
+            fp_key = (pp_name, columns)
+            if fp_key not in fingerprints:
+                fingerprints[fp_key] = input_fingerprint(
+                    preprocessed_cache[pp_name], columns
+                )
+            groups.setdefault((entry.name, fingerprints[fp_key]), []).append(combo)
+
+        if self.debug:
+            print(
+                f"Entry inputs: {len(entry_combos)} combos, "
+                f"{len(groups)} distinct computations"
+            )
+        return list(groups.values())
+
+    def _build_entry_cache(
+        self,
+        entry_combos: list[_EntryCombo],
+        preprocessed_cache: dict[str, pl.DataFrame],
+    ) -> list[_BuiltEntry]:
+        """Build entry outputs, serving what it can from the on-disk cache."""
+        if self.entry_cache_dir is None:
+            return self._run_entry_combos(entry_combos, preprocessed_cache)
+
+        disk = EntryCache(Path(self.entry_cache_dir), self.entry_cache_max_bytes)
+        market_fp = frame_fingerprint(self._market_data)
+        signal_fps = {
+            name: frame_fingerprint(df) for name, df in preprocessed_cache.items()
+        }
+
+        built: list[_BuiltEntry] = []
+        pending: list[_EntryCombo] = []
+        disk_keys: dict[tuple[str, str], str] = {}
+        for combo in entry_combos:
+            pp_name, entry, preprocessor = combo
+            if not entry.cacheable:
+                pending.append(combo)
+                continue
+            key = EntryCache.make_key(
+                preprocessor.params(),
+                entry_state(entry),
+                entry.name,
+                market_fp,
+                signal_fps[pp_name],
+            )
+            cached = disk.get(key, self._market_data.height)
+            if cached is None:
+                disk_keys[(pp_name, entry.name)] = key
+                pending.append(combo)
+            else:
+                built.append(((pp_name, entry.name), cached, entry, preprocessor))
+
+        for item in self._run_entry_combos(pending, preprocessed_cache):
+            cache_key, events = item[0], item[1]
+            if cache_key in disk_keys:
+                disk.put(disk_keys[cache_key], events)
+            built.append(item)
+        if disk_keys:
+            disk.evict()
+
+        if self.debug:
+            print(
+                f"Entry disk cache: {disk.hits} hits, {disk.misses} misses "
+                f"({disk.cache_dir})"
+            )
+        return built
+
+    def _run_entry_combos(
+        self,
+        entry_combos: list[_EntryCombo],
+        preprocessed_cache: dict[str, pl.DataFrame],
+    ) -> list[_BuiltEntry]:
+        """Run entry.events() for every combo on the configured executor.
+
+        Combos of a ``batchable`` rule type that share a preprocessor form one
+        task and go through a single batch_events() call; every other combo
+        is its own task.
+        """
+        built: list[_BuiltEntry] = []
+        if not entry_combos:
+            return built
+
+        tasks: list[list[_EntryCombo]] = []
+        batches: dict[tuple[str, type[EntryRule]], list[_EntryCombo]] = {}
+        for combo in entry_combos:
+            pp_name, entry = combo[0], combo[1]
+            if not entry.batchable:
+                tasks.append([combo])
+                continue
+            batch = batches.setdefault((pp_name, type(entry)), [])
+            if not batch:
+                tasks.append(batch)
+            batch.append(combo)
+
+        n_workers = min(self.max_workers or os.cpu_count() or 4, len(tasks))
+        desc = f"Building entry cache ({self.executor}, {n_workers} workers)"
+
+        def _collect(
+            task: list[_EntryCombo],
+            events: list[EntryEvents],
+        ) -> None:
+            for (pp_name, entry, preprocessor), ev in zip(task, events):
+                built.append(((pp_name, entry.name), ev, entry, preprocessor))
+
+        if self.executor == "serial":
+            for task in tqdm(tasks, desc=desc, disable=not self.debug):
+                _collect(
+                    task,
+                    _compute_entries(
+                        self._market_data,
+                        preprocessed_cache[task[0][0]],
+                        [combo[1] for combo in task],
+                        self._calendar,
+                    ),
+                )
+            return built
+
+        pool: Executor
+        pool_scope: AbstractContextManager[Executor]
+        if self.executor == "thread" and self.entry_pool is not None:
+            pool = self.entry_pool
+            pool_scope = nullcontext(pool)
+            desc = f"Building entry cache (shared {self.executor} pool)"
+        elif self.executor == "process":
+            # Spawn (not fork): Polars' thread pool is not fork-safe.
+            pool = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_entry_worker,
+                initargs=(self._market_data, preprocessed_cache),
+            )
+            pool_scope = pool
+        elif self.executor == "thread":
+            pool = ThreadPoolExecutor(max_workers=n_workers)
+            pool_scope = pool
+        else:
+            raise ValueError(
+                f"Unknown executor '{self.executor}'. "
+                "Expected 'thread', 'process' or 'serial'."
+            )
+
+        with pool_scope:
+            futures: dict[
+                Future[list[EntryEvents]],
+                list[_EntryCombo],
+            ] = {}
+            for task in tasks:
+                pp_name = task[0][0]
+                entries = [combo[1] for combo in task]
+                if self.executor == "process":
+                    future = pool.submit(_compute_entries_in_worker, pp_name, entries)
+                else:
+                    future = pool.submit(
+                        _compute_entries,
+                        self._market_data,
+                        preprocessed_cache[pp_name],
+                        entries,
+                        self._calendar,
+                    )
+                futures[future] = task
+
+            with tqdm(total=len(futures), desc=desc, disable=not self.debug) as pbar:
+                for future in as_completed(futures):
+                    _collect(futures[future], future.result())
+                    pbar.update(1)
+        return built
+
+    def _evaluate_batched(
+        self,
+        entry_cache: _EntryCache,
+        signal_mask: NDArray[np.uint8],
+        optimize_by: str,
+        emit: Callable[[GridSearchResult], None],
+    ) -> None:
+        """Rank every combo with the batched kernel, materialize the winners.
 
-                for exit_rule in self._exit_rules:
-                    for max_entries in self.max_entries_per_signal:
-                        pbar.update(1)
+        Exits the kernel understands are scored in one call per cached entry;
+        only the top ``materialize_top_n`` rows by the ranking metric and by
+        trade total return go through _evaluate_arrays. Exit types the
+        kernel does not know are always evaluated the regular way. Each
+        materialized result is passed to ``emit``.
+        """
+        top_n = self.materialize_top_n or 0
+        market = self._require_market_arrays()
+        batch_idx, exit_kinds, exit_params = _encode_exit_rules(self._exit_rules)
+        batched = set(batch_idx)
+        fallback_exits = [
+            er for i, er in enumerate(self._exit_rules) if i not in batched
+        ]
+        max_entries = np.asarray(self.max_entries_per_signal, dtype=np.int32)
+        rank_col = _batch_rank_col(optimize_by)
+
+        # One scoring block per (cached entry, position filter).
+        keys: list[tuple[tuple[str, str], PositionFilter]] = []
+        score_blocks: list[NDArray[np.float64]] = []
+
+        for cache_key in tqdm(
+            list(entry_cache), desc="Scoring exits", disable=not self.debug
+        ):
+            events, entry, preprocessor = entry_cache[cache_key]
+            base_arrays = _CachedArrays.from_events(events, market, signal_mask)
+            for pos_filter in self._position_filters:
+                keys.append((cache_key, pos_filter))
+                arrays = base_arrays.with_position_filter(pos_filter)
+                filtered = events.with_position_filter(pos_filter)
+                score_blocks.append(
+                    evaluate_exit_grid_cy(
+                        arrays.positions,
+                        market.closes,
+                        market.highs,
+                        market.lows,
+                        market.asset_returns,
+                        arrays.signal_date_mask,
+                        arrays.signal_ids,
+                        exit_kinds,
+                        exit_params,
+                        max_entries,
+                    )
+                )
+                for exit_rule in fallback_exits:
+                    for n_max in self.max_entries_per_signal:
                         if result := self._evaluate_arrays(
                             arrays,
-                            base_daily,
+                            filtered,
                             entry,
                             exit_rule,
                             pos_filter,
-                            max_entries,
+                            n_max,
                             preprocessor,
                         ):
-                            results.append(result)
+                            emit(result)
 
-        summary_df = self._build_summary(results, optimize_by)
+        if not score_blocks or not batch_idx:
+            return
 
-        # ── Phase 3: Reconstruct daily_df for top results ────────────
-        # Rebuild DataFrames only for results that need them (robustness
-        # tests, reports). The rest stay as daily_df=None for memory.
-        sorted_results = [results[i] for i in summary_df["_original_idx"].to_list()]
-        self._rebuild_daily_df(sorted_results, entry_cache)
+        # Row r of the stacked matrix → ((entry key, filter), exit, max_entries)
+        scores = np.vstack(score_blocks)
+        rows_per_entry = len(batch_idx) * len(max_entries)
+        traded = scores[:, N_TRADES_COL] > 0
+        winners: set[int] = set()
+        for col in (rank_col, TOTAL_RETURN_COL):
+            ranked = np.flatnonzero(traded)[
+                np.argsort(-scores[traded, col], kind="stable")
+            ]
+            winners.update(int(r) for r in ranked[:top_n])
+
+        by_entry: dict[int, list[int]] = {}
+        for row in sorted(winners):
+            by_entry.setdefault(row // rows_per_entry, []).append(row % rows_per_entry)
+
+        for entry_pos, local_rows in by_entry.items():
+            cache_key, pos_filter = keys[entry_pos]
+            events, entry, preprocessor = entry_cache[cache_key]
+            events = events.with_position_filter(pos_filter)
+            arrays = _CachedArrays.from_events(events, market, signal_mask)
+            for local in local_rows:
+                exit_rule = self._exit_rules[batch_idx[local // len(max_entries)]]
+                if result := self._evaluate_arrays(
+                    arrays,
+                    events,
+                    entry,
+                    exit_rule,
+                    pos_filter,
+                    int(max_entries[local % len(max_entries)]),
+                    preprocessor,
+                ):
+                    emit(result)
 
-        return summary_df.drop("_original_idx"), sorted_results
+    def _evaluate_halving(
+        self,
+        halving: SuccessiveHalving,
+        entry_cache: _EntryCache,
+        signal_mask: NDArray[np.uint8],
+        optimize_by: str,
+        emit: Callable[[GridSearchResult], None],
+    ) -> PruningLog:
+        """Successive-halving Phase 2: prune on proxies, evaluate survivors.
+
+        Rungs 1-2 rank (entry, filter) pairs on entry-only statistics; rung 3
+        scores every kernel-supported exit variant of the survivors on the
+        trailing ``proxy_years`` window. Survivors of rung 3 (and every exit
+        the kernel does not know, for rung-2 survivors) go through
+        _evaluate_arrays and are passed to ``emit``.
+        """
+        log = PruningLog()
+        market = self._require_market_arrays()
+        min_signals = (
+            halving.min_signals
+            if halving.min_signals is not None
+            else self.sanity_config.min_trade_count
+        )
+
+        # ── Rungs 1-2: entry-only signal count and hit rate ──────────
+        candidates: list[tuple[tuple[str, str], PositionFilter, EntryEvents]] = []
+        hit_rates: list[float] = []
+        for cache_key, (events, _entry, _preprocessor) in entry_cache.items():
+            for pos_filter in self._position_filters:
+                filtered = events.with_position_filter(pos_filter)
+                n_signals, hit_rate = entry_proxy(
+                    filtered, market.closes, halving.hit_horizon_days
+                )
+                enough = n_signals >= min_signals
+                log.record(
+                    "signals",
+                    cache_key,
+                    pos_filter,
+                    float(n_signals),
+                    enough,
+                    "" if enough else f"fewer than {min_signals} signals",
+                )
+                if enough:
+                    candidates.append((cache_key, pos_filter, filtered))
+                    hit_rates.append(hit_rate)
+
+        keep = top_mask(
+            np.asarray(hit_rates, dtype=np.float64), halving.n_keep(len(candidates))
+        )
+        for (cache_key, pos_filter, _events), rate, kept in zip(
+            candidates, hit_rates, keep
+        ):
+            log.record(
+                "hit_rate",
+                cache_key,
+                pos_filter,
+                rate,
+                bool(kept),
+                "" if kept else "hit rate below rung cutoff",
+            )
+        survivors = [c for c, kept in zip(candidates, keep) if kept]
+
+        # ── Rung 3: exit variants on the trailing window ─────────────
+        batch_idx, exit_kinds, exit_params = _encode_exit_rules(self._exit_rules)
+        batched = set(batch_idx)
+        fallback_exits = [
+            er for i, er in enumerate(self._exit_rules) if i not in batched
+        ]
+        max_entries = np.asarray(self.max_entries_per_signal, dtype=np.int32)
+        rank_col = _batch_rank_col(optimize_by)
+        start = window_start(market.dates, halving.proxy_years)
+
+        score_blocks: list[NDArray[np.float64]] = []
+        for _cache_key, _pos_filter, filtered in survivors if batch_idx else []:
+            arrays = _CachedArrays.from_events(filtered, market, signal_mask)
+            score_blocks.append(
+                evaluate_exit_grid_cy(
+                    np.ascontiguousarray(arrays.positions[start:]),
+                    market.closes[start:],
+                    market.highs[start:],
+                    market.lows[start:],
+                    market.asset_returns[start:],
+                    arrays.signal_date_mask[start:],
+                    np.ascontiguousarray(arrays.signal_ids[start:]),
+                    exit_kinds,
+                    exit_params,
+                    max_entries,
+                )
+            )
+
+        rows_per_entry = len(batch_idx) * len(max_entries)
+        window_kept = np.zeros(0, dtype=np.bool_)
+        if score_blocks:
+            scores = np.vstack(score_blocks)
+            rank_scores = np.where(
+                scores[:, N_TRADES_COL] > 0, scores[:, rank_col], np.nan
+            )
+            window_kept = top_mask(rank_scores, halving.n_keep(len(rank_scores)))
+            for row, (score, kept) in enumerate(zip(rank_scores, window_kept)):
+                cache_key, pos_filter, _events = survivors[row // rows_per_entry]
+                local = row % rows_per_entry
+                log.record(
+                    "window",
+                    cache_key,
+                    pos_filter,
+                    float(score),
+                    bool(kept),
+                    "" if kept else "window score below rung cutoff",
+                    self._exit_rules[batch_idx[local // len(max_entries)]].name,
+                    int(max_entries[local % len(max_entries)]),
+                )
+
+        # ── Full evaluation of the survivors ─────────────────────────
+        for pos, (cache_key, pos_filter, filtered) in enumerate(survivors):
+            _events, entry, preprocessor = entry_cache[cache_key]
+            arrays = _CachedArrays.from_events(filtered, market, signal_mask)
+            variants: list[tuple[ExitRule, int]] = []
+            if window_kept.size:
+                block = window_kept[pos * rows_per_entry : (pos + 1) * rows_per_entry]
+                variants += [
+                    (
+                        self._exit_rules[batch_idx[local // len(max_entries)]],
+                        int(max_entries[local % len(max_entries)]),
+                    )
+                    for local in np.flatnonzero(block)
+                ]
+            variants += [(er, int(n)) for er in fallback_exits for n in max_entries]
+            for exit_rule, n_max in variants:
+                if result := self._evaluate_arrays(
+                    arrays,
+                    filtered,
+                    entry,
+                    exit_rule,
+                    pos_filter,
+                    n_max,
+                    preprocessor,
+                ):
+                    emit(result)
+
+        if self.debug:
+            counts = ", ".join(
+                f"{rung} {kept}/{n}" for rung, (n, kept) in log.counts().items()
+            )
+            print(f"Successive halving (kept/candidates): {counts}")
+        return log
 
-    @staticmethod
     def _rebuild_daily_df(
+        self,
         sorted_results: list[GridSearchResult],
-        entry_cache: dict[
-            tuple[str, str, PositionFilter],
-            tuple[pl.DataFrame, EntryRule, Preprocessor],
-        ],
+        entry_cache: _EntryCache,
         max_rebuild: int = 50,
     ) -> None:
         """Reconstruct daily_df for the top results that need it.
@@ -511,14 +1443,14 @@ class StrategyProcessor:
             if result.daily_df is not None:
                 rebuilt += 1
                 continue
-            cache_key = (
-                result.preprocessor_name,
-                result.entry_rule.name,
-                result.position_filter,
-            )
+            cache_key = (result.preprocessor_name, result.entry_rule.name)
             if cache_key not in entry_cache:
                 continue
-            base_daily = entry_cache[cache_key][0]
+            base_daily = (
+                entry_cache[cache_key][0]
+                .with_position_filter(result.position_filter)
+                .to_daily(self._market_data)
+            )
             daily = result.exit_rule.apply_fast(base_daily)
             daily = enforce_max_entries_fast(
                 daily,
@@ -532,22 +1464,27 @@ class StrategyProcessor:
     # ── Internal ─────────────────────────────────────────────────────────
 
     def _load_data(self) -> None:
-        """Load and prepare market data."""
-        if not self._market_data.is_empty():
-            return
+        """Load and prepare market data, then extract the shared market arrays."""
+        if self._market_data.is_empty():
+            self._market_data = (
+                MarketDataLoader(self.ticker)
+                .with_returns()
+                .filter_dates(start_date=self.start_date, end_date=self.end_date)
+                .collect()
+            )
+            # Pre-join benchmark returns once
+            self._market_data = self._market_data.join(
+                self.benchmarks.get_daily_returns(self.benchmark_ticker),
+                on="date",
+                how="inner",
+            )
+        self._market_arrays = MarketArrays.from_frame(self._market_data)
+        self._calendar = TradingCalendar.from_market_data(self._market_data)
 
-        self._market_data = (
-            MarketDataLoader(self.ticker)
-            .with_returns()
-            .filter_dates(start_date=self.start_date, end_date=self.end_date)
-            .collect()
-        )
-        # Pre-join benchmark returns once
-        self._market_data = self._market_data.join(
-            self.benchmarks.get_daily_returns(self.benchmark_ticker),
-            on="date",
-            how="inner",
-        )
+    def _require_market_arrays(self) -> MarketArrays:
+        if self._market_arrays is None:
+            raise RuntimeError("Market arrays not built; call _load_data() first")
+        return self._market_arrays
 
     def get_buy_hold_return(self, start_date: dt.date, end_date: dt.date) -> float:
         """Get buy-and-hold return for the primary ticker over a date range."""
@@ -571,20 +1508,29 @@ class StrategyProcessor:
             "buy_hold_annualized_return": annualized,
         }
 
-    def _set_defaults(self) -> None:
-        if not self._entry_rules:
+    def _set_defaults(self, require_entries: bool = True) -> None:
+        if require_entries and not self._entry_rules:
             raise ValueError("No entry rules defined. Call add_entries() first.")
         if not self._exit_rules:
             self._exit_rules = [SignalChangeExit()]
         if not self._position_filters:
             self._position_filters = ["long_short"]  # Default: no filtering
+        if self.halving is not None and self.materialize_top_n is not None:
+            raise ValueError("halving and materialize_top_n are mutually exclusive")
+        # Filters are applied per cached entry in Phase 2; run each once.
+        self._position_filters = list(dict.fromkeys(self._position_filters))
         if not self._preprocessors:
             self._preprocessors = [IdentityPreprocessor()]
 
+    def _check_rank_metric(self, optimize_by: str) -> None:
+        """Fail before Phase 1 if kernel preselection can't rank by the metric."""
+        if self.halving is not None or self.materialize_top_n is not None:
+            _batch_rank_col(optimize_by)
+
     def _evaluate_arrays(
         self,
         arrays: _CachedArrays,
-        base_daily: pl.DataFrame,
+        events: EntryEvents,
         entry: EntryRule,
         exit_rule: ExitRule,
         pos_filter: PositionFilter,
@@ -598,6 +1544,7 @@ class StrategyProcessor:
         and metrics calculation.
         """
         positions = arrays.positions
+        market = arrays.market
 
         # 3. Apply exit rule directly on numpy arrays
         exit_prices: NDArray[np.float64] | None = None
@@ -610,23 +1557,23 @@ class StrategyProcessor:
         elif isinstance(exit_rule, TrailingStopExit):
             new_pos, exit_prices = trailing_stop_exit_cy(
                 positions,
-                arrays.closes,
-                arrays.highs,
-                arrays.lows,
+                market.closes,
+                market.highs,
+                market.lows,
                 exit_rule.trailing_stop_pct,
             )
         elif isinstance(exit_rule, StopLossTakeProfitExit):
             new_pos, exit_prices = stop_loss_take_profit_exit_cy(
                 positions,
-                arrays.closes,
-                arrays.highs,
-                arrays.lows,
+                market.closes,
+                market.highs,
+                market.lows,
                 exit_rule.stop_loss_pct,
                 exit_rule.take_profit_pct,
             )
         else:
             # Fallback for unknown exit types
-            daily = exit_rule.apply_fast(base_daily)
+            daily = exit_rule.apply_fast(events.to_daily(self._market_data))
             daily = enforce_max_entries_fast(daily, max_entries_per_signal=max_entries)
             daily = daily.with_columns(
                 (pl.col("asset_return") * pl.col("position")).alias("strategy_return"),
@@ -661,13 +1608,13 @@ class StrategyProcessor:
         new_pos = enforce_max_entries_cy(new_pos, arrays.signal_ids, max_entries)
 
         # 5. Strategy return = asset_return * position (numpy multiply)
-        strategy_returns = arrays.asset_returns * new_pos
+        strategy_returns = market.asset_returns * new_pos
 
         # 6. Build trade log from arrays (fast path, no Polars)
         # Use exit_prices for close if available (stop/trailing exits)
-        trade_closes = exit_prices if exit_prices is not None else arrays.closes
+        trade_closes = exit_prices if exit_prices is not None else market.closes
         trade_log = TradeLog.from_arrays(
-            new_pos, arrays.dates, trade_closes, arrays.strengths, arrays.confs
+            new_pos, market.dates, trade_closes, arrays.strengths, arrays.confs
         )
 
         if trade_log.n_trades == 0:
@@ -676,11 +1623,11 @@ class StrategyProcessor:
         # 7. Compute metrics from numpy arrays directly (skip Polars conversion)
         metrics = BacktestMetrics.from_daily(
             strategy_returns=strategy_returns,
-            asset_returns=arrays.asset_returns,
-            benchmark_returns=arrays.benchmark_returns,
+            asset_returns=market.asset_returns,
+            benchmark_returns=market.benchmark_returns,
             positions=new_pos,
-            start_date=arrays.dates[0] if arrays.dates else None,
-            end_date=arrays.dates[-1] if arrays.dates else None,
+            start_date=market.dates[0].item() if market.n_days else None,
+            end_date=market.dates[-1].item() if market.n_days else None,
             benchmark_ticker=self.benchmark_ticker,
         )
 
@@ -707,86 +1654,93 @@ class StrategyProcessor:
             preprocessor_params=pp_params,
         )
 
-    def _apply_position_filter(
-        self, daily: pl.DataFrame, pos_filter: PositionFilter
+    def _build_summary(
+        self, results: list[GridSearchResult], optimize_by: str
     ) -> pl.DataFrame:
-        """
-        Filter positions based on position_filter setting.
+        """Build summary DataFrame from results, sorted by optimization metric."""
+        df = pl.DataFrame([summary_row(r, i) for i, r in enumerate(results)])
+
+        sort_col = resolve_metric_col(optimize_by, df.columns)
+        return df.sort(sort_col, descending=True)
 
-        - "long_short": No filtering (default), keep all positions
-        - "long_only": Zero out negative positions (short → flat)
-        - "short_only": Zero out positive positions (long → flat)
+    def _finish_collector(
+        self, collector: TopKResultCollector, optimize_by: str, collect: bool
+    ) -> tuple[pl.DataFrame, list[GridSearchResult]]:
+        """Kept results plus the full summary (``collect``) or their rows only.
+
+        Either way the full summary scan is left in ``summary_scan``.
         """
-        if pos_filter == "long_short":
-            return daily
+        summary_scan, kept_summary, results = collector.finish(optimize_by)
+        self.summary_scan = summary_scan.drop("_original_idx", strict=False)
+        return (summary_scan.collect() if collect else kept_summary), results
 
-        if pos_filter == "long_only":
-            # Keep only positive positions, zero out shorts
-            return daily.with_columns(
-                pl.when(pl.col("position") > 0)
-                .then(pl.col("position"))
-                .otherwise(0.0)
-                .alias("position")
-            )
+    def _make_collector(self, optimize_by: str) -> TopKResultCollector | None:
+        """Top-K collector for ``keep_top_k``, or None to keep every result."""
+        if self.keep_top_k is None:
+            return None
+        return TopKResultCollector(
+            top_k=self.keep_top_k,
+            rank_by=(optimize_by, "sharpe_ratio", "trade_total_return"),
+            spill_dir=(
+                Path(self.summary_spill_dir)
+                if self.summary_spill_dir is not None
+                else None
+            ),
+        )
 
-        if pos_filter == "short_only":
-            # Keep only negative positions, zero out longs
-            return daily.with_columns(
-                pl.when(pl.col("position") < 0)
-                .then(pl.col("position"))
-                .otherwise(0.0)
-                .alias("position")
-            )
 
-        # Should not reach here due to Literal type, but defensive
-        return daily
+_BATCH_METRIC_ALIASES: dict[str, str] = {
+    "sharpe": "sharpe_ratio",
+    "trades": "trade_n_trades",
+}
 
-    def _build_summary(
-        self, results: list[GridSearchResult], optimize_by: str
-    ) -> pl.DataFrame:
-        """Build summary DataFrame from results, sorted by optimization metric."""
-        rows: list[dict[str, Any]] = []
-        for i, r in enumerate(results):
-            row: dict[str, Any] = {
-                "_original_idx": i,
-                "pp_name": r.preprocessor_name,
-                "entry_name": r.entry_rule.name,
-                "exit_name": r.exit_rule.name,
-                "position_filter": r.position_filter,
-                "max_entries_per_signal": r.max_entries_per_signal,
-                # Trade log stats
-                **{f"trade_{k}": v for k, v in r.trade_log.summary().items()},
-                # Metrics
-                # Sanity
-                "is_suspicious": r.sanity.is_suspicious,
-                "sanity_flags": ", ".join(r.sanity.flags_list)
-                if r.sanity.is_suspicious
-                else "",
-            } | r.metrics.make_dict()
-            # Flatten entry/exit params
-            row.update({f"entry_{k}": v for k, v in r.entry_params.items()})
-            row.update({f"exit_{k}": v for k, v in r.exit_params.items()})
-            rows.append(row)
 
-        df = pl.DataFrame(rows)
+def _batch_rank_col(optimize_by: str) -> int:
+    """Column of BATCH_METRICS to rank by.
+
+    Raises ValueError for metrics the kernel does not compute: ranking by a
+    stand-in would preselect combos by a different metric than the summary
+    is sorted by.
+    """
+    rank_metric = _BATCH_METRIC_ALIASES.get(optimize_by, optimize_by)
+    if rank_metric not in BATCH_METRICS:
+        raise ValueError(
+            f"optimize_by={optimize_by!r} is not computed by the batched exit "
+            "kernel used by materialize_top_n, halving and walk_forward; "
+            f"use one of {list(BATCH_METRICS)}"
+        )
+    return BATCH_METRICS.index(rank_metric)
 
-        sort_col = _resolve_metric_col(optimize_by, df.columns)
-        return df.sort(sort_col, descending=True)
 
+def _encode_exit_rules(
+    exit_rules: Sequence[ExitRule],
+) -> tuple[list[int], NDArray[np.int32], NDArray[np.float64]]:
+    """Encode exit rules for evaluate_exit_grid_cy.
 
-def _resolve_metric_col(name: str, columns: list[str]) -> str:
-    """Resolve a metric name to a column name."""
-    if name in columns:
-        return name
-    aliases = {
-        "sharpe": "sharpe_ratio",
-        "sortino": "sortino_ratio",
-        "calmar": "calmar_ratio",
-        "alpha": "timing_alpha",
-        "return": "annualized_return",
-        "trades": "trade_n_trades",
-    }
-    resolved = aliases.get(name, name)
-    if resolved not in columns:
-        raise ValueError(f"Unknown metric '{name}'. Available: {columns}")
-    return resolved
+    Returns the indices of the rules the batched kernel supports, plus their
+    (E,) kinds and (E, 2) parameter arrays in the same order.
+    """
+    indices: list[int] = []
+    kinds: list[int] = []
+    params: list[tuple[float, float]] = []
+    for i, rule in enumerate(exit_rules):
+        if isinstance(rule, SignalChangeExit):
+            kinds.append(EXIT_SIGNAL_CHANGE)
+            params.append((0.0, 0.0))
+        elif isinstance(rule, FixedHoldingExit):
+            kinds.append(EXIT_FIXED_HOLDING)
+            params.append((float(rule.holding_days), 0.0))
+        elif isinstance(rule, TrailingStopExit):
+            kinds.append(EXIT_TRAILING_STOP)
+            params.append((rule.trailing_stop_pct, 0.0))
+        elif isinstance(rule, StopLossTakeProfitExit):
+            kinds.append(EXIT_STOP_LOSS_TAKE_PROFIT)
+            params.append((rule.stop_loss_pct, rule.take_profit_pct))
+        else:
+            continue
+        indices.append(i)
+    return (
+        indices,
+        np.asarray(kinds, dtype=np.int32),
+        np.asarray(params, dtype=np.float64).reshape(len(params), 2),
+    )
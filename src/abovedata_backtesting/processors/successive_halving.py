@@ -0,0 +1,165 @@
+"""
+Successive-halving search mode for the strategy grid.
+
+Instead of fully evaluating every (entry, position filter) × exit ×
+max_entries combo, ``StrategyProcessor`` with ``halving`` set scores the
+grid in rungs of increasing cost and only fully evaluates the survivors:
+
+  1. signals:  entry-only signal count per (entry, filter). Pairs firing on
+               fewer signals than the minimum (``SanityConfig.min_trade_count``
+               by default) would be flagged ``too_few_trades`` under
+               signal-change exits and are dropped.
+  2. hit_rate: direction hit rate of the remaining pairs over a fixed
+               forward horizon; the top ``1 / eta`` survive.
+  3. window:   the batched exit kernel on the last ``proxy_years`` of data
+               for every exit variant of the surviving pairs; the top
+               ``1 / eta`` by the ranking metric get full evaluation.
+
+Every decision is recorded in a ``PruningLog`` (one row per candidate per
+rung) so pruned regions of the grid can be inspected afterwards.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+
+from abovedata_backtesting.entries.entry_events import EntryEvents
+
+
+@dataclass(frozen=True, slots=True)
+class SuccessiveHalving:
+    """Rung settings for the successive-halving search.
+
+    Parameters
+    ----------
+    eta
+        Reduction factor: each ranked rung keeps ``ceil(n / eta)`` candidates.
+    min_survivors
+        Lower bound on the candidates a ranked rung keeps.
+    min_signals
+        Signal count below which an (entry, filter) pair is dropped. None
+        uses the processor's ``SanityConfig.min_trade_count``.
+    hit_horizon_days
+        Forward horizon (trading days) of the direction hit rate.
+    proxy_years
+        Length of the trailing window the exit variants are scored on.
+    """
+
+    eta: float = 3.0
+    min_survivors: int = 10
+    min_signals: int | None = None
+    hit_horizon_days: int = 20
+    proxy_years: float = 3.0
+
+    def __post_init__(self) -> None:
+        if self.eta <= 1:
+            raise ValueError(f"eta must be > 1, got {self.eta}")
+        if self.hit_horizon_days < 1:
+            raise ValueError(
+                f"hit_horizon_days must be >= 1, got {self.hit_horizon_days}"
+            )
+        if self.proxy_years <= 0:
+            raise ValueError(f"proxy_years must be > 0, got {self.proxy_years}")
+
+    def n_keep(self, n_candidates: int) -> int:
+        """Survivors of a ranked rung with ``n_candidates`` entrants."""
+        return min(
+            n_candidates,
+            max(self.min_survivors, math.ceil(n_candidates / self.eta)),
+        )
+
+
+def entry_proxy(
+    events: EntryEvents, closes: NDArray[np.float64], horizon: int
+) -> tuple[int, float]:
+    """Signal count and direction hit rate of one (filtered) entry.
+
+    A signal hits when the close ``horizon`` trading days after the entry
+    (clipped to the last day) moved in the entry's direction. The hit rate
+    is NaN when the entry never fires.
+    """
+    active = events.direction != 0
+    idx = events.entry_idx[active]
+    if not idx.size:
+        return 0, math.nan
+    forward = closes[np.minimum(idx + horizon, closes.size - 1)] / closes[idx] - 1.0
+    hits = np.sign(forward) == np.sign(events.direction[active])
+    return int(idx.size), float(hits.mean())
+
+
+def window_start(dates: NDArray[np.datetime64], years: float) -> int:
+    """First index of the trailing ``years`` window of ``dates``."""
+    if not dates.size:
+        return 0
+    cutoff = dates[-1] - np.timedelta64(round(365.25 * years), "D")
+    return int(np.searchsorted(dates, cutoff, side="left"))
+
+
+def top_mask(scores: NDArray[np.float64], n_keep: int) -> NDArray[np.bool_]:
+    """True for the ``n_keep`` highest scores; NaN ranks last, ties by order."""
+    ranked = np.argsort(-np.nan_to_num(scores, nan=-np.inf), kind="stable")
+    mask = np.zeros(scores.shape[0], dtype=np.bool_)
+    mask[ranked[:n_keep]] = True
+    return mask
+
+
+@dataclass
+class PruningLog:
+    """Per-rung keep/prune decisions of one successive-halving run."""
+
+    rows: list[dict[str, Any]] = field(default_factory=list)
+
+    def record(
+        self,
+        rung: str,
+        cache_key: tuple[str, str],
+        position_filter: str,
+        score: float,
+        kept: bool,
+        reason: str = "",
+        exit_name: str | None = None,
+        max_entries_per_signal: int | None = None,
+    ) -> None:
+        self.rows.append(
+            {
+                "rung": rung,
+                "pp_name": cache_key[0],
+                "entry_name": cache_key[1],
+                "position_filter": position_filter,
+                "exit_name": exit_name,
+                "max_entries_per_signal": max_entries_per_signal,
+                "score": score,
+                "kept": kept,
+                "reason": reason,
+            }
+        )
+
+    def to_frame(self) -> pl.DataFrame:
+        return pl.DataFrame(
+            self.rows,
+            schema={
+                "rung": pl.String,
+                "pp_name": pl.String,
+                "entry_name": pl.String,
+                "position_filter": pl.String,
+                "exit_name": pl.String,
+                "max_entries_per_signal": pl.Int64,
+                "score": pl.Float64,
+                "kept": pl.Boolean,
+                "reason": pl.String,
+            },
+        )
+
+    def counts(self) -> dict[str, tuple[int, int]]:
+        """``{rung: (candidates, kept)}`` in rung order."""
+        out: dict[str, tuple[int, int]] = {}
+        for row in self.rows:
+            n, kept = out.get(row["rung"], (0, 0))
+            out[row["rung"]] = (n + 1, kept + int(row["kept"]))
+        return out
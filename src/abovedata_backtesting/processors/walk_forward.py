@@ -0,0 +1,121 @@
+"""
+Walk-forward (rolling or anchored-expanding) out-of-sample evaluation.
+
+``StrategyProcessor.walk_forward`` builds the entry cache once over the full
+timeline, then for every fold slices the cached daily arrays to the train
+window, scores every (entry, filter, exit, max_entries) combo with the
+batched exit kernel, and evaluates the train-fold winner on the following
+test window. Fold count therefore adds exit-kernel cost only; no entry rule
+is re-run per fold.
+
+Fold windows are trading-day index ranges over the market timeline:
+
+  rolling:   train [k*step, k*step + train_days), test = next test_days
+  anchored:  train [0, train_days + k*step),      test = next test_days
+
+A signal already active the day before a window starts was entered before
+the window, so it is not traded inside it; windows only trade signals that
+fire within them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from abovedata_backtesting.processors.strategy_processor import (
+        GridSearchResult,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class WalkForwardFold:
+    """Half-open train/test index ranges of one fold."""
+
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+
+
+@dataclass(frozen=True, slots=True)
+class WalkForward:
+    """Fold layout for ``StrategyProcessor.walk_forward``.
+
+    Parameters
+    ----------
+    train_days, test_days
+        Window lengths in trading days.
+    step_days
+        Offset between consecutive folds; defaults to ``test_days`` so the
+        test windows tile the timeline.
+    anchored
+        Expanding train windows that all start on the first day.
+    min_train_trades
+        Combos with fewer trades in the train window cannot be selected.
+    """
+
+    train_days: int = 504
+    test_days: int = 126
+    step_days: int | None = None
+    anchored: bool = False
+    min_train_trades: int = 1
+
+    def __post_init__(self) -> None:
+        if self.train_days < 2 or self.test_days < 2:
+            raise ValueError("train_days and test_days must be >= 2")
+        if self.step_days is not None and self.step_days < 1:
+            raise ValueError(f"step_days must be >= 1, got {self.step_days}")
+
+    def folds(self, n_days: int) -> list[WalkForwardFold]:
+        """Folds whose test window fits inside ``n_days``."""
+        step = self.step_days or self.test_days
+        folds: list[WalkForwardFold] = []
+        k = 0
+        while (train_end := self.train_days + k * step) + self.test_days <= n_days:
+            folds.append(
+                WalkForwardFold(
+                    train_start=0 if self.anchored else k * step,
+                    train_end=train_end,
+                    test_start=train_end,
+                    test_end=train_end + self.test_days,
+                )
+            )
+            k += 1
+        return folds
+
+
+@dataclass(frozen=True, slots=True)
+class WalkForwardResult:
+    """Per-fold selections and their out-of-sample results.
+
+    ``folds`` has one row per fold: window dates, the selected combo, its
+    train score and the test-window metrics (null when the selected combo
+    did not trade in the test window). ``results[i]`` is fold i's test
+    result, or None.
+    """
+
+    folds: pl.DataFrame
+    results: list[GridSearchResult | None]
+
+    @property
+    def oos_total_return(self) -> float:
+        """Compounded trade return of the test windows, in fold order."""
+        returns = self.folds["test_trade_total_return"].fill_null(0.0).to_numpy()
+        return float(np.prod(1.0 + returns) - 1.0)
+
+
+def best_row(
+    scores: NDArray[np.float64], rank_col: int, n_trades_col: int, min_trades: int
+) -> int:
+    """Row of the highest finite rank score with enough trades (-1 if none)."""
+    rank = scores[:, rank_col]
+    eligible = (scores[:, n_trades_col] >= max(min_trades, 1)) & np.isfinite(rank)
+    if not eligible.any():
+        return -1
+    return int(np.argmax(np.where(eligible, rank, -np.inf)))
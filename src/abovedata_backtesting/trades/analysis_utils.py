@@ -84,7 +84,7 @@ def analyze_best_strategies(
                     start_date=analysis.min_date,
                     end_date=analysis.max_date,
                 ),
-                n_random_trials=100,
+                n_random_trials=10_000,
             )
             print(validator.run_all().summary())
 
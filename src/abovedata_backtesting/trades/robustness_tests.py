@@ -2,7 +2,8 @@
 
 Implements four key tests to detect overfitting and spurious edges:
 
-1. EXIT ABLATION: Compare signal_change exit vs fixed_holding exits.
+1. EXIT ABLATION: Compare the original exit vs fixed holding (10/30/60/90d)
+   and trailing stop (5/10/20%) exits.
    If win rate drops significantly with fixed exits, the exit is doing
    the heavy lifting, not the signal.
 
@@ -26,7 +27,8 @@ Usage:
     validator = RobustnessValidator(
         processor=processor,
         result=best_result,
-        n_random_trials=100,
+        n_random_trials=10_000,
+        random_seed=0,
     )
     report = validator.run_all()
     print(report.summary())
@@ -35,18 +37,20 @@ Usage:
 from __future__ import annotations
 
 import datetime as dt
-import random
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import numpy as np
 import polars as pl
+from numpy.typing import NDArray
 
 from abovedata_backtesting.exits.exit_strategies import (
     ExitRule,
     FixedHoldingExit,
+    TrailingStopExit,
 )
-from abovedata_backtesting.model.metrics import BacktestMetrics
 from abovedata_backtesting.trades.trade_log import TradeLog
 
 if TYPE_CHECKING:
@@ -62,6 +66,22 @@ if TYPE_CHECKING:
 # =============================================================================
 
 
+# Exit variants of the exit ablation test.
+ABLATION_HOLDING_DAYS: tuple[int, ...] = (10, 30, 60, 90)
+ABLATION_TRAILING_STOPS: tuple[float, ...] = (0.05, 0.10, 0.20)
+
+
+@dataclass(frozen=True, slots=True)
+class ExitVariantResult:
+    """Performance of the original entries under one ablation exit."""
+
+    exit_name: str
+    win_rate: float | None
+    sharpe: float | None
+    n_trades: int | None
+    total_return: float | None
+
+
 @dataclass(frozen=True, slots=True)
 class ExitAblationResult:
     """Compare performance across exit strategies."""
@@ -79,6 +99,8 @@ class ExitAblationResult:
     fixed_60d_sharpe: float | None
     fixed_60d_n_trades: int | None
 
+    variants: tuple[ExitVariantResult, ...] = ()
+
     @property
     def exit_is_edge(self) -> bool:
         """True if win rate drops >20pp with fixed exit (exit doing heavy lifting)."""
@@ -98,6 +120,10 @@ class ExitAblationResult:
             return None
         return self.original_win_rate - self.fixed_60d_win_rate
 
+    def variant(self, exit_name: str) -> ExitVariantResult | None:
+        """Ablation variant by exit rule name (e.g. ``fixed_holding_90d``)."""
+        return next((v for v in self.variants if v.exit_name == exit_name), None)
+
 
 @dataclass(frozen=True, slots=True)
 class FlipAblationResult:
@@ -141,6 +167,7 @@ class RandomEntryResult:
     random_mean_sharpe: float
     random_mean_win_rate: float
     n_trials: int
+    empirical_pvalue: float | None = None
 
     @property
     def zscore_vs_random(self) -> float:
@@ -162,9 +189,10 @@ class RandomEntryResult:
 
     @property
     def pvalue(self) -> float:
-        """Approximate p-value (fraction of random trials beating actual)."""
-        # This is computed during the test and stored, but we can estimate
-        # from z-score using normal approximation
+        """Empirical p-value when stored, else the normal approximation."""
+        if self.empirical_pvalue is not None:
+            return self.empirical_pvalue
+
         from scipy.stats import norm
 
         return 1 - norm.cdf(self.zscore_vs_random)
@@ -287,11 +315,16 @@ class RobustnessReport:
             lines.append(
                 f"   Original ({ea.original_exit}): {ea.original_win_rate:.1%} win rate, {ea.original_sharpe:.2f} Sharpe"
             )
-            if ea.fixed_30d_win_rate is not None:
+            for v in ea.variants:
+                if v.win_rate is not None:
+                    lines.append(
+                        f"   {v.exit_name}: {v.win_rate:.1%} win rate, {v.sharpe:.2f} Sharpe ({v.n_trades} trades)"
+                    )
+            if not ea.variants and ea.fixed_30d_win_rate is not None:
                 lines.append(
                     f"   Fixed 30d: {ea.fixed_30d_win_rate:.1%} win rate, {ea.fixed_30d_sharpe:.2f} Sharpe"
                 )
-            if ea.fixed_60d_win_rate is not None:
+            if not ea.variants and ea.fixed_60d_win_rate is not None:
                 lines.append(
                     f"   Fixed 60d: {ea.fixed_60d_win_rate:.1%} win rate, {ea.fixed_60d_sharpe:.2f} Sharpe"
                 )
@@ -364,6 +397,137 @@ class RobustnessReport:
         return "\n".join(lines)
 
 
+# =============================================================================
+# Random Entry Simulation
+# =============================================================================
+
+# Random keys drawn per chunk (trials x candidate days); bounds peak memory.
+_RANDOM_ENTRY_CHUNK_ELEMENTS = 1 << 20
+
+
+@dataclass(frozen=True, slots=True)
+class RandomEntryTrials:
+    """Per-trial statistics of a random entry simulation.
+
+    Trials in which no trade could be closed are dropped; ``sharpe`` is NaN
+    for trials with fewer than two trades.
+    """
+
+    total_return: NDArray[np.float64]
+    win_rate: NDArray[np.float64]
+    sharpe: NDArray[np.float64]
+
+
+def simulate_random_entries(
+    closes: NDArray[np.float64],
+    entry_idx: NDArray[np.intp],
+    directions: NDArray[np.float64],
+    holding_days: int,
+    n_trials: int,
+    seed: int | None = None,
+    max_workers: int | None = None,
+) -> RandomEntryTrials:
+    """
+    Simulate fixed-holding trades entered on random days, all trials at once.
+
+    Each trial draws ``len(directions)`` distinct entry days from
+    ``entry_idx`` (without replacement) and pairs them with a shuffle of
+    ``directions``, so the random trades keep the actual long/short mix.
+    Trades exit ``holding_days`` later, truncated at the last close; trades
+    that cannot be closed are skipped.
+
+    Trials are simulated in chunks of a (trials x trades) index matrix,
+    each chunk with its own child of ``np.random.SeedSequence(seed)``, so
+    the result for a given seed does not depend on ``max_workers``.
+
+    Parameters
+    ----------
+    closes : NDArray[np.float64]
+        Daily close prices.
+    entry_idx : NDArray[np.intp]
+        Candidate entry day indices into ``closes``.
+    directions : NDArray[np.float64]
+        Direction of each actual trade (+1 long, -1 short).
+    holding_days : int
+        Trading days each random trade is held.
+    n_trials : int
+        Number of random trials.
+    seed : int | None
+        Seed for the draws; None draws fresh entropy.
+    max_workers : int | None
+        Threads simulating chunks; 1 runs serially.
+
+    Returns
+    -------
+    RandomEntryTrials
+    """
+    k = min(len(directions), len(entry_idx))
+    if n_trials < 1 or k == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return RandomEntryTrials(empty, empty, empty)
+
+    rows = max(1, _RANDOM_ENTRY_CHUNK_ELEMENTS // len(entry_idx))
+    sizes = [min(rows, n_trials - start) for start in range(0, n_trials, rows)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    def _chunk(
+        n_rows: int, seed_seq: np.random.SeedSequence
+    ) -> tuple[NDArray[np.float64], ...]:
+        return _random_entry_chunk(
+            closes, entry_idx, directions, k, holding_days, n_rows, seed_seq
+        )
+
+    if max_workers == 1 or len(sizes) == 1:
+        parts = list(map(_chunk, sizes, seeds))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            parts = list(pool.map(_chunk, sizes, seeds))
+
+    total_return, win_rate, sharpe, n_trades = (
+        np.concatenate(col) for col in zip(*parts)
+    )
+    traded = n_trades > 0
+    return RandomEntryTrials(
+        total_return=total_return[traded],
+        win_rate=win_rate[traded],
+        sharpe=sharpe[traded],
+    )
+
+
+def _random_entry_chunk(
+    closes: NDArray[np.float64],
+    entry_idx: NDArray[np.intp],
+    directions: NDArray[np.float64],
+    k: int,
+    holding_days: int,
+    n_rows: int,
+    seed_seq: np.random.SeedSequence,
+) -> tuple[NDArray[np.float64], ...]:
+    """(total_return, win_rate, sharpe, n_trades) for ``n_rows`` trials."""
+    rng = np.random.default_rng(seed_seq)
+    # The k smallest of iid uniform keys are a uniform k-subset of days.
+    keys = rng.random((n_rows, len(entry_idx)))
+    entries = entry_idx[np.argpartition(keys, k - 1, axis=1)[:, :k]]
+    signs = rng.permuted(np.tile(directions, (n_rows, 1)), axis=1)[:, :k]
+
+    exits = np.minimum(entries + holding_days, len(closes) - 1)
+    valid = exits > entries
+    rets = np.where(valid, (closes[exits] / closes[entries] - 1.0) * signs, 0.0)
+
+    n_trades = valid.sum(axis=1)
+    n_safe = np.maximum(n_trades, 1)
+    total_return = np.prod(1.0 + rets, axis=1) - 1.0
+    win_rate = (rets > 0).sum(axis=1) / n_safe
+    mean = rets.sum(axis=1) / n_safe
+    std = np.sqrt((((rets - mean[:, None]) * valid) ** 2).sum(axis=1) / n_safe)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(
+            std > 0, mean / std * np.sqrt(252 / max(holding_days, 1)), 0.0
+        )
+    sharpe = np.where(n_trades > 1, sharpe, np.nan)
+    return total_return, win_rate, sharpe, n_trades.astype(np.float64)
+
+
 # =============================================================================
 # Robustness Validator
 # =============================================================================
@@ -388,13 +552,28 @@ class RobustnessValidator:
         If None, will compute from processor's market data.
     n_random_trials : int
         Number of random entry permutations for baseline test.
+    random_seed : int | None
+        Seed for the random entry draws; None draws fresh entropy.
+    match_directions : bool
+        Give random trades the actual long/short mix (shuffled per trial)
+        instead of going long on every random entry.
+    max_workers : int | None
+        Threads simulating trial chunks (1 runs serially).
+    ablation_exits : Sequence[ExitRule] | None
+        Exits of the exit ablation test. None uses fixed holding exits of
+        ``ABLATION_HOLDING_DAYS`` and trailing stops of
+        ``ABLATION_TRAILING_STOPS``.
     """
 
     processor: StrategyProcessor
     result: GridSearchResult
     trade_analysis: "TradeAnalysis | None" = None
     buy_hold_return: float | None = None
-    n_random_trials: int = 100
+    n_random_trials: int = 10_000
+    random_seed: int | None = None
+    match_directions: bool = True
+    max_workers: int | None = None
+    ablation_exits: Sequence[ExitRule] | None = None
 
     def run_all(self) -> RobustnessReport:
         """Run all robustness tests and return aggregated report."""
@@ -411,37 +590,42 @@ class RobustnessValidator:
         return report
 
     def _run_exit_ablation(self) -> ExitAblationResult:
-        """Compare original exit vs fixed holding exits."""
-        original = self.result
-        signal_dates = frozenset(
-            self.processor.signals["earnings_date"].cast(pl.Date).unique().to_list()
-        )
+        """Compare original exit vs fixed holding and trailing stop exits.
 
-        # Get original metrics
-        orig_win_rate = original.trade_log.win_rate
-        orig_sharpe = original.metrics.risk.sharpe_ratio
-        orig_n = original.trade_log.n_trades
-
-        # Run with fixed 30d exit
-        fixed_30 = self._rerun_with_exit(
-            FixedHoldingExit(holding_days=30, signal_dates=signal_dates)
-        )
-        # Run with fixed 60d exit
-        fixed_60 = self._rerun_with_exit(
-            FixedHoldingExit(holding_days=60, signal_dates=signal_dates)
+        The original entries are re-run under every ablation exit through
+        ``StrategyProcessor.evaluate_exits`` (cached entry arrays and the
+        compiled exit kernels).
+        """
+        original = self.result
+        exit_rules = list(self.ablation_exits or self._default_ablation_exits())
+        variants = tuple(
+            ExitVariantResult(
+                exit_name=exit_rule.name,
+                win_rate=rerun.trade_log.win_rate if rerun else None,
+                sharpe=rerun.metrics.risk.sharpe_ratio if rerun else None,
+                n_trades=rerun.trade_log.n_trades if rerun else None,
+                total_return=rerun.trade_log.total_return if rerun else None,
+            )
+            for exit_rule, rerun in zip(
+                exit_rules, self.processor.evaluate_exits(original, exit_rules)
+            )
         )
+        by_name = {v.exit_name: v for v in variants}
+        fixed_30 = by_name.get(FixedHoldingExit(holding_days=30).name)
+        fixed_60 = by_name.get(FixedHoldingExit(holding_days=60).name)
 
         return ExitAblationResult(
             original_exit=original.exit_rule.name,
-            original_win_rate=orig_win_rate,
-            original_sharpe=orig_sharpe,
-            original_n_trades=orig_n,
-            fixed_30d_win_rate=fixed_30.trade_log.win_rate if fixed_30 else None,
-            fixed_30d_sharpe=fixed_30.metrics.risk.sharpe_ratio if fixed_30 else None,
-            fixed_30d_n_trades=fixed_30.trade_log.n_trades if fixed_30 else None,
-            fixed_60d_win_rate=fixed_60.trade_log.win_rate if fixed_60 else None,
-            fixed_60d_sharpe=fixed_60.metrics.risk.sharpe_ratio if fixed_60 else None,
-            fixed_60d_n_trades=fixed_60.trade_log.n_trades if fixed_60 else None,
+            original_win_rate=original.trade_log.win_rate,
+            original_sharpe=original.metrics.risk.sharpe_ratio,
+            original_n_trades=original.trade_log.n_trades,
+            fixed_30d_win_rate=fixed_30.win_rate if fixed_30 else None,
+            fixed_30d_sharpe=fixed_30.sharpe if fixed_30 else None,
+            fixed_30d_n_trades=fixed_30.n_trades if fixed_30 else None,
+            fixed_60d_win_rate=fixed_60.win_rate if fixed_60 else None,
+            fixed_60d_sharpe=fixed_60.sharpe if fixed_60 else None,
+            fixed_60d_n_trades=fixed_60.n_trades if fixed_60 else None,
+            variants=variants,
         )
 
     def _run_flip_ablation(self) -> FlipAblationResult | None:
@@ -476,73 +660,70 @@ class RobustnessValidator:
         )
 
     def _run_random_entry(self) -> RandomEntryResult:
-        """Shuffle entry dates and compare to actual."""
+        """Permutation test: actual entries vs random entry dates."""
         actual = self.result.trade_log
+        actual_sharpe = self.result.metrics.risk.sharpe_ratio
         daily = self.result.daily_df
 
-        # Get the entry dates from actual trades
         entry_dates = [t.entry_date for t in actual.trades]
         if len(entry_dates) < 3:
             # Not enough trades for meaningful permutation
             return RandomEntryResult(
                 actual_total_return=actual.total_return,
-                actual_sharpe=self.result.metrics.risk.sharpe_ratio,
+                actual_sharpe=actual_sharpe,
                 actual_win_rate=actual.win_rate,
                 random_mean_return=actual.total_return,
                 random_std_return=0.0,
-                random_mean_sharpe=self.result.metrics.risk.sharpe_ratio,
+                random_mean_sharpe=actual_sharpe,
                 random_mean_win_rate=actual.win_rate,
                 n_trials=0,
             )
 
-        # Get valid trading dates from daily data
-        all_dates = daily["date"].to_list()
-        valid_dates = [
-            d for d in all_dates if d >= min(entry_dates) and d <= max(entry_dates)
-        ]
-
-        random_returns: list[float] = []
-        random_sharpes: list[float] = []
-        random_win_rates: list[float] = []
-
-        for _ in range(self.n_random_trials):
-            # Randomly sample same number of entry dates
-            shuffled_entries = random.sample(
-                valid_dates, min(len(entry_dates), len(valid_dates))
-            )
-            shuffled_log = self._simulate_trades_from_dates(
-                shuffled_entries, daily, holding_days=int(actual.avg_holding_days)
+        # Candidate entries: trading days spanning the actual entry window
+        dates = daily["date"].to_numpy()
+        valid_idx = np.flatnonzero(
+            (dates >= np.datetime64(min(entry_dates), "D"))
+            & (dates <= np.datetime64(max(entry_dates), "D"))
+        )
+        directions = (
+            np.array([t.direction for t in actual.trades], dtype=np.float64)
+            if self.match_directions
+            else np.ones(len(entry_dates))
+        )
+        trials = simulate_random_entries(
+            daily["close"].to_numpy().astype(np.float64),
+            valid_idx,
+            directions,
+            holding_days=int(actual.avg_holding_days),
+            n_trials=self.n_random_trials,
+            seed=self.random_seed,
+            max_workers=self.max_workers,
+        )
+        n = len(trials.total_return)
+        if n == 0:
+            return RandomEntryResult(
+                actual_total_return=actual.total_return,
+                actual_sharpe=actual_sharpe,
+                actual_win_rate=actual.win_rate,
+                random_mean_return=0.0,
+                random_std_return=0.0,
+                random_mean_sharpe=0.0,
+                random_mean_win_rate=0.0,
+                n_trials=0,
             )
-            if shuffled_log and shuffled_log.n_trades > 0:
-                random_returns.append(shuffled_log.total_return)
-                random_win_rates.append(shuffled_log.win_rate)
-                # Approximate Sharpe from trade returns
-                if len(shuffled_log.trades) > 1:
-                    rets = np.array([t.trade_return for t in shuffled_log.trades])
-                    sharpe = (
-                        rets.mean()
-                        / rets.std()
-                        * np.sqrt(252 / actual.avg_holding_days)
-                        if rets.std() > 0
-                        else 0
-                    )
-                    random_sharpes.append(sharpe)
 
+        n_beating = int((trials.total_return >= actual.total_return).sum())
+        sharpes = trials.sharpe[np.isfinite(trials.sharpe)]
         return RandomEntryResult(
             actual_total_return=actual.total_return,
-            actual_sharpe=self.result.metrics.risk.sharpe_ratio,
+            actual_sharpe=actual_sharpe,
             actual_win_rate=actual.win_rate,
-            random_mean_return=float(np.mean(random_returns))
-            if random_returns
-            else 0.0,
-            random_std_return=float(np.std(random_returns)) if random_returns else 0.0,
-            random_mean_sharpe=float(np.mean(random_sharpes))
-            if random_sharpes
-            else 0.0,
-            random_mean_win_rate=float(np.mean(random_win_rates))
-            if random_win_rates
-            else 0.0,
-            n_trials=len(random_returns),
+            random_mean_return=float(trials.total_return.mean()),
+            random_std_return=float(trials.total_return.std()),
+            random_mean_sharpe=float(sharpes.mean()) if len(sharpes) else 0.0,
+            random_mean_win_rate=float(trials.win_rate.mean()),
+            n_trials=n,
+            empirical_pvalue=(1 + n_beating) / (1 + n),
         )
 
     def _run_alpha_attribution(self) -> AlphaAttributionResult:
@@ -596,36 +777,15 @@ class RobustnessValidator:
     # Helper Methods
     # =========================================================================
 
-    def _rerun_with_exit(self, exit_rule: ExitRule) -> GridSearchResult | None:
-        """Re-run the same entry with a different exit rule."""
-        try:
-            # Apply exit rule to the original daily positions
-            daily = self.result.daily_df.clone()
-            daily = exit_rule.apply(daily)
-
-            # Build trade log from modified positions
-            trade_log = TradeLog.from_daily(daily)
-
-            if trade_log.n_trades == 0:
-                return None
-
-            # Compute metrics from the daily DataFrame
-
-            metrics = BacktestMetrics.from_dataframe(daily)
-
-            return GridSearchResult(
-                entry_rule=self.result.entry_rule,
-                exit_rule=exit_rule,
-                position_filter=self.result.position_filter,
-                metrics=metrics,
-                trade_log=trade_log,
-                daily_df=daily,
-                entry_params=self.result.entry_params,
-                exit_params={},
-                sanity=self.result.sanity,
-            )
-        except Exception:
-            return None
+    def _default_ablation_exits(self) -> list[ExitRule]:
+        """Fixed holding exits on the signal dates, then trailing stops."""
+        signal_dates = frozenset(
+            self.processor.signals["earnings_date"].cast(pl.Date).unique().to_list()
+        )
+        return [
+            FixedHoldingExit(holding_days=days, signal_dates=signal_dates)
+            for days in ABLATION_HOLDING_DAYS
+        ] + [TrailingStopExit(trailing_stop_pct=pct) for pct in ABLATION_TRAILING_STOPS]
 
     def _run_raw_signal_direction(self) -> _SimpleMetrics | None:
         """Approximate performance using raw signal direction (no flip)."""
@@ -660,54 +820,6 @@ class RobustnessValidator:
         except Exception:
             return None
 
-    def _simulate_trades_from_dates(
-        self,
-        entry_dates: list[dt.date],
-        daily: pl.DataFrame,
-        holding_days: int,
-    ) -> TradeLog | None:
-        """Simulate trades entering on given dates with fixed holding period."""
-        try:
-            dates = daily["date"].to_list()
-            closes = daily["close"].to_list()
-            date_to_idx = {d: i for i, d in enumerate(dates)}
-
-            from abovedata_backtesting.trades.trade_log import Trade
-
-            trades: list[Trade] = []
-            for entry_d in entry_dates:
-                if entry_d not in date_to_idx:
-                    continue
-                entry_idx = date_to_idx[entry_d]
-                exit_idx = min(entry_idx + holding_days, len(dates) - 1)
-
-                if exit_idx <= entry_idx:
-                    continue
-
-                entry_price = closes[entry_idx]
-                exit_price = closes[exit_idx]
-                direction = 1.0  # Assume long for random baseline
-
-                trade_return = (exit_price / entry_price - 1) * direction
-
-                trades.append(
-                    Trade(
-                        entry_date=entry_d,
-                        exit_date=dates[exit_idx],
-                        direction=direction,
-                        entry_price=entry_price,
-                        exit_price=exit_price,
-                        holding_days=exit_idx - entry_idx,
-                        trade_return=trade_return,
-                        signal_strength=0.0,
-                        confidence=0.0,
-                    )
-                )
-
-            return TradeLog(trades=trades)
-        except Exception:
-            return None
-
 
 @dataclass(frozen=True, slots=True)
 class _SimpleMetrics:
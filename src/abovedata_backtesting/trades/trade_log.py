@@ -10,6 +10,7 @@ Vectorized implementation:
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -23,6 +24,11 @@ from abovedata_backtesting.entries.entry_context import (
 )
 
 
+def _as_date(value: Any) -> Any:
+    """datetime64[D] scalar → datetime.date; other values pass through."""
+    return value.item() if isinstance(value, np.datetime64) else value
+
+
 @dataclass(frozen=True, slots=True)
 class Trade:
     """Single round-trip trade."""
@@ -79,7 +85,7 @@ class TradeLog:
     def from_arrays(
         cls,
         positions: NDArray[np.float64],
-        dates: list[Any],
+        dates: Sequence[Any] | NDArray[np.datetime64],
         closes: NDArray[np.float64],
         strengths: NDArray[np.float64],
         confs: NDArray[np.float64],
@@ -88,6 +94,8 @@ class TradeLog:
 
         Skips Polars extraction overhead. No EntryContext support (not needed
         during grid search ranking — contexts are read only for top-N results).
+        ``dates`` may be a datetime64[D] array; only the entry/exit dates of
+        actual trades are converted to ``datetime.date``.
         """
         if len(positions) == 0:
             return cls(trades=[])
@@ -136,8 +144,8 @@ class TradeLog:
 
             trades.append(
                 Trade(
-                    entry_date=dates[entry_idx],
-                    exit_date=dates[exit_idx],
+                    entry_date=_as_date(dates[entry_idx]),
+                    exit_date=_as_date(dates[exit_idx]),
                     direction=trade_dir,
                     entry_price=entry_price,
                     exit_price=exit_price,
@@ -243,8 +251,8 @@ class TradeLog:
 
             trades.append(
                 Trade(
-                    entry_date=dates[entry_idx],
-                    exit_date=dates[exit_idx],
+                    entry_date=_as_date(dates[entry_idx]),
+                    exit_date=_as_date(dates[exit_idx]),
                     direction=trade_dir,
                     entry_price=entry_price,
                     exit_price=exit_price,
@@ -15,10 +15,12 @@ visible_count) to find which signal source yields the best performance.
 
 import argparse
 from datetime import date
+from pathlib import Path
 
 import polars as pl
 from IPython.display import display
 
+from abovedata_backtesting.benchmarks.benchmark_results import BenchmarkResults
 from abovedata_backtesting.data_loaders.load_signal_data import (
     list_visible_cols,
     load_signal_data,
@@ -66,20 +68,27 @@ from abovedata_backtesting.trades.analysis_utils import (
 from abovedata_backtesting.trades.trade_save_results import save_results
 
 
-def run_grid_search(
+def build_processor(
     ticker: str,
     visible_col: str,
+    benchmarks: BenchmarkResults | None = None,
     signal_method: str = "stl_p4_s7_robustTrue",
     start_date: date | None = date(2018, 1, 1),
     end_date: date | None = None,
     debug: bool = True,
-) -> tuple[pl.DataFrame, list[GridSearchResult], StrategyProcessor]:
+    entry_cache_dir: Path | None = Path("results") / "entry_cache",
+) -> StrategyProcessor:
     """
-    Run grid search with correlation-gated entry rules.
+    Build the correlation-gated grid search for one ticker / visible_col.
 
     Uses raw STL processor output from the visible_col-specific parquet file
     so we have access to contemp_corr_historical, leading_corr_historical,
     regime shifts, etc. — all recomputed against the given visible_col.
+
+    ``benchmarks`` may be shared across tickers (see PortfolioGridRunner);
+    None builds this ticker's benchmarks. Entry outputs are persisted under
+    ``entry_cache_dir`` (None disables), so reruns that only change exits
+    skip entry evaluation.
     """
     signals = load_signal_data(
         ticker, method=signal_method, name="processed_data", visible_col=visible_col
@@ -93,8 +102,9 @@ def run_grid_search(
             f"Available columns: {signals.columns}"
         )
 
-    bm_config = BenchmarkConfig.for_ticker(ticker, signal_col=visible_col)
-    benchmarks = BenchmarkProcessor(bm_config).run()
+    if benchmarks is None:
+        bm_config = BenchmarkConfig.for_ticker(ticker, signal_col=visible_col)
+        benchmarks = BenchmarkProcessor(bm_config).run()
 
     processor = StrategyProcessor(
         ticker=ticker,
@@ -106,6 +116,7 @@ def run_grid_search(
         debug=debug,
         max_entries_per_signal=[3],
         benchmarks=benchmarks,
+        entry_cache_dir=entry_cache_dir,
     )
 
     # =========================================================================
@@ -306,6 +317,29 @@ def run_grid_search(
         ]
     )
 
+    return processor
+
+
+def run_grid_search(
+    ticker: str,
+    visible_col: str,
+    signal_method: str = "stl_p4_s7_robustTrue",
+    start_date: date | None = date(2018, 1, 1),
+    end_date: date | None = None,
+    debug: bool = True,
+    entry_cache_dir: Path | None = Path("results") / "entry_cache",
+) -> tuple[pl.DataFrame, list[GridSearchResult], StrategyProcessor]:
+    """Build and run the grid search for one ticker / visible_col."""
+    processor = build_processor(
+        ticker,
+        visible_col,
+        signal_method=signal_method,
+        start_date=start_date,
+        end_date=end_date,
+        debug=debug,
+        entry_cache_dir=entry_cache_dir,
+    )
+
     # =========================================================================
     # Run grid search
     # =========================================================================
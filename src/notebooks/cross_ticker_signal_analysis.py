@@ -29,6 +29,8 @@ import numpy as np
 import polars as pl
 from scipy import stats
 
+from abovedata_backtesting.analytics.forward_returns import ForwardReturnEngine
+from abovedata_backtesting.analytics.rank_ic import spearman_ic, spearman_windows
 from abovedata_backtesting.data_loaders.load_market_data import MarketDataLoaders
 from abovedata_backtesting.data_loaders.load_signal_data import (
     list_visible_cols,
@@ -255,33 +257,6 @@ def load_all_market_data(
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _forward_return(
-    market_df: pl.DataFrame,
-    signal_date: date,
-    horizon_days: int,
-) -> float | None:
-    """Compute forward return from signal_date over horizon_days trading days.
-
-    No lookahead: ``signal_date`` is the **earnings_date** — the date the
-    signal became publicly known.  Forward returns start from the *first
-    trading day on or after* that date, so we only use future prices.
-    """
-    future = market_df.filter(pl.col("date") >= signal_date).sort("date")
-    if future.height < 2:
-        return None
-
-    close_0 = future["close"][0]
-    if close_0 is None or close_0 == 0:
-        return None
-
-    idx = min(horizon_days, future.height - 1)
-    close_t = future["close"][idx]
-    if close_t is None:
-        return None
-
-    return float((close_t - close_0) / close_0)
-
-
 def _compute_ic(
     signal_vals: np.ndarray,
     fwd_vals: np.ndarray,
@@ -302,6 +277,10 @@ def _compute_ic(
     return float(ic), float(pval)
 
 
+def _or_none(value: float) -> float | None:
+    return float(value) if np.isfinite(value) else None
+
+
 def _compute_rolling_abs_ic(
     signal_vals: np.ndarray,
     fwd_vals: np.ndarray,
@@ -323,19 +302,14 @@ def _compute_rolling_abs_ic(
     if n < min_window:
         return None
 
-    abs_ics: list[float] = []
     step = max(1, window // 2)  # 50 % overlap between windows
-    for start in range(0, n - min_window + 1, step):
-        end = min(start + window, n)
-        if end - start < min_window:
-            continue
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            ic, _ = stats.spearmanr(s[start:end], f[start:end])
-        if np.isfinite(ic):
-            abs_ics.append(abs(float(ic)))
+    starts = np.arange(0, n - min_window + 1, step)
+    ends = np.minimum(starts + window, n)
+    keep = ends - starts >= min_window
+    ics = spearman_windows(s, f, starts[keep], ends[keep], min_obs=min_window).ic
+    abs_ics = np.abs(ics[np.isfinite(ics)])
 
-    if not abs_ics:
+    if not len(abs_ics):
         return None
     return float(np.mean(abs_ics))
 
@@ -349,6 +323,7 @@ def screen_ticker_signals(
     market_data: dict[str, pl.DataFrame],
     horizon: int = 30,
     min_obs: int = 5,
+    returns: ForwardReturnEngine | None = None,
 ) -> pl.DataFrame:
     """Compute per-ticker, per-signal IC at the given horizon.
 
@@ -363,7 +338,12 @@ def screen_ticker_signals(
     between high/low correlation regimes.  Full-sample ``ic`` may
     average to near-zero if the signal's direction reverses, even
     when the magnitude is consistently large.
+
+    Forward returns come from ``returns`` (built from ``market_data`` if
+    None); they start at the first trading day on or after each
+    earnings_date, so no lookahead.
     """
+    returns = returns or ForwardReturnEngine.from_market_data(market_data)
     results: list[dict] = []
     tickers = signal_panel["ticker"].unique().sort().to_list()
 
@@ -371,37 +351,31 @@ def screen_ticker_signals(
         if ticker not in market_data:
             continue
 
-        mkt = market_data[ticker]
         signals = signal_panel.filter(pl.col("ticker") == ticker)
         vc = signals["visible_col"][0]
 
-        # Pre-compute forward returns for all earnings dates.
-        dates = signals["date"].to_list()
-        fwd_rets: dict[date, float | None] = {}
-        for d in dates:
-            fwd_rets[d] = _forward_return(mkt, d, horizon)
+        # Forward returns for all earnings dates in one pass (NaN = none).
+        fwd_all = returns.series(ticker, signals["date"], horizon)
 
         # Evaluate the UCC residual first.
         signal_cols_to_test = ["resid"] + [
             c for c in ALL_SIGNAL_COLS if c in signals.columns
         ]
+        sig_panel = signals.select(
+            pl.col(c).cast(pl.Float64).fill_null(np.nan) for c in signal_cols_to_test
+        ).to_numpy()
 
-        for sig_col in signal_cols_to_test:
-            sig_vals: list[float] = []
-            fwd_vals: list[float] = []
+        # Full-sample IC of every signal column in one batched call.
+        ic_all = spearman_ic(fwd_all, sig_panel, min_obs=5)
 
-            for row in signals.iter_rows(named=True):
-                fwd = fwd_rets[row["date"]]
-                sig_val = row.get(sig_col)
-                if fwd is not None and sig_val is not None and np.isfinite(sig_val):
-                    sig_vals.append(float(sig_val))
-                    fwd_vals.append(fwd)
+        for k, sig_col in enumerate(signal_cols_to_test):
+            sig_all = sig_panel[:, k]
+            paired = np.isfinite(sig_all) & ~np.isnan(fwd_all)
+            sig_arr = sig_all[paired]
+            fwd_arr = fwd_all[paired]
+            n = len(sig_arr)
 
-            n = len(sig_vals)
-            sig_arr = np.array(sig_vals)
-            fwd_arr = np.array(fwd_vals)
-
-            ic, pval = _compute_ic(sig_arr, fwd_arr)
+            ic, pval = _or_none(ic_all.ic[k]), _or_none(ic_all.pval[k])
 
             # Rolling mean |IC| — robust to regime-switching signals.
             mean_abs_ic = _compute_rolling_abs_ic(sig_arr, fwd_arr)
@@ -473,6 +447,7 @@ def build_cross_ic_matrix(
     signal_col: str,
     horizon: int = 30,
     min_obs: int = 8,
+    returns: ForwardReturnEngine | None = None,
 ) -> tuple[pl.DataFrame, list[str]]:
     """Build NxN cross-signal IC matrix for a given signal column.
 
@@ -488,7 +463,7 @@ def build_cross_ic_matrix(
     Returns (matrix_df, ticker_list).
     """
     # Filter to tickers that have this signal column with enough data.
-    ticker_signals: dict[str, list[tuple[date, float]]] = {}
+    ticker_signals: dict[str, pl.DataFrame] = {}
 
     for ticker in sorted(signal_panel["ticker"].unique().to_list()):
         if ticker not in market_data:
@@ -497,12 +472,10 @@ def build_cross_ic_matrix(
         if signal_col not in rows.columns:
             continue
 
-        pairs = []
-        for r in rows.iter_rows(named=True):
-            val = r.get(signal_col)
-            if val is not None and np.isfinite(val):
-                pairs.append((r["date"], float(val)))
-        if len(pairs) >= min_obs:
+        pairs = rows.select("date", pl.col(signal_col).cast(pl.Float64)).filter(
+            pl.col(signal_col).is_finite()
+        )
+        if pairs.height >= min_obs:
             ticker_signals[ticker] = pairs
 
     tickers = sorted(ticker_signals.keys())
@@ -510,27 +483,17 @@ def build_cross_ic_matrix(
     if n < 2:
         return pl.DataFrame(), tickers
 
+    returns = returns or ForwardReturnEngine.from_market_data(market_data)
     matrix = np.full((n, n), np.nan)
 
     for i, ticker_a in enumerate(tickers):
-        for j, ticker_b in enumerate(tickers):
-            if ticker_b not in market_data:
-                continue
-
-            mkt_b = market_data[ticker_b]
-            sigs: list[float] = []
-            fwds: list[float] = []
-
-            for sig_date, sig_val in ticker_signals[ticker_a]:
-                fwd = _forward_return(mkt_b, sig_date, horizon)
-                if fwd is not None:
-                    sigs.append(sig_val)
-                    fwds.append(fwd)
+        pairs = ticker_signals[ticker_a]
+        sig_a = pairs[signal_col].to_numpy()
+        # B's forward returns from A's public signal dates, for every B.
+        fwd = returns.matrix(pairs["date"], [horizon], tickers=tickers)[:, :, 0]
 
-            if len(sigs) >= min_obs:
-                ic, _ = _compute_ic(np.array(sigs), np.array(fwds))
-                if ic is not None:
-                    matrix[i, j] = ic
+        # Rank IC against every B at once (NaN below min_obs pairs).
+        matrix[i] = spearman_ic(sig_a, fwd, min_obs=max(min_obs, 5)).ic
 
     matrix_df = pl.DataFrame(
         {"signal_ticker": tickers}
@@ -776,8 +739,9 @@ def main(
 
     # ── Step 2: Per-ticker × per-signal screening ────────────────────────
     print(f"\n[2/4] Screening all signal types per ticker (horizon={horizon}d)...")
+    returns = ForwardReturnEngine.from_market_data(market_data)
     screening = screen_ticker_signals(
-        signal_panel, market_data, horizon=horizon, min_obs=5
+        signal_panel, market_data, horizon=horizon, min_obs=5, returns=returns
     )
 
     # ── 2a: Best signal per ticker ────────────────────────────────────────
@@ -915,6 +879,7 @@ def main(
             signal_col=sig_type,
             horizon=horizon,
             min_obs=min_obs,
+            returns=returns,
         )
 
         if len(cross_tickers) < 2:
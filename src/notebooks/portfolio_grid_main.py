@@ -0,0 +1,127 @@
+"""Correlation-aware grid search across many tickers in one run.
+
+Replaces looping ``make run-corr TICKER=...`` in the shell: every
+(ticker, visible_col) grid from correlation_aware_strategy_main runs on one
+shared worker pool, benchmarks are built once per visible_col, and each
+ticker's summary is written under ``{output_dir}/ticker={ticker}/`` as soon
+as it completes.
+
+Usage:
+    python -m src.notebooks.portfolio_grid_main                 # full universe
+    python -m src.notebooks.portfolio_grid_main --tickers DE CAT --workers 16
+"""
+
+import argparse
+from datetime import date
+from functools import partial
+from pathlib import Path
+
+import polars as pl
+
+from abovedata_backtesting.data_loaders.load_signal_data import list_signal_tickers
+from abovedata_backtesting.processors.portfolio_runner import PortfolioGridRunner
+from abovedata_backtesting.processors.strategy_processor import (
+    GridSearchResult,
+    StrategyProcessor,
+)
+from abovedata_backtesting.trades.trade_save_results import save_results
+from src.notebooks.correlation_aware_strategy_main import build_processor
+
+
+def main(
+    tickers: list[str] | None = None,
+    visible_cols: list[str] | None = None,
+    signal_method: str = "stl_p4_s7_robustTrue",
+    start_date: date | None = None,
+    output_dir: Path = Path("results") / "portfolio",
+    max_workers: int | None = None,
+    max_concurrent_jobs: int = 4,
+    save_top_n: int = 0,
+) -> pl.DataFrame:
+    """Run the universe; ``start_date`` None keeps build_processor's default."""
+    tickers = tickers or list_signal_tickers(method=signal_method)
+    print(f"Running {len(tickers)} tickers: {', '.join(tickers)}")
+
+    def _save_best(
+        ticker: str,
+        summary: pl.DataFrame,
+        outcomes: dict[
+            str, tuple[pl.DataFrame, list[GridSearchResult], StrategyProcessor | None]
+        ],
+    ) -> None:
+        """Save trade-level results for the ticker's best visible_col."""
+        best_vc = summary["visible_col"][0]
+        _, results, processor = outcomes[best_vc]
+        save_results(
+            ticker=ticker,
+            summary_df=summary.filter(pl.col("visible_col") == best_vc),
+            results=results,
+            processor=processor,
+            output_dir=output_dir / f"ticker={ticker}",
+            top_n=save_top_n,
+        )
+
+    runner = PortfolioGridRunner(
+        tickers=tickers,
+        build_processor=partial(
+            build_processor,
+            signal_method=signal_method,
+            debug=False,
+            # Same backtest span as ``make run-corr`` unless overridden.
+            **({"start_date": start_date} if start_date is not None else {}),
+        ),
+        visible_cols=visible_cols,
+        signal_method=signal_method,
+        output_dir=output_dir,
+        max_workers=max_workers,
+        max_concurrent_jobs=max_concurrent_jobs,
+        on_ticker_done=_save_best if save_top_n else None,
+        debug=True,
+    )
+    index = runner.run()
+
+    pl.Config.set_tbl_rows(len(tickers) + 5)
+    print(index)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    index.write_parquet(output_dir / "index.parquet")
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run the correlation-aware grid search over many tickers"
+    )
+    parser.add_argument(
+        "--tickers",
+        nargs="*",
+        default=None,
+        help="Tickers to run (default: every ticker in data/signal-data)",
+    )
+    parser.add_argument(
+        "--visible-cols",
+        nargs="*",
+        default=None,
+        help="visible_col variants (default: all found per ticker)",
+    )
+    parser.add_argument("--output-dir", type=Path, default=Path("results/portfolio"))
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Shared entry pool size"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=4, help="(ticker, visible_col) grids in flight"
+    )
+    parser.add_argument(
+        "--save-top-n",
+        type=int,
+        default=0,
+        help="Also save trade-level results for the top N strategies per ticker",
+    )
+    args = parser.parse_args()
+    main(
+        tickers=args.tickers,
+        visible_cols=args.visible_cols,
+        output_dir=args.output_dir,
+        max_workers=args.workers,
+        max_concurrent_jobs=args.jobs,
+        save_top_n=args.save_top_n,
+    )
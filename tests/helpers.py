@@ -0,0 +1,124 @@
+"""Synthetic market data and a small processor shared by the test modules."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+
+from abovedata_backtesting.benchmarks.benchmark_results import BenchmarkResults
+from abovedata_backtesting.entries.entry_events import EntryEvents
+from abovedata_backtesting.entries.entry_signals import (
+    MomentumEntry,
+    SignalThresholdEntry,
+)
+from abovedata_backtesting.exits.exit_strategies import (
+    FixedHoldingExit,
+    SignalChangeExit,
+    StopLossTakeProfitExit,
+    TrailingStopExit,
+)
+from abovedata_backtesting.processors.strategy_processor import StrategyProcessor
+
+
+def make_market(n: int = 1500, seed: int = 7) -> pl.DataFrame:
+    """Daily bars with asset and benchmark returns, weekdays only."""
+    rng = np.random.default_rng(seed)
+    dates: list[date] = []
+    d = date(2015, 1, 1)
+    while len(dates) < n:
+        if d.weekday() < 5:
+            dates.append(d)
+        d += timedelta(days=1)
+
+    closes = 100.0 * np.cumprod(1.0 + rng.standard_normal(n) * 0.015)
+    highs = closes * (1.0 + np.abs(rng.standard_normal(n)) * 0.01)
+    lows = closes * (1.0 - np.abs(rng.standard_normal(n)) * 0.01)
+    asset_returns = np.concatenate([[0.0], closes[1:] / closes[:-1] - 1.0])
+    return pl.DataFrame(
+        {
+            "date": dates,
+            "close": closes,
+            "high": highs,
+            "low": lows,
+            "asset_return": asset_returns,
+            "benchmark_return": rng.standard_normal(n) * 0.01,
+        }
+    )
+
+
+def make_signals(market: pl.DataFrame, seed: int = 11) -> pl.DataFrame:
+    """Quarterly signal rows aligned to (mostly) trading days."""
+    rng = np.random.default_rng(seed)
+    market_dates = market["date"].to_list()
+    earnings = market_dates[70::63]
+    return pl.DataFrame(
+        {
+            "earnings_date": earnings,
+            "visible_revenue_resid": rng.standard_normal(len(earnings)),
+        }
+    )
+
+
+def make_processor(**kwargs: object) -> StrategyProcessor:
+    market = make_market()
+    signals = make_signals(market)
+    processor = StrategyProcessor(
+        ticker="TEST",
+        signals=signals,
+        benchmarks=BenchmarkResults(),
+        **kwargs,  # type: ignore[arg-type]
+    )
+    # Pre-populated market data short-circuits _load_data (no network I/O).
+    processor._market_data = market
+    processor.add_entries(
+        MomentumEntry.grid(
+            lookback_days=[10, 20],
+            zscore_threshold=[0.0, 0.5],
+            entry_days_before=[0, 5],
+        )
+        + SignalThresholdEntry.grid(
+            long_threshold=[0.0, 0.5],
+            short_threshold=[-0.5],
+            entry_days_before=[0, 3],
+        )
+    )
+    signal_dates = frozenset(signals["earnings_date"].to_list())
+    processor.add_exits(
+        [
+            SignalChangeExit(),
+            FixedHoldingExit(holding_days=20, signal_dates=signal_dates),
+            TrailingStopExit(trailing_stop_pct=0.05),
+            StopLossTakeProfitExit(stop_loss_pct=-0.05, take_profit_pct=0.10),
+        ]
+    )
+    processor.add_position_filters(["long_short", "long_only"])
+    processor.max_entries_per_signal = [1, 2]
+    return processor
+
+
+def result_keys(summary: pl.DataFrame) -> pl.DataFrame:
+    """Columns that identify a result and its headline score, in a stable order."""
+    return summary.select(
+        "pp_name",
+        "entry_name",
+        "exit_name",
+        "position_filter",
+        "max_entries_per_signal",
+        "trade_n_trades",
+        "sharpe_ratio",
+    ).sort("entry_name", "exit_name", "position_filter", "max_entries_per_signal")
+
+
+def assert_events_equal(got: EntryEvents, expected: EntryEvents) -> None:
+    """Batched and per-rule EntryEvents must agree array for array."""
+    assert got.n_days == expected.n_days
+    for attr in (
+        "entry_idx",
+        "direction",
+        "strength",
+        "confidence",
+        "signal_id",
+        "context_id",
+    ):
+        np.testing.assert_array_equal(getattr(got, attr), getattr(expected, attr))
+    assert got.contexts == expected.contexts
@@ -0,0 +1,93 @@
+"""CorrelationAwareEntry.batch_events against per-variant events()."""
+
+from datetime import timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from abovedata_backtesting.entries.correlation_aware_entry import (
+    CorrelationAwareEntry,
+)
+from abovedata_backtesting.entries.trading_calendar import TradingCalendar
+from abovedata_backtesting.processors.strategy_processor import EntryExecutor
+from tests.helpers import assert_events_equal, make_market, make_processor, result_keys
+
+
+def _corr_signals(market: pl.DataFrame, seed: int = 5) -> pl.DataFrame:
+    """Quarterly rows with correlation context, gaps and weekend dates."""
+    rng = np.random.default_rng(seed)
+    earnings = [
+        d + timedelta(days=int(k))
+        for d, k in zip(market["date"].to_list()[70::63], rng.integers(0, 3, 30))
+    ]
+    n = len(earnings)
+
+    def _with_nulls(values: np.ndarray, frac: float) -> list[float | None]:
+        return [None if rng.random() < frac else float(v) for v in values]
+
+    return pl.DataFrame(
+        {
+            "earnings_date": earnings,
+            "quarter_start": [d - timedelta(days=95) for d in earnings],
+            "quarter_end": [d - timedelta(days=25) for d in earnings],
+            "pct_count_complete": _with_nulls(rng.uniform(0.5, 1.0, n), 0.2),
+            "visible_revenue_resid": _with_nulls(rng.standard_normal(n), 0.1),
+            "contemp_corr_historical": _with_nulls(rng.uniform(-1, 1, n), 0.15),
+            "leading_corr_historical": _with_nulls(rng.uniform(-1, 1, n), 0.15),
+            "contemp_confidence": _with_nulls(rng.uniform(0, 1, n), 0.15),
+            "leading_confidence": _with_nulls(rng.uniform(0, 1, n), 0.15),
+            "contemp_regime_shift": [
+                ["", "flip", None][k] for k in rng.integers(0, 3, n)
+            ],
+            "leading_regime_shift": [
+                ["", "flip", None][k] for k in rng.integers(0, 3, n)
+            ],
+        }
+    )
+
+
+GRID = CorrelationAwareEntry.grid(
+    corr_col=["contemp", "leading"],
+    min_signal_abs=[0.0, 0.5],
+    min_confidence=[0.0, 0.4],
+    skip_regime_shifts=[True, False],
+    scale_by_confidence=[False, True],
+    confidence_col=["contemp", "leading"],
+    entry_days_before=[0, 3, 20],
+    use_prior_quarter_corr=[True, False],
+)
+
+
+class TestCorrelationAwareBatch:
+    def test_batch_matches_each_variant(self) -> None:
+        market = make_market()
+        signals = _corr_signals(market)
+        calendar = TradingCalendar.from_market_data(market)
+
+        # Unknown signal columns come back empty, in their input position.
+        rules = [*GRID, CorrelationAwareEntry(signal_col="missing")]
+        batched = CorrelationAwareEntry.batch_events(
+            rules, market, signals, calendar=calendar
+        )
+        assert len(batched) == len(rules)
+        assert len(GRID) > 100
+        for rule, events in zip(rules, batched):
+            assert_events_equal(events, rule.events(market, signals))
+        assert batched[-1].n_events == 0
+        assert any(e.n_events and e.direction.any() for e in batched)
+
+    @pytest.mark.parametrize("executor", ["serial", "process"])
+    def test_grid_run_matches_unbatched(
+        self, executor: EntryExecutor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def _run() -> pl.DataFrame:
+            processor = make_processor(executor=executor, max_workers=2)
+            processor.signals = _corr_signals(processor._market_data)
+            processor.add_entries(GRID[::7])
+            summary, _ = processor.run()
+            return summary
+
+        batched = _run()
+        monkeypatch.setattr(CorrelationAwareEntry, "batchable", False)
+        assert result_keys(batched).equals(result_keys(_run()))
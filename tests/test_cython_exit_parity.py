@@ -10,11 +10,30 @@ from abovedata_backtesting.entries.entry_signals import (
     enforce_max_entries,
     enforce_max_entries_fast,
 )
+from abovedata_backtesting.exits.cython_batch import (
+    BATCH_METRICS,
+    EXIT_FIXED_HOLDING,
+    EXIT_SIGNAL_CHANGE,
+    EXIT_STOP_LOSS_TAKE_PROFIT,
+    EXIT_TRAILING_STOP,
+    evaluate_exit_grid_cy,
+)
+from abovedata_backtesting.exits.cython_exits import (
+    enforce_max_entries_cy,
+    stop_loss_take_profit_exit_cy,
+    stop_loss_take_profit_exit_multi_cy,
+    trailing_stop_exit_cy,
+    trailing_stop_exit_multi_cy,
+)
 from abovedata_backtesting.exits.exit_strategies import (
+    ExitRule,
     FixedHoldingExit,
+    SignalChangeExit,
     StopLossTakeProfitExit,
     TrailingStopExit,
 )
+from abovedata_backtesting.model.metrics import BacktestMetrics
+from abovedata_backtesting.trades.trade_log import TradeLog
 
 
 def _make_daily(n: int = 2500, seed: int = 42) -> pl.DataFrame:
@@ -116,6 +135,42 @@ class TestStopLossTakeProfitExitParity:
         )
 
 
+class TestMultiParameterKernelParity:
+    """(K, N) multi-parameter kernels match K single-parameter calls."""
+
+    def test_trailing_stop(self, daily: pl.DataFrame) -> None:
+        arrays = [daily[c].to_numpy() for c in ("position", "close", "high", "low")]
+        pcts = np.array([0.02, 0.05, 0.10, 0.20])
+        multi_pos, multi_exit = trailing_stop_exit_multi_cy(*arrays, pcts)
+
+        assert multi_pos.shape == (len(pcts), daily.height)
+        for k, pct in enumerate(pcts):
+            pos, exit_prices = trailing_stop_exit_cy(*arrays, float(pct))
+            np.testing.assert_array_equal(multi_pos[k], pos)
+            np.testing.assert_array_equal(multi_exit[k], exit_prices)
+
+    def test_stop_loss_take_profit(self, daily: pl.DataFrame) -> None:
+        arrays = [daily[c].to_numpy() for c in ("position", "close", "high", "low")]
+        sl = np.array([-0.05, -0.10, -0.03, -0.15])
+        tp = np.array([0.10, 0.20, 0.05, 0.30])
+        multi_pos, multi_exit = stop_loss_take_profit_exit_multi_cy(*arrays, sl, tp)
+
+        assert multi_pos.shape == (len(sl), daily.height)
+        for k in range(len(sl)):
+            pos, exit_prices = stop_loss_take_profit_exit_cy(
+                *arrays, float(sl[k]), float(tp[k])
+            )
+            np.testing.assert_array_equal(multi_pos[k], pos)
+            np.testing.assert_array_equal(multi_exit[k], exit_prices)
+
+    def test_mismatched_sl_tp_raises(self, daily: pl.DataFrame) -> None:
+        arrays = [daily[c].to_numpy() for c in ("position", "close", "high", "low")]
+        with pytest.raises(ValueError, match="differ"):
+            stop_loss_take_profit_exit_multi_cy(
+                *arrays, np.array([-0.05, -0.10]), np.array([0.10])
+            )
+
+
 class TestEnforceMaxEntriesParity:
     @pytest.mark.parametrize("max_entries", [1, 2, 3])
     def test_parity(self, daily: pl.DataFrame, max_entries: int) -> None:
@@ -163,3 +218,94 @@ class TestEdgeCases:
         ts = TrailingStopExit(trailing_stop_pct=0.05)
         result = ts.apply_fast(daily)
         assert result.height == 1
+
+
+class TestBatchedExitScoringParity:
+    """evaluate_exit_grid_cy matches TradeLog + BacktestMetrics per combo."""
+
+    def test_matches_per_combo_metrics(self, daily: pl.DataFrame) -> None:
+        dates = daily["date"].to_list()
+        signal_dates = frozenset(dates[::80])
+        positions = daily["position"].to_numpy()
+        closes = daily["close"].to_numpy()
+        highs = daily["high"].to_numpy()
+        lows = daily["low"].to_numpy()
+        signal_ids = daily["signal_id"].to_numpy().astype(np.int32)
+        asset_returns = np.concatenate([[0.0], closes[1:] / closes[:-1] - 1.0])
+        mask = np.array([d in signal_dates for d in dates], dtype=np.uint8)
+
+        exits: list[tuple[ExitRule, int, tuple[float, float]]] = [
+            (SignalChangeExit(), EXIT_SIGNAL_CHANGE, (0.0, 0.0)),
+            (
+                FixedHoldingExit(holding_days=30, signal_dates=signal_dates),
+                EXIT_FIXED_HOLDING,
+                (30.0, 0.0),
+            ),
+            (TrailingStopExit(trailing_stop_pct=0.05), EXIT_TRAILING_STOP, (0.05, 0)),
+            (
+                StopLossTakeProfitExit(stop_loss_pct=-0.05, take_profit_pct=0.10),
+                EXIT_STOP_LOSS_TAKE_PROFIT,
+                (-0.05, 0.10),
+            ),
+        ]
+        max_entries = np.array([1, 3], dtype=np.int32)
+        scores = evaluate_exit_grid_cy(
+            positions,
+            closes,
+            highs,
+            lows,
+            asset_returns,
+            mask,
+            signal_ids,
+            np.array([kind for _, kind, _ in exits], dtype=np.int32),
+            np.array([p for _, _, p in exits], dtype=np.float64),
+            max_entries,
+        )
+        assert scores.shape == (len(exits) * len(max_entries), len(BATCH_METRICS))
+
+        for e, (rule, _, _) in enumerate(exits):
+            exited = rule.apply_fast(daily)
+            trade_closes = (
+                exited["exit_price"].to_numpy()
+                if "exit_price" in exited.columns
+                else closes
+            )
+            for m, n_max in enumerate(max_entries):
+                new_pos = enforce_max_entries_cy(
+                    exited["position"].to_numpy(), signal_ids, int(n_max)
+                )
+                log = TradeLog.from_arrays(
+                    new_pos, dates, trade_closes, positions, positions
+                )
+                metrics = BacktestMetrics.from_daily(
+                    strategy_returns=asset_returns * new_pos,
+                    asset_returns=asset_returns,
+                    benchmark_returns=asset_returns,
+                    positions=new_pos,
+                )
+                expected = [
+                    metrics.risk.sharpe_ratio,
+                    log.total_return,
+                    log.n_trades,
+                    metrics.risk.max_drawdown,
+                    log.win_rate,
+                ]
+                np.testing.assert_allclose(
+                    scores[e * len(max_entries) + m], expected, rtol=1e-9, atol=1e-12
+                )
+
+    def test_empty_input(self) -> None:
+        empty = np.array([], dtype=np.float64)
+        scores = evaluate_exit_grid_cy(
+            empty,
+            empty,
+            empty,
+            empty,
+            empty,
+            np.array([], dtype=np.uint8),
+            np.array([], dtype=np.int32),
+            np.array([EXIT_SIGNAL_CHANGE], dtype=np.int32),
+            np.zeros((1, 2), dtype=np.float64),
+            np.array([1], dtype=np.int32),
+        )
+        assert (scores == 0.0).all()
@@ -0,0 +1,110 @@
+"""EntryEvents: sparse entry output and its daily expansions."""
+
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from abovedata_backtesting.entries.entry_context import (
+    ENTRY_CONTEXT_COLUMNS,
+    EntryContext,
+)
+from abovedata_backtesting.entries.entry_events import EntryEvents
+from abovedata_backtesting.entries.entry_signals import (
+    DivergenceEntry,
+    EntryRule,
+    MomentumEntry,
+    SignalThresholdEntry,
+)
+from abovedata_backtesting.processors.entry_cache import EntryCache
+from tests.helpers import make_market, make_signals
+
+RULES: list[EntryRule] = [
+    MomentumEntry(lookback_days=10, zscore_threshold=0.5, entry_days_before=3),
+    SignalThresholdEntry(long_threshold=0.2, short_threshold=-0.1),
+    DivergenceEntry(divergence_zscore=0.3, fundamental_threshold=0.2),
+    SignalThresholdEntry(signal_col="missing"),
+]
+
+
+@pytest.fixture(scope="module")
+def frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    market = make_market(n=600)
+    return market, make_signals(market)
+
+
+def _assert_arrays_match(events: EntryEvents, daily: pl.DataFrame) -> None:
+    positions, signal_ids, strengths, confs = events.daily_arrays()
+    np.testing.assert_array_equal(positions, daily["position"].to_numpy())
+    np.testing.assert_array_equal(strengths, daily["signal_strength"].to_numpy())
+    np.testing.assert_array_equal(confs, daily["confidence"].to_numpy())
+    if "signal_id" in daily.columns:
+        np.testing.assert_array_equal(signal_ids, daily["signal_id"].to_numpy())
+
+
+class TestEntryEvents:
+    @pytest.mark.parametrize("rule", RULES, ids=lambda r: r.name)
+    def test_daily_arrays_match_apply(
+        self, rule: EntryRule, frames: tuple[pl.DataFrame, pl.DataFrame]
+    ) -> None:
+        market, signals = frames
+        events = rule.events(market, signals)
+        _assert_arrays_match(events, rule.apply(market, signals))
+
+    @pytest.mark.parametrize("rule", RULES, ids=lambda r: r.name)
+    def test_from_daily_roundtrip(
+        self, rule: EntryRule, frames: tuple[pl.DataFrame, pl.DataFrame]
+    ) -> None:
+        market, signals = frames
+        daily = rule.apply(market, signals)
+        assert EntryEvents.from_daily(daily).to_daily(market).equals(daily)
+
+    def test_context_to_row_roundtrip(self) -> None:
+        ctx = EntryContext(
+            entry_type="corr_aware",
+            signal_col="visible_revenue_resid",
+            signal_value=0.4,
+            raw_direction=1,
+            final_direction=-1,
+            flipped=True,
+            corr_col_used="contemp",
+        )
+        row = ctx.to_row()
+        assert list(row) == ENTRY_CONTEXT_COLUMNS
+        assert EntryContext.from_row(row) == ctx
+
+    def test_empty_events_are_flat(self) -> None:
+        market = make_market(n=300)
+        rule = SignalThresholdEntry(signal_col="missing")
+        events = rule.events(market, make_signals(market))
+        assert events.n_events == 0
+        assert events.nbytes == 0
+        assert events.to_daily(market)["position"].sum() == 0.0
+
+    @pytest.mark.parametrize("pos_filter", ["long_only", "short_only"])
+    def test_position_filter(
+        self, pos_filter: str, frames: tuple[pl.DataFrame, pl.DataFrame]
+    ) -> None:
+        market, signals = frames
+        events = RULES[1].events(market, signals)
+        filtered = events.with_position_filter(pos_filter)  # type: ignore[arg-type]
+        positions = filtered.daily_arrays()[0]
+        if pos_filter == "long_only":
+            assert (positions >= 0).all() and (positions > 0).any()
+        else:
+            assert (positions <= 0).all() and (positions < 0).any()
+        np.testing.assert_array_equal(filtered.signal_id, events.signal_id)
+
+    def test_disk_cache_roundtrip(
+        self, tmp_path: Path, frames: tuple[pl.DataFrame, pl.DataFrame]
+    ) -> None:
+        market, signals = frames
+        cache = EntryCache(tmp_path)
+        for i, rule in enumerate(RULES):
+            events = rule.events(market, signals)
+            cache.put(f"k{i}", events)
+            loaded = cache.get(f"k{i}", market.height)
+            assert loaded is not None
+            assert loaded.to_daily(market).equals(events.to_daily(market))
+        assert cache.get("k0", n_days=10) is None
@@ -0,0 +1,89 @@
+"""ForwardReturnEngine against the per-pair DataFrame filter it replaces."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from abovedata_backtesting.analytics.forward_returns import ForwardReturnEngine
+
+
+def _reference_forward_return(
+    market_df: pl.DataFrame, signal_date: date, horizon_days: int
+) -> float | None:
+    """The original per-(signal, ticker) forward return."""
+    future = market_df.filter(pl.col("date") >= signal_date).sort("date")
+    if future.height < 2:
+        return None
+    close_0 = future["close"][0]
+    if close_0 is None or close_0 == 0:
+        return None
+    idx = min(horizon_days, future.height - 1)
+    close_t = future["close"][idx]
+    if close_t is None:
+        return None
+    return float((close_t - close_0) / close_0)
+
+
+@pytest.fixture(scope="module")
+def market_data() -> dict[str, pl.DataFrame]:
+    rng = np.random.default_rng(7)
+    out = {}
+    for k, ticker in enumerate(["CCC", "AAA", "BBB"]):
+        n = 300 - 50 * k
+        offsets = np.sort(rng.choice(500, n, replace=False))
+        closes = pl.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, n))))
+        if ticker == "AAA":
+            closes[10] = None
+            closes[40] = 0.0
+        # Unsorted input: the engine must sort by date itself.
+        out[ticker] = pl.DataFrame(
+            {
+                "date": [date(2020, 1, 1) + timedelta(days=int(d)) for d in offsets],
+                "close": closes,
+            }
+        ).reverse()
+    return out
+
+
+@pytest.fixture(scope="module")
+def signal_dates() -> list[date]:
+    return [date(2019, 12, 1) + timedelta(days=9 * i) for i in range(70)]
+
+
+class TestForwardReturnEngine:
+    def test_matrix_matches_reference(
+        self, market_data: dict[str, pl.DataFrame], signal_dates: list[date]
+    ) -> None:
+        engine = ForwardReturnEngine.from_market_data(market_data)
+        horizons = [0, 1, 30, 1000]
+        fwd = engine.matrix(signal_dates, horizons)
+
+        assert engine.tickers == ("AAA", "BBB", "CCC")
+        assert fwd.shape == (len(signal_dates), 3, len(horizons))
+        for j, ticker in enumerate(engine.tickers):
+            for k, h in enumerate(horizons):
+                expected = [
+                    _reference_forward_return(market_data[ticker], d, h)
+                    for d in signal_dates
+                ]
+                got = [None if np.isnan(v) else float(v) for v in fwd[:, j, k]]
+                assert got == expected, (ticker, h)
+
+    def test_series_and_ticker_selection(
+        self, market_data: dict[str, pl.DataFrame], signal_dates: list[date]
+    ) -> None:
+        engine = ForwardReturnEngine.from_market_data(market_data)
+        dates = pl.Series(signal_dates)
+        sub = engine.matrix(dates, [30], tickers=["CCC", "AAA"])
+        np.testing.assert_array_equal(
+            sub[:, 0, 0], engine.series("CCC", signal_dates, 30)
+        )
+        np.testing.assert_array_equal(sub[:, 1, 0], engine.series("AAA", dates, 30))
+
+    def test_unknown_ticker_raises(self, market_data: dict[str, pl.DataFrame]) -> None:
+        engine = ForwardReturnEngine.from_market_data(market_data)
+        assert "ZZZ" not in engine
+        with pytest.raises(KeyError, match="ZZZ"):
+            engine.series("ZZZ", [date(2020, 1, 1)], 30)
@@ -0,0 +1,53 @@
+"""MomentumEntry.batch_events against per-variant events()."""
+
+from datetime import timedelta
+
+import polars as pl
+import pytest
+
+from abovedata_backtesting.entries.entry_signals import MomentumEntry
+from abovedata_backtesting.entries.trading_calendar import TradingCalendar
+from tests.helpers import assert_events_equal, make_market, make_processor, result_keys
+
+GRID = MomentumEntry.grid(
+    lookback_days=[5, 10, 20],
+    zscore_threshold=[0.0, 0.5, 1.0, 2.0],
+    zscore_window=[20, 60],
+    entry_days_before=[0, 3, 10, 400],
+)
+
+
+def _flat_stretch_market() -> pl.DataFrame:
+    """Market with a constant-price stretch (zero-variance z-score windows)."""
+    market = make_market(n=900)
+    closes = market["close"].to_numpy().copy()
+    closes[300:420] = closes[300]
+    return market.with_columns(pl.Series("close", closes))
+
+
+def _signals(market: pl.DataFrame) -> pl.DataFrame:
+    """Quarterly dates incl. weekends, duplicates and a pre-history date."""
+    dates = market["date"].to_list()
+    earnings = [d + timedelta(days=k % 3) for k, d in enumerate(dates[5::45])]
+    earnings += [earnings[3], dates[0] - timedelta(days=10)]
+    return pl.DataFrame({"earnings_date": earnings})
+
+
+class TestMomentumBatch:
+    def test_batch_matches_each_variant(self) -> None:
+        market = _flat_stretch_market()
+        signals = _signals(market)
+        calendar = TradingCalendar.from_market_data(market)
+
+        batched = MomentumEntry.batch_events(GRID, market, signals, calendar=calendar)
+        assert len(batched) == len(GRID)
+        for rule, events in zip(GRID, batched):
+            assert_events_equal(events, rule.events(market, signals))
+        assert any((e.direction > 0).any() for e in batched)
+        assert any((e.direction < 0).any() for e in batched)
+
+    def test_grid_run_matches_unbatched(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        batched, _ = make_processor(executor="serial").run()
+        monkeypatch.setattr(MomentumEntry, "batchable", False)
+        unbatched, _ = make_processor(executor="serial").run()
+        assert result_keys(batched).equals(result_keys(unbatched))
@@ -0,0 +1,176 @@
+"""Sampling search drivers and StrategyProcessor.evaluate_entries."""
+
+import datetime as dt
+import math
+import warnings
+
+import numpy as np
+import polars as pl
+import pytest
+
+from abovedata_backtesting.entries.cross_ticker_entry import CrossTickerEntry
+from abovedata_backtesting.entries.entry_signals import MomentumEntry
+from abovedata_backtesting.entries.peer_signal_store import PeerSignalSeries
+from abovedata_backtesting.processors import strategy_processor
+from abovedata_backtesting.processors.parameter_search import (
+    ParameterSearch,
+    ParamSpace,
+    RandomSampler,
+    Sampler,
+    SobolSampler,
+    TPESampler,
+)
+from tests.helpers import make_processor, result_keys
+
+SPACE = ParamSpace.of(
+    MomentumEntry,
+    lookback_days=[5, 10, 20, 40],
+    zscore_threshold=[0.0, 0.5, 1.0],
+    entry_days_before=[0, 3, 5],
+)
+GRID = MomentumEntry.grid(**{name: list(values) for name, values in SPACE.axes})
+
+
+@pytest.fixture(scope="module")
+def full_summary() -> pl.DataFrame:
+    processor = make_processor(executor="serial")
+    processor._entry_rules = list(GRID)
+    summary, _ = processor.run()
+    return summary
+
+
+def _search(sampler: Sampler, budget: int, seed: int = 3) -> ParameterSearch:
+    return ParameterSearch(
+        make_processor(executor="serial"),
+        SPACE,
+        sampler,
+        budget=budget,
+        batch_size=8,
+        seed=seed,
+    )
+
+
+class TestEvaluateEntries:
+    def test_batches_match_full_run(
+        self, full_summary: pl.DataFrame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        original = strategy_processor._compute_entries
+
+        def _counting(market, signals, entries, *args):  # type: ignore[no-untyped-def]
+            calls.extend(e.name for e in entries)
+            return original(market, signals, entries, *args)
+
+        monkeypatch.setattr(strategy_processor, "_compute_entries", _counting)
+        processor = make_processor(executor="serial")
+        first, first_results = processor.evaluate_entries(GRID[:30])
+        second, _ = processor.evaluate_entries(GRID[20:])
+        repeat, repeat_results = processor.evaluate_entries(GRID[:5])
+
+        assert len(first_results) == first.height
+        assert sorted(calls) == sorted(e.name for e in GRID)
+        assert repeat.height == 0 and repeat_results == []
+        combined = pl.concat([first, second], how="diagonal_relaxed")
+        assert result_keys(combined).equals(result_keys(full_summary))
+
+
+class TestParameterSearch:
+    def test_space_points_build_grid_rules(self) -> None:
+        assert SPACE.size == len(GRID) == 36
+        assert {SPACE.rule(p).name for p in [(0, 0, 0), (3, 2, 2)]} == {
+            GRID[0].name,
+            GRID[-1].name,
+        }
+
+    @pytest.mark.parametrize(
+        "sampler_cls",
+        [RandomSampler, SobolSampler, TPESampler],
+        ids=lambda c: c.__name__,
+    )
+    def test_budget_and_seeding(
+        self, sampler_cls: type[Sampler], full_summary: pl.DataFrame
+    ) -> None:
+        sampler = (
+            TPESampler(n_startup=8) if sampler_cls is TPESampler else sampler_cls()
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = _search(sampler, budget=20).run()
+        again = _search(
+            TPESampler(n_startup=8) if sampler_cls is TPESampler else sampler_cls(),
+            budget=20,
+        ).run()
+
+        trials = result.trials
+        assert trials.height == 20
+        assert trials.select([name for name, _ in SPACE.axes]).is_unique().all()
+        assert trials.equals(again.trials)
+
+        # A trial's objective is the best sharpe over its combos.
+        best = (
+            full_summary.group_by("entry_name")
+            .agg(pl.col("sharpe_ratio").fill_nan(None).max())
+            .rename({"sharpe_ratio": "expected"})
+        )
+        joined = trials.join(best, on="entry_name", how="left")
+        for got, expected in zip(joined["objective"], joined["expected"]):
+            if expected is None:
+                assert math.isnan(got)
+            else:
+                assert got == expected
+        assert set(result.summary["entry_name"]) <= set(trials["entry_name"])
+
+    def test_exhaustive_budget_finds_grid_optimum(
+        self, full_summary: pl.DataFrame
+    ) -> None:
+        result = _search(RandomSampler(), budget=1000).run()
+        assert result.trials.height == SPACE.size
+        top = full_summary.sort("sharpe_ratio", descending=True, nulls_last=True)
+        assert result.best_rules(1)[0].name == top["entry_name"][0]
+
+
+class _StubPeerStore:
+    """Quarterly random peer signals, no file I/O."""
+
+    def series(self, ticker: str, signal_col: str) -> PeerSignalSeries:
+        rng = np.random.default_rng(sum(map(ord, ticker)))
+        dates = [dt.date(2015, 2, 1) + dt.timedelta(days=91 * q) for q in range(24)]
+        return PeerSignalSeries(
+            dates=np.array(dates, dtype="datetime64[D]"),
+            values=rng.standard_normal(len(dates)),
+        )
+
+
+class TestCrossTickerSpace:
+    def test_points_dropped_by_grid_are_skipped(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(CrossTickerEntry, "peer_store", _StubPeerStore())
+        space = ParamSpace.of(
+            CrossTickerEntry,
+            peer_tickers=[("A",), ("A", "B")],
+            min_peer_signals=[1, 2],
+            own_signal_col=["visible_revenue_resid"],
+            entry_days_before=[0, 3],
+        )
+        assert space.rule((0, 1, 0, 0)) is None
+        valid = {
+            p
+            for p in np.ndindex(*space.shape)
+            if space.rule(tuple(int(i) for i in p)) is not None
+        }
+        assert len(valid) == 6
+
+        result = ParameterSearch(
+            make_processor(executor="serial"),
+            space,
+            RandomSampler(),
+            budget=100,
+            batch_size=3,
+        ).run()
+        trials = result.trials
+        assert trials.height == 6
+        assert trials.filter(
+            pl.col("min_peer_signals") > pl.col("peer_tickers").list.len()
+        ).is_empty()
+        assert trials["objective"].is_not_nan().any()
@@ -0,0 +1,108 @@
+"""PeerSignalStore: one load per peer, as-of lookups via searchsorted."""
+
+import datetime as dt
+import pickle
+
+import numpy as np
+import polars as pl
+import pytest
+
+from abovedata_backtesting.entries import peer_signal_store
+from abovedata_backtesting.entries.peer_signal_store import (
+    PeerSignalSeries,
+    PeerSignalStore,
+)
+
+D0 = dt.date(2020, 1, 1)
+
+
+def _reference_latest_before(
+    rows: list[tuple[dt.date, float]], our_date: dt.date, max_age_days: int
+) -> tuple[dt.date, float] | None:
+    """The original linear scan over (date, value) rows."""
+    best = None
+    cutoff = our_date - dt.timedelta(days=max_age_days)
+    for peer_date, val in rows:
+        if peer_date >= our_date or peer_date < cutoff:
+            continue
+        if best is None or peer_date > best[0]:
+            best = (peer_date, val)
+    return best
+
+
+@pytest.fixture
+def peer_files(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    """Two visible_col variants for ticker P; records every file read."""
+    frames = {
+        "sparse": pl.DataFrame(
+            {
+                "earnings_date": [D0, D0 + dt.timedelta(days=90)],
+                "sparse_resid": [1.0, None],
+            }
+        ),
+        "dense": pl.DataFrame(
+            {
+                "earnings_date": [D0 + dt.timedelta(days=90 * q) for q in range(4)],
+                "dense_resid": [0.5, -1.0, float("nan"), 2.0],
+                "corr": [0.1, None, 0.3, 0.4],
+            }
+        ),
+    }
+    reads: list[tuple[str, str]] = []
+
+    def _load(ticker: str, method: str, name: str, visible_col: str) -> pl.DataFrame:
+        reads.append((ticker, visible_col))
+        return frames[visible_col]
+
+    monkeypatch.setattr(
+        peer_signal_store, "list_visible_cols", lambda ticker, method: list(frames)
+    )
+    monkeypatch.setattr(peer_signal_store, "load_signal_data", _load)
+    return reads
+
+
+class TestPeerSignalSeries:
+    def test_latest_before_matches_linear_scan(self) -> None:
+        rng = np.random.default_rng(0)
+        dates = sorted(D0 + dt.timedelta(days=int(d)) for d in rng.integers(0, 900, 40))
+        rows = [(d, float(v)) for d, v in zip(dates, rng.normal(size=40))]
+        series = PeerSignalSeries(
+            dates=np.array(dates, dtype="datetime64[D]"),
+            values=np.array([v for _, v in rows]),
+        )
+        queries = [D0 + dt.timedelta(days=int(d)) for d in range(-10, 950, 7)]
+        for max_age in (0, 30, 90):
+            idx = series.latest_before_many(
+                np.array(queries, dtype="datetime64[D]"), max_age
+            )
+            for q, i in zip(queries, idx):
+                expected = _reference_latest_before(rows, q, max_age)
+                assert series.latest_before(q, max_age) == expected
+                assert (i < 0) == (expected is None)
+
+
+class TestPeerSignalStore:
+    def test_loads_each_peer_once(self, peer_files: list[tuple[str, str]]) -> None:
+        store = PeerSignalStore()
+        resid = store.series("P", "resid")
+        corr = store.series("P", "corr")
+        assert store.series("P", "resid") is resid
+        assert store.best_visible_col("P") == "dense"
+        # One read per visible_col file, none after the first lookup.
+        assert sorted(peer_files) == [("P", "dense"), ("P", "sparse")]
+
+        # NaN and null values are dropped.
+        assert resid.values.tolist() == [0.5, -1.0, 2.0]
+        assert corr.values.tolist() == [0.1, 0.3, 0.4]
+        assert len(store.series("P", "missing")) == 0
+
+    def test_pickle_keeps_loaded_data(self, peer_files: list[tuple[str, str]]) -> None:
+        store = PeerSignalStore()
+        store.series("P", "resid")
+        clone = pickle.loads(pickle.dumps(store))
+        n_reads = len(peer_files)
+        np.testing.assert_array_equal(
+            clone.series("P", "resid").values, store.series("P", "resid").values
+        )
+        clone.series("P", "corr")
+        assert len(peer_files) == n_reads
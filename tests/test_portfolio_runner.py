@@ -0,0 +1,99 @@
+"""PortfolioGridRunner on synthetic tickers (no market-data I/O)."""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import polars as pl
+
+from abovedata_backtesting.benchmarks.benchmark_results import BenchmarkResults
+from abovedata_backtesting.processors.portfolio_runner import PortfolioGridRunner
+from abovedata_backtesting.processors.strategy_processor import StrategyProcessor
+from tests.helpers import make_processor, result_keys
+
+
+def _factory(
+    ticker: str, visible_col: str, benchmarks: BenchmarkResults
+) -> StrategyProcessor:
+    if ticker == "BAD":
+        raise ValueError("no signal data")
+    processor = make_processor()
+    processor.ticker = ticker
+    processor.benchmarks = benchmarks
+    return processor
+
+
+class TestPortfolioGridRunner:
+    def test_runs_every_job_and_streams_summaries(self, tmp_path: Path) -> None:
+        benchmark_calls: list[tuple[tuple[str, ...], str]] = []
+
+        def _benchmarks(tickers: Sequence[str], visible_col: str) -> BenchmarkResults:
+            benchmark_calls.append((tuple(tickers), visible_col))
+            return BenchmarkResults()
+
+        done: list[str] = []
+        runner = PortfolioGridRunner(
+            tickers=["AAA", "BBB", "BAD"],
+            build_processor=_factory,
+            visible_cols=["visible_revenue", "visible_count"],
+            output_dir=tmp_path,
+            max_workers=3,
+            max_concurrent_jobs=2,
+            build_benchmarks=_benchmarks,
+            on_ticker_done=lambda ticker, _summary, _outcomes: done.append(ticker),
+        )
+        index = runner.run()
+
+        # One benchmark build per visible_col, covering every ticker
+        assert sorted(vc for _, vc in benchmark_calls) == [
+            "visible_count",
+            "visible_revenue",
+        ]
+        assert all(t == ("AAA", "BBB", "BAD") for t, _ in benchmark_calls)
+
+        assert index["ticker"].to_list() == ["AAA", "BAD", "BBB"]
+        assert sorted(done) == ["AAA", "BBB"]
+        bad = index.filter(pl.col("ticker") == "BAD").row(0, named=True)
+        assert bad["n_results"] == 0 and "no signal data" in bad["error"]
+
+        reference, _ = make_processor().run()
+        for ticker in ("AAA", "BBB"):
+            summary = pl.read_parquet(tmp_path / f"ticker={ticker}" / "summary.parquet")
+            assert summary["visible_col"].unique().sort().to_list() == [
+                "visible_count",
+                "visible_revenue",
+            ]
+            per_vc = summary.filter(pl.col("visible_col") == "visible_revenue")
+            assert result_keys(per_vc).equals(result_keys(reference))
+
+    def test_failing_benchmarks_are_recorded_per_ticker(self, tmp_path: Path) -> None:
+        def _benchmarks(tickers: Sequence[str], visible_col: str) -> BenchmarkResults:
+            if visible_col == "visible_count":
+                raise FileNotFoundError("no market data for BBB")
+            return BenchmarkResults()
+
+        runner = PortfolioGridRunner(
+            tickers=["AAA", "BBB"],
+            build_processor=_factory,
+            visible_cols=["visible_revenue", "visible_count"],
+            output_dir=tmp_path,
+            max_workers=2,
+            build_benchmarks=_benchmarks,
+        )
+        index = runner.run()
+
+        assert index["ticker"].to_list() == ["AAA", "BBB"]
+        for row in index.iter_rows(named=True):
+            assert row["n_results"] > 0
+            assert "visible_count: benchmarks failed" in row["error"]
+            assert "no market data for BBB" in row["error"]
+            summary = pl.read_parquet(row["path"])
+            assert summary["visible_col"].unique().to_list() == ["visible_revenue"]
+
+        all_failed = PortfolioGridRunner(
+            tickers=["AAA"],
+            build_processor=_factory,
+            visible_cols=["visible_count"],
+            output_dir=tmp_path,
+            build_benchmarks=_benchmarks,
+        ).run()
+        assert all_failed.row(0, named=True)["n_results"] == 0
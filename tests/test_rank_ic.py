@@ -0,0 +1,142 @@
+"""Batched and rolling Spearman IC kernels against scipy.stats.spearmanr."""
+
+import datetime as dt
+import warnings
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from abovedata_backtesting.analytics.rank_ic import (
+    masked_average_ranks,
+    rolling_spearman,
+    spearman_ic,
+    spearman_ic_matrix,
+    spearman_windows,
+)
+from abovedata_backtesting.entries.cross_ticker_entry import CrossTickerEntry
+from abovedata_backtesting.entries.peer_signal_store import PeerSignalSeries
+
+
+def _scipy_ic(x: np.ndarray, y: np.ndarray, min_obs: int) -> tuple[float, float]:
+    mask = np.isfinite(x) & np.isfinite(y)
+    if mask.sum() < min_obs:
+        return np.nan, np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        ic, pval = stats.spearmanr(x[mask], y[mask])
+    return (ic, pval) if np.isfinite(ic) else (np.nan, np.nan)
+
+
+@pytest.fixture(scope="module")
+def panel() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(3)
+    n, m = 30, 60
+    x = rng.normal(size=n)
+    x[4] = np.nan
+    x[7] = x[8]  # tie
+    y = rng.normal(size=(n, m)) + 0.5 * np.nan_to_num(x)[:, None]
+    y[rng.random((n, m)) < 0.25] = np.nan
+    y[:, 1] = np.round(y[:, 1])  # heavy ties
+    y[:, 2] = 1.0  # constant
+    y[5:, 3] = np.nan  # too few pairs
+    y[:, 4] = np.inf
+    return x, y
+
+
+class TestSpearmanIC:
+    def test_matches_scipy_pairwise_complete(
+        self, panel: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        x, y = panel
+        res = spearman_ic(x, y, min_obs=5)
+        expected = np.array([_scipy_ic(x, y[:, j], 5) for j in range(y.shape[1])])
+        np.testing.assert_allclose(res.ic, expected[:, 0], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(res.pval, expected[:, 1], rtol=0, atol=1e-12)
+        assert np.isnan(res.ic[[2, 3, 4]]).all()
+        np.testing.assert_array_equal(
+            res.n_obs, (np.isfinite(x)[:, None] & np.isfinite(y)).sum(0)
+        )
+
+    def test_min_obs_masks_cells(self, panel: tuple[np.ndarray, np.ndarray]) -> None:
+        x, y = panel
+        res = spearman_ic(x, y, min_obs=20)
+        assert np.isnan(res.ic[res.n_obs < 20]).all()
+        assert np.isfinite(res.ic[res.n_obs >= 20]).any()
+
+    def test_matrix_matches_rows(self, panel: tuple[np.ndarray, np.ndarray]) -> None:
+        x, y = panel
+        xs = np.column_stack([x, y[:, 0], -x])
+        res = spearman_ic_matrix(xs, y[:, :10], min_obs=5)
+        assert res.ic.shape == (3, 10)
+        for i in range(3):
+            np.testing.assert_array_equal(
+                res.ic[i], spearman_ic(xs[:, i], y[:, :10], min_obs=5).ic
+            )
+        np.testing.assert_allclose(res.ic[2], -res.ic[0], atol=1e-12)
+
+    def test_masked_ranks_match_rankdata(self) -> None:
+        values = np.array([[3.0, 1.0], [1.0, 1.0], [3.0, 2.0], [2.0, 5.0]])
+        mask = np.array([[True, True], [True, False], [True, True], [False, True]])
+        ranks = masked_average_ranks(values, mask)
+        np.testing.assert_array_equal(ranks[mask[:, 0], 0], stats.rankdata([3, 1, 3]))
+        np.testing.assert_array_equal(ranks[mask[:, 1], 1], stats.rankdata([1, 2, 5]))
+        assert np.isnan(ranks[~mask]).all()
+
+
+class TestRollingSpearman:
+    def test_matches_scipy_per_window(self) -> None:
+        rng = np.random.default_rng(11)
+        x = rng.normal(size=25)
+        y = np.round(x + rng.normal(size=25), 1)
+        window = 6
+        res = rolling_spearman(x, y, window, min_obs=3)
+        for t in range(len(x)):
+            lo = max(0, t - window + 1)
+            expected, _ = _scipy_ic(x[lo : t + 1], y[lo : t + 1], min_obs=3)
+            if np.isnan(expected):
+                assert np.isnan(res.ic[t])
+            else:
+                assert res.ic[t] == pytest.approx(expected, abs=1e-12)
+        assert res.n_obs.tolist() == [min(t + 1, window) for t in range(len(x))]
+
+    def test_windows_mask_nan_and_short_windows(self) -> None:
+        x = np.array([1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 2.0])
+        y = np.array([2.0, 1.0, 3.0, 5.0, 4.0, 7.0, 1.0])
+        res = spearman_windows(x, y, np.array([0, 2, 4]), np.array([7, 5, 6]), 3)
+        assert res.n_obs.tolist() == [6, 2, 2]
+        assert res.ic[0] == pytest.approx(_scipy_ic(x, y, 3)[0], abs=1e-12)
+        assert np.isnan(res.ic[1:]).all()
+
+
+class TestCrossTickerRollingIC:
+    def test_series_lookup_matches_per_date_recompute(self) -> None:
+        rng = np.random.default_rng(2)
+        start = dt.date(2018, 1, 1)
+        own_fwd = {
+            start + dt.timedelta(days=91 * q): float(rng.normal()) for q in range(16)
+        }
+        peer = PeerSignalSeries(
+            dates=np.array(
+                [start + dt.timedelta(days=91 * q - 20) for q in range(16)],
+                dtype="datetime64[D]",
+            ),
+            values=rng.normal(size=16),
+        )
+        rule = CrossTickerEntry(peer_tickers=("P",), rolling_ic_window=4)
+        series = rule._rolling_cross_ic_series(peer, own_fwd, 4)
+
+        for current in sorted(own_fwd):
+            # Reference: rebuild the pairs strictly before ``current``.
+            pairs = [
+                (sig[1], own_fwd[d])
+                for d in sorted(own_fwd)
+                if d < current
+                and (sig := peer.latest_before(d, rule.max_peer_signal_age_days))
+            ]
+            got = rule._rolling_cross_ic_at(current, *series)
+            if len(pairs) < 3:
+                assert got is None
+                continue
+            xs, ys = np.array(pairs[-4:]).T
+            assert got == pytest.approx(stats.spearmanr(xs, ys)[0], abs=1e-12)
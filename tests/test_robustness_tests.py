@@ -0,0 +1,158 @@
+"""Vectorized random-entry permutation test."""
+
+import time
+
+import numpy as np
+import polars as pl
+import pytest
+
+from abovedata_backtesting.trades.robustness_tests import (
+    RandomEntryResult,
+    RobustnessReport,
+    RobustnessValidator,
+    simulate_random_entries,
+)
+from tests.helpers import make_processor
+
+
+def _loop_trial(
+    closes: np.ndarray, entries: np.ndarray, signs: np.ndarray, holding_days: int
+) -> tuple[float, float, float]:
+    """One trial the way the per-trade loop computes it."""
+    rets = []
+    for entry, sign in zip(entries, signs):
+        exit_ = min(entry + holding_days, len(closes) - 1)
+        if exit_ > entry:
+            rets.append((closes[exit_] / closes[entry] - 1.0) * sign)
+    r = np.array(rets)
+    sharpe = r.mean() / r.std() * np.sqrt(252 / holding_days) if r.std() > 0 else 0.0
+    return float(np.prod(1 + r) - 1), float(np.mean(r > 0)), sharpe
+
+
+class TestSimulateRandomEntries:
+    closes = 100.0 * np.cumprod(
+        1.0 + np.random.default_rng(1).standard_normal(400) * 0.02
+    )
+    entry_idx = np.arange(50, 395)
+    directions = np.array([1.0, 1.0, -1.0, 1.0, -1.0, 1.0])
+
+    def test_matches_per_trade_loop(self) -> None:
+        trials = simulate_random_entries(
+            self.closes, self.entry_idx, self.directions, 10, 50, seed=4
+        )
+        # Re-draw the same chunk to recover each trial's entries and signs.
+        rng = np.random.default_rng(np.random.SeedSequence(4).spawn(1)[0])
+        keys = rng.random((50, len(self.entry_idx)))
+        k = len(self.directions)
+        entries = self.entry_idx[np.argpartition(keys, k - 1, axis=1)[:, :k]]
+        signs = rng.permuted(np.tile(self.directions, (50, 1)), axis=1)
+
+        assert len(trials.total_return) == 50
+        for i, (e, s) in enumerate(zip(entries, signs)):
+            assert len(set(e.tolist())) == k
+            assert sorted(s.tolist()) == sorted(self.directions.tolist())
+            total, win, sharpe = _loop_trial(self.closes, e, s, 10)
+            assert trials.total_return[i] == pytest.approx(total, rel=1e-12)
+            assert trials.win_rate[i] == pytest.approx(win)
+            assert trials.sharpe[i] == pytest.approx(sharpe, rel=1e-9)
+
+    def test_seeded_and_worker_independent(self) -> None:
+        args = (self.closes, self.entry_idx, self.directions, 10, 20_000)
+        serial = simulate_random_entries(*args, seed=9, max_workers=1)
+        threaded = simulate_random_entries(*args, seed=9, max_workers=4)
+        other = simulate_random_entries(*args, seed=10)
+        assert np.array_equal(serial.total_return, threaded.total_return)
+        assert np.array_equal(serial.sharpe, threaded.sharpe, equal_nan=True)
+        assert not np.array_equal(serial.total_return, other.total_return)
+
+    def test_untradeable_entries_are_dropped(self) -> None:
+        # Entries only on the last day can never be closed.
+        trials = simulate_random_entries(
+            self.closes, np.array([399]), self.directions, 5, 10, seed=0
+        )
+        assert len(trials.total_return) == 0
+
+
+class TestRandomEntryValidator:
+    def test_exact_pvalue_and_speed(self) -> None:
+        processor = make_processor(executor="serial")
+        _, results = processor.run()
+        result = max(results, key=lambda r: r.trade_log.n_trades)
+        assert result.trade_log.n_trades >= 3
+
+        validator = RobustnessValidator(
+            processor=processor, result=result, random_seed=0
+        )
+        start = time.perf_counter()
+        random_entry = validator._run_random_entry()
+        elapsed = time.perf_counter() - start
+
+        assert random_entry.n_trials == 10_000
+        assert elapsed < 1.0
+        assert random_entry.empirical_pvalue is not None
+        assert 1 / 10_001 <= random_entry.pvalue <= 1.0
+        assert random_entry.pvalue * 10_001 == pytest.approx(
+            round(random_entry.pvalue * 10_001)
+        )
+        assert validator._run_random_entry() == random_entry
+
+    def test_pvalue_falls_back_to_normal_approximation(self) -> None:
+        result = RandomEntryResult(
+            actual_total_return=0.2,
+            actual_sharpe=1.0,
+            actual_win_rate=0.6,
+            random_mean_return=0.0,
+            random_std_return=0.1,
+            random_mean_sharpe=0.0,
+            random_mean_win_rate=0.5,
+            n_trials=100,
+        )
+        assert result.pvalue == pytest.approx(0.02275, abs=1e-5)
+
+
+class TestExitAblation:
+    def test_variants_match_grid_run(self) -> None:
+        processor = make_processor(executor="serial")
+        _, results = processor.run()
+        result = next(
+            r
+            for r in results
+            if r.position_filter == "long_only" and r.max_entries_per_signal == 2
+        )
+        validator = RobustnessValidator(processor=processor, result=result)
+        ablation = validator._run_exit_ablation()
+        exits = validator._default_ablation_exits()
+        assert [v.exit_name for v in ablation.variants] == [e.name for e in exits]
+        assert len(ablation.variants) == 7
+
+        # The same exits run as a grid give the same per-exit results.
+        grid = make_processor(executor="serial")
+        grid._exit_rules = exits
+        summary, _ = grid.run()
+        expected = summary.filter(
+            (pl.col("pp_name") == result.preprocessor_name)
+            & (pl.col("entry_name") == result.entry_rule.name)
+            & (pl.col("position_filter") == "long_only")
+            & (pl.col("max_entries_per_signal") == 2)
+        )
+        by_exit = {row["exit_name"]: row for row in expected.iter_rows(named=True)}
+        for variant in ablation.variants:
+            row = by_exit.get(variant.exit_name)
+            if row is None:
+                assert variant.n_trades is None
+                continue
+            assert variant.n_trades == row["trade_n_trades"]
+            assert variant.sharpe == row["sharpe_ratio"]
+
+        fixed_60 = ablation.variant("fixed_holding_60d")
+        assert fixed_60 is not None
+        assert ablation.fixed_60d_win_rate == fixed_60.win_rate
+        assert ablation.fixed_30d_sharpe == ablation.variant("fixed_holding_30d").sharpe  # type: ignore[union-attr]
+        assert (
+            "trailing_stop_20%"
+            in RobustnessReport(
+                strategy_name="x",
+                n_trades=result.trade_log.n_trades,
+                exit_ablation=ablation,
+            ).summary()
+        )
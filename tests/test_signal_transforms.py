@@ -16,6 +16,7 @@ import pytest
 from abovedata_backtesting.processors.signal_preprocessor import (
     IdentityPreprocessor,
     SignalPreprocessor,
+    apply_preprocessors,
 )
 from abovedata_backtesting.processors.signal_transforms import (
     AccelerationTransform,
@@ -350,3 +351,78 @@ class TestSignalPreprocessor:
             )
         )
         assert pp1.name != pp2.name
+
+
+# ============================================================================
+# Prefix-tree execution
+# ============================================================================
+
+
+class TestApplyPreprocessors:
+    @staticmethod
+    def _grid() -> list[SignalPreprocessor]:
+        return SignalPreprocessor.grid(
+            [
+                TimeShiftTransform.grid(
+                    source_cols=[("visible_revenue_resid", "consensus_resid")],
+                    shift_quarters=[1, 2],
+                ),
+                RateOfChangeTransform.grid(
+                    source_col=["visible_revenue_resid"],
+                    lookback_quarters=[1, 2],
+                ),
+                WeightedBlendTransform.grid(
+                    col_a=["visible_revenue_resid"],
+                    col_b=["visible_revenue_resid_lag1q"],
+                    weight_a=[0.25, 0.5, 0.75],
+                ),
+            ]
+        )
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_matches_per_chain_apply(
+        self, sample_signals: pl.DataFrame, max_workers: int
+    ) -> None:
+        pps: list[SignalPreprocessor | IdentityPreprocessor] = [
+            IdentityPreprocessor(),
+            *self._grid(),
+            SignalPreprocessor(transforms=()),
+        ]
+        out = apply_preprocessors(pps, sample_signals, max_workers=max_workers)
+        assert list(out) == list(dict.fromkeys(pp.name for pp in pps))
+        for pp in pps[1:-1]:
+            assert out[pp.name].equals(pp.apply(sample_signals))
+        assert out["identity"].equals(sample_signals)
+
+    def test_each_prefix_runs_once(
+        self, sample_signals: pl.DataFrame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        for cls in (TimeShiftTransform, RateOfChangeTransform, WeightedBlendTransform):
+            original = cls.apply
+
+            def _counting(self, signals, date_col, _original=original):  # type: ignore[no-untyped-def]
+                calls.append(self.name)
+                return _original(self, signals, date_col)
+
+            monkeypatch.setattr(cls, "apply", _counting)
+
+        pps = self._grid()
+        apply_preprocessors(pps, sample_signals, max_workers=1)
+        # 2 shifts + 2x2 roc prefixes + 2x2x3 blends, not 12 chains x 3.
+        assert len(pps) == 12
+        assert len(calls) == 2 + 4 + 12
+
+    def test_rejects_column_overwrite(self, sample_signals: pl.DataFrame) -> None:
+        class BadTransform(RateOfChangeTransform):
+            def output_columns(self) -> list[str]:
+                return ["consensus_resid"]
+
+        bad = SignalPreprocessor(
+            transforms=(
+                TimeShiftTransform(source_cols=("visible_revenue_resid",)),
+                BadTransform(source_col="visible_revenue_resid"),
+            )
+        )
+        with pytest.raises(ValueError, match="overwrite original columns"):
+            apply_preprocessors([*self._grid(), bad], sample_signals)
@@ -0,0 +1,167 @@
+"""STLResidualEngine against the original expanding-window STL loop."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+from statsmodels.tsa.seasonal import STL
+
+from abovedata_backtesting.processors.signal_processor import (
+    STLSignalProcessor,
+    compute_stl_residuals_stable,
+)
+from abovedata_backtesting.processors.stl_residuals import (
+    STLParams,
+    STLResidualEngine,
+)
+
+
+def _reference_residuals(
+    vals: np.ndarray, period: int = 4, min_burn_in: int = 8
+) -> list[float | None]:
+    """The pre-engine compute_stl_residuals_stable loop, verbatim."""
+    n = len(vals)
+    residuals: list[float | None] = [None] * n
+    for i in range(min_burn_in, n):
+        window_data = vals[: i + 1]
+        stl = STL(window_data, period=period, seasonal=7, trend=13, robust=True).fit()
+        res_val = stl.resid[-1]
+        prev_res_std = np.std(stl.resid[:-1]) if len(stl.resid) > 1 else 1.0
+        residuals[i] = res_val / (prev_res_std + 1e-9)
+    return residuals
+
+
+def _quarterly_frame(n: int = 20, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    seasonal = 5 * np.sin(t * np.pi / 2)
+    return pl.DataFrame(
+        {
+            "earnings_date": [
+                date(2012, 1, 1) + timedelta(days=91 * i) for i in range(n)
+            ],
+            "visible_revenue": 100 + 2 * t + seasonal + rng.normal(0, 1, n),
+            "total_revenue": 500 + 4 * t + rng.normal(0, 3, n),
+            "consensus": 498 + 4 * t + rng.normal(0, 2, n),
+        }
+    )
+
+
+def _segmented_frame(base: pl.DataFrame, names: list[str]) -> pl.DataFrame:
+    return pl.concat(
+        [
+            base.with_columns(
+                pl.lit(name).alias("name"),
+                (pl.col("visible_revenue") * k).alias("count"),
+            )
+            for k, name in enumerate(names, start=1)
+        ]
+    )
+
+
+def _processor(df: pl.DataFrame, engine: STLResidualEngine) -> STLSignalProcessor:
+    return STLSignalProcessor(
+        df=df,
+        ticker="TEST",
+        visible_col="visible_revenue",
+        is_medical=False,
+        stl_engine=engine,
+    )
+
+
+class TestSTLResidualEngine:
+    def test_matches_original_loop(self) -> None:
+        df = _quarterly_frame()
+        engine = STLResidualEngine()
+        out = compute_stl_residuals_stable(df, "visible_revenue", engine=engine)
+        assert out.name == "visible_revenue_resid"
+        assert out.to_list() == _reference_residuals(df["visible_revenue"].to_numpy())
+
+    def test_repeated_prefix_is_a_cache_hit(self) -> None:
+        df = _quarterly_frame(n=16)
+        engine = STLResidualEngine()
+        first = engine.residuals(df["total_revenue"].to_numpy())
+        assert (engine.hits, engine.misses) == (0, 8)
+
+        # A new quarter only fits the new prefix.
+        longer = _quarterly_frame(n=17)["total_revenue"].to_numpy().copy()
+        longer[:16] = df["total_revenue"].to_numpy()
+        second = engine.residuals(longer)
+        assert (engine.hits, engine.misses) == (8, 9)
+        assert second[:16] == first
+        assert second == _reference_residuals(longer)
+
+    def test_params_are_part_of_the_key(self) -> None:
+        vals = _quarterly_frame(n=14)["total_revenue"].to_numpy()
+        engine = STLResidualEngine()
+        engine.residuals(vals)
+        engine.residuals(vals, STLParams(period=4, min_burn_in=10))
+        assert engine.hits == 0
+        assert engine.residuals(vals, STLParams(min_burn_in=10)) == (
+            _reference_residuals(vals, min_burn_in=10)
+        )
+
+    def test_process_executor_matches_serial(self) -> None:
+        series = [
+            _quarterly_frame(n=n, seed=n)["visible_revenue"].to_numpy()
+            for n in (12, 15, 18)
+        ]
+        serial = STLResidualEngine().residuals_many(series)
+        parallel = STLResidualEngine(executor="process", max_workers=2)
+        assert parallel.residuals_many(series) == serial
+
+    def test_unknown_executor_raises(self) -> None:
+        engine = STLResidualEngine(executor="cluster", max_workers=2)  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Unknown executor"):
+            engine.residuals(_quarterly_frame(n=12)["total_revenue"].to_numpy())
+
+    def test_segments_share_ticker_level_fits(self) -> None:
+        base = _quarterly_frame(n=14)
+        df = _segmented_frame(base, ["a", "b"])
+        engine = STLResidualEngine()
+        out = STLSignalProcessor(
+            df=df,
+            ticker="TEST",
+            visible_col="visible_revenue",
+            is_medical=False,
+            stl_engine=engine,
+        ).process_by_segment()
+        assert out.height > 0
+
+        # Two segment counts plus total_revenue and consensus fitted once
+        # each, 6 prefixes per series; the sub-processors only hit the cache.
+        assert engine.misses == 4 * 6
+        segment = out.filter(pl.col("name") == "b")
+        expected = _reference_residuals(base["visible_revenue"].to_numpy() * 2)
+        assert segment["count_resid"].to_list() == [
+            v for v, d in zip(expected, base["earnings_date"]) if d.year >= 2015
+        ]
+
+
+class TestProcessBySegment:
+    def test_process_pool_matches_serial_in_order(self) -> None:
+        # Names out of alphabetical order: output must follow input order.
+        df = _segmented_frame(_quarterly_frame(n=14), ["d", "a", "c", "b"])
+        serial = _processor(df, STLResidualEngine()).process_by_segment()
+
+        processor = _processor(df, STLResidualEngine())
+        parallel = processor.process_by_segment(executor="process", max_workers=2)
+        assert parallel.equals(serial)
+        assert parallel["name"].unique(maintain_order=True).to_list() == [
+            "d",
+            "a",
+            "c",
+            "b",
+        ]
+        assert list(processor.segment_timings) == ["d", "a", "c", "b"]
+        # 4 segment counts + total_revenue + consensus, fitted once in the
+        # parent and handed back to the processor's engine.
+        assert len(processor._engine.snapshot()) == 6 * 6
+
+    def test_unknown_executor_raises(self) -> None:
+        df = _segmented_frame(_quarterly_frame(n=12), ["a"])
+        with pytest.raises(ValueError, match="Unknown executor"):
+            _processor(df, STLResidualEngine()).process_by_segment(
+                executor="thread"  # type: ignore[arg-type]
+            )
@@ -0,0 +1,276 @@
+"""StrategyProcessor grid search on synthetic market and signal data."""
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from abovedata_backtesting.entries.entry_events import EntryEvents
+from abovedata_backtesting.entries.entry_signals import (
+    MomentumEntry,
+    SignalThresholdEntry,
+)
+from abovedata_backtesting.processors import strategy_processor
+from abovedata_backtesting.processors.entry_cache import (
+    EntryCache,
+    frame_fingerprint,
+    input_fingerprint,
+)
+from abovedata_backtesting.processors.result_collector import TopKResultCollector
+from abovedata_backtesting.processors.signal_preprocessor import (
+    IdentityPreprocessor,
+    SignalPreprocessor,
+)
+from abovedata_backtesting.processors.signal_transforms import TimeShiftTransform
+from abovedata_backtesting.processors.strategy_processor import (
+    EntryExecutor,
+    MarketArrays,
+)
+from tests.helpers import make_market, make_processor, make_signals, result_keys
+
+
+class TestEntryExecutors:
+    @pytest.mark.parametrize("executor", ["serial", "process"])
+    def test_matches_thread_executor(self, executor: EntryExecutor) -> None:
+        reference, _ = make_processor(executor="thread").run()
+        summary, results = make_processor(executor=executor, max_workers=2).run()
+
+        assert len(results) == summary.height
+        assert result_keys(summary).equals(result_keys(reference))
+
+    def test_unknown_executor_raises(self) -> None:
+        processor = make_processor(executor="gpu")
+        with pytest.raises(ValueError, match="Unknown executor"):
+            processor.run()
+
+
+class TestMaterializeTopN:
+    def test_winners_match_full_run(self) -> None:
+        full, _ = make_processor().run()
+        summary, results = make_processor(materialize_top_n=5).run()
+
+        assert len(results) == summary.height
+        assert 5 <= summary.height <= 10
+        top_full = full.filter(pl.col("trade_n_trades") > 0).head(5)
+        assert result_keys(summary.head(5)).equals(result_keys(top_full))
+        assert summary["trade_total_return"].max() == full["trade_total_return"].max()
+
+    def test_rejects_metric_kernel_cannot_rank(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def _unexpected(*args: object) -> None:
+            raise AssertionError("entries built before the metric was checked")
+
+        monkeypatch.setattr(strategy_processor, "_compute_entries", _unexpected)
+        for optimize_by in ["calmar", "sortino_ratio", "return"]:
+            with pytest.raises(ValueError, match="not computed by the batched"):
+                make_processor(materialize_top_n=5).run(optimize_by=optimize_by)
+
+
+class TestKeepTopK:
+    def test_summary_covers_all_combos(self, tmp_path: Path) -> None:
+        full, full_results = make_processor().run()
+        in_memory, _ = make_processor(keep_top_k=3).run()
+        processor = make_processor(keep_top_k=3, summary_spill_dir=tmp_path)
+        summary, results = processor.run()
+
+        assert result_keys(in_memory).equals(result_keys(full))
+        assert processor.summary_scan is not None
+        assert result_keys(processor.summary_scan.collect()).equals(result_keys(full))
+        # Spilled runs only return the kept results' rows, in summary order.
+        assert summary.height == len(results)
+        assert summary["entry_name"].to_list() == [r.entry_rule.name for r in results]
+        assert 3 <= len(results) <= 6 < len(full_results)
+        assert list(tmp_path.glob("summary-*.parquet"))
+        kept = {(r.make_key(), r.position_filter) for r in results}
+        for col in ("sharpe_ratio", "trade_total_return"):
+            for row in full.sort(col, descending=True).head(3).iter_rows(named=True):
+                assert (
+                    f"{row['entry_name']} × {row['exit_name']}",
+                    row["position_filter"],
+                ) in kept
+
+    def test_spilled_batches_match_single_frame(self, tmp_path: Path) -> None:
+        processor = make_processor()
+        _, results = processor.run()
+        collector = TopKResultCollector(top_k=4, spill_dir=tmp_path, batch_rows=7)
+        for result in results:
+            collector.add(result)
+        scan, kept_summary, kept = collector.finish("sharpe_ratio")
+
+        assert len(list(tmp_path.glob("*.parquet"))) == -(-len(results) // 7)
+        expected = processor._build_summary(results, "sharpe_ratio")
+        assert result_keys(scan.collect()).equals(result_keys(expected))
+        position = {id(r): i for i, r in enumerate(results)}
+        assert kept_summary["_original_idx"].to_list() == [
+            position[id(r)] for r in kept
+        ]
+        by_sharpe = sorted(
+            results, key=lambda r: r.metrics.risk.sharpe_ratio, reverse=True
+        )
+        assert kept[:4] == by_sharpe[:4]
+        assert len(kept) <= 8
+
+
+class TestPositionFilters:
+    def test_entries_run_once_for_all_filters(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        original = MomentumEntry.batch_events.__func__  # type: ignore[attr-defined]
+
+        def _counting(cls, rules, *args, **kwargs):  # type: ignore[no-untyped-def]
+            calls.extend(r.name for r in rules)
+            return original(cls, rules, *args, **kwargs)
+
+        monkeypatch.setattr(MomentumEntry, "batch_events", classmethod(_counting))
+        processor = make_processor(executor="serial")
+        processor.add_position_filters(["short_only"])
+        _, results = processor.run()
+
+        momentum = [e.name for e in processor._entry_rules if "momentum" in e.name]
+        assert sorted(calls) == sorted(momentum)
+        filters = {r.position_filter for r in results}
+        assert filters == {"long_short", "long_only", "short_only"}
+        for r in results:
+            if r.position_filter == "long_only":
+                assert all(t.direction > 0 for t in r.trade_log.trades)
+
+
+class TestInputDedup:
+    def test_preprocessors_share_entries_reading_unchanged_columns(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        original = strategy_processor._compute_entries
+
+        def _counting(market, signals, entries, *args):  # type: ignore[no-untyped-def]
+            calls.extend(e.name for e in entries)
+            return original(market, signals, entries, *args)
+
+        monkeypatch.setattr(strategy_processor, "_compute_entries", _counting)
+        lagged = SignalPreprocessor(
+            (TimeShiftTransform(source_cols=("visible_revenue_resid",)),)
+        )
+        processor = make_processor(executor="serial")
+        processor.add_preprocessors([IdentityPreprocessor(), lagged])
+        processor.add_entries(
+            [SignalThresholdEntry(signal_col="visible_revenue_resid_lag1q")]
+        )
+        summary, _ = processor.run()
+
+        # Only the entry reading the lagged column runs per preprocessor
+        # (and is empty without it); every other entry runs once.
+        names = [e.name for e in processor._entry_rules]
+        assert len(calls) == len(names) + 1
+        assert len(set(calls)) == len(names)
+        per_pp = summary.partition_by("pp_name", as_dict=True)
+        identity = per_pp[("identity",)].filter(
+            ~pl.col("entry_name").str.contains("lag1q")
+        )
+        shifted = per_pp[(lagged.name,)].filter(
+            ~pl.col("entry_name").str.contains("lag1q")
+        )
+        assert (
+            result_keys(identity)
+            .drop("pp_name")
+            .equals(result_keys(shifted).drop("pp_name"))
+        )
+
+    def test_input_fingerprint_ignores_unread_columns(self) -> None:
+        market = make_market(n=50)
+        signals = make_signals(market)
+        extra = signals.with_columns(pl.lit(1.0).alias("other"))
+        cols = ("earnings_date", "visible_revenue_resid", "missing")
+        assert input_fingerprint(signals, cols) == input_fingerprint(extra, cols)
+        assert input_fingerprint(signals, None) != input_fingerprint(extra, None)
+        assert input_fingerprint(signals, cols) != input_fingerprint(
+            signals.with_columns(pl.lit(None).alias("missing")), cols
+        )
+
+
+class TestPersistentEntryCache:
+    def test_second_run_reads_from_disk(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        reference, _ = make_processor().run()
+        first, _ = make_processor(entry_cache_dir=tmp_path).run()
+        n_files = len(list(tmp_path.glob("*.parquet")))
+        assert n_files > 0
+
+        def _fail(*_args: object, **_kwargs: object) -> EntryEvents:
+            raise AssertionError("entry.events() called despite cache hit")
+
+        monkeypatch.setattr(MomentumEntry, "events", _fail)
+        monkeypatch.setattr(SignalThresholdEntry, "events", _fail)
+        second, _ = make_processor(entry_cache_dir=tmp_path).run()
+
+        assert result_keys(first).equals(result_keys(reference))
+        assert result_keys(second).equals(result_keys(reference))
+        assert len(list(tmp_path.glob("*.parquet"))) == n_files
+
+    def test_key_covers_fields_missing_from_params(self, tmp_path: Path) -> None:
+        def _run(confidence_col: str | None, cache_dir: Path | None) -> list[float]:
+            processor = make_processor(entry_cache_dir=cache_dir)
+            processor.signals = processor.signals.with_columns(
+                conf=pl.col("visible_revenue_resid").abs()
+            )
+            processor._entry_rules = [
+                SignalThresholdEntry(confidence_col=confidence_col)
+            ]
+            _, results = processor.run()
+            return [t.confidence for r in results for t in r.trade_log.trades]
+
+        _run(None, tmp_path)
+        assert _run("conf", tmp_path) == _run("conf", None)
+
+    def test_eviction_respects_size_budget(self, tmp_path: Path) -> None:
+        make_processor(entry_cache_dir=tmp_path, entry_cache_max_bytes=0).run()
+        assert list(tmp_path.glob("*.parquet")) == []
+
+    def test_key_changes_with_inputs(self) -> None:
+        market = make_market(n=50)
+        base = {
+            "preprocessor_params": {"preprocessor": "identity"},
+            "entry_params": {"lookback_days": 10},
+            "entry_name": "momentum",
+            "market_fingerprint": frame_fingerprint(market),
+            "signals_fingerprint": "sig",
+        }
+        key = EntryCache.make_key(**base)  # type: ignore[arg-type]
+        assert key == EntryCache.make_key(**base)  # type: ignore[arg-type]
+        changed = base | {
+            "market_fingerprint": frame_fingerprint(
+                market.with_columns(pl.col("close") * 1.01)
+            )
+        }
+        assert key != EntryCache.make_key(**changed)  # type: ignore[arg-type]
+        assert key != EntryCache.make_key(  # type: ignore[arg-type]
+            **(base | {"entry_params": {"lookback_days": 20}})
+        )
+
+
+class TestMarketArrays:
+    def test_shared_read_only_arrays(self) -> None:
+        market = MarketArrays.from_frame(make_market(n=200))
+        assert market.dates.dtype == np.dtype("datetime64[D]")
+        for arr in (market.dates, market.closes, market.asset_returns):
+            assert not arr.flags.writeable
+        with pytest.raises(ValueError):
+            market.closes[0] = 0.0
+
+    def test_signal_date_mask(self) -> None:
+        frame = make_market(n=200)
+        market = MarketArrays.from_frame(frame)
+        picked = frozenset(frame["date"].to_list()[::50])
+        mask = market.signal_date_mask(picked)
+        assert mask.sum() == len(picked)
+        assert market.signal_date_mask(None).sum() == 0
+
+    def test_trade_dates_are_dates(self) -> None:
+        _, results = make_processor().run()
+        trade = results[0].trade_log.trades[0]
+        assert type(trade.entry_date) is date
+        assert type(results[0].metrics.start_date) is date
@@ -0,0 +1,94 @@
+"""Successive-halving search mode against the exhaustive grid run."""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from abovedata_backtesting.processors.successive_halving import (
+    SuccessiveHalving,
+    top_mask,
+)
+from tests.helpers import make_processor, result_keys
+
+
+@pytest.fixture(scope="module")
+def full_summary() -> pl.DataFrame:
+    summary, _ = make_processor(executor="serial").run()
+    return summary
+
+
+class TestSuccessiveHalving:
+    def test_survivors_match_full_evaluation(self, full_summary: pl.DataFrame) -> None:
+        halving = SuccessiveHalving(eta=2.0, min_survivors=2, min_signals=1)
+        processor = make_processor(executor="serial", halving=halving)
+        summary, results = processor.run()
+        log = processor.pruning_log
+        assert log is not None
+
+        counts = {
+            rung: (frame.height, int(frame["kept"].sum()))
+            for (rung,), frame in log.partition_by("rung", as_dict=True).items()
+        }
+        n_pairs = len(processor._entry_rules) * len(processor._position_filters)
+        assert counts["signals"][0] == n_pairs
+        assert counts["hit_rate"][0] == counts["signals"][1]
+        assert counts["hit_rate"][1] == halving.n_keep(counts["hit_rate"][0])
+        n_window = counts["window"][0]
+        assert counts["window"][1] == halving.n_keep(n_window)
+        assert 0 < summary.height <= counts["window"][1] < full_summary.height
+        assert len(results) == summary.height
+
+        # Survivors are evaluated exactly as in the exhaustive run.
+        keys = result_keys(summary)
+        matched = keys.join(
+            result_keys(full_summary),
+            on=keys.columns[:5],
+            how="inner",
+            suffix="_full",
+        )
+        assert matched.height == summary.height
+        assert matched["sharpe_ratio"].equals(
+            matched["sharpe_ratio_full"], check_names=False
+        )
+
+    def test_min_signals_prunes_sparse_entries(self) -> None:
+        probe = make_processor(
+            executor="serial", halving=SuccessiveHalving(min_signals=0)
+        )
+        probe.run()
+        assert probe.pruning_log is not None
+        signals = probe.pruning_log.filter(pl.col("rung") == "signals")
+        threshold = int(signals["score"].median())  # type: ignore[arg-type]
+
+        processor = make_processor(
+            executor="serial", halving=SuccessiveHalving(min_signals=threshold)
+        )
+        summary, _ = processor.run()
+        assert processor.pruning_log is not None
+        pruned = processor.pruning_log.filter(
+            (pl.col("rung") == "signals") & ~pl.col("kept")
+        )
+        assert pruned.height > 0
+        assert (pruned["score"] < threshold).all()
+        kept_pairs = summary.select("entry_name", "position_filter").unique()
+        assert (
+            kept_pairs.join(
+                pruned.select("entry_name", "position_filter"),
+                on=["entry_name", "position_filter"],
+            ).height
+            == 0
+        )
+
+    def test_rejects_materialize_top_n(self) -> None:
+        processor = make_processor(halving=SuccessiveHalving(), materialize_top_n=5)
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            processor.run()
+
+    def test_top_mask_ranks_nan_last(self) -> None:
+        scores = np.array([0.5, np.nan, 2.0, 0.5, -1.0])
+        assert top_mask(scores, 2).tolist() == [True, False, True, False, False]
+        assert top_mask(scores, 5).all()
+        assert SuccessiveHalving(eta=3.0, min_survivors=2).n_keep(10) == 4
+        assert SuccessiveHalving(eta=3.0, min_survivors=20).n_keep(10) == 10
+        with pytest.raises(ValueError, match="eta"):
+            SuccessiveHalving(eta=1.0)
@@ -0,0 +1,91 @@
+"""TradingCalendar against the original list/dict entry-date resolution."""
+
+import datetime as dt
+
+import numpy as np
+import polars as pl
+import pytest
+
+from abovedata_backtesting.entries.entry_signals import (
+    MomentumEntry,
+    _resolve_entry_dates,
+)
+from abovedata_backtesting.entries.trading_calendar import TradingCalendar
+from tests.helpers import make_market, make_signals
+
+
+def _reference_entry_map(
+    market_data: pl.DataFrame, signal_dates: list[dt.date], entry_days_before: int
+) -> dict[dt.date, dt.date]:
+    """The pre-calendar _resolve_entry_dates loop, verbatim."""
+    trading_dates = market_data["date"].to_list()
+    date_to_idx = {d: i for i, d in enumerate(trading_dates)}
+
+    entry_map: dict[dt.date, dt.date] = {}
+    for sig_date in signal_dates:
+        if sig_date not in date_to_idx:
+            candidates = [d for d in trading_dates if d <= sig_date]
+            if not candidates:
+                continue
+            sig_idx = date_to_idx[candidates[-1]]
+        else:
+            sig_idx = date_to_idx[sig_date]
+
+        entry_idx = sig_idx - entry_days_before
+        if entry_idx >= 0:
+            entry_map[trading_dates[entry_idx]] = sig_date
+
+    return entry_map
+
+
+@pytest.fixture(scope="module")
+def market() -> pl.DataFrame:
+    return make_market()
+
+
+class TestTradingCalendar:
+    def test_matches_reference_for_all_offsets(self, market: pl.DataFrame) -> None:
+        rng = np.random.default_rng(0)
+        first = market["date"][0]
+        # Weekends, pre-history dates, duplicates and out-of-order dates.
+        signal_dates = [
+            first + dt.timedelta(days=int(k)) for k in rng.integers(-10, 500, 60)
+        ]
+        offsets = [0, 1, 3, 5, 20]
+        calendar = TradingCalendar.from_market_data(market)
+
+        maps = calendar.entry_maps(signal_dates, offsets)
+        for offset in offsets:
+            expected = _reference_entry_map(market, signal_dates, offset)
+            assert maps[offset] == expected
+            assert list(maps[offset].items()) == list(expected.items())
+            assert _resolve_entry_dates(market, signal_dates, offset) == expected
+
+            events, owners = calendar.unique_entries(
+                calendar.entry_indices(signal_dates, [offset])[:, 0]
+            )
+            assert calendar.dates[events].tolist() == sorted(expected)
+            assert [signal_dates[k] for k in owners] == [
+                expected[d] for d in sorted(expected)
+            ]
+
+    def test_entry_indices_mark_unresolvable_signals(
+        self, market: pl.DataFrame
+    ) -> None:
+        calendar = TradingCalendar.from_market_data(market)
+        first = market["date"][0]
+        idx = calendar.entry_indices(
+            [first - dt.timedelta(days=1), first, market["date"][4]], [0, 2]
+        )
+        assert idx.tolist() == [[-1, -1], [0, -1], [4, 2]]
+
+    def test_unsorted_market_raises(self, market: pl.DataFrame) -> None:
+        with pytest.raises(ValueError, match="sorted"):
+            TradingCalendar.from_market_data(market.reverse())
+
+    def test_shared_calendar_matches_per_call(self, market: pl.DataFrame) -> None:
+        signals = make_signals(market)
+        calendar = TradingCalendar.from_market_data(market)
+        for rule in MomentumEntry.grid(entry_days_before=[0, 3]):
+            shared = rule.events(market, signals, calendar=calendar)
+            assert shared.to_daily(market).equals(rule.apply(market, signals))
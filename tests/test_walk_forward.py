@@ -0,0 +1,148 @@
+"""Walk-forward engine: fold layout and train/test selection."""
+
+import math
+
+import numpy as np
+import pytest
+
+from abovedata_backtesting.processors import strategy_processor
+from abovedata_backtesting.processors.strategy_processor import _CachedArrays
+from abovedata_backtesting.processors.walk_forward import (
+    WalkForward,
+    WalkForwardFold,
+)
+from tests.helpers import make_processor
+
+CONFIG = WalkForward(train_days=500, test_days=250)
+
+
+class TestFolds:
+    def test_rolling_and_anchored_layout(self) -> None:
+        rolling = WalkForward(train_days=400, test_days=200).folds(1000)
+        assert rolling == [
+            WalkForwardFold(0, 400, 400, 600),
+            WalkForwardFold(200, 600, 600, 800),
+            WalkForwardFold(400, 800, 800, 1000),
+        ]
+        anchored = WalkForward(
+            train_days=400, test_days=200, step_days=300, anchored=True
+        ).folds(1000)
+        assert anchored == [
+            WalkForwardFold(0, 400, 400, 600),
+            WalkForwardFold(0, 700, 700, 900),
+        ]
+        assert WalkForward(train_days=900, test_days=200).folds(1000) == []
+
+
+class TestWalkForward:
+    def test_selects_train_best_and_scores_test_window(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        original = strategy_processor._compute_entries
+
+        def _counting(market, signals, entries, *args):  # type: ignore[no-untyped-def]
+            calls.extend(e.name for e in entries)
+            return original(market, signals, entries, *args)
+
+        monkeypatch.setattr(strategy_processor, "_compute_entries", _counting)
+        processor = make_processor(executor="serial")
+        wf = processor.walk_forward(CONFIG)
+
+        folds = CONFIG.folds(processor._market_data.height)
+        assert wf.folds.height == len(folds) == 4
+        # One entry.events() per entry rule, however many folds there are.
+        assert sorted(calls) == sorted({e.name for e in processor._entry_rules})
+
+        # Brute force: full _evaluate_arrays on every combo's train window.
+        market = processor._require_market_arrays()
+        signal_mask = processor._signal_mask()
+        entry_cache = processor._build_entries(
+            processor._entry_rules, processor._preprocess()
+        )
+        for fold, row, result in zip(folds, wf.folds.iter_rows(named=True), wf.results):
+            best_score, best_key = -math.inf, None
+            for events, entry, preprocessor in entry_cache.values():
+                for pos_filter in processor._position_filters:
+                    filtered = events.with_position_filter(pos_filter)
+                    arrays = _CachedArrays.from_events(
+                        filtered, market, signal_mask
+                    ).window(fold.train_start, fold.train_end)
+                    for exit_rule in processor._exit_rules:
+                        for n_max in processor.max_entries_per_signal:
+                            r = processor._evaluate_arrays(
+                                arrays,
+                                filtered,
+                                entry,
+                                exit_rule,
+                                pos_filter,
+                                n_max,
+                                preprocessor,
+                            )
+                            sharpe = r.metrics.risk.sharpe_ratio if r else math.nan
+                            if np.isfinite(sharpe) and sharpe > best_score + 1e-12:
+                                best_score = sharpe
+                                best_key = (
+                                    preprocessor.name,
+                                    entry.name,
+                                    exit_rule.name,
+                                    pos_filter,
+                                    n_max,
+                                )
+            assert best_key == (
+                row["pp_name"],
+                row["entry_name"],
+                row["exit_name"],
+                row["position_filter"],
+                row["max_entries_per_signal"],
+            )
+            assert row["train_score"] == pytest.approx(best_score, rel=1e-9)
+
+            assert result is not None
+            assert row["test_sharpe_ratio"] == result.metrics.risk.sharpe_ratio
+            test_dates = (row["test_start"], row["test_end"])
+            assert result.metrics.start_date == test_dates[0]
+            for trade in result.trade_log.trades:
+                assert test_dates[0] <= trade.entry_date <= test_dates[1]
+
+        returns = wf.folds["test_trade_total_return"].to_numpy()
+        assert wf.oos_total_return == pytest.approx(np.prod(1 + returns) - 1)
+
+    def test_windows_only_trade_signals_fired_inside(self) -> None:
+        processor = make_processor(executor="serial")
+        wf = processor.walk_forward(CONFIG)
+        market = processor._require_market_arrays()
+        signal_mask = processor._signal_mask()
+        entry_cache = processor._build_entries(
+            processor._entry_rules, processor._preprocess()
+        )
+        day_of = {d: i for i, d in enumerate(market.dates.tolist())}
+        for fold, row, result in zip(
+            CONFIG.folds(market.n_days), wf.folds.iter_rows(named=True), wf.results
+        ):
+            events, _, _ = entry_cache[(row["pp_name"], row["entry_name"])]
+            full = _CachedArrays.from_events(
+                events.with_position_filter(row["position_filter"]),
+                market,
+                signal_mask,
+            )
+            first_day = {
+                int(sid): int(np.argmax(full.signal_ids == sid))
+                for sid in np.unique(full.signal_ids)
+            }
+            for start, stop in [
+                (fold.train_start, fold.train_end),
+                (fold.test_start, fold.test_end),
+            ]:
+                window = full.window(start, stop)
+                held = window.signal_ids[window.positions != 0]
+                assert all(first_day[int(sid)] >= start for sid in held)
+
+            assert result is not None
+            for trade in result.trade_log.trades:
+                sid = int(full.signal_ids[day_of[trade.entry_date]])
+                assert first_day[sid] >= fold.test_start
+
+    def test_too_short_timeline_raises(self) -> None:
+        with pytest.raises(ValueError, match="too few"):
+            make_processor().walk_forward(WalkForward(train_days=1400, test_days=200))